@@ -5,7 +5,7 @@ Contains transversal technical components without business logic.
 
 from .config import settings
 from .db import Base, engine, get_db, UnitOfWork
-from .cache import redis_client, rate_limiter, distributed_lock
+from .cache import redis_client, async_redis_client, rate_limiter, distributed_lock
 from .security import password_hasher, jwt_handler, Role, Permission, rbac_service
 from .errors import register_error_handlers
 from .middleware import register_middlewares
@@ -18,6 +18,7 @@ __all__ = [
     "get_db",
     "UnitOfWork",
     "redis_client",
+    "async_redis_client",
     "rate_limiter",
     "distributed_lock",
     "password_hasher",
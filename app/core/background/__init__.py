@@ -0,0 +1,7 @@
+from .executor import BackgroundExecutor, background_executor, offload
+
+__all__ = [
+    "BackgroundExecutor",
+    "background_executor",
+    "offload",
+]
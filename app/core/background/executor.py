@@ -0,0 +1,205 @@
+"""
+Bounded in-process executor for fire-and-forget side effects.
+
+Notifications, audit logging and similar non-critical work is queued on a
+bounded asyncio.Queue and run by a fixed pool of worker tasks, so the
+response goes out as soon as the state change commits. Work offloaded
+during a request is held until the request's session commits and dropped
+if it rolls back, so no side effect goes out for a write that never
+happened. When the queue is full new work is rejected (and counted)
+instead of piling up in memory.
+On shutdown the queue is drained for up to BACKGROUND_DRAIN_TIMEOUT
+seconds. Queued work is lost if the process dies: anything that must
+survive a crash belongs in the transactional outbox instead.
+"""
+
+from typing import Any, Awaitable, Callable, List, Optional
+from functools import wraps
+import asyncio
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db.session import request_session
+from app.core.observability.metrics import MetricsCollector, metrics_collector
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding work to submit once the transaction commits
+PENDING_WORK_KEY = "background_work"
+
+
+class BackgroundExecutor:
+    """Fixed pool of worker tasks consuming a bounded queue."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        drain_timeout: float = 10.0,
+        metrics: MetricsCollector = metrics_collector,
+    ):
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.drain_timeout = drain_timeout
+        self._metrics = metrics
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks) and not self._closing
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def _ensure_started(self) -> None:
+        """Start workers on the running loop if the lifespan has not (scripts, tests)."""
+        loop = asyncio.get_running_loop()
+        if self._tasks and self._loop is loop:
+            return
+        self._loop = loop
+        self._closing = False
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._tasks = [
+            loop.create_task(self._worker(), name=f"background-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """
+        Queue func(*args, **kwargs) without waiting.
+
+        func may be a coroutine function or a plain callable (run in a
+        thread). Returns False if the queue is full or shutting down.
+        """
+        if self._closing:
+            self._metrics.background_tasks.labels("rejected").inc()
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((func, args, kwargs, self._loop.time()))
+        except asyncio.QueueFull:
+            self._metrics.background_tasks.labels("rejected").inc()
+            logger.warning(
+                f"Background queue full ({self.max_queue_size}), dropping {getattr(func, '__qualname__', func)}"
+            )
+            return False
+        self._metrics.background_queue_depth.set(self._queue.qsize())
+        return True
+
+    def submit_after_commit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """
+        submit() once the current request's session commits.
+
+        The work is dropped if the transaction rolls back. Outside a
+        request (scripts, tests) there is nothing to wait for and it is
+        submitted immediately. Returns False only if immediate submission
+        is rejected.
+        """
+        session = request_session()
+        if session is None:
+            return self.submit(func, *args, **kwargs)
+        session.info.setdefault(PENDING_WORK_KEY, []).append((self, func, args, kwargs))
+        return True
+
+    async def submit_wait(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue func(*args, **kwargs), waiting for room instead of rejecting."""
+        if self._closing:
+            raise RuntimeError("Background executor is shutting down")
+        self._ensure_started()
+        await self._queue.put((func, args, kwargs, self._loop.time()))
+        self._metrics.background_queue_depth.set(self._queue.qsize())
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, kwargs, enqueued_at = await queue.get()
+            self._metrics.background_wait.observe(loop.time() - enqueued_at)
+            try:
+                if asyncio.iscoroutinefunction(func):
+                    await func(*args, **kwargs)
+                else:
+                    await asyncio.to_thread(func, *args, **kwargs)
+                self._metrics.background_tasks.labels("completed").inc()
+            except Exception as e:
+                self._metrics.background_tasks.labels("failed").inc()
+                logger.error(
+                    f"Background task {getattr(func, '__qualname__', func)} failed: {str(e)}",
+                    exc_info=True,
+                )
+            finally:
+                queue.task_done()
+                self._metrics.background_queue_depth.set(queue.qsize())
+
+    async def start(self) -> None:
+        """Start the worker tasks (called from app lifespan)."""
+        self._ensure_started()
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting work, drain the queue, then stop the workers."""
+        if not self._tasks:
+            return
+        self._closing = True
+        timeout = self.drain_timeout if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Background executor drain timed out after {timeout}s, "
+                f"dropping {self._queue.qsize()} queued task(s)"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+        self._closing = False
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_after_commit(session: Session) -> None:
+    for executor, func, args, kwargs in session.info.pop(PENDING_WORK_KEY, ()):
+        executor.submit(func, *args, **kwargs)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    pending = session.info.pop(PENDING_WORK_KEY, None)
+    if pending:
+        logger.info(f"Transaction rolled back, dropping {len(pending)} background task(s)")
+
+
+def offload(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[bool]]:
+    """
+    Run a coroutine function on the background executor instead of inline.
+
+    The work is queued when the request's transaction commits (at once
+    outside a request). The call returns an already-resolved awaitable with
+    whether it was accepted, so callers that await the original coroutine
+    keep working and callers that forget to await it still get the side
+    effect.
+    """
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Awaitable[bool]:
+        accepted = background_executor.submit_after_commit(func, *args, **kwargs)
+        result = asyncio.get_running_loop().create_future()
+        result.set_result(accepted)
+        return result
+
+    return wrapper
+
+
+# Singleton instance
+background_executor = BackgroundExecutor(
+    workers=settings.background_workers,
+    max_queue_size=settings.background_queue_size,
+    drain_timeout=settings.background_drain_timeout,
+)
@@ -1,10 +1,45 @@
+from .codec import Codec, JSONCodec, MsgpackCodec, get_codec, register_enum
 from .redis_client import redis_client
-from .distributed_lock import DistributedLock, distributed_lock
+from .async_redis_client import AsyncRedisClient, CachePipeline, async_redis_client
+from .near_cache import LocalLRUCache, NearCache, near_cache
+from .distributed_lock import DistributedLock, LockAcquisitionError, distributed_lock
+from .read_through import SingleFlight, cached, peek, store, store_many
 from .rate_limiter import rate_limiter
+from .versions import ResourceVersions, mark_changed, resource_versions
+from .conditional import (
+    PRIVATE_REVALIDATE,
+    NotModified,
+    conditional_get,
+    private_max_age,
+)
 
 __all__ = [
+    "Codec",
+    "JSONCodec",
+    "MsgpackCodec",
+    "get_codec",
+    "register_enum",
     "redis_client",
+    "AsyncRedisClient",
+    "CachePipeline",
+    "async_redis_client",
+    "LocalLRUCache",
+    "NearCache",
+    "near_cache",
     "DistributedLock",
+    "LockAcquisitionError",
     "distributed_lock",
+    "SingleFlight",
+    "cached",
+    "peek",
+    "store",
+    "store_many",
     "rate_limiter",
-]
\ No newline at end of file
+    "ResourceVersions",
+    "mark_changed",
+    "resource_versions",
+    "PRIVATE_REVALIDATE",
+    "NotModified",
+    "conditional_get",
+    "private_max_age",
+]
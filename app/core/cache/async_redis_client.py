@@ -0,0 +1,303 @@
+from typing import Optional, Any, Union, AsyncIterator, Callable, Dict, List, Sequence, Tuple
+from datetime import timedelta
+import logging
+
+import redis.asyncio as aioredis
+from redis.asyncio import ConnectionPool
+
+from app.core.cache.codec import Codec, get_codec
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TAG_KEY_PREFIX = "tag:"
+
+# Delete every member of the tag sets in KEYS, then the sets; returns the members
+INVALIDATE_TAGS_SCRIPT = """
+local members = redis.call("SUNION", unpack(KEYS))
+for i = 1, #members, 1000 do
+    redis.call("UNLINK", unpack(members, i, math.min(i + 999, #members)))
+end
+redis.call("UNLINK", unpack(KEYS))
+return members
+"""
+
+
+def tag_key(tag: str) -> str:
+    """Redis set holding the keys registered under a tag."""
+    return f"{TAG_KEY_PREFIX}{tag}"
+
+
+def _ttl_seconds(ttl: Optional[Union[int, timedelta]]) -> int:
+    if ttl is None:
+        return settings.redis_ttl
+    if isinstance(ttl, timedelta):
+        return int(ttl.total_seconds())
+    return ttl
+
+
+class CachePipeline:
+    """
+    Batch of cache commands sent in a single round trip.
+
+    Values are encoded with the client's codec and GET results decoded, so
+    the pipeline speaks the same types as AsyncRedisClient.get/set. Without
+    a Redis connection execute() returns a None for every queued command.
+
+    Usage:
+        pipe = async_redis_client.pipeline()
+        pipe.get("user:1")
+        pipe.set("user:2", data, ttl=300)
+        user_1, stored = await pipe.execute()
+    """
+
+    def __init__(self, client: Optional[aioredis.Redis], codec: Codec, transaction: bool = False):
+        self._client = client
+        self._codec = codec
+        self._transaction = transaction
+        self._commands: List[Tuple[str, tuple, Callable[[Any], Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def get(self, key: str) -> "CachePipeline":
+        self._commands.append(("get", (key,), self._decode))
+        return self
+
+    def set(self, key: str, value: Any, ttl: Optional[Union[int, timedelta]] = None) -> "CachePipeline":
+        self._commands.append(("setex", (key, _ttl_seconds(ttl), self._codec.encode(value)), bool))
+        return self
+
+    def delete(self, *keys: str) -> "CachePipeline":
+        self._commands.append(("delete", keys, int))
+        return self
+
+    def expire(self, key: str, ttl: Union[int, timedelta]) -> "CachePipeline":
+        self._commands.append(("expire", (key, _ttl_seconds(ttl)), bool))
+        return self
+
+    def tag(self, key: str, tags: Sequence[str], ttl: Optional[Union[int, timedelta]] = None) -> "CachePipeline":
+        """Register key under each tag; tag sets outlive the keys they hold."""
+        tag_ttl = max(_ttl_seconds(ttl), settings.cache_tag_ttl)
+        for tag in tags:
+            self._commands.append(("sadd", (tag_key(tag), key), int))
+            self._commands.append(("expire", (tag_key(tag), tag_ttl), bool))
+        return self
+
+    def _decode(self, value: Optional[bytes]) -> Any:
+        return self._codec.decode(value) if value else None
+
+    async def execute(self) -> List[Any]:
+        """Send every queued command; failed commands yield None."""
+        commands, self._commands = self._commands, []
+        if not self._client or not commands:
+            return [None] * len(commands)
+        try:
+            pipe = self._client.pipeline(transaction=self._transaction)
+            for method, args, _ in commands:
+                getattr(pipe, method)(*args)
+            replies = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.warning(f"Redis pipeline failed: {str(e)}")
+            return [None] * len(commands)
+
+        results = []
+        for (_, _, convert), reply in zip(commands, replies):
+            try:
+                results.append(None if isinstance(reply, Exception) else convert(reply))
+            except Exception:
+                results.append(None)
+        return results
+
+
+class AsyncRedisClient:
+    """
+    Asyncio Redis client wrapper with a shared connection pool.
+
+    Mirrors the RedisClient API but never blocks the event loop. The pool
+    is created in the application lifespan via initialize() and torn down
+    with close(); the synchronous RedisClient remains for scripts only.
+
+    Connections return raw bytes; cached values are encoded with the
+    REDIS_CODEC codec. mget, mset and pipeline() batch several keys into
+    one round trip. Keys written with tags are added to a tag:{tag} set so
+    invalidate_tags() can drop them all without scanning the keyspace.
+    """
+
+    _instance: Optional["AsyncRedisClient"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "_initialized"):
+            self._initialized = True
+            self._pool: Optional[ConnectionPool] = None
+            self._client: Optional[aioredis.Redis] = None
+            self.codec: Codec = get_codec(settings.redis_codec)
+
+    async def initialize(self) -> None:
+        """Create the shared connection pool (called from app lifespan)."""
+        if self._client or not settings.redis_url:
+            return
+        self._pool = ConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+        )
+        self._client = aioredis.Redis(connection_pool=self._pool)
+
+    async def close(self) -> None:
+        """Close the client and disconnect every pooled connection."""
+        if self._client:
+            await self._client.aclose()
+        if self._pool:
+            await self._pool.disconnect()
+        self._client = None
+        self._pool = None
+
+    @property
+    def client(self) -> Optional[aioredis.Redis]:
+        """Get the underlying redis.asyncio client instance."""
+        return self._client
+
+    async def is_available(self) -> bool:
+        """Check if Redis is available."""
+        if not self._client:
+            return False
+        try:
+            return bool(await self._client.ping())
+        except Exception:
+            return False
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        if not self._client:
+            return None
+        try:
+            value = await self._client.get(key)
+            if value:
+                return self.codec.decode(value)
+            return None
+        except Exception:
+            return None
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Get several values in one round trip, None for each miss."""
+        if not self._client or not keys:
+            return [None] * len(keys)
+        try:
+            values = await self._client.mget(keys)
+        except Exception:
+            return [None] * len(keys)
+
+        results = []
+        for value in values:
+            try:
+                results.append(self.codec.decode(value) if value else None)
+            except Exception:
+                results.append(None)
+        return results
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[Union[int, timedelta]] = None,
+        tags: Sequence[str] = (),
+    ) -> bool:
+        """Set value in cache with optional TTL, registering it under tags."""
+        if not self._client:
+            return False
+        if tags:
+            stored, *_ = await self.pipeline().set(key, value, ttl=ttl).tag(key, tags, ttl=ttl).execute()
+            return bool(stored)
+        try:
+            return bool(await self._client.setex(key, _ttl_seconds(ttl), self.codec.encode(value)))
+        except Exception:
+            return False
+
+    async def mset(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[Union[int, timedelta]] = None,
+        tags: Sequence[str] = (),
+    ) -> bool:
+        """Set several values with a shared TTL and tags in one round trip."""
+        if not self._client or not mapping:
+            return False
+        pipe = self.pipeline()
+        for key, value in mapping.items():
+            pipe.set(key, value, ttl=ttl)
+        for key in mapping:
+            pipe.tag(key, tags, ttl=ttl)
+        return all((await pipe.execute())[:len(mapping)])
+
+    async def invalidate_tags(self, *tags: str) -> List[str]:
+        """Delete every key registered under these tags in one round trip, returning the keys."""
+        if not self._client or not tags:
+            return []
+        try:
+            script = self._client.register_script(INVALIDATE_TAGS_SCRIPT)
+            members = await script(keys=[tag_key(tag) for tag in tags])
+            return [key.decode() if isinstance(key, bytes) else key for key in members]
+        except Exception as e:
+            logger.error(f"Failed to invalidate cache tags {tags}: {str(e)}")
+            return []
+
+    def pipeline(self, transaction: bool = False) -> CachePipeline:
+        """Start a batch of commands sent together by CachePipeline.execute()."""
+        return CachePipeline(self._client, self.codec, transaction=transaction)
+
+    async def delete(self, *keys: str) -> int:
+        """Delete one or more keys from cache, returning how many were removed."""
+        if not self._client or not keys:
+            return 0
+        try:
+            return int(await self._client.delete(*keys))
+        except Exception:
+            return 0
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+        if not self._client:
+            return False
+        try:
+            return bool(await self._client.exists(key))
+        except Exception:
+            return False
+
+    async def increment(self, key: str, amount: int = 1) -> Optional[int]:
+        """Increment a counter."""
+        if not self._client:
+            return None
+        try:
+            return await self._client.incr(key, amount)
+        except Exception:
+            return None
+
+    async def expire(self, key: str, ttl: Union[int, timedelta]) -> bool:
+        """Set TTL on existing key."""
+        if not self._client:
+            return False
+        try:
+            if isinstance(ttl, timedelta):
+                ttl = int(ttl.total_seconds())
+            return bool(await self._client.expire(key, ttl))
+        except Exception:
+            return False
+
+    async def scan_iter(self, match: Optional[str] = None, count: int = 100) -> AsyncIterator[str]:
+        """Iterate over keys matching a pattern."""
+        if not self._client:
+            return
+        try:
+            async for key in self._client.scan_iter(match=match, count=count):
+                yield key.decode() if isinstance(key, bytes) else key
+        except Exception:
+            return
+
+
+# Singleton instance
+async_redis_client = AsyncRedisClient()
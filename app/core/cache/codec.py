@@ -0,0 +1,156 @@
+"""
+Value codecs for the Redis clients.
+
+MsgpackCodec writes compact binary payloads and round-trips Decimal,
+datetime, date, UUID and Enum values through msgpack extension types, so
+cached entities come back with the types they were stored with. Its
+payloads start with a marker byte that JSON never does, and both codecs
+read both formats, so existing entries (including JSON written before
+codecs existed) stay readable whichever REDIS_CODEC is configured.
+
+Enums are decoded only to classes in the enum registry: those this
+process has encoded, plus those listed with register_enum() so values
+written by other workers decode from the first read. Payload contents
+never cause an import. An unknown enum name fails to decode, which the
+Redis client treats as a miss.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Type
+from uuid import UUID
+import json
+
+import msgpack
+
+# Never a valid first byte of a JSON document
+MSGPACK_MARKER = b"\x01"
+
+EXT_DECIMAL = 1
+EXT_DATETIME = 2
+EXT_DATE = 3
+EXT_UUID = 4
+EXT_ENUM = 5
+
+
+class Codec(ABC):
+    """Encodes cache values to bytes and back."""
+
+    name = ""
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value for Redis."""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Deserialize a value read from Redis."""
+
+
+class JSONCodec(Codec):
+    """Plain JSON, readable by every release; Decimal and datetime need converting first."""
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    def decode(self, data: bytes) -> Any:
+        if data[:1] == MSGPACK_MARKER:
+            return _msgpack.decode(data)
+        return json.loads(data)
+
+
+_enum_types: Dict[str, Type[Enum]] = {}
+
+
+def _enum_name(enum_type: Type[Enum]) -> str:
+    return f"{enum_type.__module__}:{enum_type.__qualname__}"
+
+
+def register_enum(*enum_types: Type[Enum]) -> None:
+    """Allow these Enum classes to be decoded from cached values."""
+    for enum_type in enum_types:
+        if not (isinstance(enum_type, type) and issubclass(enum_type, Enum)):
+            raise TypeError(f"{enum_type!r} is not an Enum")
+        _enum_types[_enum_name(enum_type)] = enum_type
+
+
+def _resolve_enum(name: str) -> Type[Enum]:
+    """Look up a registered Enum class by module:qualname."""
+    enum_type = _enum_types.get(name)
+    if enum_type is None:
+        raise ValueError(f"Enum {name} is not registered for cache decoding")
+    return enum_type
+
+
+class MsgpackCodec(Codec):
+    """Compact binary codec preserving Decimal, datetime, date, UUID and Enum values."""
+
+    name = "msgpack"
+
+    def _default(self, value: Any) -> Any:
+        # strict_types sends subclasses (str enums, OrderedDict, tuples) here too
+        if isinstance(value, Enum):
+            name = _enum_name(type(value))
+            _enum_types.setdefault(name, type(value))
+            return msgpack.ExtType(EXT_ENUM, self._pack([name, value.value]))
+        if isinstance(value, Decimal):
+            return msgpack.ExtType(EXT_DECIMAL, str(value).encode())
+        if isinstance(value, datetime):
+            return msgpack.ExtType(EXT_DATETIME, value.isoformat().encode())
+        if isinstance(value, date):
+            return msgpack.ExtType(EXT_DATE, value.isoformat().encode())
+        if isinstance(value, UUID):
+            return msgpack.ExtType(EXT_UUID, value.bytes)
+        if isinstance(value, dict):
+            return dict(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return list(value)
+        for base in (str, int, float, bytes):
+            if isinstance(value, base):
+                return base(value)
+        raise TypeError(f"Cannot encode {type(value).__name__} for the cache")
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == EXT_DECIMAL:
+            return Decimal(data.decode())
+        if code == EXT_DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == EXT_DATE:
+            return date.fromisoformat(data.decode())
+        if code == EXT_UUID:
+            return UUID(bytes=data)
+        if code == EXT_ENUM:
+            name, value = self._unpack(data)
+            return _resolve_enum(name)(value)
+        return msgpack.ExtType(code, data)
+
+    def _pack(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=self._default, use_bin_type=True, strict_types=True)
+
+    def _unpack(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+
+    def encode(self, value: Any) -> bytes:
+        return MSGPACK_MARKER + self._pack(value)
+
+    def decode(self, data: bytes) -> Any:
+        if data[:1] != MSGPACK_MARKER:
+            return json.loads(data)
+        return self._unpack(data[1:])
+
+
+_msgpack = MsgpackCodec()
+
+CODECS = {codec.name: codec for codec in (JSONCodec, MsgpackCodec)}
+
+
+def get_codec(name: str) -> Codec:
+    """Codec instance for a REDIS_CODEC setting value."""
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown Redis codec {name!r}, expected one of {sorted(CODECS)}")
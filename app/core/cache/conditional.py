@@ -0,0 +1,81 @@
+"""
+Conditional GET (ETag / If-None-Match) for read-mostly endpoints.
+
+The ETag is derived only from resource version counters, so deciding
+whether a client's copy is current costs one Redis round trip and no
+database query or serialization.
+"""
+
+from typing import Callable, Dict, Optional, Sequence
+
+from fastapi import Request, Response
+
+from app.core.cache.versions import resource_versions
+from app.core.config import settings
+
+# Clients keep a copy but revalidate on every use (a cheap 304 when unchanged)
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def private_max_age(max_age: Optional[int] = None) -> str:
+    """Cache-Control letting a client reuse its copy for max_age seconds before revalidating."""
+    max_age = settings.catalog_cache_max_age if max_age is None else max_age
+    return f"private, max-age={max_age}"
+
+
+class NotModified(Exception):
+    """Raised by conditional_get when the client's copy is current; rendered as 304."""
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+
+
+def make_etag(resources: Sequence[str], versions: Sequence[int]) -> str:
+    """Weak ETag such as W/"categories.17-services.42"."""
+    return 'W/"' + "-".join(f"{resource}.{version}" for resource, version in zip(resources, versions)) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def conditional_get(
+    *resources: str,
+    cache_control: str = PRIVATE_REVALIDATE,
+    vary: Optional[str] = "Authorization",
+) -> Callable:
+    """
+    Dependency factory adding ETag and Cache-Control to a GET endpoint.
+
+    Raises NotModified (304) when If-None-Match matches the current
+    versions of resources. List it after authentication so unauthenticated
+    requests are still rejected.
+
+    Usage:
+        dependencies=[Depends(get_current_user), Depends(conditional_get("services"))]
+    """
+    async def dependency(request: Request, response: Response) -> None:
+        headers = {"Cache-Control": cache_control}
+        if vary:
+            headers["Vary"] = vary
+
+        versions = await resource_versions.get(*resources)
+        if versions is not None:
+            headers["ETag"] = make_etag(resources, versions)
+            if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+                raise NotModified(headers)
+
+        response.headers.update(headers)
+
+    return dependency
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    """Render NotModified as an empty 304 response."""
+    return Response(status_code=304, headers=exc.headers)
@@ -1,101 +1,205 @@
-from typing import Optional
-from contextlib import contextmanager
+"""
+Asyncio distributed lock on Redis with fencing tokens and lease renewal.
+
+Every successful acquisition is issued a fencing token from a single Redis
+counter, so tokens grow monotonically across all holders. A holder whose
+lease expired (GC pause, slow query) can detect it with validate() and any
+store that remembers the highest token it has seen can reject its writes.
+"""
+
+from typing import Optional, AsyncIterator
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+import random
 import uuid
-import time
 
-from app.core.cache.redis_client import redis_client
+from app.core.cache.async_redis_client import AsyncRedisClient, async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Shared counter issuing fencing tokens
+FENCING_COUNTER_KEY = "lock:fencing_token"
+
+# Set the lock only if free and stamp it with the next fencing token.
+# The stored value is "<owner>:<token>"; returns the token or 0.
+ACQUIRE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return 0
+end
+local token = redis.call("INCR", KEYS[2])
+redis.call("SET", KEYS[1], ARGV[1] .. ":" .. token, "PX", ARGV[2])
+return token
+"""
+
+# Only release if we own the lock
+RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Only extend if we own the lock
+EXTEND_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class LockAcquisitionError(RuntimeError):
+    """Raised when a lock cannot be acquired within its blocking timeout."""
 
 
 class DistributedLock:
-    """Distributed lock implementation using Redis."""
+    """
+    Distributed lock implementation using Redis.
+
+    Waiting uses exponential backoff with jitter and never blocks the event
+    loop. With auto_renew the lease is extended every timeout / 3 seconds
+    until release(). The lock fails closed: if Redis is unavailable or
+    errors, acquire() returns False.
+    """
 
     def __init__(
         self,
         key: str,
-        timeout: int = 10,
+        timeout: float = 10,
         blocking: bool = True,
-        blocking_timeout: int = 5,
+        blocking_timeout: float = 5,
+        auto_renew: bool = False,
+        redis: AsyncRedisClient = async_redis_client,
+        initial_backoff: float = 0.01,
+        max_backoff: float = 0.5,
     ):
         self.key = f"lock:{key}"
         self.timeout = timeout
         self.blocking = blocking
         self.blocking_timeout = blocking_timeout
-        self.token = str(uuid.uuid4())
-        self.redis = redis_client.client
-
-    def acquire(self) -> bool:
-        """Acquire the lock."""
-        if not self.redis:
-            return True  # If Redis is not available, allow operation
-
-        if self.blocking:
-            start_time = time.time()
-            while True:
-                if self._try_acquire():
-                    return True
-                if time.time() - start_time >= self.blocking_timeout:
-                    return False
-                time.sleep(0.1)
-        else:
-            return self._try_acquire()
-
-    def _try_acquire(self) -> bool:
-        """Try to acquire the lock once."""
-        if not self.redis:
-            return True
-        
+        self.auto_renew = auto_renew
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.owner = uuid.uuid4().hex
+        self.fencing_token: Optional[int] = None
+        self.lost = False
+        self._redis = redis
+        self._renewal: Optional[asyncio.Task] = None
+
+    @property
+    def _value(self) -> str:
+        return f"{self.owner}:{self.fencing_token}"
+
+    @property
+    def _ttl_ms(self) -> int:
+        return int(self.timeout * 1000)
+
+    async def acquire(self) -> bool:
+        """Acquire the lock, waiting up to blocking_timeout when blocking."""
+        client = self._redis.client
+        if not client:
+            logger.warning(f"Redis unavailable, refusing lock {self.key}")
+            return False
+
+        script = client.register_script(ACQUIRE_SCRIPT)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.blocking_timeout
+        delay = self.initial_backoff
+
+        while True:
+            try:
+                token = await script(keys=[self.key, FENCING_COUNTER_KEY], args=[self.owner, self._ttl_ms])
+            except Exception as e:
+                logger.error(f"Failed to acquire lock {self.key}: {str(e)}")
+                return False
+
+            if token:
+                self.fencing_token = int(token)
+                self.lost = False
+                if self.auto_renew:
+                    self._renewal = asyncio.create_task(self._renew(), name=f"lock-renewal:{self.key}")
+                return True
+
+            remaining = deadline - loop.time()
+            if not self.blocking or remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay * random.uniform(0.5, 1.0), remaining))
+            delay = min(delay * 2, self.max_backoff)
+
+    async def extend(self, timeout: Optional[float] = None) -> bool:
+        """Reset the lease to timeout seconds if we still own the lock."""
+        client = self._redis.client
+        if not client or self.fencing_token is None:
+            return False
+        ttl_ms = int(timeout * 1000) if timeout is not None else self._ttl_ms
         try:
-            # SET NX EX - atomic operation
-            result = self.redis.set(
-                self.key,
-                self.token,
-                nx=True,
-                ex=self.timeout,
-            )
-            return bool(result)
-        except:
-            return True  # Allow operation if Redis fails
-
-    def release(self) -> bool:
-        """Release the lock if we own it."""
-        if not self.redis:
-            return True
+            script = client.register_script(EXTEND_SCRIPT)
+            return bool(await script(keys=[self.key], args=[self._value, ttl_ms]))
+        except Exception as e:
+            logger.error(f"Failed to extend lock {self.key}: {str(e)}")
+            return False
 
+    async def validate(self) -> bool:
+        """Check that we still hold the lock with our fencing token."""
+        client = self._redis.client
+        if not client or self.fencing_token is None or self.lost:
+            return False
         try:
-            # Use Lua script for atomic check-and-delete
-            lua_script = """
-            if redis.call("get", KEYS[1]) == ARGV[1] then
-                return redis.call("del", KEYS[1])
-            else
-                return 0
-            end
-            """
-            result = self.redis.eval(lua_script, 1, self.key, self.token)
-            return bool(result)
-        except:
+            return await client.get(self.key) == self._value.encode()
+        except Exception:
             return False
 
-    def __enter__(self):
-        if not self.acquire():
-            raise RuntimeError(f"Could not acquire lock for {self.key}")
+    async def release(self) -> bool:
+        """Release the lock if we own it."""
+        await self._stop_renewal()
+        client = self._redis.client
+        if not client or self.fencing_token is None:
+            return False
+        try:
+            script = client.register_script(RELEASE_SCRIPT)
+            return bool(await script(keys=[self.key], args=[self._value]))
+        except Exception as e:
+            logger.error(f"Failed to release lock {self.key}: {str(e)}")
+            return False
+
+    async def _renew(self) -> None:
+        """Extend the lease every timeout / 3 seconds until cancelled or lost."""
+        interval = self.timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            if not await self.extend():
+                self.lost = True
+                logger.warning(f"Lost lease on lock {self.key} (fencing token {self.fencing_token})")
+                return
+
+    async def _stop_renewal(self) -> None:
+        if self._renewal:
+            self._renewal.cancel()
+            try:
+                await self._renewal
+            except asyncio.CancelledError:
+                pass
+            self._renewal = None
+
+    async def __aenter__(self):
+        if not await self.acquire():
+            raise LockAcquisitionError(f"Could not acquire lock for {self.key}")
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.release()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()
 
 
-@contextmanager
-def distributed_lock(
+@asynccontextmanager
+async def distributed_lock(
     key: str,
-    timeout: int = 10,
+    timeout: float = 10,
     blocking: bool = True,
-    blocking_timeout: int = 5,
-):
+    blocking_timeout: float = 5,
+    auto_renew: bool = False,
+) -> AsyncIterator[DistributedLock]:
     """Context manager for distributed locking."""
-    lock = DistributedLock(key, timeout, blocking, blocking_timeout)
-    try:
-        if not lock.acquire():
-            raise RuntimeError(f"Could not acquire lock for {key}")
+    lock = DistributedLock(key, timeout, blocking, blocking_timeout, auto_renew)
+    async with lock:
         yield lock
-    finally:
-        lock.release()
\ No newline at end of file
@@ -0,0 +1,308 @@
+"""
+Two-tier cache: a per-worker in-process LRU in front of Redis.
+
+Reads are served from local memory when possible and fall back to Redis.
+Writes, deletes and tag invalidations go to Redis first and are then
+broadcast on a pub/sub channel so every other worker and node drops its
+local copy.
+"""
+
+from typing import Optional, Any, Dict, Iterable, List, Sequence, Union
+from collections import OrderedDict
+from datetime import timedelta
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+from app.core.cache.async_redis_client import AsyncRedisClient, async_redis_client
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LocalLRUCache:
+    """Bounded in-process LRU cache with per-entry TTL and usage counters."""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, refreshing its LRU position. Expired entries count as misses."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        ttl = self.default_ttl if ttl is None else min(ttl, self.default_ttl)
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Drop a single key."""
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Usage counters for sizing the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+class NearCache:
+    """
+    Read-through local cache in front of AsyncRedisClient.
+
+    Values held locally are the decoded objects returned by Redis and are
+    shared between callers, so they must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        redis: AsyncRedisClient = async_redis_client,
+        max_entries: int = settings.near_cache_max_entries,
+        local_ttl: float = settings.near_cache_ttl,
+        channel: str = settings.near_cache_channel,
+        enabled: bool = settings.near_cache_enabled,
+    ):
+        self._redis = redis
+        self._local = LocalLRUCache(max_entries=max_entries, default_ttl=local_ttl)
+        self.channel = channel
+        self.enabled = enabled
+        self.node_id = uuid.uuid4().hex
+        # Bumped on every write, delete and invalidation (local or remote)
+        # so in-flight reads never repopulate the local tier with a value
+        # that was just replaced or removed.
+        self._generation = 0
+        self._listener: Optional[asyncio.Task] = None
+        self._pubsub = None
+
+    @property
+    def local(self) -> LocalLRUCache:
+        """The in-process tier."""
+        return self._local
+
+    @property
+    def redis(self) -> AsyncRedisClient:
+        """The Redis tier."""
+        return self._redis
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value from the local tier, falling back to Redis."""
+        if self.enabled:
+            value = self._local.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        generation = self._generation
+        value = await self._redis.get(key)
+        if self.enabled and value is not None and generation == self._generation:
+            self._local.set(key, value)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[Union[int, timedelta]] = None,
+        tags: Sequence[str] = (),
+    ) -> bool:
+        """Write through to Redis and tell other workers to drop their copy."""
+        result = await self._redis.set(key, value, ttl=ttl, tags=tags)
+        if self.enabled:
+            self.invalidate_local([key])
+            # Only keep locally what Redis actually holds
+            if result:
+                if isinstance(ttl, timedelta):
+                    ttl = ttl.total_seconds()
+                self._local.set(key, value, ttl=ttl)
+                await self._publish([key])
+        return result
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Get several values: local hits first, the rest in one Redis MGET."""
+        values = [self._local.get(key, _MISSING) if self.enabled else _MISSING for key in keys]
+        missing = [i for i, value in enumerate(values) if value is _MISSING]
+        if missing:
+            generation = self._generation
+            fetched = await self._redis.mget([keys[i] for i in missing])
+            for i, value in zip(missing, fetched):
+                values[i] = value
+                if self.enabled and value is not None and generation == self._generation:
+                    self._local.set(keys[i], value)
+        return values
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[Union[int, timedelta]] = None,
+        tags: Sequence[str] = (),
+    ) -> bool:
+        """Write several values through to Redis in one round trip and one invalidation message."""
+        result = await self._redis.mset(mapping, ttl=ttl, tags=tags)
+        if self.enabled and mapping:
+            self.invalidate_local(mapping)
+            if result:
+                if isinstance(ttl, timedelta):
+                    ttl = ttl.total_seconds()
+                for key, value in mapping.items():
+                    self._local.set(key, value, ttl=ttl)
+                await self._publish(list(mapping))
+        return result
+
+    async def delete(self, *keys: str) -> int:
+        """Delete keys from Redis and every worker's local tier."""
+        if not keys:
+            return 0
+        deleted = await self._redis.delete(*keys)
+        if self.enabled:
+            self.invalidate_local(keys)
+            await self._publish(list(keys))
+        return deleted
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key registered under these tags from Redis and every worker's local tier."""
+        keys = await self._redis.invalidate_tags(*tags)
+        if self.enabled and keys:
+            self.invalidate_local(keys)
+            await self._publish(keys)
+        return len(keys)
+
+    def invalidate_local(self, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop keys (or everything when keys is None) from this worker only.
+
+        Also stops reads already in flight from filling the local tier.
+        """
+        self._generation += 1
+        if keys is None:
+            self._local.clear()
+            return
+        for key in keys:
+            self._local.delete(key)
+
+    async def _publish(self, keys: Optional[list]) -> None:
+        """Broadcast an invalidation message to other workers."""
+        client = self._redis.client
+        if not client:
+            return
+        try:
+            message = json.dumps({"origin": self.node_id, "keys": keys})
+            await client.publish(self.channel, message)
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {str(e)}")
+
+    def _handle_message(self, data: Union[str, bytes]) -> None:
+        """Apply an invalidation message received from the channel."""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed cache invalidation message")
+            return
+        if message.get("origin") == self.node_id:
+            return
+        self.invalidate_local(message.get("keys"))
+
+    async def start(self) -> None:
+        """Subscribe to the invalidation channel (called from app lifespan)."""
+        client = self._redis.client
+        if not self.enabled or not client or self._listener:
+            return
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(), name="near-cache-invalidation")
+
+    async def _listen(self) -> None:
+        """Consume invalidation messages until cancelled."""
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message and message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Connection dropped: local entries may now be stale.
+                logger.error(f"Cache invalidation listener error: {str(e)}")
+                self.invalidate_local()
+                await asyncio.sleep(1)
+
+    async def stop(self) -> None:
+        """Stop listening and release the pub/sub connection."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub:
+            try:
+                await self._pubsub.unsubscribe(self.channel)
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for the local tier."""
+        return {"enabled": self.enabled, **self._local.stats()}
+
+
+# Singleton instance
+near_cache = NearCache()
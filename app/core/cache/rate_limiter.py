@@ -1,17 +1,118 @@
 from typing import Optional, Tuple
-from datetime import datetime, timedelta
+from collections import OrderedDict
+import time
+import uuid
 
-from app.core.cache.redis_client import redis_client
+from app.core.cache.async_redis_client import async_redis_client
 from app.core.config import settings
 
 
+# Trim, count, conditionally add and set TTL as one atomic server-side step.
+# Returns {allowed, remaining, reset_ms}; reset_ms is 0 when allowed.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call("ZREMRANGEBYSCORE", key, 0, now - window)
+local count = redis.call("ZCARD", key)
+
+if count < limit then
+    redis.call("ZADD", key, now, ARGV[4])
+    redis.call("PEXPIRE", key, window)
+    return {1, limit - count - 1, 0}
+end
+
+local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+local reset = now + window
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window
+end
+return {0, 0, reset}
+"""
+
+
+class LocalTokenBucket:
+    """
+    Per-worker token buckets used as a pre-filter in front of Redis.
+
+    Each bucket holds at most max_requests tokens and refills at
+    max_requests / window_seconds. A token is only kept for a request Redis
+    admits (denied requests are refunded), so the bucket counts this
+    worker's share of the client's global window. Once it is empty the
+    client has spent roughly the whole limit through this worker alone and
+    the request can be rejected without a Redis round trip. The continuous
+    refill is an approximation of the sliding window, not an exact match.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    def consume(self, key: str, capacity: int, window_seconds: int) -> Tuple[bool, float]:
+        """
+        Take one token for key.
+
+        Returns:
+            (allowed, seconds_until_next_token)
+        """
+        now = time.monotonic()
+        rate = capacity / window_seconds
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [float(capacity), now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        tokens, last = bucket
+        tokens = min(float(capacity), tokens + (now - last) * rate)
+        bucket[1] = now
+
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return True, 0.0
+
+        bucket[0] = tokens
+        return False, (1 - tokens) / rate
+
+    def refund(self, key: str, capacity: int) -> None:
+        """Give back the token taken for a request that was rejected after all."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket[0] = min(float(capacity), bucket[0] + 1)
+
+    def clear(self) -> None:
+        """Drop all buckets."""
+        self._buckets.clear()
+
+
 class RateLimiter:
     """Rate limiter using Redis for distributed rate limiting."""
 
     def __init__(self):
-        self.redis = redis_client.client
+        self._redis_client = async_redis_client
+        self._script = None
+        self._script_client = None
+        self.local_bucket = LocalTokenBucket(settings.rate_limit_local_max_keys)
 
-    def check_rate_limit(
+    @property
+    def redis(self):
+        """Async Redis client, available once the app lifespan has started."""
+        return self._redis_client.client
+
+    def _sliding_window(self):
+        """Registered Lua script (EVALSHA with EVAL fallback) for the current client."""
+        client = self.redis
+        if self._script_client is not client:
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+            self._script_client = client
+        return self._script
+
+    async def check_rate_limit(
         self,
         key: str,
         max_requests: int,
@@ -19,67 +120,58 @@ class RateLimiter:
     ) -> Tuple[bool, int, Optional[int]]:
         """
         Check if request is within rate limit.
-        
+
         Returns:
             (allowed, remaining_requests, reset_time_seconds)
         """
-        if not settings.rate_limit_enabled or not self.redis:
+        if not settings.rate_limit_enabled:
+            return True, max_requests, None
+
+        # Reject abusive clients locally without touching Redis
+        prefilter = settings.rate_limit_local_prefilter
+        if prefilter:
+            allowed, retry_after = self.local_bucket.consume(key, max_requests, window_seconds)
+            if not allowed:
+                return False, 0, int(time.time() + retry_after) + 1
+
+        if not self.redis:
             return True, max_requests, None
 
         try:
-            # Use sliding window with Redis
-            now = datetime.utcnow()
-            window_start = now - timedelta(seconds=window_seconds)
-            
-            # Clean old entries
-            self.redis.zremrangebyscore(
-                key,
-                0,
-                window_start.timestamp(),
+            now_ms = int(time.time() * 1000)
+            allowed, remaining, reset_ms = await self._sliding_window()(
+                keys=[key],
+                args=[now_ms, window_seconds * 1000, max_requests, f"{now_ms}:{uuid.uuid4().hex}"],
             )
-            
-            # Count requests in window
-            request_count = self.redis.zcard(key)
-            
-            if request_count < max_requests:
-                # Add current request
-                self.redis.zadd(key, {str(now.timestamp()): now.timestamp()})
-                self.redis.expire(key, window_seconds)
-                
-                remaining = max_requests - request_count - 1
-                return True, remaining, None
-            else:
-                # Get oldest request time for reset calculation
-                oldest = self.redis.zrange(key, 0, 0, withscores=True)
-                if oldest:
-                    reset_time = int(oldest[0][1]) + window_seconds
-                else:
-                    reset_time = int(now.timestamp()) + window_seconds
-                
-                return False, 0, reset_time
-        except:
+            if allowed:
+                return True, int(remaining), None
+            # Not counted in the Redis window, so it must not drain the local bucket
+            if prefilter:
+                self.local_bucket.refund(key, max_requests)
+            return False, 0, int(reset_ms) // 1000
+        except Exception:
             # Allow request if Redis fails
             return True, max_requests, None
 
-    def check_ip_rate_limit(self, ip: str) -> Tuple[bool, int, Optional[int]]:
+    async def check_ip_rate_limit(self, ip: str) -> Tuple[bool, int, Optional[int]]:
         """Check rate limit for IP address."""
         key = f"rate_limit:ip:{ip}"
-        return self.check_rate_limit(
+        return await self.check_rate_limit(
             key,
             settings.rate_limit_requests_per_minute,
             60,
         )
 
-    def check_user_rate_limit(self, user_id: str) -> Tuple[bool, int, Optional[int]]:
+    async def check_user_rate_limit(self, user_id: str) -> Tuple[bool, int, Optional[int]]:
         """Check rate limit for user."""
         key = f"rate_limit:user:{user_id}"
-        return self.check_rate_limit(
+        return await self.check_rate_limit(
             key,
             settings.rate_limit_requests_per_minute * 2,  # Higher limit for authenticated users
             60,
         )
 
-    def check_endpoint_rate_limit(
+    async def check_endpoint_rate_limit(
         self,
         endpoint: str,
         identifier: str,
@@ -88,8 +180,8 @@ class RateLimiter:
     ) -> Tuple[bool, int, Optional[int]]:
         """Check rate limit for specific endpoint."""
         key = f"rate_limit:endpoint:{endpoint}:{identifier}"
-        return self.check_rate_limit(key, max_requests, window_seconds)
+        return await self.check_rate_limit(key, max_requests, window_seconds)
 
 
 # Singleton instance
-rate_limiter = RateLimiter()
\ No newline at end of file
+rate_limiter = RateLimiter()
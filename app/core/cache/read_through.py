@@ -0,0 +1,259 @@
+"""
+Read-through caching with cache stampede protection.
+
+cached(key, loader, ttl) returns the cached value or loads and stores it.
+It stops a hot key from sending every concurrent request to the database
+when the key expires:
+
+- Single-flight: concurrent misses for a key in one worker share a single
+  loader call.
+- Redis lock (lock=True): across workers, one loads while the others wait
+  for its result.
+- Probabilistic early refresh: as expiry approaches, a request now and then
+  refreshes the entry in the background. The chance grows with how long the
+  loader takes, so hot keys are usually refreshed before they expire.
+- Stale-while-revalidate: for stale_ttl seconds after expiry the old value
+  is still served while one background refresh replaces it.
+
+Background refreshes outlive the request that triggered them, so they run
+refresher(), which must not touch the request's session (open one with
+read_session() instead). Without a refresher there is no early refresh, and
+an expired entry is reloaded inline with loader(); the stale value is only
+served if that load fails.
+
+Entries are stored as {"value", "expires_at", "delta"} envelopes with a
+Redis TTL of ttl + stale_ttl. A None result is returned but never cached.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, TypeVar, Union
+import asyncio
+import logging
+import math
+import random
+import time
+
+from app.core.cache.distributed_lock import DistributedLock
+from app.core.cache.near_cache import NearCache, near_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Loader = Callable[[], Awaitable[Optional[T]]]
+
+# Fixed tags, or a function deriving them from the loaded value
+Tags = Union[Sequence[str], Callable[[Any], Sequence[str]]]
+
+ENTRY_FIELDS = frozenset(("value", "expires_at", "delta"))
+
+
+def _wrap(value: Any, ttl: float, delta: float) -> Dict[str, Any]:
+    return {"value": value, "expires_at": time.time() + ttl, "delta": delta}
+
+
+def _unwrap(entry: Any, stale_ttl: float) -> Optional[Dict[str, Any]]:
+    """The envelope if it is still servable, otherwise None (a miss)."""
+    if not isinstance(entry, dict) or entry.keys() != ENTRY_FIELDS:
+        return None
+    # The local tier may outlive the Redis TTL by a few seconds
+    if time.time() >= entry["expires_at"] + stale_ttl:
+        return None
+    return entry
+
+
+def _should_refresh_early(entry: Dict[str, Any], beta: float) -> bool:
+    """XFetch: refresh with rising probability as expires_at approaches."""
+    if beta <= 0:
+        return False
+    jitter = -math.log(1.0 - random.random())
+    return time.time() + entry["delta"] * beta * jitter >= entry["expires_at"]
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one task per worker."""
+
+    def __init__(self):
+        self._flights: Dict[str, asyncio.Task] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._flights
+
+    def _start(self, key: str, fn: Callable[[], Awaitable[T]]) -> asyncio.Task:
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.create_task(fn(), name=f"single-flight:{key}")
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Retrieve the outcome so unawaited background failures are not reported twice
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or wait for the call already in flight for key."""
+        # Shielded so one cancelled caller does not cancel the others' load
+        return await asyncio.shield(self._start(key, fn))
+
+    def start(self, key: str, fn: Callable[[], Awaitable[T]]) -> None:
+        """Run fn in the background unless a call for key is already in flight."""
+        self._start(key, fn)
+
+
+_single_flight = SingleFlight()
+
+
+async def _compute(
+    key: str,
+    loader: Loader,
+    ttl: float,
+    stale_ttl: float,
+    tags: Tags,
+    cache: NearCache,
+) -> Optional[T]:
+    start = time.perf_counter()
+    value = await loader()
+    delta = time.perf_counter() - start
+    if value is not None:
+        if callable(tags):
+            tags = tags(value)
+        await cache.set(key, _wrap(value, ttl, delta), ttl=int(ttl + stale_ttl), tags=tags)
+    return value
+
+
+async def _load(
+    key: str,
+    loader: Loader,
+    ttl: float,
+    stale_ttl: float,
+    lock: bool,
+    tags: Tags,
+    cache: NearCache,
+) -> Optional[T]:
+    if not lock or not cache.redis.client:
+        return await _compute(key, loader, ttl, stale_ttl, tags, cache)
+
+    timeout = settings.cache_lock_timeout
+    distributed = DistributedLock(f"cache:{key}", timeout=timeout, blocking_timeout=timeout, redis=cache.redis)
+    acquired = await distributed.acquire()
+    try:
+        # Another worker may have stored a fresh value while we waited
+        cache.invalidate_local([key])
+        entry = _unwrap(await cache.get(key), stale_ttl)
+        if entry is not None and entry["expires_at"] > time.time():
+            return entry["value"]
+        if not acquired:
+            logger.warning(f"Timed out waiting for cache lock on {key}, loading anyway")
+        return await _compute(key, loader, ttl, stale_ttl, tags, cache)
+    finally:
+        if acquired:
+            await distributed.release()
+
+
+async def _refresh(
+    key: str,
+    loader: Loader,
+    ttl: float,
+    stale_ttl: float,
+    lock: bool,
+    tags: Tags,
+    cache: NearCache,
+) -> None:
+    try:
+        await _load(key, loader, ttl, stale_ttl, lock, tags, cache)
+    except Exception as e:
+        logger.error(f"Background refresh of cache key {key} failed: {str(e)}")
+
+
+async def cached(
+    key: str,
+    loader: Loader,
+    ttl: float,
+    *,
+    stale_ttl: Optional[float] = None,
+    early_refresh: Optional[float] = None,
+    lock: bool = False,
+    tags: Tags = (),
+    cache: NearCache = near_cache,
+    refresher: Optional[Loader] = None,
+) -> Optional[T]:
+    """
+    Return the value cached under key, loading it with loader() on a miss.
+
+    Args:
+        ttl: Seconds the value is fresh.
+        stale_ttl: Seconds an expired value may still be served while it is
+            refreshed in the background (CACHE_STALE_TTL by default).
+        early_refresh: XFetch beta; 0 disables early refresh
+            (CACHE_EARLY_REFRESH_BETA by default).
+        lock: Also coalesce misses across workers with a Redis lock.
+        tags: Tags the entry is registered under for invalidate_tags(), or
+            a function returning them for the loaded value.
+        refresher: Loader safe to run after the request has finished, used
+            for background refreshes. loader() usually reads through the
+            request's session, which cannot be shared with a concurrent task.
+
+    Usage:
+        services = await cached("popular_services", repository.list_popular, ttl=1800)
+    """
+    stale_ttl = settings.cache_stale_ttl if stale_ttl is None else stale_ttl
+    beta = settings.cache_early_refresh_beta if early_refresh is None else early_refresh
+
+    entry = _unwrap(await cache.get(key), stale_ttl)
+    if entry is None:
+        return await _single_flight.do(key, lambda: _load(key, loader, ttl, stale_ttl, lock, tags, cache))
+
+    expired = entry["expires_at"] <= time.time()
+    if refresher is not None:
+        if expired or _should_refresh_early(entry, beta):
+            _single_flight.start(key, lambda: _refresh(key, refresher, ttl, stale_ttl, lock, tags, cache))
+    elif expired:
+        try:
+            return await _single_flight.do(key, lambda: _load(key, loader, ttl, stale_ttl, lock, tags, cache))
+        except Exception as e:
+            logger.error(f"Refresh of cache key {key} failed, serving stale value: {str(e)}")
+    return entry["value"]
+
+
+async def store(
+    key: str,
+    value: Any,
+    ttl: float,
+    *,
+    stale_ttl: Optional[float] = None,
+    tags: Sequence[str] = (),
+    cache: NearCache = near_cache,
+) -> bool:
+    """Write a value that cached() and peek() will read back."""
+    stale_ttl = settings.cache_stale_ttl if stale_ttl is None else stale_ttl
+    return await cache.set(key, _wrap(value, ttl, 0.0), ttl=int(ttl + stale_ttl), tags=tags)
+
+
+async def store_many(
+    values: Dict[str, Any],
+    ttl: float,
+    *,
+    stale_ttl: Optional[float] = None,
+    tags: Sequence[str] = (),
+    cache: NearCache = near_cache,
+) -> bool:
+    """store() for several keys in one round trip."""
+    stale_ttl = settings.cache_stale_ttl if stale_ttl is None else stale_ttl
+    entries = {key: _wrap(value, ttl, 0.0) for key, value in values.items()}
+    return await cache.set_many(entries, ttl=int(ttl + stale_ttl), tags=tags)
+
+
+async def peek(
+    key: str,
+    *,
+    stale_ttl: Optional[float] = None,
+    cache: NearCache = near_cache,
+) -> Optional[Any]:
+    """The cached value, fresh or stale, without loading or refreshing it."""
+    stale_ttl = settings.cache_stale_ttl if stale_ttl is None else stale_ttl
+    entry = _unwrap(await cache.get(key), stale_ttl)
+    return entry["value"] if entry is not None else None
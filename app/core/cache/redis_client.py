@@ -1,9 +1,9 @@
-from typing import Optional, Any, Union
-import json
+from typing import Optional, Any, Union, Dict, List, Sequence
 import redis
 from redis import ConnectionPool
 from datetime import timedelta
 
+from app.core.cache.codec import Codec, get_codec
 from app.core.config import settings
 
 
@@ -22,6 +22,7 @@ class RedisClient:
         if not hasattr(self, "_initialized"):
             self._initialized = True
             self._client: Optional[redis.Redis] = None
+            self.codec: Codec = get_codec(settings.redis_codec)
             if settings.redis_url:
                 self._setup_connection()
 
@@ -31,7 +32,6 @@ class RedisClient:
             self._pool = redis.ConnectionPool.from_url(
                 settings.redis_url,
                 max_connections=settings.redis_max_connections,
-                decode_responses=True,
             )
         self._client = redis.Redis(connection_pool=self._pool)
 
@@ -56,11 +56,20 @@ class RedisClient:
         try:
             value = self._client.get(key)
             if value:
-                return json.loads(value)
+                return self.codec.decode(value)
             return None
         except:
             return None
 
+    def mget(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Get several values in one round trip, None for each miss."""
+        if not self._client or not keys:
+            return [None] * len(keys)
+        try:
+            return [self.codec.decode(value) if value else None for value in self._client.mget(keys)]
+        except:
+            return [None] * len(keys)
+
     def set(
         self,
         key: str,
@@ -71,7 +80,7 @@ class RedisClient:
         if not self._client:
             return False
         try:
-            serialized = json.dumps(value)
+            serialized = self.codec.encode(value)
             if ttl is None:
                 ttl = settings.redis_ttl
             elif isinstance(ttl, timedelta):
@@ -80,6 +89,26 @@ class RedisClient:
         except:
             return False
 
+    def mset(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Set several values with a shared TTL in one round trip."""
+        if not self._client or not mapping:
+            return False
+        try:
+            if ttl is None:
+                ttl = settings.redis_ttl
+            elif isinstance(ttl, timedelta):
+                ttl = int(ttl.total_seconds())
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, self.codec.encode(value))
+            return all(pipe.execute())
+        except:
+            return False
+
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
         if not self._client:
@@ -0,0 +1,119 @@
+"""
+Per-resource version counters shared by all workers through Redis.
+
+Repositories mark the resources they write with mark_changed(session, ...)
+and the counters are bumped once the session commits, so a version is
+never observed before the data it describes. Counters are seeded with the
+current time in milliseconds rather than 0, so a Redis flush can never hand
+out a version a client has already seen.
+"""
+
+from typing import Iterable, List, Optional, Set
+import asyncio
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache.async_redis_client import AsyncRedisClient, async_redis_client
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "version:"
+
+# Session.info key holding resources written in the current transaction
+CHANGED_RESOURCES_KEY = "changed_resources"
+
+# Read every counter, seeding missing ones with ARGV[1]
+GET_SCRIPT = """
+local versions = {}
+for i, key in ipairs(KEYS) do
+    redis.call("SET", key, ARGV[1], "NX")
+    versions[i] = redis.call("GET", key)
+end
+return versions
+"""
+
+# Increment every counter, seeding missing ones with ARGV[1] first
+BUMP_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    redis.call("SET", key, ARGV[1], "NX")
+    redis.call("INCR", key)
+end
+return #KEYS
+"""
+
+
+def _seed() -> int:
+    return int(time.time() * 1000)
+
+
+class ResourceVersions:
+    """Version counters for cacheable resources (categories, services, wash bays, ...)."""
+
+    def __init__(self, redis: AsyncRedisClient = async_redis_client):
+        self._redis = redis
+
+    @staticmethod
+    def _keys(resources: Iterable[str]) -> List[str]:
+        return [f"{VERSION_KEY_PREFIX}{resource}" for resource in resources]
+
+    async def get(self, *resources: str) -> Optional[List[int]]:
+        """Current versions in one round trip, or None if Redis is unavailable."""
+        client = self._redis.client
+        if not client:
+            return None
+        try:
+            script = client.register_script(GET_SCRIPT)
+            versions = await script(keys=self._keys(resources), args=[_seed()])
+            return [int(version) for version in versions]
+        except Exception as e:
+            logger.warning(f"Failed to read resource versions {resources}: {str(e)}")
+            return None
+
+    async def bump(self, *resources: str) -> bool:
+        """Invalidate every ETag derived from these resources."""
+        client = self._redis.client
+        if not client or not resources:
+            return False
+        try:
+            script = client.register_script(BUMP_SCRIPT)
+            await script(keys=self._keys(resources), args=[_seed()])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to bump resource versions {resources}: {str(e)}")
+            return False
+
+
+_pending_bumps: Set[asyncio.Task] = set()
+
+
+def mark_changed(session, *resources: str) -> None:
+    """Bump these resource versions when the session's transaction commits."""
+    session.info.setdefault(CHANGED_RESOURCES_KEY, set()).update(resources)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_after_commit(session: Session) -> None:
+    resources = session.info.pop(CHANGED_RESOURCES_KEY, None)
+    if not resources:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.debug(f"No event loop, not bumping resource versions {resources}")
+        return
+    task = loop.create_task(resource_versions.bump(*sorted(resources)))
+    # Keep a reference until done so the task is not garbage collected
+    _pending_bumps.add(task)
+    task.add_done_callback(_pending_bumps.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(CHANGED_RESOURCES_KEY, None)
+
+
+# Singleton instance
+resource_versions = ResourceVersions()
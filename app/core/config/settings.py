@@ -37,10 +37,92 @@ class Settings(BaseSettings):
     database_pool_timeout: int = Field(default=30, alias="DATABASE_POOL_TIMEOUT")
     database_echo: bool = Field(default=False, alias="DATABASE_ECHO")
 
+    # Read replicas - JSON list, e.g. ["postgresql+asyncpg://...@replica1/db"]
+    database_replica_urls: list[str] = Field(
+        default_factory=list, alias="DATABASE_REPLICA_URLS"
+    )
+    database_replica_pool_size: int = Field(
+        default=5, alias="DATABASE_REPLICA_POOL_SIZE"
+    )
+    database_replica_max_overflow: int = Field(
+        default=10, alias="DATABASE_REPLICA_MAX_OVERFLOW"
+    )
+    database_replica_retry_seconds: int = Field(
+        default=30, alias="DATABASE_REPLICA_RETRY_SECONDS"
+    )
+
+    # Per-request SQL profiling (Server-Timing header, log fields, N+1 warnings)
+    # Unset: on only with DEBUG, since Server-Timing exposes query counts and timings
+    db_query_profiling: Optional[bool] = Field(default=None, alias="DB_QUERY_PROFILING")
+    db_n_plus_one_threshold: int = Field(
+        default=10, alias="DB_N_PLUS_ONE_THRESHOLD"
+    )
+
+    # Transactional outbox dispatcher (domain events)
+    outbox_dispatcher_enabled: bool = Field(
+        default=True, alias="OUTBOX_DISPATCHER_ENABLED"
+    )
+    outbox_batch_size: int = Field(default=100, alias="OUTBOX_BATCH_SIZE")
+    outbox_poll_interval: float = Field(default=1.0, alias="OUTBOX_POLL_INTERVAL")
+    outbox_max_attempts: int = Field(default=10, alias="OUTBOX_MAX_ATTEMPTS")
+    outbox_retention_days: int = Field(default=7, alias="OUTBOX_RETENTION_DAYS")
+
+    # Background executor for fire-and-forget side effects
+    background_workers: int = Field(default=4, alias="BACKGROUND_WORKERS")
+    background_queue_size: int = Field(default=1000, alias="BACKGROUND_QUEUE_SIZE")
+    background_drain_timeout: float = Field(
+        default=10.0, alias="BACKGROUND_DRAIN_TIMEOUT"
+    )
+
+    # Seconds clients may reuse catalog responses before revalidating their ETag
+    catalog_cache_max_age: int = Field(default=60, alias="CATALOG_CACHE_MAX_AGE")
+
+    # Analytics result cache: closed ranges (ending before today) vs ranges including today
+    analytics_cache_enabled: bool = Field(default=True, alias="ANALYTICS_CACHE_ENABLED")
+    analytics_cache_closed_ttl: int = Field(
+        default=86400, alias="ANALYTICS_CACHE_CLOSED_TTL"
+    )
+    analytics_cache_open_ttl: int = Field(default=60, alias="ANALYTICS_CACHE_OPEN_TTL")
+    # Dashboard sections computed at once (1-4); each holds a pooled connection
+    analytics_dashboard_concurrency: int = Field(
+        default=2, alias="ANALYTICS_DASHBOARD_CONCURRENCY"
+    )
+    # Revenue rollups: seconds between checks for closed days not rolled up yet,
+    # and how many of the most recent closed days each check covers
+    analytics_rollup_interval: float = Field(
+        default=300.0, alias="ANALYTICS_ROLLUP_INTERVAL"
+    )
+    analytics_rollup_backfill_days: int = Field(
+        default=7, alias="ANALYTICS_ROLLUP_BACKFILL_DAYS"
+    )
+
     # Redis
     redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")
     redis_max_connections: int = Field(default=10, alias="REDIS_MAX_CONNECTIONS")
     redis_ttl: int = Field(default=300, alias="REDIS_TTL")
+    # Cache value encoding: "msgpack" (compact, keeps Decimal/datetime/enum types) or "json"
+    redis_codec: Literal["msgpack", "json"] = Field(
+        default="msgpack", alias="REDIS_CODEC"
+    )
+
+    # Near cache (per-worker LRU in front of Redis)
+    near_cache_enabled: bool = Field(default=True, alias="NEAR_CACHE_ENABLED")
+    near_cache_max_entries: int = Field(
+        default=1024, alias="NEAR_CACHE_MAX_ENTRIES"
+    )
+    near_cache_ttl: int = Field(default=30, alias="NEAR_CACHE_TTL")
+    near_cache_channel: str = Field(
+        default="cache:invalidate", alias="NEAR_CACHE_CHANNEL"
+    )
+
+    # Read-through cache stampede protection
+    cache_stale_ttl: int = Field(default=60, alias="CACHE_STALE_TTL")
+    cache_early_refresh_beta: float = Field(
+        default=1.0, alias="CACHE_EARLY_REFRESH_BETA"
+    )
+    cache_lock_timeout: int = Field(default=5, alias="CACHE_LOCK_TIMEOUT")
+    # Minimum lifetime of tag:{tag} sets; keep above the longest cache TTL
+    cache_tag_ttl: int = Field(default=86400, alias="CACHE_TAG_TTL")
 
     # Security
     secret_key: str = Field(
@@ -71,6 +153,10 @@ class Settings(BaseSettings):
     )
     smtp_from_name: str = Field(default="BlingAuto", alias="SMTP_FROM_NAME")
     smtp_use_tls: bool = Field(default=True, alias="SMTP_USE_TLS")
+    # Persistent SMTP connections shared by queued email delivery
+    smtp_pool_size: int = Field(default=2, alias="SMTP_POOL_SIZE")
+    smtp_timeout: float = Field(default=30.0, alias="SMTP_TIMEOUT")
+    smtp_idle_timeout: float = Field(default=60.0, alias="SMTP_IDLE_TIMEOUT")
     frontend_url: str = Field(
         default="http://localhost:3000", alias="FRONTEND_URL"
     )
@@ -83,6 +169,12 @@ class Settings(BaseSettings):
     rate_limit_requests_per_hour: int = Field(
         default=1000, alias="RATE_LIMIT_REQUESTS_PER_HOUR"
     )
+    rate_limit_local_prefilter: bool = Field(
+        default=True, alias="RATE_LIMIT_LOCAL_PREFILTER"
+    )
+    rate_limit_local_max_keys: int = Field(
+        default=10000, alias="RATE_LIMIT_LOCAL_MAX_KEYS"
+    )
 
     # CORS - for lists in env vars, use JSON format: ["item1","item2"]
     cors_origins: list[str] = Field(
@@ -101,6 +193,17 @@ class Settings(BaseSettings):
         alias="CORS_ALLOW_HEADERS"
     )
 
+    # Response compression - gzip for allowlisted types at or above the size threshold
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_minimum_size: int = Field(
+        default=1024, alias="COMPRESSION_MINIMUM_SIZE"
+    )
+    compression_level: int = Field(default=6, alias="COMPRESSION_LEVEL")
+    compression_content_types: list[str] = Field(
+        default_factory=lambda: ["application/json", "text/plain", "text/csv", "text/html"],
+        alias="COMPRESSION_CONTENT_TYPES"
+    )
+
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     log_format: str = Field(
@@ -108,6 +211,20 @@ class Settings(BaseSettings):
         alias="LOG_FORMAT",
     )
 
+    # Metrics (Prometheus)
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
+    metrics_multiproc_dir: str = Field(
+        default="/tmp/prometheus_multiproc", alias="PROMETHEUS_MULTIPROC_DIR"
+    )
+    metrics_sample_interval: float = Field(
+        default=5.0, alias="METRICS_SAMPLE_INTERVAL"
+    )
+
+    # Health checks
+    health_sample_interval: float = Field(
+        default=5.0, alias="HEALTH_SAMPLE_INTERVAL"
+    )
+
     # Business Rules
     max_services_per_booking: int = Field(
         default=10, alias="MAX_SERVICES_PER_BOOKING"
@@ -139,6 +256,12 @@ class Settings(BaseSettings):
     password_min_length: int = Field(default=8, alias="PASSWORD_MIN_LENGTH")
     password_max_length: int = Field(default=128, alias="PASSWORD_MAX_LENGTH")
 
+    @property
+    def query_profiling_enabled(self) -> bool:
+        if self.db_query_profiling is None:
+            return self.debug
+        return self.db_query_profiling
+
     @property
     def is_production(self) -> bool:
         return self.environment == "production"
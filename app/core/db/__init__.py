@@ -4,9 +4,21 @@ from .session import (
     AsyncSessionLocal,
     get_db,
     get_db_session,
+    get_read_db,
+    replica_router,
+    request_session,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from .unit_of_work import UnitOfWork, get_unit_of_work
+from .outbox import OutboxEventModel, OutboxPublisher, OutboxDispatcher, outbox_dispatcher
+from .aggregation import as_date, as_decimal, day_bucket, within_days
+from .profiling import (
+    QueryBudgetExceeded,
+    QueryProfile,
+    assert_query_budget,
+    current_profile,
+    profile_queries,
+)
 
 __all__ = [
     "Base",
@@ -15,7 +27,23 @@ __all__ = [
     "AsyncSessionLocal",
     "get_db",
     "get_db_session",
+    "get_read_db",
+    "replica_router",
+    "request_session",
     "AsyncSession",
     "UnitOfWork",
     "get_unit_of_work",
+    "OutboxEventModel",
+    "OutboxPublisher",
+    "OutboxDispatcher",
+    "outbox_dispatcher",
+    "QueryBudgetExceeded",
+    "QueryProfile",
+    "assert_query_budget",
+    "current_profile",
+    "profile_queries",
+    "as_date",
+    "as_decimal",
+    "day_bucket",
+    "within_days",
 ]
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Helpers for date-bucketed aggregate queries.
+
+Features group rows by day in SQL so analytics read one row per day instead
+of every record in the period:
+
+    day = day_bucket(WalkInServiceModel.started_at)
+    stmt = (
+        select(day, func.sum(WalkInServiceModel.final_amount))
+        .where(*within_days(WalkInServiceModel.started_at, start_date, end_date))
+        .group_by(day)
+    )
+    totals = {as_date(row[0]): row[1] for row in await session.execute(stmt)}
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, List, Optional, Union
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def day_bucket(column: Any) -> ColumnElement:
+    """The calendar day of a timestamp column, for GROUP BY."""
+    return func.date(column)
+
+
+def within_days(column: Any, start_date: date, end_date: date) -> List[ColumnElement]:
+    """
+    Conditions keeping column inside [start_date, end_date], both inclusive.
+
+    The bounds are compared against the raw column (a half-open timestamp
+    range for DateTime columns) so an index on it can still be used.
+    """
+    if column.type.python_type is datetime:
+        start = datetime.combine(start_date, datetime.min.time())
+        end = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+        return [column >= start, column < end]
+    return [column >= start_date, column <= end_date]
+
+
+def as_date(value: Union[date, datetime, str]) -> date:
+    """Normalize a day_bucket() value (SQLite returns ISO strings)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def as_decimal(value: Optional[Any]) -> Decimal:
+    """SUM() results as Decimal; NULL for no rows becomes 0."""
+    if value is None:
+        return Decimal("0")
+    return value if isinstance(value, Decimal) else Decimal(str(value))
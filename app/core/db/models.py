@@ -5,6 +5,7 @@ This ensures all models are properly imported for migrations.
 
 # Core database setup
 from .base import Base
+from .outbox import OutboxEventModel
 
 # Auth feature models
 try:
@@ -96,11 +97,20 @@ try:
 except ImportError as e:
     print(f"✗ Failed to import walk-ins models: {e}")
 
+# Analytics feature models (revenue rollups)
+try:
+    from app.features.analytics.adapters.models import (
+        DailyRevenueRollupModel, DailyServiceRollupModel
+    )
+    print("✓ Analytics models imported successfully")
+except ImportError as e:
+    print(f"✗ Failed to import analytics models: {e}")
+
 # Export metadata for migrations
 metadata = Base.metadata
 
 # Model registry for introspection - only include successfully imported models
-ALL_MODELS = []
+ALL_MODELS = [OutboxEventModel]
 
 # Add auth models if imported
 try:
@@ -162,6 +172,12 @@ try:
 except NameError:
     pass
 
+# Add analytics models if imported
+try:
+    ALL_MODELS.extend([DailyRevenueRollupModel, DailyServiceRollupModel])
+except NameError:
+    pass
+
 print(f"📊 Total models registered: {len(ALL_MODELS)}")
 
 __all__ = [
@@ -0,0 +1,273 @@
+"""
+Transactional outbox for domain events.
+
+Publishing adds a row to outbox_events on the caller's session, so the
+event commits or rolls back together with the business change. A
+background dispatcher in every worker claims due rows in batches with
+SELECT ... FOR UPDATE SKIP LOCKED (workers never block on or double-claim
+each other's rows) and delivers them to EventBus subscribers at least
+once, retrying failures with exponential backoff.
+
+Claiming is its own short transaction: rows are marked in flight with a
+lease and committed before any handler runs, so no row lock or pooled
+connection is held during delivery. Outcomes are recorded in a second
+short transaction. If the worker dies in between, the lease expires and
+another worker claims the row again. Dispatched rows are purged once they
+are older than the retention period.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+import asyncio
+import json
+import logging
+import random
+import time
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, delete, or_, select, update
+
+from app.core.config import settings
+from app.core.db.base import Base
+from app.core.db.session import AsyncSessionLocal
+from app.core.events import EventBus, event_bus
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_PENDING = "pending"
+OUTBOX_IN_FLIGHT = "in_flight"
+OUTBOX_DISPATCHED = "dispatched"
+OUTBOX_FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class OutboxEventModel(Base):
+    """Domain event waiting to be (or already) delivered to subscribers."""
+
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_name = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default=OUTBOX_PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    dispatched_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("ix_outbox_events_status_available_at", "status", "available_at"),
+    )
+
+
+class OutboxPublisher:
+    """
+    Event publisher writing to the outbox in the caller's transaction.
+
+    Drop-in replacement for EventBus.publish in feature event services:
+    publishing is a session.add(), flushed and committed with the request's
+    session.
+    """
+
+    def __init__(self, session):
+        self._session = session
+
+    async def publish(self, event_name: str, event_data: Dict[str, Any]) -> bool:
+        """Record an event for background delivery."""
+        self._session.add(
+            OutboxEventModel(
+                event_name=event_name,
+                payload=json.dumps(event_data, default=str),
+            )
+        )
+        return True
+
+
+class OutboxDispatcher:
+    """Background delivery of outbox events to EventBus subscribers."""
+
+    def __init__(
+        self,
+        bus: EventBus = event_bus,
+        session_factory: Callable = AsyncSessionLocal,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        base_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        handler_timeout: float = 30.0,
+        lease: Optional[float] = None,
+        retention: timedelta = timedelta(days=7),
+        purge_interval: float = 3600.0,
+    ):
+        self.bus = bus
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.handler_timeout = handler_timeout
+        # Deliveries in a batch run concurrently, so a batch normally
+        # finishes within one handler timeout
+        self.lease = 2 * handler_timeout if lease is None else lease
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self._task: Optional[asyncio.Task] = None
+        self._next_purge = 0.0
+
+    def backoff(self, attempts: int) -> float:
+        """Delay before the next attempt, with jitter."""
+        delay = min(self.base_backoff * 2 ** (attempts - 1), self.max_backoff)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def dispatch_batch(self) -> int:
+        """
+        Claim and deliver one batch of due events.
+
+        Returns:
+            Number of events claimed (delivered or rescheduled)
+        """
+        events = await self._claim()
+        if not events:
+            return 0
+        outcomes = await asyncio.gather(*(self._deliver(event) for event in events))
+        await self._record(events, outcomes)
+        return len(events)
+
+    async def _claim(self) -> List[OutboxEventModel]:
+        """Lease a batch of due events, including in-flight ones whose lease expired."""
+        now = _utcnow()
+        async with self.session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(OutboxEventModel)
+                    .where(
+                        or_(
+                            OutboxEventModel.status == OUTBOX_PENDING,
+                            OutboxEventModel.status == OUTBOX_IN_FLIGHT,
+                        ),
+                        OutboxEventModel.available_at <= now,
+                    )
+                    .order_by(OutboxEventModel.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                events = []
+                for event in result.scalars().all():
+                    if event.status == OUTBOX_IN_FLIGHT and event.attempts >= self.max_attempts:
+                        # Its worker died mid-delivery on the final attempt
+                        event.status = OUTBOX_FAILED
+                        event.last_error = "Delivery lease expired"
+                        continue
+                    event.attempts += 1
+                    event.status = OUTBOX_IN_FLIGHT
+                    event.available_at = now + timedelta(seconds=self.lease)
+                    events.append(event)
+        return events
+
+    async def _deliver(self, event: OutboxEventModel) -> Dict[str, Any]:
+        """Deliver one claimed event; returns the column values recording the outcome."""
+        try:
+            await asyncio.wait_for(
+                self.bus.deliver(event.event_name, json.loads(event.payload)),
+                timeout=self.handler_timeout,
+            )
+        except Exception as e:
+            error = str(e)[:2000] or type(e).__name__
+            if event.attempts >= self.max_attempts:
+                logger.error(
+                    f"Giving up on outbox event {event.id} ({event.event_name}) "
+                    f"after {event.attempts} attempts: {error}"
+                )
+                return {"status": OUTBOX_FAILED, "last_error": error}
+            delay = self.backoff(event.attempts)
+            logger.warning(
+                f"Outbox event {event.id} ({event.event_name}) failed, "
+                f"retrying in {delay:.1f}s: {error}"
+            )
+            return {
+                "status": OUTBOX_PENDING,
+                "available_at": _utcnow() + timedelta(seconds=delay),
+                "last_error": error,
+            }
+
+        return {"status": OUTBOX_DISPATCHED, "dispatched_at": _utcnow(), "last_error": None}
+
+    async def _record(self, events: List[OutboxEventModel], outcomes: List[Dict[str, Any]]) -> None:
+        """Store delivery outcomes, skipping rows another worker has claimed since."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                for event, values in zip(events, outcomes):
+                    await session.execute(
+                        update(OutboxEventModel)
+                        .where(
+                            OutboxEventModel.id == event.id,
+                            OutboxEventModel.status == OUTBOX_IN_FLIGHT,
+                            OutboxEventModel.attempts == event.attempts,
+                        )
+                        .values(**values)
+                    )
+
+    async def purge(self) -> int:
+        """Delete dispatched events older than the retention period; returns the rows deleted."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    delete(OutboxEventModel).where(
+                        OutboxEventModel.status == OUTBOX_DISPATCHED,
+                        OutboxEventModel.dispatched_at < _utcnow() - self.retention,
+                    )
+                )
+        return result.rowcount or 0
+
+    async def _purge_if_due(self) -> None:
+        if time.monotonic() < self._next_purge:
+            return
+        self._next_purge = time.monotonic() + self.purge_interval
+        try:
+            purged = await self.purge()
+        except Exception as e:
+            logger.error(f"Outbox purge failed: {str(e)}")
+            return
+        if purged:
+            logger.info(f"Purged {purged} dispatched outbox event(s)")
+
+    async def _run(self) -> None:
+        """Dispatch until cancelled, sleeping only when the outbox is drained."""
+        while True:
+            try:
+                claimed = await self.dispatch_batch()
+            except Exception as e:
+                logger.error(f"Outbox dispatch failed: {str(e)}")
+                claimed = 0
+            if claimed < self.batch_size:
+                await self._purge_if_due()
+                await asyncio.sleep(self.poll_interval)
+
+    async def start(self) -> None:
+        """Start the dispatcher (called from app lifespan)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self) -> None:
+        """Stop the dispatcher; an interrupted batch is retried once its lease expires."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Singleton instance
+outbox_dispatcher = OutboxDispatcher(
+    batch_size=settings.outbox_batch_size,
+    poll_interval=settings.outbox_poll_interval,
+    max_attempts=settings.outbox_max_attempts,
+    retention=timedelta(days=settings.outbox_retention_days),
+)
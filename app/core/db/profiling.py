@@ -0,0 +1,112 @@
+"""
+SQL statement profiling.
+
+Engine-level hooks count statements, total DB time and repeated statement
+shapes for whatever profile is active in the current context (one per HTTP
+request, or one opened explicitly with profile_queries()). With no active
+profile the hooks cost a single ContextVar lookup.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+import re
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|\$\d+|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so executions that differ only by parameters compare equal."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryProfile:
+    """Statement count, DB time and per-shape counts for one unit of work."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed at least threshold times (suspected N+1)."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def server_timing(self) -> str:
+        """Server-Timing header value."""
+        return f'db;dur={self.total_time * 1000:.1f};desc="{self.count} queries"'
+
+    def log_fields(self) -> Dict[str, float]:
+        """Structured log fields."""
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.total_time * 1000, 2),
+        }
+
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar("query_profile", default=None)
+
+
+def current_profile() -> Optional[QueryProfile]:
+    """Profile collecting statements in the current context, if any."""
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """Collect every statement executed in this context into a fresh profile."""
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block runs more statements than its budget."""
+
+
+@contextmanager
+def assert_query_budget(max_queries: int) -> Iterator[QueryProfile]:
+    """Fail if the block executes more than max_queries statements."""
+    with profile_queries() as profile:
+        yield profile
+    if profile.count > max_queries:
+        details = "\n".join(f"  {count}x {shape}" for shape, count in profile.shapes.most_common())
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, executed {profile.count}:\n{details}"
+        )
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    if profile is None:
+        return
+    starts = conn.info.get("query_start")
+    if starts:
+        profile.record(statement, time.perf_counter() - starts.pop())
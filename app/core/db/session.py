@@ -1,27 +1,40 @@
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, List, Optional
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import logging
+import time
+
+from fastapi import Depends
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
-def create_db_engine():
-    """Create async database engine."""
+def create_db_engine(
+    url: Optional[str] = None,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+):
+    """Create async database engine (the primary unless url is given)."""
+    url = url or settings.database_url
     if settings.environment == "testing":
         # Use NullPool for tests to avoid connection issues
         return create_async_engine(
-            settings.database_url,
+            url,
             echo=settings.database_echo,
             poolclass=NullPool,
         )
     else:
         # Use default async pool for production/development
         return create_async_engine(
-            settings.database_url,
+            url,
             echo=settings.database_echo,
-            pool_size=settings.database_pool_size,
-            max_overflow=settings.database_max_overflow,
+            pool_size=pool_size or settings.database_pool_size,
+            max_overflow=settings.database_max_overflow if max_overflow is None else max_overflow,
             pool_timeout=settings.database_pool_timeout,
             pool_pre_ping=True,  # Verify connections before using
         )
@@ -38,9 +51,99 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+class ReplicaRouter:
+    """
+    Routes read-only sessions to read replicas.
+
+    Each replica has its own engine and pool. Replicas are used round-robin
+    and sessions stay lazy (no connection until the first query). A replica
+    that fails to connect or drops a connection is skipped for
+    retry_seconds; when none is healthy (or none is configured), reads go
+    to the primary.
+    """
+
+    def __init__(self, urls: List[str], retry_seconds: float = 30):
+        self.retry_seconds = retry_seconds
+        self.engines = [
+            create_db_engine(
+                url,
+                pool_size=settings.database_replica_pool_size,
+                max_overflow=settings.database_replica_max_overflow,
+            )
+            for url in urls
+        ]
+        self._sessionmakers = [
+            async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+            for replica in self.engines
+        ]
+        self._down_until = [0.0] * len(self.engines)
+        self._next = 0
+        for index, replica in enumerate(self.engines):
+            event.listen(replica.sync_engine, "handle_error", self._error_handler(index))
+
+    def _error_handler(self, index: int):
+        def handle_error(context) -> None:
+            # connection is None when the error happened while connecting
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(index)
+                logger.warning(f"Read replica {index} unavailable: {context.original_exception}")
+        return handle_error
+
+    def _candidates(self) -> List[int]:
+        """Healthy replica indexes, starting with the next in round-robin order."""
+        count = len(self.engines)
+        if not count:
+            return []
+        start = self._next
+        self._next = (start + 1) % count
+        now = time.monotonic()
+        return [
+            index
+            for index in ((start + offset) % count for offset in range(count))
+            if self._down_until[index] <= now
+        ]
+
+    def mark_down(self, index: int) -> None:
+        """Take a replica out of rotation for retry_seconds."""
+        self._down_until[index] = time.monotonic() + self.retry_seconds
+
+    def open_session(self) -> Optional[AsyncSession]:
+        """Session on a healthy replica, or None when reads should use the primary."""
+        candidates = self._candidates()
+        if not candidates:
+            return None
+        return self._sessionmakers[candidates[0]]()
+
+    async def dispose(self) -> None:
+        """Close every replica pool."""
+        for replica in self.engines:
+            await replica.dispose()
+
+
+replica_router = ReplicaRouter(
+    settings.database_replica_urls,
+    retry_seconds=settings.database_replica_retry_seconds,
+)
+
+
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar("request_session", default=None)
+
+
+def request_session() -> Optional[AsyncSession]:
+    """The session get_db opened for the current request, if any."""
+    return _request_session.get()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Async dependency to get database session."""
+    """
+    Async dependency to get the request's database session.
+
+    FastAPI caches dependencies per request, so auth, unit of work and
+    repository dependencies that all depend on get_db share this one
+    session. It only checks out a pool connection on its first query.
+    """
     session = AsyncSessionLocal()
+    token = _request_session.set(session)
     try:
         yield session
         await session.commit()
@@ -51,10 +154,46 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
         raise
     finally:
+        try:
+            _request_session.reset(token)
+        except ValueError:
+            # Cleanup ran in another context; just unbind the session there
+            _request_session.set(None)
         # Ensure session is properly closed
         await session.close()
 
 
+async def get_read_db(
+    primary: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Async dependency to get a read-only session, on a replica when configured."""
+    session = replica_router.open_session()
+    if session is None:
+        # No healthy replica: share the request's primary session
+        yield primary
+        return
+    try:
+        yield session
+    finally:
+        # Nothing to commit; closing rolls back the read transaction
+        await session.close()
+
+
+@asynccontextmanager
+async def read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Standalone read-only session, on a replica when one is healthy.
+
+    For reads that run concurrently within one request: a session runs one
+    query at a time, so each concurrent branch needs its own.
+    """
+    session = replica_router.open_session() or AsyncSessionLocal()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Async context manager for database session."""
@@ -1,20 +1,24 @@
 from typing import Optional
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from contextlib import asynccontextmanager
 
-from app.core.db.session import AsyncSessionLocal
+from app.core.db.session import AsyncSessionLocal, get_db
 
 
 class UnitOfWork:
     """Async Unit of Work pattern implementation for transaction management."""
 
-    def __init__(self, session_factory=AsyncSessionLocal):
+    def __init__(self, session_factory=AsyncSessionLocal, session: Optional[AsyncSession] = None):
         self.session_factory = session_factory
-        self._session: Optional[AsyncSession] = None
+        self._session: Optional[AsyncSession] = session
+        # A session passed in belongs to the caller (e.g. the request) and is not closed here
+        self._owns_session = session is None
 
     async def __aenter__(self):
-        self._session = self.session_factory()
-        await self._session.__aenter__()
+        if self._owns_session:
+            self._session = self.session_factory()
+            await self._session.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -24,8 +28,9 @@ class UnitOfWork:
             else:
                 await self.commit()
         finally:
-            await self._session.__aexit__(exc_type, exc_val, exc_tb)
-            self._session = None
+            if self._owns_session:
+                await self._session.__aexit__(exc_type, exc_val, exc_tb)
+                self._session = None
 
     @property
     def session(self) -> AsyncSession:
@@ -59,6 +64,6 @@ class UnitOfWork:
                 raise
 
 
-def get_unit_of_work() -> UnitOfWork:
-    """Get a UnitOfWork instance for dependency injection."""
-    return UnitOfWork()
+def get_unit_of_work(session: AsyncSession = Depends(get_db)) -> UnitOfWork:
+    """Get a UnitOfWork bound to the request's shared session."""
+    return UnitOfWork(session=session)
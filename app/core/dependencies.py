@@ -1,6 +1,9 @@
 """Core dependency injection for the application."""
 
-from app.core.db.session import AsyncSession
+from fastapi import Depends
+
+from app.core.db.outbox import OutboxPublisher
+from app.core.db.session import AsyncSession, get_db
 from app.core.db.unit_of_work import UnitOfWork
 
 
@@ -17,15 +20,14 @@ async def get_unit_of_work() -> UnitOfWork:
 
 
 async def get_cache_service():
-    """Get cache service."""
-    # This would be implemented with actual cache service
-    pass
+    """Get the shared async Redis cache client."""
+    from app.core.cache import async_redis_client
+    return async_redis_client
 
 
-async def get_event_service():
-    """Get event service."""
-    # This would be implemented with actual event service
-    pass
+def get_event_service(session: AsyncSession = Depends(get_db)) -> OutboxPublisher:
+    """Get the event publisher, writing to the outbox in the request's transaction."""
+    return OutboxPublisher(session)
 
 
 async def get_email_service():
@@ -13,6 +13,7 @@ from datetime import datetime
 
 # Import core errors
 from app.core.errors.exceptions import BaseError
+from app.core.responses import FastJSONResponse
 
 # Use TYPE_CHECKING to avoid circular imports at runtime
 if TYPE_CHECKING:
@@ -79,7 +80,7 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
     )
     
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -126,7 +127,7 @@ async def http_exception_handler(request: Request, exc: Union[HTTPException, Sta
         status_code=exc.status_code
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -143,7 +144,7 @@ async def base_error_handler(request: Request, exc: BaseError) -> JSONResponse:
         status_code=exc.status_code
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -167,7 +168,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -185,7 +186,7 @@ async def auth_domain_authentication_error_handler(request: Request, exc: Except
         status_code=status.HTTP_401_UNAUTHORIZED
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -206,7 +207,7 @@ async def auth_domain_business_rule_error_handler(request: Request, exc: Excepti
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -227,7 +228,7 @@ async def auth_domain_validation_error_handler(request: Request, exc: Exception)
         status_code=status.HTTP_400_BAD_REQUEST
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -243,7 +244,7 @@ async def auth_domain_user_inactive_error_handler(request: Request, exc: Excepti
         status_code=status.HTTP_403_FORBIDDEN
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=error_response.status_code,
         content=error_response.to_dict()
     )
@@ -264,6 +265,10 @@ def register_error_handlers(app):
     for exception_type, handler in specific_handlers.items():
         app.add_exception_handler(exception_type, handler)
 
+    # Conditional GET: current client copies get an empty 304
+    from app.core.cache.conditional import NotModified, not_modified_handler
+    app.add_exception_handler(NotModified, not_modified_handler)
+
     # Register core BaseError handler (for ConflictError, NotFoundError, etc.)
     # Must be before auth domain handlers since some may inherit from BaseError
     app.add_exception_handler(BaseError, base_error_handler)
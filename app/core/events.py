@@ -11,6 +11,16 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class EventDeliveryError(Exception):
+    """Raised when one or more handlers failed to process an event."""
+
+    def __init__(self, event_name: str, errors: Dict[str, BaseException]):
+        self.event_name = event_name
+        self.errors = errors
+        details = "; ".join(f"{name}: {error}" for name, error in errors.items())
+        super().__init__(f"{len(errors)} handler(s) failed for event {event_name}: {details}")
+
+
 class EventBus:
     """
     Simple in-memory event bus for domain events.
@@ -19,6 +29,10 @@ class EventBus:
     - Event publishing (fire and forget)
     - Event subscription (multiple handlers per event)
     - Async event handlers
+
+    Request handlers publish through the transactional outbox
+    (app.core.db.OutboxPublisher); the outbox dispatcher then calls
+    deliver() from a background task.
     """
 
     def __init__(self):
@@ -113,6 +127,39 @@ class EventBus:
                 exc_info=True
             )
 
+    async def deliver(self, event_name: str, event_data: Dict[str, Any]) -> None:
+        """
+        Deliver an event to all subscribers, raising if any handler fails.
+
+        Used by the outbox dispatcher, which retries the whole event on
+        failure, so handlers must be idempotent.
+
+        Raises:
+            EventDeliveryError: If at least one handler raised
+        """
+        handlers = list(self._subscribers.get(event_name, []))
+        if not handlers:
+            return
+
+        results = await asyncio.gather(
+            *(self._call_handler(handler, event_data) for handler in handlers),
+            return_exceptions=True,
+        )
+        errors = {
+            handler.__name__: result
+            for handler, result in zip(handlers, results)
+            if isinstance(result, BaseException)
+        }
+        if errors:
+            raise EventDeliveryError(event_name, errors)
+
+    @staticmethod
+    async def _call_handler(handler: Callable, event_data: Dict[str, Any]) -> None:
+        if asyncio.iscoroutinefunction(handler):
+            await handler(event_data)
+        else:
+            handler(event_data)
+
     def clear_all_subscribers(self) -> None:
         """Clear all event subscribers (useful for testing)."""
         self._subscribers.clear()
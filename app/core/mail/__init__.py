@@ -0,0 +1,9 @@
+from .smtp import SMTPConnectionPool
+from .mailer import MAIL_EVENT, Mailer, mailer
+
+__all__ = [
+    "SMTPConnectionPool",
+    "MAIL_EVENT",
+    "Mailer",
+    "mailer",
+]
@@ -0,0 +1,131 @@
+"""
+Queued email delivery.
+
+Sending an email only records a "mail.send" event in the transactional
+outbox; when a session is passed, the email is written in the caller's
+transaction and only goes out if that transaction commits. The outbox
+dispatcher then delivers queued messages through the shared SMTP pool,
+many at a time over a few persistent connections, and retries transient
+SMTP failures with backoff. Permanent rejections (5xx) are logged and
+dropped.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from email.message import EmailMessage
+import logging
+
+import aiosmtplib
+
+from app.core.config import settings
+from app.core.db.outbox import OutboxPublisher
+from app.core.db.session import AsyncSessionLocal
+from app.core.events import event_bus
+from app.core.mail.smtp import SMTPConnectionPool
+
+logger = logging.getLogger(__name__)
+
+MAIL_EVENT = "mail.send"
+
+
+class Mailer:
+    """Queues emails in the outbox and delivers them over pooled SMTP connections."""
+
+    def __init__(
+        self,
+        pool: Optional[SMTPConnectionPool],
+        from_email: str,
+        from_name: str,
+        session_factory: Callable = AsyncSessionLocal,
+    ):
+        self.pool = pool
+        self.from_email = from_email
+        self.from_name = from_name
+        self.session_factory = session_factory
+
+    def build_message(self, to_email: str, subject: str, html_body: str, text_body: str) -> EmailMessage:
+        """Multipart text/HTML message."""
+        message = EmailMessage()
+        message["Subject"] = subject
+        message["From"] = f"{self.from_name} <{self.from_email}>"
+        message["To"] = to_email
+        message.set_content(text_body)
+        message.add_alternative(html_body, subtype="html")
+        return message
+
+    async def enqueue(
+        self,
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: str,
+        session=None,
+    ) -> bool:
+        """Queue an email for delivery, in the caller's transaction if session is given."""
+        if self.pool is None:
+            logger.warning(f"SMTP not configured, not sending email to {to_email}")
+            return False
+
+        payload = {
+            "to_email": to_email,
+            "subject": subject,
+            "html_body": html_body,
+            "text_body": text_body,
+        }
+        try:
+            if session is not None:
+                return await OutboxPublisher(session).publish(MAIL_EVENT, payload)
+            async with self.session_factory() as own_session:
+                await OutboxPublisher(own_session).publish(MAIL_EVENT, payload)
+                await own_session.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to queue email to {to_email}: {str(e)}")
+            return False
+
+    async def deliver(self, data: Dict[str, Any]) -> None:
+        """Outbox handler: send one queued email (raises on transient failures)."""
+        if self.pool is None:
+            logger.warning(f"SMTP not configured, dropping queued email to {data['to_email']}")
+            return
+
+        message = self.build_message(**data)
+        try:
+            await self.pool.send(message)
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            if all(refusal.code >= 500 for refusal in e.recipients):
+                logger.error(f"Recipient refused, dropping email to {data['to_email']}: {e.recipients}")
+                return
+            raise
+        except aiosmtplib.SMTPResponseException as e:
+            if e.code >= 500:
+                logger.error(f"Permanent SMTP failure, dropping email to {data['to_email']}: {e.code} {e.message}")
+                return
+            raise
+        logger.info(f"Email sent successfully to {data['to_email']}")
+
+    async def close(self) -> None:
+        """Close pooled SMTP connections (called from app lifespan)."""
+        if self.pool is not None:
+            await self.pool.close()
+
+
+def create_mailer() -> Mailer:
+    """Build the mailer from SMTP settings."""
+    pool = None
+    if settings.smtp_host:
+        pool = SMTPConnectionPool(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            username=settings.smtp_username,
+            password=settings.smtp_password,
+            start_tls=settings.smtp_use_tls,
+            size=settings.smtp_pool_size,
+            timeout=settings.smtp_timeout,
+            idle_timeout=settings.smtp_idle_timeout,
+        )
+    return Mailer(pool, settings.smtp_from_email, settings.smtp_from_name)
+
+
+# Singleton instance
+mailer = create_mailer()
+event_bus.subscribe(MAIL_EVENT, mailer.deliver)
@@ -0,0 +1,102 @@
+"""
+Pooled asynchronous SMTP connections.
+
+Connections are opened lazily (TCP, STARTTLS and AUTH once) and returned to
+the pool after each message, so consecutive messages reuse the same session
+instead of paying the handshake every time.
+"""
+
+from typing import AsyncIterator, List, Optional, Tuple
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+import asyncio
+import logging
+import time
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    """Bounded pool of persistent aiosmtplib connections."""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: bool = True,
+        size: int = 2,
+        timeout: float = 30.0,
+        idle_timeout: float = 60.0,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.size = size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._idle: List[Tuple[aiosmtplib.SMTP, float]] = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username or None,
+            password=self.password or None,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        logger.debug(f"Opened SMTP connection to {self.hostname}:{self.port}")
+        return smtp
+
+    @staticmethod
+    async def _close(smtp: aiosmtplib.SMTP) -> None:
+        try:
+            if smtp.is_connected:
+                await smtp.quit()
+        except Exception:
+            smtp.close()
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        """Most recently used live connection, or a new one."""
+        now = time.monotonic()
+        while self._idle:
+            smtp, released_at = self._idle.pop()
+            if smtp.is_connected and now - released_at < self.idle_timeout:
+                return smtp
+            await self._close(smtp)
+        return await self._connect()
+
+    @asynccontextmanager
+    async def connection(self, fresh: bool = False) -> AsyncIterator[aiosmtplib.SMTP]:
+        """Borrow a connection (a new one if fresh); it is discarded if the block raises."""
+        async with self._slots:
+            smtp = await self._connect() if fresh else await self._checkout()
+            try:
+                yield smtp
+            except BaseException:
+                await self._close(smtp)
+                raise
+            self._idle.append((smtp, time.monotonic()))
+
+    async def send(self, message: EmailMessage) -> None:
+        """Send one message, reconnecting once if a pooled connection went stale."""
+        try:
+            async with self.connection() as smtp:
+                await smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            async with self.connection(fresh=True) as smtp:
+                await smtp.send_message(message)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            await self._close(smtp)
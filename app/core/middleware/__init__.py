@@ -1,8 +1,12 @@
+from app.core.config import settings
+
 from .request_id import RequestIdMiddleware
 from .logging import LoggingMiddleware
 from .cors import setup_cors
 from .rate_limit import RateLimitMiddleware
 from .security_headers import SecurityHeadersMiddleware
+from .pipeline import RequestPipelineMiddleware
+from .compression import CompressionMiddleware
 
 __all__ = [
     "RequestIdMiddleware",
@@ -10,25 +14,25 @@ __all__ = [
     "setup_cors",
     "RateLimitMiddleware",
     "SecurityHeadersMiddleware",
+    "RequestPipelineMiddleware",
+    "CompressionMiddleware",
 ]
 
 
 def register_middlewares(app):
     """Register all middlewares with the FastAPI app."""
-    # Order matters: these are executed in reverse order for requests
-    # and in forward order for responses
-    
+    # Gzip large bodies; innermost, so only the route's response is compressed
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            compress_level=settings.compression_level,
+            content_types=settings.compression_content_types,
+        )
+
     # CORS should be early to handle preflight requests
     setup_cors(app)
-    
-    # Security headers
-    app.add_middleware(SecurityHeadersMiddleware)
-    
-    # Rate limiting
-    app.add_middleware(RateLimitMiddleware)
-    
-    # Request ID should be early to be available for other middlewares
-    app.add_middleware(RequestIdMiddleware)
-    
-    # Logging should be last to log the complete request/response cycle
-    app.add_middleware(LoggingMiddleware)
\ No newline at end of file
+
+    # Request ID, rate limiting, logging and security headers run as a
+    # single outermost ASGI layer
+    app.add_middleware(RequestPipelineMiddleware)
@@ -0,0 +1,119 @@
+import zlib
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Media types worth compressing; images, archives and already-encoded bodies are not
+DEFAULT_COMPRESSIBLE_TYPES = ("application/json", "text/plain", "text/csv", "text/html")
+
+# wbits for zlib with a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """True if an Accept-Encoding header allows gzip (q=0 refuses it)."""
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip() not in ("gzip", "*"):
+            continue
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class CompressionMiddleware:
+    """
+    Gzip responses of allowlisted content types once they reach minimum_size.
+
+    Complete bodies below the threshold, responses that already carry a
+    Content-Encoding and other media types pass through untouched.
+    Streaming responses are compressed chunk by chunk, flushing after each
+    chunk so clients still receive data as it is produced.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compress_level: int = 6,
+        content_types: Iterable[str] = DEFAULT_COMPRESSIBLE_TYPES,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compress_level = compress_level
+        self.content_types = frozenset(content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not accepts_gzip(Headers(scope=scope).get("accept-encoding", "")):
+            await self.app(scope, receive, send)
+            return
+        await GzipResponder(self, send)(self.app, scope, receive)
+
+    def compressible(self, headers: Headers) -> bool:
+        media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        return media_type in self.content_types and "content-encoding" not in headers
+
+
+class GzipResponder:
+    """Per-request send wrapper that decides on compression at the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send):
+        self.middleware = middleware
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, app: ASGIApp, scope: Scope, receive: Receive) -> None:
+        await app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+        elif message["type"] == "http.response.start":
+            self.start_message = message
+            if not self.middleware.compressible(Headers(raw=message.get("headers", []))):
+                self.passthrough = True
+                await self.send(message)
+        elif message["type"] == "http.response.body":
+            await self.send_body(message)
+        else:
+            await self.send(message)
+
+    async def send_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+            self.compressor = zlib.compressobj(self.middleware.compress_level, zlib.DEFLATED, GZIP_WBITS)
+            headers = MutableHeaders(raw=list(self.start_message.get("headers", [])))
+            headers["Content-Encoding"] = "gzip"
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+
+            if not more_body:
+                body = self.compressor.compress(body) + self.compressor.flush()
+                headers["Content-Length"] = str(len(body))
+                self.start_message["headers"] = headers.raw
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            self.start_message["headers"] = headers.raw
+            await self.send(self.start_message)
+
+        if more_body:
+            body = self.compressor.compress(body) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            body = self.compressor.compress(body) + self.compressor.flush()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
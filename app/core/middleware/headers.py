@@ -0,0 +1,25 @@
+from typing import Iterable, Sequence, Tuple
+
+from starlette.types import Message
+
+RawHeader = Tuple[bytes, bytes]
+
+
+def replace_headers(
+    message: Message,
+    headers: Sequence[RawHeader],
+    remove: Iterable[bytes] = (),
+) -> None:
+    """
+    Set headers on an http.response.start message in a single pass.
+
+    Existing headers with the same name, and any name listed in remove,
+    are dropped before the new ones are appended. Names must be lowercase.
+    """
+    dropped = {name for name, _ in headers}
+    dropped.update(remove)
+    message["headers"] = [
+        (name, value)
+        for name, value in message.get("headers", ())
+        if name.lower() not in dropped
+    ] + list(headers)
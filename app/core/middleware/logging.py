@@ -1,56 +1,96 @@
 import time
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .headers import replace_headers
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for request/response logging."""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Start timer
-        start_time = time.time()
-        
-        # Get request details
-        request_id = getattr(request.state, "request_id", "unknown")
-        method = request.method
-        path = request.url.path
-        query = str(request.url.query) if request.url.query else ""
-        
-        # Log request
-        logger.info(
-            f"Request started: {method} {path}",
-            extra={
-                "request_id": request_id,
-                "method": method,
-                "path": path,
-                "query": query,
-                "client": request.client.host if request.client else None,
-            }
-        )
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate duration
-        duration = time.time() - start_time
-        
-        # Log response
-        logger.info(
-            f"Request completed: {method} {path} - {response.status_code} ({duration:.3f}s)",
+def log_request_started(scope: Scope, request_id: str) -> None:
+    """Log the start of an HTTP request."""
+    method = scope["method"]
+    path = scope["path"]
+    client = scope.get("client")
+    logger.info(
+        f"Request started: {method} {path}",
+        extra={
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "client": client[0] if client else None,
+        }
+    )
+
+
+def log_request_completed(
+    scope: Scope,
+    request_id: str,
+    status_code: Optional[int],
+    duration: float,
+    fields: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Log the outcome of an HTTP request, with optional extra structured fields."""
+    method = scope["method"]
+    path = scope["path"]
+    logger.info(
+        f"Request completed: {method} {path} - {status_code} ({duration:.3f}s)",
+        extra={
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration": duration,
+            **(fields or {}),
+        }
+    )
+
+
+def log_repeated_queries(scope: Scope, request_id: str, repeated: List[Tuple[str, int]]) -> None:
+    """Warn about statement shapes repeated within one request (suspected N+1)."""
+    method = scope["method"]
+    path = scope["path"]
+    for shape, count in repeated:
+        logger.warning(
+            f"Possible N+1 in {method} {path}: {count} executions of {shape[:200]}",
             extra={
                 "request_id": request_id,
                 "method": method,
                 "path": path,
-                "status_code": response.status_code,
-                "duration": duration,
+                "statement": shape,
+                "executions": count,
             }
         )
-        
-        # Add timing header
-        response.headers["X-Process-Time"] = str(duration)
-        
-        return response
\ No newline at end of file
+
+
+class LoggingMiddleware:
+    """Middleware for request/response logging."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        request_id = scope.get("state", {}).get("request_id", "unknown")
+        log_request_started(scope, request_id)
+        status_code = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration = time.perf_counter() - start_time
+                replace_headers(message, [(b"x-process-time", str(duration).encode("latin-1"))])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            log_request_completed(scope, request_id, status_code, time.perf_counter() - start_time)
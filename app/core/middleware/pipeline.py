@@ -0,0 +1,91 @@
+import time
+from contextlib import nullcontext
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import rate_limiter
+from app.core.config import settings
+from app.core.db.profiling import profile_queries
+from app.core.observability.metrics import metrics_collector, route_template
+
+from .headers import replace_headers
+from .logging import log_repeated_queries, log_request_completed, log_request_started
+from .rate_limit import (
+    RATE_LIMIT_EXEMPT_PATHS,
+    client_ip,
+    rate_limit_headers,
+    rate_limited_response,
+)
+from .request_id import REQUEST_ID_HEADER, resolve_request_id
+from .security_headers import REMOVED_HEADERS, SECURITY_HEADERS
+
+
+class RequestPipelineMiddleware:
+    """
+    Request ID, rate limiting, logging, metrics, SQL profiling and security
+    headers in one ASGI layer.
+
+    Behaves like stacking RequestIdMiddleware, LoggingMiddleware,
+    RateLimitMiddleware and SecurityHeadersMiddleware, but wraps send once
+    and rewrites the response headers in a single pass. Rate-limited
+    responses carry the request ID and security headers as well.
+
+    With DB_QUERY_PROFILING enabled (by default only when DEBUG is),
+    statements run while handling the
+    request are reported in a Server-Timing header and the completion log,
+    and repeated statement shapes above DB_N_PLUS_ONE_THRESHOLD are logged
+    as suspected N+1 queries.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        request_id = resolve_request_id(scope)
+        log_request_started(scope, request_id)
+
+        app = self.app
+        headers = [(REQUEST_ID_HEADER, request_id.encode("latin-1"))]
+        if settings.rate_limit_enabled and scope["path"] not in RATE_LIMIT_EXEMPT_PATHS:
+            allowed, remaining, reset_time = await rate_limiter.check_ip_rate_limit(client_ip(scope))
+            if allowed:
+                headers.extend(rate_limit_headers(remaining))
+            else:
+                app = rate_limited_response(remaining, reset_time)
+        headers.extend(SECURITY_HEADERS)
+
+        status_code: Optional[int] = None
+        profiling = profile_queries() if settings.query_profiling_enabled else nullcontext()
+
+        with profiling as profile:
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    duration = time.perf_counter() - start_time
+                    response_headers = headers + [(b"x-process-time", str(duration).encode("latin-1"))]
+                    if profile is not None:
+                        response_headers.append((b"server-timing", profile.server_timing().encode("latin-1")))
+                    replace_headers(message, response_headers, remove=REMOVED_HEADERS)
+                await send(message)
+
+            try:
+                await app(scope, receive, send_wrapper)
+            finally:
+                duration = time.perf_counter() - start_time
+                fields = None
+                if profile is not None:
+                    fields = profile.log_fields()
+                    repeated = profile.repeated(settings.db_n_plus_one_threshold)
+                    if repeated:
+                        log_repeated_queries(scope, request_id, repeated)
+                log_request_completed(scope, request_id, status_code, duration, fields)
+                metrics_collector.record_request(
+                    route_template(scope), scope["method"], status_code or 500, duration
+                )
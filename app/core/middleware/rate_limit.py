@@ -1,52 +1,78 @@
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from typing import List, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.cache import rate_limiter
 from app.core.config import settings
 
+from .headers import RawHeader, replace_headers
+
+# Health checks and metrics scrapes are never rate limited
+RATE_LIMIT_EXEMPT_PATHS = frozenset({"/health", "/ready", "/live", "/metrics"})
+
+
+def client_ip(scope: Scope) -> str:
+    """Client address from the ASGI scope."""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def rate_limit_headers(remaining: int) -> List[RawHeader]:
+    """X-RateLimit-* headers for an allowed request."""
+    return [
+        (b"x-ratelimit-limit", str(settings.rate_limit_requests_per_minute).encode("latin-1")),
+        (b"x-ratelimit-remaining", str(remaining).encode("latin-1")),
+    ]
+
+
+def rate_limited_response(remaining: int, reset_time: Optional[int]) -> JSONResponse:
+    """429 response returned when a client exceeds its limit."""
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": {
+                "code": "RATE_LIMIT_EXCEEDED",
+                "message": "Too many requests",
+                "reset_time": reset_time,
+            }
+        },
+        headers={
+            "X-RateLimit-Limit": str(settings.rate_limit_requests_per_minute),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset_time) if reset_time else "",
+            "Retry-After": str(reset_time - int(time.time())) if reset_time else "60",
+        }
+    )
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+
+class RateLimitMiddleware:
     """Middleware for rate limiting."""
-    
-    async def dispatch(self, request: Request, call_next):
-        if not settings.rate_limit_enabled:
-            return await call_next(request)
-        
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/ready"]:
-            return await call_next(request)
-        
-        # Get client identifier
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Check rate limit
-        allowed, remaining, reset_time = rate_limiter.check_ip_rate_limit(client_ip)
-        
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not settings.rate_limit_enabled
+            or scope["path"] in RATE_LIMIT_EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        allowed, remaining, reset_time = await rate_limiter.check_ip_rate_limit(client_ip(scope))
+
         if not allowed:
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": {
-                        "code": "RATE_LIMIT_EXCEEDED",
-                        "message": "Too many requests",
-                        "reset_time": reset_time,
-                    }
-                },
-                headers={
-                    "X-RateLimit-Limit": str(settings.rate_limit_requests_per_minute),
-                    "X-RateLimit-Remaining": str(remaining),
-                    "X-RateLimit-Reset": str(reset_time) if reset_time else "",
-                    "Retry-After": str(reset_time - int(time.time())) if reset_time else "60",
-                }
-            )
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(settings.rate_limit_requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        
-        return response
\ No newline at end of file
+            await rate_limited_response(remaining, reset_time)(scope, receive, send)
+            return
+
+        headers = rate_limit_headers(remaining)
+
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                replace_headers(message, headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit_headers)
@@ -1,23 +1,42 @@
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
 
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+from .headers import replace_headers
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+
+def resolve_request_id(scope: Scope) -> str:
+    """Reuse the caller's X-Request-ID or generate one, and expose it as request.state.request_id."""
+    request_id = None
+    for name, value in scope.get("headers", ()):
+        if name == REQUEST_ID_HEADER:
+            request_id = value.decode("latin-1")
+            break
+    if not request_id:
+        request_id = str(uuid.uuid4())
+    scope.setdefault("state", {})["request_id"] = request_id
+    return request_id
+
+
+class RequestIdMiddleware:
     """Middleware to add unique request ID to each request."""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        
-        # Store request ID in request state
-        request.state.request_id = request_id
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-        
-        return response
\ No newline at end of file
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = resolve_request_id(scope)
+        header = (REQUEST_ID_HEADER, request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                replace_headers(message, [header])
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
@@ -1,8 +1,9 @@
 from .health import health_checker
-from .metrics import metrics_collector, track_time
+from .metrics import metrics_collector, track_time, route_template
 
 __all__ = [
     "health_checker",
     "metrics_collector",
     "track_time",
+    "route_template",
 ]
\ No newline at end of file
@@ -1,5 +1,8 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
+import asyncio
+import logging
+import time
 import psutil
 from sqlalchemy import text
 # Removed FastAPI dependency - this is core infrastructure only
@@ -7,61 +10,136 @@ from sqlalchemy import text
 from app.core.db import engine
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+def _saturation(in_use: int, capacity: int) -> Optional[float]:
+    return round(in_use / capacity, 3) if capacity > 0 else None
+
 
 class HealthChecker:
-    """Health check utilities."""
-    
-    @staticmethod
-    async def check_database() -> Dict[str, Any]:
-        """Check database connectivity."""
+    """
+    Health check utilities.
+
+    CPU, memory and disk usage are sampled by a background task and health
+    checks read the cached snapshot, so a probe never blocks the event loop.
+    """
+
+    def __init__(self):
+        self._system: Dict[str, Any] = {}
+        self._sampler: Optional[asyncio.Task] = None
+
+    async def check_database(self) -> Dict[str, Any]:
+        """Check database connectivity, round-trip latency and pool usage."""
         try:
+            start = time.perf_counter()
             async with engine.connect() as conn:
                 result = await conn.execute(text("SELECT 1"))
                 result.fetchone()
-            return {"status": "healthy", "latency_ms": 0}
+            latency_ms = (time.perf_counter() - start) * 1000
+            return {"status": "healthy", "latency_ms": round(latency_ms, 2), **self.database_pool()}
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
-    
+
     @staticmethod
-    async def check_redis() -> Dict[str, Any]:
-        """Check Redis connectivity."""
+    def database_pool() -> Dict[str, Any]:
+        """Primary pool usage (empty for pools without checkout tracking)."""
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return {}
+        capacity = pool.size() + settings.database_max_overflow
+        return {
+            "pool_checked_out": pool.checkedout(),
+            "pool_capacity": capacity,
+            "pool_saturation": _saturation(pool.checkedout(), capacity),
+        }
+
+    async def check_redis(self) -> Dict[str, Any]:
+        """Check Redis connectivity, round-trip latency and pool usage."""
         if not settings.redis_url:
             return {"status": "not_configured"}
 
         try:
-            from app.core.cache.redis_client import redis_client
+            from app.core.cache.async_redis_client import async_redis_client
 
-            if redis_client.is_available():
-                return {"status": "healthy"}
-            else:
+            start = time.perf_counter()
+            if not await async_redis_client.is_available():
                 return {"status": "unhealthy", "error": "Redis ping failed"}
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            result = {"status": "healthy", "latency_ms": round(latency_ms, 2)}
+            pool = async_redis_client.client.connection_pool
+            in_use = len(getattr(pool, "_in_use_connections", ()))
+            result.update({
+                "pool_in_use": in_use,
+                "pool_capacity": pool.max_connections,
+                "pool_saturation": _saturation(in_use, pool.max_connections),
+            })
+            return result
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
-    
-    @staticmethod
-    async def check_system() -> Dict[str, Any]:
-        """Check system resources."""
-        try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage("/")
-            
-            return {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "disk_percent": disk.percent,
-                "status": "healthy" if cpu_percent < 90 and memory.percent < 90 else "degraded"
-            }
-        except Exception as e:
-            return {"status": "unknown", "error": str(e)}
-    
+
     @staticmethod
-    async def get_health_status() -> Dict[str, Any]:
+    def sample_system() -> Dict[str, Any]:
+        """Read CPU, memory and disk usage (CPU is measured since the previous call)."""
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage("/")
+        return {
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory.percent,
+            "disk_percent": disk.percent,
+            "status": "healthy" if cpu_percent < 90 and memory.percent < 90 else "degraded",
+            "sampled_at": time.time(),
+        }
+
+    async def _sample_loop(self, interval: float) -> None:
+        """Refresh the system snapshot until cancelled."""
+        while True:
+            try:
+                self._system = await asyncio.to_thread(self.sample_system)
+            except Exception as e:
+                logger.warning(f"System sampling failed: {str(e)}")
+                self._system = {"status": "unknown", "error": str(e)}
+            await asyncio.sleep(interval)
+
+    async def start(self) -> None:
+        """Start the system sampler (called from app lifespan)."""
+        if self._sampler is None:
+            # Prime the CPU counter so the first snapshot covers a real interval
+            psutil.cpu_percent(interval=None)
+            self._sampler = asyncio.create_task(
+                self._sample_loop(settings.health_sample_interval),
+                name="health-system-sampler",
+            )
+
+    async def stop(self) -> None:
+        """Stop the system sampler."""
+        if self._sampler:
+            self._sampler.cancel()
+            try:
+                await self._sampler
+            except asyncio.CancelledError:
+                pass
+            self._sampler = None
+
+    async def check_system(self) -> Dict[str, Any]:
+        """Check system resources from the latest background sample."""
+        if not self._system:
+            return {"status": "unknown", "error": "No system sample yet"}
+        snapshot = dict(self._system)
+        if "sampled_at" in snapshot:
+            snapshot["age_seconds"] = round(time.time() - snapshot.pop("sampled_at"), 1)
+        return snapshot
+
+    async def get_health_status(self) -> Dict[str, Any]:
         """Get overall health status."""
-        database = await HealthChecker.check_database()
-        redis = await HealthChecker.check_redis()
-        system = await HealthChecker.check_system()
-        
+        database, redis, system = await asyncio.gather(
+            self.check_database(),
+            self.check_redis(),
+            self.check_system(),
+        )
+
         # Determine overall status
         if database["status"] != "healthy":
             overall_status = "unhealthy"
@@ -69,7 +147,7 @@ class HealthChecker:
             overall_status = "degraded"
         else:
             overall_status = "healthy"
-        
+
         return {
             "status": overall_status,
             "timestamp": datetime.utcnow().isoformat(),
@@ -81,15 +159,14 @@ class HealthChecker:
                 "system": system,
             }
         }
-    
-    @staticmethod
-    async def get_readiness_status() -> Dict[str, Any]:
+
+    async def get_readiness_status(self) -> Dict[str, Any]:
         """Get readiness status."""
-        database = await HealthChecker.check_database()
-        
+        database = await self.check_database()
+
         # Application is ready if database is healthy
         is_ready = database["status"] == "healthy"
-        
+
         return {
             "ready": is_ready,
             "timestamp": datetime.utcnow().isoformat(),
@@ -98,7 +175,15 @@ class HealthChecker:
             }
         }
 
+    @staticmethod
+    def get_liveness_status() -> Dict[str, Any]:
+        """Get liveness status without any I/O."""
+        return {
+            "status": "alive",
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
 
 health_checker = HealthChecker()
 
-# Health checker utility only - endpoints moved to interfaces/health.py
\ No newline at end of file
+# Health checker utility only - endpoints moved to interfaces/health.py
@@ -1,76 +1,332 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
+import os
+import shutil
 import time
 from functools import wraps
 import logging
 import asyncio
 
+from app.core.config import settings
+
+# prometheus_client picks its value storage at import time, so multi-process
+# mode has to be switched on before it is imported.
+if settings.workers > 1 and settings.metrics_multiproc_dir:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.metrics_multiproc_dir)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from app.core.cache.async_redis_client import async_redis_client  # noqa: E402
+from app.core.cache.near_cache import NearCache, near_cache  # noqa: E402
+from app.core.db import engine  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
+# LocalLRUCache counters exported as near_cache_<name>_total
+NEAR_CACHE_COUNTERS = ("hits", "misses", "evictions", "expirations", "invalidations")
+
+# Request latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Label used for requests that did not match any route, to bound cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+def is_multiprocess() -> bool:
+    """Whether metrics are shared between worker processes."""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def reset_multiprocess_dir() -> None:
+    """Remove metric files left by previous runs (call once before starting workers)."""
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        return
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """Route path template (e.g. /api/v1/bookings/{booking_id}) for an ASGI scope."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def _bucket_quantile(q: float, buckets: List[Tuple[float, float]]) -> Optional[float]:
+    """Estimate a quantile from cumulative (upper_bound, count) buckets."""
+    if not buckets or buckets[-1][1] == 0:
+        return None
+    rank = q * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0.0
+    for upper_bound, count in buckets:
+        if count >= rank:
+            if upper_bound == float("inf"):
+                return lower_bound
+            if count == lower_count:
+                return upper_bound
+            return lower_bound + (upper_bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+        lower_bound, lower_count = upper_bound, count
+    return lower_bound
+
 
 class MetricsCollector:
-    """Simple metrics collection."""
-    
-    def __init__(self):
-        self._metrics = {
-            "requests": {},
-            "durations": {},
-            "errors": {},
-        }
+    """
+    Prometheus metrics: request histograms and counters keyed by route
+    template, error counters and runtime gauges.
+
+    Memory is bounded by the number of routes, not by traffic. With
+    multiple workers every process writes to PROMETHEUS_MULTIPROC_DIR and
+    render() aggregates all of them, whichever worker serves the scrape.
+    """
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None):
+        self.registry = registry or CollectorRegistry()
         self._start_time = time.time()
-    
+        self._sampler: Optional[asyncio.Task] = None
+
+        self.requests = Counter(
+            "http_requests_total",
+            "HTTP requests by route template, method and status code.",
+            ["method", "route", "status"],
+            registry=self.registry,
+        )
+        self.durations = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route template and method.",
+            ["method", "route"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.errors = Counter(
+            "app_errors_total",
+            "Application errors by type.",
+            ["type"],
+            registry=self.registry,
+        )
+        self.db_pool = Gauge(
+            "db_pool_connections",
+            "Database pool connections by state.",
+            ["state"],
+            multiprocess_mode="livesum",
+            registry=self.registry,
+        )
+        self.redis_pool = Gauge(
+            "redis_pool_connections",
+            "Redis pool connections by state.",
+            ["state"],
+            multiprocess_mode="livesum",
+            registry=self.registry,
+        )
+        self.background_queue_depth = Gauge(
+            "background_queue_depth",
+            "Side-effect tasks waiting in the background executor queue.",
+            multiprocess_mode="livesum",
+            registry=self.registry,
+        )
+        self.background_tasks = Counter(
+            "background_tasks_total",
+            "Background side-effect tasks by outcome (completed, failed, rejected).",
+            ["status"],
+            registry=self.registry,
+        )
+        self.background_wait = Histogram(
+            "background_task_wait_seconds",
+            "Time background tasks spend queued before a worker picks them up.",
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.response_cache = Counter(
+            "response_cache_requests_total",
+            "Response cache lookups by route template and result (hit, miss, bypass).",
+            ["route", "result"],
+            registry=self.registry,
+        )
+        self.near_cache_events = {
+            name: Counter(
+                f"near_cache_{name}",
+                f"Near cache local-tier {name}.",
+                registry=self.registry,
+            )
+            for name in NEAR_CACHE_COUNTERS
+        }
+        self.near_cache_entries = Gauge(
+            "near_cache_entries",
+            "Entries held in the near cache local tier.",
+            multiprocess_mode="livesum",
+            registry=self.registry,
+        )
+        self.near_cache_max_entries = Gauge(
+            "near_cache_max_entries",
+            "Configured near cache local-tier capacity per worker.",
+            multiprocess_mode="livemax",
+            registry=self.registry,
+        )
+        self._near_cache_seen = dict.fromkeys(NEAR_CACHE_COUNTERS, 0)
+        self.event_loop_lag = Gauge(
+            "event_loop_lag_seconds",
+            "Delay between a scheduled wake-up and the event loop running it.",
+            multiprocess_mode="livemax",
+            registry=self.registry,
+        )
+
     def record_request(self, endpoint: str, method: str, status_code: int, duration: float):
-        """Record a request metric."""
-        key = f"{method}:{endpoint}:{status_code}"
-        
-        if key not in self._metrics["requests"]:
-            self._metrics["requests"][key] = 0
-        self._metrics["requests"][key] += 1
-        
-        if endpoint not in self._metrics["durations"]:
-            self._metrics["durations"][endpoint] = []
-        self._metrics["durations"][endpoint].append(duration)
-        
-        # Keep only last 100 durations per endpoint
-        if len(self._metrics["durations"][endpoint]) > 100:
-            self._metrics["durations"][endpoint] = self._metrics["durations"][endpoint][-100:]
-    
+        """Record a request metric. endpoint must be a route template, not a raw path."""
+        self.requests.labels(method, endpoint, str(status_code)).inc()
+        self.durations.labels(method, endpoint).observe(duration)
+
     def record_error(self, error_type: str):
         """Record an error."""
-        if error_type not in self._metrics["errors"]:
-            self._metrics["errors"][error_type] = 0
-        self._metrics["errors"][error_type] += 1
-    
+        self.errors.labels(error_type).inc()
+
+    def record_cache_lookup(self, route: str, result: str):
+        """Record a response cache lookup. route must be a route template."""
+        self.response_cache.labels(route, result).inc()
+
+    def sample_pools(self) -> None:
+        """Refresh the DB and Redis pool gauges."""
+        pool = engine.pool
+        if hasattr(pool, "checkedout"):
+            self.db_pool.labels("checked_out").set(pool.checkedout())
+            self.db_pool.labels("idle").set(pool.checkedin())
+            self.db_pool.labels("overflow").set(max(pool.overflow(), 0))
+
+        redis_pool = getattr(async_redis_client.client, "connection_pool", None)
+        if redis_pool is not None:
+            self.redis_pool.labels("in_use").set(len(getattr(redis_pool, "_in_use_connections", ())))
+            self.redis_pool.labels("idle").set(len(getattr(redis_pool, "_available_connections", ())))
+
+    def sample_near_cache(self, cache: Optional[NearCache] = None) -> None:
+        """Bring the near cache counters and size gauges up to date."""
+        stats = (cache or near_cache).stats()
+        for name in NEAR_CACHE_COUNTERS:
+            # The cache keeps running totals; counters only move forward
+            delta = stats[name] - self._near_cache_seen[name]
+            if delta > 0:
+                self.near_cache_events[name].inc(delta)
+            self._near_cache_seen[name] = stats[name]
+        self.near_cache_entries.set(stats["size"])
+        self.near_cache_max_entries.set(stats["max_entries"])
+
+    async def _sample_loop(self, interval: float) -> None:
+        """Measure event-loop lag and refresh pool and near cache gauges until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(interval)
+            self.event_loop_lag.set(max(loop.time() - scheduled - interval, 0.0))
+            try:
+                self.sample_pools()
+                self.sample_near_cache()
+            except Exception as e:
+                logger.warning(f"Failed to sample pool metrics: {str(e)}")
+
+    async def start(self) -> None:
+        """Start the runtime sampler (called from app lifespan)."""
+        if self._sampler is None:
+            self._sampler = asyncio.create_task(
+                self._sample_loop(settings.metrics_sample_interval),
+                name="metrics-sampler",
+            )
+
+    async def stop(self) -> None:
+        """Stop the runtime sampler and retire this worker's live gauges."""
+        if self._sampler:
+            self._sampler.cancel()
+            try:
+                await self._sampler
+            except asyncio.CancelledError:
+                pass
+            self._sampler = None
+        if is_multiprocess():
+            multiprocess.mark_process_dead(os.getpid())
+
+    def render(self) -> Tuple[bytes, str]:
+        """Prometheus text exposition, aggregated across workers when enabled."""
+        if is_multiprocess():
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = self.registry
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    def _histograms(self) -> Iterable[Tuple[Tuple[str, str], List[Tuple[float, float]], float]]:
+        """Per (method, route) cumulative buckets and sum from this process."""
+        series: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for metric in self.durations.collect():
+            for sample in metric.samples:
+                key = (sample.labels["method"], sample.labels["route"])
+                entry = series.setdefault(key, {"buckets": [], "sum": 0.0})
+                if sample.name.endswith("_bucket"):
+                    entry["buckets"].append((float(sample.labels["le"]), sample.value))
+                elif sample.name.endswith("_sum"):
+                    entry["sum"] = sample.value
+        for key, entry in series.items():
+            yield key, sorted(entry["buckets"]), entry["sum"]
+
     def get_metrics(self) -> Dict[str, Any]:
-        """Get current metrics."""
-        uptime = time.time() - self._start_time
-        
-        # Calculate average durations
-        avg_durations = {}
-        for endpoint, durations in self._metrics["durations"].items():
-            if durations:
-                avg_durations[endpoint] = {
-                    "avg_ms": sum(durations) / len(durations) * 1000,
-                    "min_ms": min(durations) * 1000,
-                    "max_ms": max(durations) * 1000,
-                    "count": len(durations),
-                }
-        
+        """Summary of this process's metrics with bucket-estimated percentiles."""
+        requests = {}
+        for metric in self.requests.collect():
+            for sample in metric.samples:
+                if sample.name.endswith("_total"):
+                    labels = sample.labels
+                    requests[f"{labels['method']}:{labels['route']}:{labels['status']}"] = int(sample.value)
+
+        durations = {}
+        for (method, route), buckets, total in self._histograms():
+            count = buckets[-1][1] if buckets else 0
+            if not count:
+                continue
+            durations[f"{method}:{route}"] = {
+                "avg_ms": total / count * 1000,
+                "p50_ms": _bucket_quantile(0.50, buckets) * 1000,
+                "p95_ms": _bucket_quantile(0.95, buckets) * 1000,
+                "p99_ms": _bucket_quantile(0.99, buckets) * 1000,
+                "count": int(count),
+            }
+
+        errors = {}
+        for metric in self.errors.collect():
+            for sample in metric.samples:
+                if sample.name.endswith("_total"):
+                    errors[sample.labels["type"]] = int(sample.value)
+
+        response_cache: Dict[str, Dict[str, Any]] = {}
+        for metric in self.response_cache.collect():
+            for sample in metric.samples:
+                if sample.name.endswith("_total"):
+                    route = response_cache.setdefault(
+                        sample.labels["route"], {"hit": 0, "miss": 0, "bypass": 0}
+                    )
+                    route[sample.labels["result"]] = int(sample.value)
+        for route in response_cache.values():
+            lookups = route["hit"] + route["miss"]
+            route["hit_ratio"] = route["hit"] / lookups if lookups else 0.0
+
         return {
-            "uptime_seconds": uptime,
-            "requests": self._metrics["requests"],
-            "durations": avg_durations,
-            "errors": self._metrics["errors"],
+            "uptime_seconds": time.time() - self._start_time,
+            "requests": requests,
+            "durations": durations,
+            "errors": errors,
+            "response_cache": response_cache,
             "timestamp": datetime.utcnow().isoformat(),
         }
-    
+
     def reset(self):
-        """Reset metrics."""
-        self._metrics = {
-            "requests": {},
-            "durations": {},
-            "errors": {},
-        }
+        """Reset request, duration, error and response cache metrics."""
+        self.requests.clear()
+        self.durations.clear()
+        self.errors.clear()
+        self.response_cache.clear()
 
 
 def track_time(name: str):
@@ -88,7 +344,7 @@ def track_time(name: str):
                 duration = time.time() - start
                 logger.error(f"{name} failed after {duration:.3f}s: {str(e)}")
                 raise
-        
+
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             start = time.time()
@@ -101,14 +357,14 @@ def track_time(name: str):
                 duration = time.time() - start
                 logger.error(f"{name} failed after {duration:.3f}s: {str(e)}")
                 raise
-        
+
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         else:
             return sync_wrapper
-    
+
     return decorator
 
 
 # Singleton instance
-metrics_collector = MetricsCollector()
\ No newline at end of file
+metrics_collector = MetricsCollector()
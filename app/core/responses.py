@@ -0,0 +1,43 @@
+"""
+JSON response class backed by orjson.
+
+orjson serializes datetime, date, UUID, enums and dataclasses natively.
+Decimals are written as strings, the same as pydantic's JSON mode, so a
+field looks the same whether a route returns a response_model or a plain
+dict.
+
+FastAPI only serializes a response_model with pydantic-core (its dump_json
+fast path) while a route keeps the default response class, so this class is
+used explicitly, for routes that return plain dicts and for error handlers,
+rather than as the app's default_response_class.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact JSON bytes."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
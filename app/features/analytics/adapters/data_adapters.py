@@ -9,10 +9,10 @@ from app.features.analytics.ports.data_providers import (
     IStaffDataProvider,
     IExpenseDataProvider,
     IServiceDataProvider,
-    BookingRevenueDTO,
-    WalkInRevenueDTO,
+    DailyRevenueDTO,
+    DailyServiceRevenueDTO,
     StaffWorkDataDTO,
-    AttendanceDataDTO,
+    AttendanceSummaryDTO,
     ExpenseDataDTO,
     BudgetDataDTO,
     ServiceBookingDataDTO,
@@ -23,6 +23,7 @@ from app.features.analytics.ports.data_providers import (
 from app.features.bookings.use_cases.get_revenue_data import (
     GetRevenueDataUseCase as GetBookingRevenueUseCase,
     GetRevenueDataRequest as GetBookingRevenueRequest,
+    CountRevenueCustomersUseCase,
 )
 from app.features.bookings.use_cases.get_customer_stats import (
     GetCustomerStatsUseCase,
@@ -33,16 +34,18 @@ from app.features.bookings.use_cases.get_customer_stats import (
 from app.features.bookings.use_cases.get_service_stats import (
     GetServiceStatsUseCase,
     GetServiceStatsRequest,
+    GetDailyServiceStatsUseCase,
 )
 from app.features.walkins.use_cases.get_revenue_data import (
     GetWalkInRevenueDataUseCase,
     GetWalkInRevenueDataRequest,
+    GetWalkInDailyServiceDataUseCase,
 )
 from app.features.staff.use_cases.get_staff_data_for_analytics import (
     GetStaffWorkDataUseCase,
     GetStaffWorkDataRequest,
-    GetAttendanceDataUseCase,
-    GetAttendanceDataRequest,
+    GetAttendanceSummaryUseCase,
+    GetAttendanceSummaryRequest,
     GetActiveStaffIdsUseCase,
 )
 from app.features.expenses.use_cases.get_expense_data_for_analytics import (
@@ -68,19 +71,23 @@ class BookingDataAdapter(IBookingDataProvider):
     def __init__(
         self,
         revenue_use_case: GetBookingRevenueUseCase,
+        customer_count_use_case: CountRevenueCustomersUseCase,
         customer_stats_use_case: GetCustomerStatsUseCase,
         top_customers_use_case: GetTopCustomersUseCase,
         service_stats_use_case: GetServiceStatsUseCase,
+        daily_service_stats_use_case: GetDailyServiceStatsUseCase,
     ):
         self._revenue_use_case = revenue_use_case
+        self._customer_count_use_case = customer_count_use_case
         self._customer_stats_use_case = customer_stats_use_case
         self._top_customers_use_case = top_customers_use_case
         self._service_stats_use_case = service_stats_use_case
+        self._daily_service_stats_use_case = daily_service_stats_use_case
 
-    async def get_revenue_data(
+    async def get_daily_revenue(
         self, start_date: date, end_date: date
-    ) -> List[BookingRevenueDTO]:
-        """Get booking revenue data via bookings feature's use case."""
+    ) -> List[DailyRevenueDTO]:
+        """Get daily booking revenue via bookings feature's use case."""
         request = GetBookingRevenueRequest(
             start_date=start_date, end_date=end_date
         )
@@ -88,17 +95,21 @@ class BookingDataAdapter(IBookingDataProvider):
 
         # Convert to Analytics DTOs
         return [
-            BookingRevenueDTO(
-                booking_id=b.booking_id,
-                booking_date=b.booking_date,
-                total_amount=b.total_amount,
-                status=b.status,
-                customer_id=b.customer_id,
-                service_id=b.service_id,
+            DailyRevenueDTO(
+                date=b.booking_date,
+                revenue=b.total_amount,
+                count=b.booking_count,
             )
             for b in booking_data
         ]
 
+    async def count_customers(self, start_date: date, end_date: date) -> int:
+        """Count revenue customers via bookings feature's use case."""
+        request = GetBookingRevenueRequest(
+            start_date=start_date, end_date=end_date
+        )
+        return await self._customer_count_use_case.execute(request)
+
     async def get_customer_booking_data(
         self, customer_id: str
     ) -> Optional[CustomerBookingDataDTO]:
@@ -155,6 +166,24 @@ class BookingDataAdapter(IBookingDataProvider):
             for s in stats_list
         ]
 
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get per-day service booking stats via bookings feature's use case."""
+        request = GetServiceStatsRequest(start_date=start_date, end_date=end_date)
+        stats_list = await self._daily_service_stats_use_case.execute(request)
+
+        return [
+            DailyServiceRevenueDTO(
+                date=s.booking_date,
+                service_id=s.service_id,
+                service_name=s.service_name,
+                count=s.booking_count,
+                revenue=s.total_revenue,
+            )
+            for s in stats_list
+        ]
+
 
 # ============================================================================
 # Walk-in Data Adapter - Analytics owns this
@@ -164,28 +193,52 @@ class BookingDataAdapter(IBookingDataProvider):
 class WalkInDataAdapter(IWalkInDataProvider):
     """Adapter that calls walkins feature's public use case."""
 
-    def __init__(self, revenue_use_case: GetWalkInRevenueDataUseCase):
+    def __init__(
+        self,
+        revenue_use_case: GetWalkInRevenueDataUseCase,
+        daily_service_use_case: GetWalkInDailyServiceDataUseCase,
+    ):
         self._revenue_use_case = revenue_use_case
+        self._daily_service_use_case = daily_service_use_case
 
-    async def get_revenue_data(
+    async def get_daily_revenue(
         self, start_date: date, end_date: date
-    ) -> List[WalkInRevenueDTO]:
-        """Get walk-in revenue data via walkins feature's use case."""
+    ) -> List[DailyRevenueDTO]:
+        """Get daily walk-in revenue via walkins feature's use case."""
         request = GetWalkInRevenueDataRequest(
             start_date=start_date, end_date=end_date
         )
         walkin_data = await self._revenue_use_case.execute(request)
 
         return [
-            WalkInRevenueDTO(
-                walkin_id=w.walkin_id,
-                service_date=w.service_date,
-                final_amount=w.final_amount,
-                status=w.status,
+            DailyRevenueDTO(
+                date=w.service_date,
+                revenue=w.total_amount,
+                count=w.walkin_count,
             )
             for w in walkin_data
         ]
 
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get per-day service revenue via walkins feature's use case."""
+        request = GetWalkInRevenueDataRequest(
+            start_date=start_date, end_date=end_date
+        )
+        service_data = await self._daily_service_use_case.execute(request)
+
+        return [
+            DailyServiceRevenueDTO(
+                date=w.service_date,
+                service_id=w.service_id,
+                service_name=w.service_name,
+                count=w.walkin_count,
+                revenue=w.total_amount,
+            )
+            for w in service_data
+        ]
+
 
 # ============================================================================
 # Staff Data Adapter - Analytics owns this
@@ -198,7 +251,7 @@ class StaffDataAdapter(IStaffDataProvider):
     def __init__(
         self,
         work_data_use_case: GetStaffWorkDataUseCase,
-        attendance_use_case: GetAttendanceDataUseCase,
+        attendance_use_case: GetAttendanceSummaryUseCase,
         active_staff_use_case: GetActiveStaffIdsUseCase,
     ):
         self._work_data_use_case = work_data_use_case
@@ -228,23 +281,23 @@ class StaffDataAdapter(IStaffDataProvider):
         """Get active staff IDs via staff feature's use case."""
         return await self._active_staff_use_case.execute()
 
-    async def get_attendance_data(
-        self, staff_id: str, start_date: date, end_date: date
-    ) -> List[AttendanceDataDTO]:
-        """Get attendance data via staff feature's use case."""
-        request = GetAttendanceDataRequest(
-            staff_id=staff_id, start_date=start_date, end_date=end_date
+    async def get_attendance_summary(
+        self, start_date: date, end_date: date, staff_id: Optional[str] = None
+    ) -> List[AttendanceSummaryDTO]:
+        """Get attendance totals via staff feature's use case."""
+        request = GetAttendanceSummaryRequest(
+            start_date=start_date, end_date=end_date, staff_id=staff_id
         )
-        attendance_list = await self._attendance_use_case.execute(request)
+        summaries = await self._attendance_use_case.execute(request)
 
         return [
-            AttendanceDataDTO(
+            AttendanceSummaryDTO(
                 staff_id=a.staff_id,
-                date=a.date,
-                status=a.status,
+                days_recorded=a.days_recorded,
+                present_days=a.present_days,
                 hours_worked=a.hours_worked,
             )
-            for a in attendance_list
+            for a in summaries
         ]
 
 
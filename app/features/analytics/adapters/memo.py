@@ -0,0 +1,144 @@
+"""
+Per-request memo for analytics data providers.
+
+Reports built for the same request (the dashboard sections) ask the
+providers for the same period data: revenue metrics, financial KPIs and
+growth all read daily booking and walk-in revenue. Wrapping the providers
+in one shared memo makes each distinct call hit the database once, even
+when the sections run concurrently on separate sessions.
+"""
+
+import asyncio
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from app.features.analytics.ports.data_providers import (
+    IBookingDataProvider,
+    IWalkInDataProvider,
+    DailyRevenueDTO,
+    DailyServiceRevenueDTO,
+    ServiceBookingDataDTO,
+    CustomerBookingDataDTO,
+)
+
+
+class ProviderMemo:
+    """
+    Results of provider calls for the lifetime of one request.
+
+    The first caller for a key runs the load on its own session; concurrent
+    callers wait for that result instead of issuing the same query. Failed
+    loads are not remembered, so a later call retries.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, asyncio.Future] = {}
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the memoized result for key, loading it on first use."""
+        future = self._results.get(key)
+        if future is not None:
+            # Shielded so a cancelled waiter does not cancel the shared result
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._results[key] = future
+        try:
+            result = await load()
+        except BaseException as e:
+            del self._results[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved: there may be no waiters to see it
+                future.exception()
+            raise
+        future.set_result(result)
+        return result
+
+
+class MemoBookingDataProvider(IBookingDataProvider):
+    """Booking data provider whose calls are memoized per request."""
+
+    def __init__(self, provider: IBookingDataProvider, memo: ProviderMemo):
+        self._provider = provider
+        self._memo = memo
+
+    async def get_daily_revenue(
+        self, start_date: date, end_date: date
+    ) -> List[DailyRevenueDTO]:
+        """Get booking revenue per day."""
+        return await self._memo.get(
+            ("bookings.daily_revenue", start_date, end_date),
+            lambda: self._provider.get_daily_revenue(start_date, end_date),
+        )
+
+    async def count_customers(self, start_date: date, end_date: date) -> int:
+        """Count distinct customers with revenue bookings."""
+        return await self._memo.get(
+            ("bookings.count_customers", start_date, end_date),
+            lambda: self._provider.count_customers(start_date, end_date),
+        )
+
+    async def get_customer_booking_data(
+        self, customer_id: str
+    ) -> Optional[CustomerBookingDataDTO]:
+        """Get booking statistics for a customer."""
+        return await self._memo.get(
+            ("bookings.customer", customer_id),
+            lambda: self._provider.get_customer_booking_data(customer_id),
+        )
+
+    async def get_top_customers_data(
+        self, start_date: date, end_date: date, limit: int
+    ) -> List[CustomerBookingDataDTO]:
+        """Get top customers by spending."""
+        return await self._memo.get(
+            ("bookings.top_customers", start_date, end_date, limit),
+            lambda: self._provider.get_top_customers_data(start_date, end_date, limit),
+        )
+
+    async def get_service_booking_data(
+        self, start_date: date, end_date: date
+    ) -> List[ServiceBookingDataDTO]:
+        """Get booking statistics by service."""
+        return await self._memo.get(
+            ("bookings.services", start_date, end_date),
+            lambda: self._provider.get_service_booking_data(start_date, end_date),
+        )
+
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get booking statistics per day and service."""
+        return await self._memo.get(
+            ("bookings.daily_services", start_date, end_date),
+            lambda: self._provider.get_daily_service_data(start_date, end_date),
+        )
+
+
+class MemoWalkInDataProvider(IWalkInDataProvider):
+    """Walk-in data provider whose calls are memoized per request."""
+
+    def __init__(self, provider: IWalkInDataProvider, memo: ProviderMemo):
+        self._provider = provider
+        self._memo = memo
+
+    async def get_daily_revenue(
+        self, start_date: date, end_date: date
+    ) -> List[DailyRevenueDTO]:
+        """Get walk-in revenue per day."""
+        return await self._memo.get(
+            ("walkins.daily_revenue", start_date, end_date),
+            lambda: self._provider.get_daily_revenue(start_date, end_date),
+        )
+
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get walk-in revenue per day and service."""
+        return await self._memo.get(
+            ("walkins.daily_services", start_date, end_date),
+            lambda: self._provider.get_daily_service_data(start_date, end_date),
+        )
@@ -0,0 +1,43 @@
+"""Analytics database models - materialized rollups."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import Column, Date, DateTime, Integer, Numeric, String
+
+from app.core.db.base import Base
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class DailyRevenueRollupModel(Base):
+    """
+    Revenue per day and source (bookings, walk-ins).
+
+    Every refreshed day gets a row, with zero revenue if nothing happened,
+    so a missing row means the day has not been rolled up yet.
+    """
+
+    __tablename__ = "daily_revenue_rollup"
+
+    day = Column(Date, primary_key=True)
+    source = Column(String(20), primary_key=True)
+    revenue = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    transaction_count = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+
+
+class DailyServiceRollupModel(Base):
+    """Revenue per day, source and service."""
+
+    __tablename__ = "daily_service_rollup"
+
+    day = Column(Date, primary_key=True)
+    source = Column(String(20), primary_key=True)
+    service_id = Column(String, primary_key=True)
+    service_name = Column(String(200), nullable=False, default="")
+    revenue = Column(Numeric(12, 2), nullable=False, default=Decimal("0.00"))
+    transaction_count = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
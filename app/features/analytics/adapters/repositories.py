@@ -1,8 +1,10 @@
 """Analytics repository implementations using data providers (NO cross-feature imports)."""
 
+import asyncio
+from collections import defaultdict
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.features.analytics.domain.entities import (
     RevenueMetrics,
@@ -17,7 +19,11 @@ from app.features.analytics.domain.entities import (
     PeakHoursAnalysis,
     DashboardSummary,
 )
-from app.features.analytics.domain.enums import RevenueSource, CustomerSegment
+from app.features.analytics.domain.enums import (
+    RevenueSource,
+    CustomerSegment,
+    TimeGranularity,
+)
 from app.features.analytics.ports.repositories import (
     IRevenueAnalyticsRepository,
     IStaffAnalyticsRepository,
@@ -32,9 +38,40 @@ from app.features.analytics.ports.data_providers import (
     IStaffDataProvider,
     IExpenseDataProvider,
     IServiceDataProvider,
+    StaffWorkDataDTO,
+    AttendanceSummaryDTO,
 )
 
 
+_MONTHS_PER_PERIOD = {
+    TimeGranularity.MONTHLY: 1,
+    TimeGranularity.QUARTERLY: 3,
+    TimeGranularity.YEARLY: 12,
+}
+
+
+def _period_start(day: date, granularity: TimeGranularity) -> date:
+    """First day of the period containing day (weeks start on Monday)."""
+    if granularity == TimeGranularity.DAILY:
+        return day
+    if granularity == TimeGranularity.WEEKLY:
+        return day - timedelta(days=day.weekday())
+    if granularity in _MONTHS_PER_PERIOD:
+        months = _MONTHS_PER_PERIOD[granularity]
+        return date(day.year, (day.month - 1) // months * months + 1, 1)
+    raise ValueError(f"Revenue cannot be broken down by {granularity.value} periods")
+
+
+def _next_period(period: date, granularity: TimeGranularity) -> date:
+    """First day of the period after the one starting on period."""
+    if granularity == TimeGranularity.DAILY:
+        return period + timedelta(days=1)
+    if granularity == TimeGranularity.WEEKLY:
+        return period + timedelta(days=7)
+    month = period.month - 1 + _MONTHS_PER_PERIOD[granularity]
+    return date(period.year + month // 12, month % 12 + 1, 1)
+
+
 class RevenueAnalyticsRepository(IRevenueAnalyticsRepository):
     """Repository for revenue analytics using data providers."""
 
@@ -46,22 +83,27 @@ class RevenueAnalyticsRepository(IRevenueAnalyticsRepository):
         self._booking_provider = booking_provider
         self._walkin_provider = walkin_provider
 
+    async def _revenue_totals(self, start_date: date, end_date: date):
+        """Bookings revenue, bookings count and walk-ins revenue for a period."""
+        booking_days = await self._booking_provider.get_daily_revenue(
+            start_date, end_date
+        )
+        walkin_days = await self._walkin_provider.get_daily_revenue(
+            start_date, end_date
+        )
+
+        bookings_revenue = sum((d.revenue for d in booking_days), Decimal("0"))
+        bookings_count = sum(d.count for d in booking_days)
+        walkins_revenue = sum((d.revenue for d in walkin_days), Decimal("0"))
+        return bookings_revenue, bookings_count, walkins_revenue
+
     async def get_revenue_metrics(
         self, start_date: date, end_date: date
     ) -> RevenueMetrics:
         """Get revenue metrics by calling other features' use cases."""
-        # Get booking revenue data
-        booking_data = await self._booking_provider.get_revenue_data(
-            start_date, end_date
-        )
-        bookings_revenue = sum(b.total_amount for b in booking_data)
-        bookings_count = len(booking_data)
-
-        # Get walk-in revenue data
-        walkin_data = await self._walkin_provider.get_revenue_data(
-            start_date, end_date
+        bookings_revenue, bookings_count, walkins_revenue = (
+            await self._revenue_totals(start_date, end_date)
         )
-        walkins_revenue = sum(w.final_amount for w in walkin_data)
 
         total_revenue = bookings_revenue + walkins_revenue
         total_bookings = bookings_count
@@ -90,34 +132,47 @@ class RevenueAnalyticsRepository(IRevenueAnalyticsRepository):
         )
 
     async def get_daily_revenue(
-        self, start_date: date, end_date: date
+        self,
+        start_date: date,
+        end_date: date,
+        granularity: TimeGranularity = TimeGranularity.DAILY,
     ) -> List[DailyRevenue]:
-        """Get daily revenue breakdown."""
-        # Get all data for period
-        booking_data = await self._booking_provider.get_revenue_data(
+        """
+        Get revenue broken down by day, week, month, quarter or year.
+
+        Provider rows are bucketed in a single pass, then every period in the
+        range is emitted, with zeros for periods without activity. Each
+        period is dated by its first day, clamped to start_date.
+        """
+        period = _period_start(start_date, granularity)
+
+        bookings_revenue: Dict[date, Decimal] = defaultdict(Decimal)
+        bookings_count: Dict[date, int] = defaultdict(int)
+        walkins_revenue: Dict[date, Decimal] = defaultdict(Decimal)
+        walkins_count: Dict[date, int] = defaultdict(int)
+
+        booking_days = await self._booking_provider.get_daily_revenue(
             start_date, end_date
         )
-        walkin_data = await self._walkin_provider.get_revenue_data(
+        for d in booking_days:
+            bucket = _period_start(d.date, granularity)
+            bookings_revenue[bucket] += d.revenue
+            bookings_count[bucket] += d.count
+
+        walkin_days = await self._walkin_provider.get_daily_revenue(
             start_date, end_date
         )
+        for d in walkin_days:
+            bucket = _period_start(d.date, granularity)
+            walkins_revenue[bucket] += d.revenue
+            walkins_count[bucket] += d.count
 
-        # Group by date
         daily_revenues = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            # Bookings for this day
-            day_bookings = [b for b in booking_data if b.booking_date == current_date]
-            bookings_revenue = sum(b.total_amount for b in day_bookings)
-            bookings_count = len(day_bookings)
-
-            # Walk-ins for this day
-            day_walkins = [w for w in walkin_data if w.service_date == current_date]
-            walkins_revenue = sum(w.final_amount for w in day_walkins)
-            walkins_count = len(day_walkins)
-
-            total_revenue = bookings_revenue + walkins_revenue
-            total_count = bookings_count + walkins_count
+        while period <= end_date:
+            total_revenue = bookings_revenue.get(
+                period, Decimal("0")
+            ) + walkins_revenue.get(period, Decimal("0"))
+            total_count = bookings_count.get(period, 0) + walkins_count.get(period, 0)
             avg_value = (
                 total_revenue / Decimal(str(total_count))
                 if total_count > 0
@@ -126,15 +181,15 @@ class RevenueAnalyticsRepository(IRevenueAnalyticsRepository):
 
             daily_revenues.append(
                 DailyRevenue(
-                    date=current_date,
+                    date=max(period, start_date),
                     revenue=total_revenue,
-                    bookings_count=bookings_count,
-                    walkins_count=walkins_count,
+                    bookings_count=bookings_count.get(period, 0),
+                    walkins_count=walkins_count.get(period, 0),
                     average_value=avg_value,
                 )
             )
 
-            current_date += timedelta(days=1)
+            period = _next_period(period, granularity)
 
         return daily_revenues
 
@@ -146,11 +201,16 @@ class RevenueAnalyticsRepository(IRevenueAnalyticsRepository):
         previous_start = start_date - timedelta(days=period_length)
         previous_end = start_date - timedelta(days=1)
 
-        current_metrics = await self.get_revenue_metrics(start_date, end_date)
-        current_revenue = current_metrics.total_revenue
+        # Totals only: going through get_revenue_metrics would recurse forever
+        bookings_revenue, _, walkins_revenue = await self._revenue_totals(
+            start_date, end_date
+        )
+        current_revenue = bookings_revenue + walkins_revenue
 
-        previous_metrics = await self.get_revenue_metrics(previous_start, previous_end)
-        previous_revenue = previous_metrics.total_revenue
+        bookings_revenue, _, walkins_revenue = await self._revenue_totals(
+            previous_start, previous_end
+        )
+        previous_revenue = bookings_revenue + walkins_revenue
 
         if previous_revenue == Decimal("0"):
             return None
@@ -176,14 +236,26 @@ class StaffAnalyticsRepository(IStaffAnalyticsRepository):
             staff_id, start_date, end_date
         )
 
-        # Get attendance data
-        attendance_data = await self._staff_provider.get_attendance_data(
-            staff_id, start_date, end_date
+        # Get attendance totals
+        summaries = await self._staff_provider.get_attendance_summary(
+            start_date, end_date, staff_id=staff_id
         )
 
-        total_days = len(attendance_data)
-        present_days = sum(1 for a in attendance_data if a.status == "present")
-        total_hours = sum(a.hours_worked for a in attendance_data)
+        return self._to_performance(
+            work_data, summaries[0] if summaries else None, start_date, end_date
+        )
+
+    def _to_performance(
+        self,
+        work_data: StaffWorkDataDTO,
+        attendance: Optional[AttendanceSummaryDTO],
+        start_date: date,
+        end_date: date,
+    ) -> StaffPerformanceMetrics:
+        """Combine work data and attendance totals into performance metrics."""
+        total_days = attendance.days_recorded if attendance else 0
+        present_days = attendance.present_days if attendance else 0
+        total_hours = attendance.hours_worked if attendance else Decimal("0")
 
         attendance_rate = (
             (Decimal(str(present_days)) / Decimal(str(total_days))) * Decimal("100")
@@ -198,7 +270,7 @@ class StaffAnalyticsRepository(IStaffAnalyticsRepository):
         )
 
         return StaffPerformanceMetrics(
-            staff_id=staff_id,
+            staff_id=work_data.staff_id,
             staff_name=work_data.staff_name,
             period_start=start_date,
             period_end=end_date,
@@ -217,16 +289,28 @@ class StaffAnalyticsRepository(IStaffAnalyticsRepository):
         # Get all active staff IDs
         staff_ids = await self._staff_provider.get_all_active_staff_ids()
 
+        # One grouped query for everyone's attendance
+        attendance = {
+            a.staff_id: a
+            for a in await self._staff_provider.get_attendance_summary(
+                start_date, end_date
+            )
+        }
+
         performance_list = []
         for staff_id in staff_ids:
             try:
-                performance = await self.get_staff_performance(
+                work_data = await self._staff_provider.get_staff_work_data(
                     staff_id, start_date, end_date
                 )
-                performance_list.append(performance)
             except LookupError:
                 # Skip if staff not found
                 continue
+            performance_list.append(
+                self._to_performance(
+                    work_data, attendance.get(staff_id), start_date, end_date
+                )
+            )
 
         return performance_list
 
@@ -270,15 +354,11 @@ class CustomerAnalyticsRepository(ICustomerAnalyticsRepository):
         self, start_date: date, end_date: date
     ) -> CustomerMetrics:
         """Get customer metrics for a period."""
-        # Get booking data
-        booking_data = await self._booking_provider.get_revenue_data(
+        # Get unique customers
+        total_customers = await self._booking_provider.count_customers(
             start_date, end_date
         )
 
-        # Get unique customers
-        unique_customers = set(b.customer_id for b in booking_data)
-        total_customers = len(unique_customers)
-
         # Simplified segmentation
         new_customers = 0
         returning_customers = total_customers - new_customers
@@ -391,15 +471,15 @@ class FinancialAnalyticsRepository(IFinancialAnalyticsRepository):
     ) -> FinancialKPIs:
         """Get financial KPIs by combining revenue and expense data."""
         # Get revenue data
-        booking_data = await self._booking_provider.get_revenue_data(
+        booking_days = await self._booking_provider.get_daily_revenue(
             start_date, end_date
         )
-        walkin_data = await self._walkin_provider.get_revenue_data(
+        walkin_days = await self._walkin_provider.get_daily_revenue(
             start_date, end_date
         )
 
-        bookings_revenue = sum(b.total_amount for b in booking_data)
-        walkins_revenue = sum(w.final_amount for w in walkin_data)
+        bookings_revenue = sum((d.revenue for d in booking_days), Decimal("0"))
+        walkins_revenue = sum((d.revenue for d in walkin_days), Decimal("0"))
         total_revenue = bookings_revenue + walkins_revenue
 
         # Get expense data
@@ -416,7 +496,7 @@ class FinancialAnalyticsRepository(IFinancialAnalyticsRepository):
             else Decimal("0")
         )
 
-        booking_count = len(booking_data)
+        booking_count = sum(d.count for d in booking_days)
         revenue_per_booking = (
             total_revenue / Decimal(str(booking_count))
             if booking_count > 0
@@ -492,10 +572,12 @@ class ServiceAnalyticsRepository(IServiceAnalyticsRepository):
 
         popularity_list = []
         for service_data in service_booking_data:
-            # Get service name
-            service_name = await self._service_provider.get_service_name(
-                service_data.service_id
-            )
+            # Bookings snapshot the service name; look it up only if missing
+            service_name = service_data.service_name
+            if not service_name:
+                service_name = await self._service_provider.get_service_name(
+                    service_data.service_id
+                )
 
             popularity_list.append(
                 ServicePopularity(
@@ -534,28 +616,39 @@ class DashboardRepository(IDashboardRepository):
         financial_repo: FinancialAnalyticsRepository,
         customer_repo: CustomerAnalyticsRepository,
         service_repo: ServiceAnalyticsRepository,
+        lanes: int = 4,
     ):
         self._revenue_repo = revenue_repo
         self._financial_repo = financial_repo
         self._customer_repo = customer_repo
         self._service_repo = service_repo
+        self._lanes = max(1, min(lanes, 4))
 
     async def get_dashboard_summary(
         self, start_date: date, end_date: date
     ) -> DashboardSummary:
-        """Get comprehensive dashboard summary."""
-        revenue_metrics = await self._revenue_repo.get_revenue_metrics(
-            start_date, end_date
-        )
-        financial_kpis = await self._financial_repo.get_financial_kpis(
-            start_date, end_date
-        )
-        customer_metrics = await self._customer_repo.get_customer_metrics(
-            start_date, end_date
-        )
-        top_services = await self._service_repo.get_service_popularity(
-            start_date, end_date
-        )
+        """
+        Get comprehensive dashboard summary.
+
+        Section i (revenue, financial, customer, service) runs in lane
+        i % lanes: lanes run concurrently, the sections within a lane one
+        after another. Sections in different lanes must not share a session
+        (see build_dashboard_repository).
+        """
+        sections = [
+            lambda: self._revenue_repo.get_revenue_metrics(start_date, end_date),
+            lambda: self._financial_repo.get_financial_kpis(start_date, end_date),
+            lambda: self._customer_repo.get_customer_metrics(start_date, end_date),
+            lambda: self._service_repo.get_service_popularity(start_date, end_date),
+        ]
+        results: List = [None] * len(sections)
+
+        async def run_lane(lane: int) -> None:
+            for index in range(lane, len(sections), self._lanes):
+                results[index] = await sections[index]()
+
+        await asyncio.gather(*(run_lane(lane) for lane in range(self._lanes)))
+        revenue_metrics, financial_kpis, customer_metrics, top_services = results
 
         return DashboardSummary(
             period_start=start_date,
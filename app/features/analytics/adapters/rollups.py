@@ -0,0 +1,287 @@
+"""
+Revenue rollups - materialized daily aggregates for analytics.
+
+Closed days (before today) are read from daily_revenue_rollup and
+daily_service_rollup; today, future days and any day that has not been
+rolled up yet are aggregated live, one query per run of missing days, so
+results never depend on whether the rollups are complete. Each day is rolled
+up shortly after it closes, refreshed again by booking and walk-in events
+that touch it later, and can be rebuilt with scripts/rebuild_revenue_rollups.py.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.analytics.adapters.models import (
+    DailyRevenueRollupModel,
+    DailyServiceRollupModel,
+)
+from app.features.analytics.domain.enums import RevenueSource
+from app.features.analytics.ports.data_providers import (
+    IBookingDataProvider,
+    IWalkInDataProvider,
+    DailyRevenueDTO,
+    DailyServiceRevenueDTO,
+    ServiceBookingDataDTO,
+    CustomerBookingDataDTO,
+)
+from app.features.analytics.ports.repositories import IRevenueRollupRepository
+
+LiveQuery = Callable[[date, date], Awaitable[list]]
+
+
+def uncovered_ranges(
+    start_date: date, end_date: date, covered: Set[date]
+) -> List[Tuple[date, date]]:
+    """Contiguous (first, last) runs of days in the period that are not covered."""
+    ranges: List[Tuple[date, date]] = []
+    gap_start: Optional[date] = None
+    day = start_date
+    while day <= end_date:
+        if day in covered:
+            if gap_start is not None:
+                ranges.append((gap_start, day - timedelta(days=1)))
+                gap_start = None
+        elif gap_start is None:
+            gap_start = day
+        day += timedelta(days=1)
+    if gap_start is not None:
+        ranges.append((gap_start, end_date))
+    return ranges
+
+
+class SqlRevenueRollupRepository(IRevenueRollupRepository):
+    """Rollup repository implementation using SQLAlchemy."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_daily_revenue(
+        self, source: RevenueSource, start_date: date, end_date: date
+    ) -> List[DailyRevenueDTO]:
+        """Get rolled-up days for a source (only days that have been rolled up)."""
+        result = await self._session.execute(
+            select(DailyRevenueRollupModel)
+            .where(
+                DailyRevenueRollupModel.source == source.value,
+                DailyRevenueRollupModel.day >= start_date,
+                DailyRevenueRollupModel.day <= end_date,
+            )
+            .order_by(DailyRevenueRollupModel.day)
+        )
+        return [
+            DailyRevenueDTO(
+                date=row.day, revenue=row.revenue, count=row.transaction_count
+            )
+            for row in result.scalars()
+        ]
+
+    async def get_daily_service_revenue(
+        self, source: RevenueSource, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get rolled-up per-service rows for a source."""
+        result = await self._session.execute(
+            select(DailyServiceRollupModel)
+            .where(
+                DailyServiceRollupModel.source == source.value,
+                DailyServiceRollupModel.day >= start_date,
+                DailyServiceRollupModel.day <= end_date,
+            )
+            .order_by(DailyServiceRollupModel.day)
+        )
+        return [
+            DailyServiceRevenueDTO(
+                date=row.day,
+                service_id=row.service_id,
+                service_name=row.service_name,
+                count=row.transaction_count,
+                revenue=row.revenue,
+            )
+            for row in result.scalars()
+        ]
+
+    async def replace_period(
+        self,
+        source: RevenueSource,
+        start_date: date,
+        end_date: date,
+        days: List[DailyRevenueDTO],
+        services: List[DailyServiceRevenueDTO],
+    ) -> None:
+        """Replace a source's rollup rows for the period with freshly computed ones."""
+        for model in (DailyRevenueRollupModel, DailyServiceRollupModel):
+            await self._session.execute(
+                delete(model).where(
+                    model.source == source.value,
+                    model.day >= start_date,
+                    model.day <= end_date,
+                )
+            )
+
+        if days:
+            await self._session.execute(
+                insert(DailyRevenueRollupModel),
+                [
+                    {
+                        "day": d.date,
+                        "source": source.value,
+                        "revenue": d.revenue,
+                        "transaction_count": d.count,
+                    }
+                    for d in days
+                ],
+            )
+        if services:
+            await self._session.execute(
+                insert(DailyServiceRollupModel),
+                [
+                    {
+                        "day": s.date,
+                        "source": source.value,
+                        "service_id": s.service_id,
+                        "service_name": s.service_name or "",
+                        "revenue": s.revenue,
+                        "transaction_count": s.count,
+                    }
+                    for s in services
+                ],
+            )
+        await self._session.flush()
+
+
+class RollupReader:
+    """Combines rolled-up closed days with live aggregates for everything else."""
+
+    def __init__(self, rollups: IRevenueRollupRepository, source: RevenueSource):
+        self._rollups = rollups
+        self._source = source
+
+    async def _rolled_days(
+        self, start_date: date, end_date: date
+    ) -> Tuple[List[DailyRevenueDTO], Set[date]]:
+        closed_end = min(end_date, date.today() - timedelta(days=1))
+        if start_date > closed_end:
+            return [], set()
+        rows = await self._rollups.get_daily_revenue(
+            self._source, start_date, closed_end
+        )
+        return rows, {row.date for row in rows}
+
+    async def _live_rows(
+        self, start_date: date, end_date: date, covered: Set[date], live: LiveQuery
+    ) -> list:
+        # One live query per run of uncovered days
+        rows: list = []
+        for gap_start, gap_end in uncovered_ranges(start_date, end_date, covered):
+            rows.extend(await live(gap_start, gap_end))
+        return rows
+
+    async def daily_revenue(
+        self, start_date: date, end_date: date, live: LiveQuery
+    ) -> List[DailyRevenueDTO]:
+        """Revenue per day, omitting days without activity like the live query."""
+        rolled, covered = await self._rolled_days(start_date, end_date)
+        rows = [row for row in rolled if row.count > 0]
+        rows.extend(await self._live_rows(start_date, end_date, covered, live))
+        return sorted(rows, key=lambda row: row.date)
+
+    async def daily_services(
+        self, start_date: date, end_date: date, live: LiveQuery
+    ) -> List[DailyServiceRevenueDTO]:
+        """Revenue per day and service."""
+        _, covered = await self._rolled_days(start_date, end_date)
+        rows: List[DailyServiceRevenueDTO] = []
+        if covered:
+            rows = await self._rollups.get_daily_service_revenue(
+                self._source, min(covered), max(covered)
+            )
+        rows.extend(await self._live_rows(start_date, end_date, covered, live))
+        return sorted(rows, key=lambda row: row.date)
+
+
+class RollupBookingDataProvider(IBookingDataProvider):
+    """Booking data provider reading daily revenue from the rollups."""
+
+    def __init__(self, live: IBookingDataProvider, rollups: IRevenueRollupRepository):
+        self._live = live
+        self._reader = RollupReader(rollups, RevenueSource.BOOKINGS)
+
+    async def get_daily_revenue(
+        self, start_date: date, end_date: date
+    ) -> List[DailyRevenueDTO]:
+        """Get booking revenue per day from rollups, live where not rolled up."""
+        return await self._reader.daily_revenue(
+            start_date, end_date, self._live.get_daily_revenue
+        )
+
+    async def count_customers(self, start_date: date, end_date: date) -> int:
+        """Count revenue customers (always live: not additive across days)."""
+        return await self._live.count_customers(start_date, end_date)
+
+    async def get_customer_booking_data(
+        self, customer_id: str
+    ) -> Optional[CustomerBookingDataDTO]:
+        """Get booking statistics for a customer."""
+        return await self._live.get_customer_booking_data(customer_id)
+
+    async def get_top_customers_data(
+        self, start_date: date, end_date: date, limit: int
+    ) -> List[CustomerBookingDataDTO]:
+        """Get top customers by spending."""
+        return await self._live.get_top_customers_data(start_date, end_date, limit)
+
+    async def get_service_booking_data(
+        self, start_date: date, end_date: date
+    ) -> List[ServiceBookingDataDTO]:
+        """Get booking statistics by service, summed from the daily rows."""
+        totals: Dict[str, ServiceBookingDataDTO] = {}
+        for row in await self.get_daily_service_data(start_date, end_date):
+            service = totals.setdefault(
+                row.service_id,
+                ServiceBookingDataDTO(
+                    service_id=row.service_id,
+                    service_name=row.service_name,
+                    booking_count=0,
+                    total_revenue=Decimal("0"),
+                    status="active",
+                ),
+            )
+            service.booking_count += row.count
+            service.total_revenue += row.revenue
+        return sorted(totals.values(), key=lambda s: s.total_revenue, reverse=True)
+
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get booking statistics per day and service."""
+        return await self._reader.daily_services(
+            start_date, end_date, self._live.get_daily_service_data
+        )
+
+
+class RollupWalkInDataProvider(IWalkInDataProvider):
+    """Walk-in data provider reading daily revenue from the rollups."""
+
+    def __init__(self, live: IWalkInDataProvider, rollups: IRevenueRollupRepository):
+        self._live = live
+        self._reader = RollupReader(rollups, RevenueSource.WALK_INS)
+
+    async def get_daily_revenue(
+        self, start_date: date, end_date: date
+    ) -> List[DailyRevenueDTO]:
+        """Get walk-in revenue per day from rollups, live where not rolled up."""
+        return await self._reader.daily_revenue(
+            start_date, end_date, self._live.get_daily_revenue
+        )
+
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get walk-in revenue per day and service."""
+        return await self._reader.daily_services(
+            start_date, end_date, self._live.get_daily_service_data
+        )
@@ -0,0 +1,148 @@
+"""
+Result cache for analytics endpoints.
+
+Responses are cached per route, date range and remaining query parameters:
+
+- A range ending before today only covers closed days and is cached for
+  ANALYTICS_CACHE_CLOSED_TTL.
+- A range including today (or later) is cached for ANALYTICS_CACHE_OPEN_TTL,
+  under a key carrying the bookings, walk-ins and expenses resource
+  versions. Their repositories mark those resources changed on every
+  write, so the first request after a committed write recomputes. Without
+  Redis the versions are unknown and open ranges are not cached.
+
+Send `X-Cache-Bypass: 1` to compute a fresh result without reading or
+storing the cache. Every response reports HIT, MISS or BYPASS in X-Cache,
+and lookups are counted per route in response_cache_requests_total.
+"""
+
+from datetime import date
+from typing import Awaitable, Callable, Optional, Type, TypeVar
+
+from fastapi import Query, Request, Response
+from pydantic import BaseModel
+
+from app.core.cache import NearCache, ResourceVersions, cached, near_cache, resource_versions
+from app.core.config import settings
+from app.core.observability.metrics import MetricsCollector, metrics_collector, route_template
+
+S = TypeVar("S", bound=BaseModel)
+
+# Resources whose writes change open-range analytics
+ANALYTICS_RESOURCES = ("bookings", "walkins", "expenses")
+
+# Every entry is tagged so all analytics results can be dropped at once
+ANALYTICS_CACHE_TAG = "analytics"
+
+BYPASS_HEADER = "X-Cache-Bypass"
+STATUS_HEADER = "X-Cache"
+
+
+class AnalyticsResultCache:
+    """Caches one endpoint's response for one date range."""
+
+    def __init__(
+        self,
+        route: str,
+        start_date: date,
+        end_date: date,
+        response: Response,
+        bypass: bool = False,
+        cache: NearCache = near_cache,
+        versions: ResourceVersions = resource_versions,
+        metrics: MetricsCollector = metrics_collector,
+    ):
+        self.route = route
+        self.start_date = start_date
+        self.end_date = end_date
+        self.bypass = bypass
+        self._response = response
+        self._cache = cache
+        self._versions = versions
+        self._metrics = metrics
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the range ends before today, so its data no longer changes."""
+        return self.end_date < date.today()
+
+    async def _key(self, params: dict) -> Optional[str]:
+        """Cache key, or None when an open range cannot be invalidated."""
+        parts = [
+            ANALYTICS_CACHE_TAG,
+            self.route,
+            self.start_date.isoformat(),
+            self.end_date.isoformat(),
+        ]
+        parts.extend(f"{name}={value}" for name, value in sorted(params.items()))
+        if not self.is_closed:
+            versions = await self._versions.get(*ANALYTICS_RESOURCES)
+            if versions is None:
+                return None
+            parts.append(".".join(str(version) for version in versions))
+        return ":".join(parts)
+
+    def _record(self, result: str) -> None:
+        self._response.headers[STATUS_HEADER] = result.upper()
+        self._metrics.record_cache_lookup(self.route, result)
+
+    async def get_or_compute(
+        self, schema: Type[S], compute: Callable[[], Awaitable[S]], **params
+    ) -> S:
+        """
+        Return the cached response, or compute and cache it.
+
+        params are the endpoint's other query parameters; they are part of
+        the key. Errors raised by compute are never cached.
+        """
+        key = None
+        if settings.analytics_cache_enabled and not self.bypass:
+            key = await self._key(params)
+        if key is None:
+            self._record("bypass")
+            return await compute()
+
+        computed = False
+
+        async def load():
+            nonlocal computed
+            computed = True
+            return (await compute()).model_dump(mode="json")
+
+        ttl = (
+            settings.analytics_cache_closed_ttl
+            if self.is_closed
+            else settings.analytics_cache_open_ttl
+        )
+        # No stale serving: an expired open range is always recomputed
+        data = await cached(
+            key,
+            load,
+            ttl,
+            stale_ttl=0,
+            early_refresh=0,
+            tags=[ANALYTICS_CACHE_TAG],
+            cache=self._cache,
+        )
+        self._record("miss" if computed else "hit")
+        return schema.model_validate(data)
+
+
+def get_analytics_cache(
+    request: Request,
+    response: Response,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+) -> AnalyticsResultCache:
+    """Get the result cache for this request's endpoint and date range."""
+    return AnalyticsResultCache(
+        route_template(request.scope),
+        start_date,
+        end_date,
+        response,
+        bypass=request.headers.get(BYPASS_HEADER, "").lower() in ("1", "true", "yes"),
+        # Resolved per request rather than at import, so they can be swapped
+        cache=near_cache,
+        versions=resource_versions,
+        metrics=metrics_collector,
+    )
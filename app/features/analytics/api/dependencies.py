@@ -1,11 +1,13 @@
 """Analytics API dependencies - Dependency injection setup with data providers."""
 
-from typing import Annotated
+from contextlib import AsyncExitStack
+from typing import Annotated, AsyncGenerator, Sequence
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db.session import get_db
+from app.core.config import settings
+from app.core.db.session import get_db, get_read_db, read_session
 
 # Analytics repositories and data providers
 from app.features.analytics.adapters.repositories import (
@@ -23,6 +25,16 @@ from app.features.analytics.adapters.data_adapters import (
     ExpenseDataAdapter,
     ServiceDataAdapter,
 )
+from app.features.analytics.adapters.memo import (
+    ProviderMemo,
+    MemoBookingDataProvider,
+    MemoWalkInDataProvider,
+)
+from app.features.analytics.adapters.rollups import (
+    SqlRevenueRollupRepository,
+    RollupBookingDataProvider,
+    RollupWalkInDataProvider,
+)
 from app.features.analytics.use_cases.get_revenue_metrics import (
     GetRevenueMetricsUseCase,
 )
@@ -48,44 +60,60 @@ from app.features.analytics.use_cases.get_service_popularity import (
 from app.features.analytics.use_cases.get_dashboard_summary import (
     GetDashboardSummaryUseCase,
 )
+from app.features.analytics.use_cases.refresh_revenue_rollups import (
+    RefreshRevenueRollupsUseCase,
+)
 
 # Other features' dependencies for public use cases
-from app.features.bookings.api.dependencies import get_booking_repository
+from app.features.bookings.api.dependencies import (
+    get_booking_repository,
+    get_read_booking_repository,
+)
 from app.features.bookings.ports.repositories import IBookingRepository
-from app.features.walkins.api.dependencies import get_walkin_repository
+from app.features.walkins.api.dependencies import (
+    get_walkin_repository,
+    get_read_walkin_repository,
+)
 from app.features.walkins.ports.repositories import IWalkInRepository
 from app.features.staff.api.dependencies import (
-    get_staff_repository,
-    get_attendance_repository,
+    get_read_staff_repository,
+    get_read_attendance_repository,
 )
 from app.features.staff.ports.repositories import (
     IStaffRepository,
     IAttendanceRepository,
 )
 from app.features.expenses.api.dependencies import (
-    get_expense_repository,
-    get_budget_repository,
+    get_read_expense_repository,
+    get_read_budget_repository,
 )
 from app.features.expenses.ports.repositories import (
     IExpenseRepository,
     IBudgetRepository,
 )
-from app.features.services.api.dependencies import get_service_repository
+from app.features.services.api.dependencies import get_read_service_repository
 from app.features.services.ports.repositories import IServiceRepository
 
 # Import public use cases from other features
-from app.features.bookings.use_cases.get_revenue_data import GetRevenueDataUseCase
+from app.features.bookings.use_cases.get_revenue_data import (
+    GetRevenueDataUseCase,
+    CountRevenueCustomersUseCase,
+)
 from app.features.bookings.use_cases.get_customer_stats import (
     GetCustomerStatsUseCase,
     GetTopCustomersUseCase,
 )
-from app.features.bookings.use_cases.get_service_stats import GetServiceStatsUseCase
+from app.features.bookings.use_cases.get_service_stats import (
+    GetServiceStatsUseCase,
+    GetDailyServiceStatsUseCase,
+)
 from app.features.walkins.use_cases.get_revenue_data import (
     GetWalkInRevenueDataUseCase,
+    GetWalkInDailyServiceDataUseCase,
 )
 from app.features.staff.use_cases.get_staff_data_for_analytics import (
     GetStaffWorkDataUseCase,
-    GetAttendanceDataUseCase,
+    GetAttendanceSummaryUseCase,
     GetActiveStaffIdsUseCase,
 )
 from app.features.expenses.use_cases.get_expense_data_for_analytics import (
@@ -101,41 +129,46 @@ from app.features.services.use_cases.get_service_name import GetServiceNameUseCa
 
 
 def get_booking_data_provider(
-    booking_repo: Annotated[IBookingRepository, Depends(get_booking_repository)]
+    booking_repo: Annotated[IBookingRepository, Depends(get_read_booking_repository)]
 ) -> BookingDataAdapter:
     """Get booking data provider (analytics owns this adapter)."""
     # Create public use cases from bookings feature
     revenue_use_case = GetRevenueDataUseCase(booking_repo)
+    customer_count_use_case = CountRevenueCustomersUseCase(booking_repo)
     customer_stats_use_case = GetCustomerStatsUseCase(booking_repo)
     top_customers_use_case = GetTopCustomersUseCase(booking_repo)
     service_stats_use_case = GetServiceStatsUseCase(booking_repo)
+    daily_service_stats_use_case = GetDailyServiceStatsUseCase(booking_repo)
 
     # Return analytics-owned adapter
     return BookingDataAdapter(
         revenue_use_case,
+        customer_count_use_case,
         customer_stats_use_case,
         top_customers_use_case,
         service_stats_use_case,
+        daily_service_stats_use_case,
     )
 
 
 def get_walkin_data_provider(
-    walkin_repo: Annotated[IWalkInRepository, Depends(get_walkin_repository)]
+    walkin_repo: Annotated[IWalkInRepository, Depends(get_read_walkin_repository)]
 ) -> WalkInDataAdapter:
     """Get walk-in data provider (analytics owns this adapter)."""
     revenue_use_case = GetWalkInRevenueDataUseCase(walkin_repo)
-    return WalkInDataAdapter(revenue_use_case)
+    daily_service_use_case = GetWalkInDailyServiceDataUseCase(walkin_repo)
+    return WalkInDataAdapter(revenue_use_case, daily_service_use_case)
 
 
 def get_staff_data_provider(
-    staff_repo: Annotated[IStaffRepository, Depends(get_staff_repository)],
+    staff_repo: Annotated[IStaffRepository, Depends(get_read_staff_repository)],
     attendance_repo: Annotated[
-        IAttendanceRepository, Depends(get_attendance_repository)
+        IAttendanceRepository, Depends(get_read_attendance_repository)
     ],
 ) -> StaffDataAdapter:
     """Get staff data provider (analytics owns this adapter)."""
     work_data_use_case = GetStaffWorkDataUseCase(staff_repo, attendance_repo)
-    attendance_use_case = GetAttendanceDataUseCase(attendance_repo)
+    attendance_use_case = GetAttendanceSummaryUseCase(attendance_repo)
     active_staff_use_case = GetActiveStaffIdsUseCase(staff_repo)
 
     return StaffDataAdapter(
@@ -144,8 +177,8 @@ def get_staff_data_provider(
 
 
 def get_expense_data_provider(
-    expense_repo: Annotated[IExpenseRepository, Depends(get_expense_repository)],
-    budget_repo: Annotated[IBudgetRepository, Depends(get_budget_repository)],
+    expense_repo: Annotated[IExpenseRepository, Depends(get_read_expense_repository)],
+    budget_repo: Annotated[IBudgetRepository, Depends(get_read_budget_repository)],
 ) -> ExpenseDataAdapter:
     """Get expense data provider (analytics owns this adapter)."""
     expense_use_case = GetExpenseDataUseCase(expense_repo)
@@ -155,7 +188,7 @@ def get_expense_data_provider(
 
 
 def get_service_data_provider(
-    service_repo: Annotated[IServiceRepository, Depends(get_service_repository)]
+    service_repo: Annotated[IServiceRepository, Depends(get_read_service_repository)]
 ) -> ServiceDataAdapter:
     """Get service data provider (analytics owns this adapter)."""
     service_name_use_case = GetServiceNameUseCase(service_repo)
@@ -163,13 +196,63 @@ def get_service_data_provider(
 
 
 # ============================================================================
-# Analytics Repository Factories - Use data providers instead of session
+# Revenue Rollups - Closed days served from materialized daily rows
 # ============================================================================
 
 
-def get_revenue_analytics_repository(
+def get_revenue_rollup_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> SqlRevenueRollupRepository:
+    """Get revenue rollup repository for reads (replica when configured)."""
+    return SqlRevenueRollupRepository(session)
+
+
+def get_rollup_booking_data_provider(
     booking_provider: Annotated[BookingDataAdapter, Depends(get_booking_data_provider)],
+    rollups: Annotated[
+        SqlRevenueRollupRepository, Depends(get_revenue_rollup_repository)
+    ],
+) -> RollupBookingDataProvider:
+    """Get booking data provider backed by the revenue rollups."""
+    return RollupBookingDataProvider(booking_provider, rollups)
+
+
+def get_rollup_walkin_data_provider(
     walkin_provider: Annotated[WalkInDataAdapter, Depends(get_walkin_data_provider)],
+    rollups: Annotated[
+        SqlRevenueRollupRepository, Depends(get_revenue_rollup_repository)
+    ],
+) -> RollupWalkInDataProvider:
+    """Get walk-in data provider backed by the revenue rollups."""
+    return RollupWalkInDataProvider(walkin_provider, rollups)
+
+
+def build_rollup_refresher(session: AsyncSession) -> RefreshRevenueRollupsUseCase:
+    """
+    Build the rollup refresh use case on a primary session.
+
+    Used outside requests (event handlers, rebuild script), so the live
+    providers read the primary rather than a possibly lagging replica.
+    """
+    return RefreshRevenueRollupsUseCase(
+        SqlRevenueRollupRepository(session),
+        get_booking_data_provider(get_booking_repository(session)),
+        get_walkin_data_provider(get_walkin_repository(session)),
+    )
+
+
+# ============================================================================
+# Analytics Repository Factories - Use data providers instead of session
+# ============================================================================
+
+
+def get_revenue_analytics_repository(
+    booking_provider: Annotated[
+        RollupBookingDataProvider, Depends(get_rollup_booking_data_provider)
+    ],
+    walkin_provider: Annotated[
+        RollupWalkInDataProvider, Depends(get_rollup_walkin_data_provider)
+    ],
 ) -> RevenueAnalyticsRepository:
     """Get revenue analytics repository instance."""
     return RevenueAnalyticsRepository(booking_provider, walkin_provider)
@@ -190,8 +273,12 @@ def get_customer_analytics_repository(
 
 
 def get_financial_analytics_repository(
-    booking_provider: Annotated[BookingDataAdapter, Depends(get_booking_data_provider)],
-    walkin_provider: Annotated[WalkInDataAdapter, Depends(get_walkin_data_provider)],
+    booking_provider: Annotated[
+        RollupBookingDataProvider, Depends(get_rollup_booking_data_provider)
+    ],
+    walkin_provider: Annotated[
+        RollupWalkInDataProvider, Depends(get_rollup_walkin_data_provider)
+    ],
     expense_provider: Annotated[ExpenseDataAdapter, Depends(get_expense_data_provider)],
 ) -> FinancialAnalyticsRepository:
     """Get financial analytics repository instance."""
@@ -201,33 +288,78 @@ def get_financial_analytics_repository(
 
 
 def get_service_analytics_repository(
-    booking_provider: Annotated[BookingDataAdapter, Depends(get_booking_data_provider)],
+    booking_provider: Annotated[
+        RollupBookingDataProvider, Depends(get_rollup_booking_data_provider)
+    ],
     service_provider: Annotated[ServiceDataAdapter, Depends(get_service_data_provider)],
 ) -> ServiceAnalyticsRepository:
     """Get service analytics repository instance."""
     return ServiceAnalyticsRepository(booking_provider, service_provider)
 
 
-def get_dashboard_repository(
-    revenue_repo: Annotated[
-        RevenueAnalyticsRepository, Depends(get_revenue_analytics_repository)
-    ],
-    financial_repo: Annotated[
-        FinancialAnalyticsRepository, Depends(get_financial_analytics_repository)
-    ],
-    customer_repo: Annotated[
-        CustomerAnalyticsRepository, Depends(get_customer_analytics_repository)
-    ],
-    service_repo: Annotated[
-        ServiceAnalyticsRepository, Depends(get_service_analytics_repository)
-    ],
-) -> DashboardRepository:
-    """Get dashboard repository instance."""
+def build_dashboard_repository(sessions: Sequence[AsyncSession]) -> DashboardRepository:
+    """
+    Build the dashboard repository with one read session per lane.
+
+    Sections in different lanes run concurrently, and a session runs one
+    query at a time, so section i uses sessions[i % len(sessions)], the
+    session of its lane. Booking and walk-in providers share a per-request
+    memo, so the period data several sections need is fetched once, by
+    whichever asks first.
+    """
+    memo = ProviderMemo()
+    revenue_session, financial_session, customer_session, service_session = (
+        sessions[index % len(sessions)] for index in range(4)
+    )
+
+    def booking_provider(session: AsyncSession) -> MemoBookingDataProvider:
+        provider = RollupBookingDataProvider(
+            get_booking_data_provider(get_read_booking_repository(session)),
+            SqlRevenueRollupRepository(session),
+        )
+        return MemoBookingDataProvider(provider, memo)
+
+    def walkin_provider(session: AsyncSession) -> MemoWalkInDataProvider:
+        provider = RollupWalkInDataProvider(
+            get_walkin_data_provider(get_read_walkin_repository(session)),
+            SqlRevenueRollupRepository(session),
+        )
+        return MemoWalkInDataProvider(provider, memo)
+
     return DashboardRepository(
-        revenue_repo, financial_repo, customer_repo, service_repo
+        RevenueAnalyticsRepository(
+            booking_provider(revenue_session), walkin_provider(revenue_session)
+        ),
+        FinancialAnalyticsRepository(
+            booking_provider(financial_session),
+            walkin_provider(financial_session),
+            get_expense_data_provider(
+                get_read_expense_repository(financial_session),
+                get_read_budget_repository(financial_session),
+            ),
+        ),
+        CustomerAnalyticsRepository(booking_provider(customer_session)),
+        ServiceAnalyticsRepository(
+            booking_provider(service_session),
+            get_service_data_provider(get_read_service_repository(service_session)),
+        ),
+        lanes=len(sessions),
     )
 
 
+async def get_dashboard_repository() -> AsyncGenerator[DashboardRepository, None]:
+    """
+    Get dashboard repository instance (sessions closed after the request).
+
+    Each of the ANALYTICS_DASHBOARD_CONCURRENCY lanes holds a pooled
+    connection while its sections run.
+    """
+    lanes = max(1, min(settings.analytics_dashboard_concurrency, 4))
+    async with AsyncExitStack() as stack:
+        sessions = [await stack.enter_async_context(read_session()) for _ in range(lanes)]
+        yield build_dashboard_repository(sessions)
+
+
 # ============================================================================
 # Use Case Factories - Revenue
 # ============================================================================
@@ -0,0 +1,173 @@
+"""
+Analytics event handlers - keep the revenue rollups current.
+
+Today is always aggregated live, so nothing is rolled up before a day
+closes. RollupDayCloser then rolls up each closed day that has no rollup
+yet, yesterday included, shortly after midnight. Booking and walk-in events
+arrive through the outbox dispatcher (at least once); each one refreshes the
+closed days it touches, which covers late changes to days already rolled up.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.core.db.session import AsyncSessionLocal
+from app.core.events import EventBus, event_bus
+from app.features.analytics.adapters.rollups import (
+    SqlRevenueRollupRepository,
+    uncovered_ranges,
+)
+from app.features.analytics.api.dependencies import build_rollup_refresher
+from app.features.analytics.domain.enums import RevenueSource
+from app.features.analytics.use_cases.refresh_revenue_rollups import (
+    RefreshRevenueRollupsRequest,
+)
+
+BOOKING_EVENTS = (
+    "booking.created",
+    "booking.confirmed",
+    "booking.cancelled",
+    "booking.completed",
+    "booking.updated",
+    "booking.rescheduled",
+)
+WALKIN_EVENTS = (
+    "walkin.completed",
+    "walkin.cancelled",
+    "walkin.payment_recorded",
+)
+
+# Sources with rollup tables
+ROLLUP_SOURCES = (RevenueSource.BOOKINGS, RevenueSource.WALK_INS)
+
+logger = logging.getLogger(__name__)
+
+
+def _closed_days(event_data: Dict[str, Any], fields: Iterable[str]) -> List[date]:
+    today = date.today()
+    days = {
+        datetime.fromisoformat(event_data[field]).date()
+        for field in fields
+        if event_data.get(field)
+    }
+    return sorted(day for day in days if day < today)
+
+
+class RevenueRollupSubscriber:
+    """Refreshes the rollup days named in booking and walk-in events."""
+
+    def __init__(self, session_factory: Callable = AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    def subscribe(self, bus: EventBus) -> None:
+        """Register the handlers on an event bus."""
+        for event_name in BOOKING_EVENTS:
+            bus.subscribe(event_name, self.on_booking_event)
+        for event_name in WALKIN_EVENTS:
+            bus.subscribe(event_name, self.on_walkin_event)
+
+    async def on_booking_event(self, event_data: Dict[str, Any]) -> None:
+        """Refresh the booking rollups for the (old and new) scheduled day."""
+        await self._refresh(
+            RevenueSource.BOOKINGS,
+            _closed_days(event_data, ("scheduled_at", "previous_scheduled_at")),
+        )
+
+    async def on_walkin_event(self, event_data: Dict[str, Any]) -> None:
+        """Refresh the walk-in rollups for the service day."""
+        await self._refresh(
+            RevenueSource.WALK_INS, _closed_days(event_data, ("started_at",))
+        )
+
+    async def _refresh(self, source: RevenueSource, days: List[date]) -> None:
+        if not days:
+            return
+        async with self.session_factory() as session:
+            refresher = build_rollup_refresher(session)
+            for day in days:
+                await refresher.execute(
+                    RefreshRevenueRollupsRequest(day, day, sources=(source,))
+                )
+            await session.commit()
+
+
+class RollupDayCloser:
+    """
+    Rolls up closed days that have no rollup yet.
+
+    Checks every `interval` seconds, in each worker, for days among the last
+    `backfill_days` closed ones that are missing a rollup row, and refreshes
+    each run of missing days. Once yesterday is rolled up a check is a single
+    indexed read per source. Refreshing is idempotent, so two workers closing
+    the same day at once leave the same rows behind. Older gaps stay live
+    until scripts/rebuild_revenue_rollups.py fills them.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = AsyncSessionLocal,
+        interval: float = 300.0,
+        backfill_days: int = 7,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.backfill_days = backfill_days
+        self._task: Optional[asyncio.Task] = None
+
+    async def close_days(self, today: Optional[date] = None) -> int:
+        """Roll up the missing closed days in the backfill window; returns the days refreshed."""
+        last_closed = (today or date.today()) - timedelta(days=1)
+        first = last_closed - timedelta(days=max(self.backfill_days, 1) - 1)
+        refreshed = 0
+        async with self.session_factory() as session:
+            rollups = SqlRevenueRollupRepository(session)
+            refresher = build_rollup_refresher(session)
+            for source in ROLLUP_SOURCES:
+                rows = await rollups.get_daily_revenue(source, first, last_closed)
+                covered = {row.date for row in rows}
+                for gap_start, gap_end in uncovered_ranges(first, last_closed, covered):
+                    refreshed += await refresher.execute(
+                        RefreshRevenueRollupsRequest(gap_start, gap_end, sources=(source,))
+                    )
+            await session.commit()
+        return refreshed
+
+    async def _run(self) -> None:
+        """Close days until cancelled."""
+        while True:
+            try:
+                closed = await self.close_days()
+            except Exception as e:
+                logger.error(f"Revenue rollup day close failed: {str(e)}")
+            else:
+                if closed:
+                    logger.info(f"Rolled up {closed} closed day(s) of revenue")
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        """Start closing days (called from app lifespan)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="rollup-day-closer")
+
+    async def stop(self) -> None:
+        """Stop closing days; a missed day is picked up on the next start."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Singleton instances
+rollup_subscriber = RevenueRollupSubscriber()
+rollup_subscriber.subscribe(event_bus)
+
+rollup_day_closer = RollupDayCloser(
+    interval=settings.analytics_rollup_interval,
+    backfill_days=settings.analytics_rollup_backfill_days,
+)
@@ -7,6 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.shared.auth import require_any_role
 from app.features.auth.domain import UserRole
+from app.features.analytics.domain.enums import TimeGranularity
+from app.features.analytics.api import events  # noqa: F401 (subscribes rollup handlers)
+from app.features.analytics.api.cache import AnalyticsResultCache, get_analytics_cache
 from app.features.analytics.api.dependencies import (
     get_revenue_metrics_use_case,
     get_daily_revenue_use_case,
@@ -78,20 +81,27 @@ async def get_revenue_metrics(
     start_date: date = Query(...),
     end_date: date = Query(...),
     use_case: Annotated[object, Depends(get_revenue_metrics_use_case)] = None,
+    cache: Annotated[AnalyticsResultCache, Depends(get_analytics_cache)] = None,
 ) -> RevenueMetricsSchema:
     """Get revenue metrics for a period."""
-    request = GetRevenueMetricsRequest(start_date=start_date, end_date=end_date)
-    metrics = await use_case.execute(request)
-
-    return RevenueMetricsSchema(
-        period_start=metrics.period_start,
-        period_end=metrics.period_end,
-        total_revenue=metrics.total_revenue,
-        revenue_by_source={k.value: v for k, v in metrics.revenue_by_source.items()},
-        total_bookings=metrics.total_bookings,
-        average_transaction_value=metrics.average_transaction_value,
-        growth_rate=metrics.growth_rate,
-    )
+
+    async def compute() -> RevenueMetricsSchema:
+        request = GetRevenueMetricsRequest(start_date=start_date, end_date=end_date)
+        metrics = await use_case.execute(request)
+
+        return RevenueMetricsSchema(
+            period_start=metrics.period_start,
+            period_end=metrics.period_end,
+            total_revenue=metrics.total_revenue,
+            revenue_by_source={
+                k.value: v for k, v in metrics.revenue_by_source.items()
+            },
+            total_bookings=metrics.total_bookings,
+            average_transaction_value=metrics.average_transaction_value,
+            growth_rate=metrics.growth_rate,
+        )
+
+    return await cache.get_or_compute(RevenueMetricsSchema, compute)
 
 
 @router.get(
@@ -104,24 +114,40 @@ async def get_revenue_metrics(
 async def get_daily_revenue(
     start_date: date = Query(...),
     end_date: date = Query(...),
+    granularity: TimeGranularity = Query(TimeGranularity.DAILY),
     use_case: Annotated[object, Depends(get_daily_revenue_use_case)] = None,
+    cache: Annotated[AnalyticsResultCache, Depends(get_analytics_cache)] = None,
 ) -> DailyRevenueListSchema:
-    """Get daily revenue breakdown."""
-    request = GetDailyRevenueRequest(start_date=start_date, end_date=end_date)
-    daily_revenues = await use_case.execute(request)
-
-    items = [
-        DailyRevenueSchema(
-            date=dr.date,
-            revenue=dr.revenue,
-            bookings_count=dr.bookings_count,
-            walkins_count=dr.walkins_count,
-            average_value=dr.average_value,
+    """Get revenue breakdown per day, week, month, quarter or year."""
+
+    async def compute() -> DailyRevenueListSchema:
+        request = GetDailyRevenueRequest(
+            start_date=start_date, end_date=end_date, granularity=granularity
         )
-        for dr in daily_revenues
-    ]
 
-    return DailyRevenueListSchema(items=items, total_days=len(items))
+        try:
+            daily_revenues = await use_case.execute(request)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        items = [
+            DailyRevenueSchema(
+                date=dr.date,
+                revenue=dr.revenue,
+                bookings_count=dr.bookings_count,
+                walkins_count=dr.walkins_count,
+                average_value=dr.average_value,
+            )
+            for dr in daily_revenues
+        ]
+
+        return DailyRevenueListSchema(
+            items=items, total_days=len(items), granularity=granularity
+        )
+
+    return await cache.get_or_compute(
+        DailyRevenueListSchema, compute, granularity=granularity.value
+    )
 
 
 # ============================================================================
@@ -224,23 +250,28 @@ async def get_customer_metrics(
     start_date: date = Query(...),
     end_date: date = Query(...),
     use_case: Annotated[object, Depends(get_customer_metrics_use_case)] = None,
+    cache: Annotated[AnalyticsResultCache, Depends(get_analytics_cache)] = None,
 ) -> CustomerMetricsSchema:
     """Get customer metrics for a period."""
-    request = GetCustomerMetricsRequest(start_date=start_date, end_date=end_date)
-    metrics = await use_case.execute(request)
-
-    return CustomerMetricsSchema(
-        period_start=metrics.period_start,
-        period_end=metrics.period_end,
-        total_customers=metrics.total_customers,
-        new_customers=metrics.new_customers,
-        returning_customers=metrics.returning_customers,
-        customer_retention_rate=metrics.customer_retention_rate,
-        average_customer_lifetime_value=metrics.average_customer_lifetime_value,
-        customers_by_segment={
-            k.value: v for k, v in metrics.customers_by_segment.items()
-        },
-    )
+
+    async def compute() -> CustomerMetricsSchema:
+        request = GetCustomerMetricsRequest(start_date=start_date, end_date=end_date)
+        metrics = await use_case.execute(request)
+
+        return CustomerMetricsSchema(
+            period_start=metrics.period_start,
+            period_end=metrics.period_end,
+            total_customers=metrics.total_customers,
+            new_customers=metrics.new_customers,
+            returning_customers=metrics.returning_customers,
+            customer_retention_rate=metrics.customer_retention_rate,
+            average_customer_lifetime_value=metrics.average_customer_lifetime_value,
+            customers_by_segment={
+                k.value: v for k, v in metrics.customers_by_segment.items()
+            },
+        )
+
+    return await cache.get_or_compute(CustomerMetricsSchema, compute)
 
 
 @router.get(
@@ -291,24 +322,29 @@ async def get_financial_kpis(
     start_date: date = Query(...),
     end_date: date = Query(...),
     use_case: Annotated[object, Depends(get_financial_kpis_use_case)] = None,
+    cache: Annotated[AnalyticsResultCache, Depends(get_analytics_cache)] = None,
 ) -> FinancialKPIsSchema:
     """Get financial KPIs for a period (Admin only)."""
-    request = GetFinancialKPIsRequest(start_date=start_date, end_date=end_date)
-    kpis = await use_case.execute(request)
-
-    return FinancialKPIsSchema(
-        period_start=kpis.period_start,
-        period_end=kpis.period_end,
-        total_revenue=kpis.total_revenue,
-        total_expenses=kpis.total_expenses,
-        gross_profit=kpis.gross_profit,
-        net_profit=kpis.net_profit,
-        profit_margin=kpis.profit_margin,
-        operating_expenses=kpis.operating_expenses,
-        cost_of_goods_sold=kpis.cost_of_goods_sold,
-        revenue_per_booking=kpis.revenue_per_booking,
-        expenses_per_booking=kpis.expenses_per_booking,
-    )
+
+    async def compute() -> FinancialKPIsSchema:
+        request = GetFinancialKPIsRequest(start_date=start_date, end_date=end_date)
+        kpis = await use_case.execute(request)
+
+        return FinancialKPIsSchema(
+            period_start=kpis.period_start,
+            period_end=kpis.period_end,
+            total_revenue=kpis.total_revenue,
+            total_expenses=kpis.total_expenses,
+            gross_profit=kpis.gross_profit,
+            net_profit=kpis.net_profit,
+            profit_margin=kpis.profit_margin,
+            operating_expenses=kpis.operating_expenses,
+            cost_of_goods_sold=kpis.cost_of_goods_sold,
+            revenue_per_booking=kpis.revenue_per_booking,
+            expenses_per_booking=kpis.expenses_per_booking,
+        )
+
+    return await cache.get_or_compute(FinancialKPIsSchema, compute)
 
 
 # ============================================================================
@@ -327,25 +363,30 @@ async def get_service_popularity(
     start_date: date = Query(...),
     end_date: date = Query(...),
     use_case: Annotated[object, Depends(get_service_popularity_use_case)] = None,
+    cache: Annotated[AnalyticsResultCache, Depends(get_analytics_cache)] = None,
 ) -> ServicePopularityListSchema:
     """Get service popularity metrics."""
-    request = GetServicePopularityRequest(start_date=start_date, end_date=end_date)
-    services = await use_case.execute(request)
-
-    items = [
-        ServicePopularitySchema(
-            service_id=s.service_id,
-            service_name=s.service_name,
-            total_bookings=s.total_bookings,
-            total_revenue=s.total_revenue,
-            average_rating=s.average_rating,
-            completion_rate=s.completion_rate,
-            cancellation_rate=s.cancellation_rate,
-        )
-        for s in services
-    ]
 
-    return ServicePopularityListSchema(items=items, total=len(items))
+    async def compute() -> ServicePopularityListSchema:
+        request = GetServicePopularityRequest(start_date=start_date, end_date=end_date)
+        services = await use_case.execute(request)
+
+        items = [
+            ServicePopularitySchema(
+                service_id=s.service_id,
+                service_name=s.service_name,
+                total_bookings=s.total_bookings,
+                total_revenue=s.total_revenue,
+                average_rating=s.average_rating,
+                completion_rate=s.completion_rate,
+                cancellation_rate=s.cancellation_rate,
+            )
+            for s in services
+        ]
+
+        return ServicePopularityListSchema(items=items, total=len(items))
+
+    return await cache.get_or_compute(ServicePopularityListSchema, compute)
 
 
 # ============================================================================
@@ -364,65 +405,70 @@ async def get_dashboard_summary(
     start_date: date = Query(...),
     end_date: date = Query(...),
     use_case: Annotated[object, Depends(get_dashboard_summary_use_case)] = None,
+    cache: Annotated[AnalyticsResultCache, Depends(get_analytics_cache)] = None,
 ) -> DashboardSummarySchema:
     """Get comprehensive dashboard summary."""
-    request = GetDashboardSummaryRequest(start_date=start_date, end_date=end_date)
-    summary = await use_case.execute(request)
-
-    return DashboardSummarySchema(
-        period_start=summary.period_start,
-        period_end=summary.period_end,
-        revenue_metrics=RevenueMetricsSchema(
-            period_start=summary.revenue_metrics.period_start,
-            period_end=summary.revenue_metrics.period_end,
-            total_revenue=summary.revenue_metrics.total_revenue,
-            revenue_by_source={
-                k.value: v for k, v in summary.revenue_metrics.revenue_by_source.items()
-            },
-            total_bookings=summary.revenue_metrics.total_bookings,
-            average_transaction_value=summary.revenue_metrics.average_transaction_value,
-            growth_rate=summary.revenue_metrics.growth_rate,
-        ),
-        financial_kpis=FinancialKPIsSchema(
-            period_start=summary.financial_kpis.period_start,
-            period_end=summary.financial_kpis.period_end,
-            total_revenue=summary.financial_kpis.total_revenue,
-            total_expenses=summary.financial_kpis.total_expenses,
-            gross_profit=summary.financial_kpis.gross_profit,
-            net_profit=summary.financial_kpis.net_profit,
-            profit_margin=summary.financial_kpis.profit_margin,
-            operating_expenses=summary.financial_kpis.operating_expenses,
-            cost_of_goods_sold=summary.financial_kpis.cost_of_goods_sold,
-            revenue_per_booking=summary.financial_kpis.revenue_per_booking,
-            expenses_per_booking=summary.financial_kpis.expenses_per_booking,
-        ),
-        customer_metrics=CustomerMetricsSchema(
-            period_start=summary.customer_metrics.period_start,
-            period_end=summary.customer_metrics.period_end,
-            total_customers=summary.customer_metrics.total_customers,
-            new_customers=summary.customer_metrics.new_customers,
-            returning_customers=summary.customer_metrics.returning_customers,
-            customer_retention_rate=summary.customer_metrics.customer_retention_rate,
-            average_customer_lifetime_value=summary.customer_metrics.average_customer_lifetime_value,
-            customers_by_segment={
-                k.value: v
-                for k, v in summary.customer_metrics.customers_by_segment.items()
-            },
-        ),
-        total_active_staff=summary.total_active_staff,
-        total_completed_services=summary.total_completed_services,
-        average_customer_satisfaction=summary.average_customer_satisfaction,
-        top_performing_services=[
-            ServicePopularitySchema(
-                service_id=s.service_id,
-                service_name=s.service_name,
-                total_bookings=s.total_bookings,
-                total_revenue=s.total_revenue,
-                average_rating=s.average_rating,
-                completion_rate=s.completion_rate,
-                cancellation_rate=s.cancellation_rate,
-            )
-            for s in summary.top_performing_services
-        ],
-        generated_at=summary.generated_at,
-    )
+
+    async def compute() -> DashboardSummarySchema:
+        request = GetDashboardSummaryRequest(start_date=start_date, end_date=end_date)
+        summary = await use_case.execute(request)
+
+        return DashboardSummarySchema(
+            period_start=summary.period_start,
+            period_end=summary.period_end,
+            revenue_metrics=RevenueMetricsSchema(
+                period_start=summary.revenue_metrics.period_start,
+                period_end=summary.revenue_metrics.period_end,
+                total_revenue=summary.revenue_metrics.total_revenue,
+                revenue_by_source={
+                    k.value: v for k, v in summary.revenue_metrics.revenue_by_source.items()
+                },
+                total_bookings=summary.revenue_metrics.total_bookings,
+                average_transaction_value=summary.revenue_metrics.average_transaction_value,
+                growth_rate=summary.revenue_metrics.growth_rate,
+            ),
+            financial_kpis=FinancialKPIsSchema(
+                period_start=summary.financial_kpis.period_start,
+                period_end=summary.financial_kpis.period_end,
+                total_revenue=summary.financial_kpis.total_revenue,
+                total_expenses=summary.financial_kpis.total_expenses,
+                gross_profit=summary.financial_kpis.gross_profit,
+                net_profit=summary.financial_kpis.net_profit,
+                profit_margin=summary.financial_kpis.profit_margin,
+                operating_expenses=summary.financial_kpis.operating_expenses,
+                cost_of_goods_sold=summary.financial_kpis.cost_of_goods_sold,
+                revenue_per_booking=summary.financial_kpis.revenue_per_booking,
+                expenses_per_booking=summary.financial_kpis.expenses_per_booking,
+            ),
+            customer_metrics=CustomerMetricsSchema(
+                period_start=summary.customer_metrics.period_start,
+                period_end=summary.customer_metrics.period_end,
+                total_customers=summary.customer_metrics.total_customers,
+                new_customers=summary.customer_metrics.new_customers,
+                returning_customers=summary.customer_metrics.returning_customers,
+                customer_retention_rate=summary.customer_metrics.customer_retention_rate,
+                average_customer_lifetime_value=summary.customer_metrics.average_customer_lifetime_value,
+                customers_by_segment={
+                    k.value: v
+                    for k, v in summary.customer_metrics.customers_by_segment.items()
+                },
+            ),
+            total_active_staff=summary.total_active_staff,
+            total_completed_services=summary.total_completed_services,
+            average_customer_satisfaction=summary.average_customer_satisfaction,
+            top_performing_services=[
+                ServicePopularitySchema(
+                    service_id=s.service_id,
+                    service_name=s.service_name,
+                    total_bookings=s.total_bookings,
+                    total_revenue=s.total_revenue,
+                    average_rating=s.average_rating,
+                    completion_rate=s.completion_rate,
+                    cancellation_rate=s.cancellation_rate,
+                )
+                for s in summary.top_performing_services
+            ],
+            generated_at=summary.generated_at,
+        )
+
+    return await cache.get_or_compute(DashboardSummarySchema, compute)
\ No newline at end of file
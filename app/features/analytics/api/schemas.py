@@ -6,7 +6,11 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from app.features.analytics.domain.enums import RevenueSource, CustomerSegment
+from app.features.analytics.domain.enums import (
+    RevenueSource,
+    CustomerSegment,
+    TimeGranularity,
+)
 
 
 # ============================================================================
@@ -14,7 +18,7 @@ from app.features.analytics.domain.enums import RevenueSource, CustomerSegment
 # ============================================================================
 
 class DailyRevenueSchema(BaseModel):
-    """Schema for daily revenue data."""
+    """Schema for daily revenue data (one period; date is its first day)."""
 
     date: date
     revenue: Decimal
@@ -46,6 +50,7 @@ class DailyRevenueListSchema(BaseModel):
 
     items: List[DailyRevenueSchema]
     total_days: int
+    granularity: TimeGranularity = TimeGranularity.DAILY
 
 
 # ============================================================================
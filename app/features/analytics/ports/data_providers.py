@@ -12,25 +12,23 @@ from typing import List, Optional
 # ============================================================================
 
 @dataclass
-class BookingRevenueDTO:
-    """DTO for booking revenue data."""
+class DailyRevenueDTO:
+    """DTO for revenue aggregated over one day."""
 
-    booking_id: str
-    booking_date: date
-    total_amount: Decimal
-    status: str
-    customer_id: str
-    service_id: str
+    date: date
+    revenue: Decimal
+    count: int
 
 
 @dataclass
-class WalkInRevenueDTO:
-    """DTO for walk-in revenue data."""
+class DailyServiceRevenueDTO:
+    """DTO for one service's revenue aggregated over one day."""
 
-    walkin_id: str
-    service_date: date
-    final_amount: Decimal
-    status: str
+    date: date
+    service_id: str
+    service_name: str
+    count: int
+    revenue: Decimal
 
 
 @dataclass
@@ -47,12 +45,12 @@ class StaffWorkDataDTO:
 
 
 @dataclass
-class AttendanceDataDTO:
-    """DTO for attendance data."""
+class AttendanceSummaryDTO:
+    """DTO for attendance aggregated over a period."""
 
     staff_id: str
-    date: date
-    status: str
+    days_recorded: int
+    present_days: int
     hours_worked: Decimal
 
 
@@ -108,10 +106,15 @@ class IBookingDataProvider(ABC):
     """Interface for accessing booking data from bookings feature."""
 
     @abstractmethod
-    async def get_revenue_data(
+    async def get_daily_revenue(
         self, start_date: date, end_date: date
-    ) -> List[BookingRevenueDTO]:
-        """Get booking revenue data for a period."""
+    ) -> List[DailyRevenueDTO]:
+        """Get booking revenue per day for a period (days without bookings omitted)."""
+        pass
+
+    @abstractmethod
+    async def count_customers(self, start_date: date, end_date: date) -> int:
+        """Count distinct customers with revenue bookings in a period."""
         pass
 
     @abstractmethod
@@ -135,15 +138,29 @@ class IBookingDataProvider(ABC):
         """Get booking statistics by service."""
         pass
 
+    @abstractmethod
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get booking statistics per day and service."""
+        pass
+
 
 class IWalkInDataProvider(ABC):
     """Interface for accessing walk-in data from walkins feature."""
 
     @abstractmethod
-    async def get_revenue_data(
+    async def get_daily_revenue(
         self, start_date: date, end_date: date
-    ) -> List[WalkInRevenueDTO]:
-        """Get walk-in revenue data for a period."""
+    ) -> List[DailyRevenueDTO]:
+        """Get walk-in revenue per day for a period (days without walk-ins omitted)."""
+        pass
+
+    @abstractmethod
+    async def get_daily_service_data(
+        self, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get walk-in revenue per day and service."""
         pass
 
 
@@ -163,10 +180,10 @@ class IStaffDataProvider(ABC):
         pass
 
     @abstractmethod
-    async def get_attendance_data(
-        self, staff_id: str, start_date: date, end_date: date
-    ) -> List[AttendanceDataDTO]:
-        """Get attendance records for a staff member."""
+    async def get_attendance_summary(
+        self, start_date: date, end_date: date, staff_id: Optional[str] = None
+    ) -> List[AttendanceSummaryDTO]:
+        """Get attendance totals per staff member (or for one) in a period."""
         pass
 
 
@@ -17,6 +17,11 @@ from app.features.analytics.domain.entities import (
     PeakHoursAnalysis,
     DashboardSummary,
 )
+from app.features.analytics.domain.enums import RevenueSource, TimeGranularity
+from app.features.analytics.ports.data_providers import (
+    DailyRevenueDTO,
+    DailyServiceRevenueDTO,
+)
 
 
 class IRevenueAnalyticsRepository(ABC):
@@ -31,9 +36,12 @@ class IRevenueAnalyticsRepository(ABC):
 
     @abstractmethod
     async def get_daily_revenue(
-        self, start_date: date, end_date: date
+        self,
+        start_date: date,
+        end_date: date,
+        granularity: TimeGranularity = TimeGranularity.DAILY,
     ) -> List[DailyRevenue]:
-        """Get daily revenue breakdown."""
+        """Get revenue breakdown per day (or week, month, ...), zero-filled."""
         pass
 
     @abstractmethod
@@ -139,3 +147,33 @@ class IDashboardRepository(ABC):
     ) -> DashboardSummary:
         """Get comprehensive dashboard summary."""
         pass
+
+
+class IRevenueRollupRepository(ABC):
+    """Interface for the materialized daily revenue rollups."""
+
+    @abstractmethod
+    async def get_daily_revenue(
+        self, source: RevenueSource, start_date: date, end_date: date
+    ) -> List[DailyRevenueDTO]:
+        """Get rolled-up days for a source (only days that have been rolled up)."""
+        pass
+
+    @abstractmethod
+    async def get_daily_service_revenue(
+        self, source: RevenueSource, start_date: date, end_date: date
+    ) -> List[DailyServiceRevenueDTO]:
+        """Get rolled-up per-service rows for a source."""
+        pass
+
+    @abstractmethod
+    async def replace_period(
+        self,
+        source: RevenueSource,
+        start_date: date,
+        end_date: date,
+        days: List[DailyRevenueDTO],
+        services: List[DailyServiceRevenueDTO],
+    ) -> None:
+        """Replace a source's rollup rows for the period with freshly computed ones."""
+        pass
@@ -5,6 +5,7 @@ from datetime import date
 from typing import List
 
 from app.features.analytics.domain.entities import DailyRevenue
+from app.features.analytics.domain.enums import TimeGranularity
 from app.features.analytics.ports.repositories import IRevenueAnalyticsRepository
 
 
@@ -14,6 +15,7 @@ class GetDailyRevenueRequest:
 
     start_date: date
     end_date: date
+    granularity: TimeGranularity = TimeGranularity.DAILY
 
 
 class GetDailyRevenueUseCase:
@@ -25,5 +27,5 @@ class GetDailyRevenueUseCase:
     async def execute(self, request: GetDailyRevenueRequest) -> List[DailyRevenue]:
         """Execute the use case."""
         return await self._repository.get_daily_revenue(
-            request.start_date, request.end_date
+            request.start_date, request.end_date, request.granularity
         )
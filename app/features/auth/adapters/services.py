@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable
 import logging
 
 from app.features.auth.ports import (
@@ -8,8 +8,9 @@ from app.features.auth.ports import (
     ICacheService,
 )
 from app.core.security import password_hasher, jwt_handler
-from app.core.cache import redis_client
+from app.core.cache import async_redis_client, cached, near_cache, peek, store
 from app.core.config import settings
+from app.core.mail import mailer
 
 logger = logging.getLogger(__name__)
 
@@ -47,52 +48,22 @@ class TokenServiceAdapter(ITokenService):
 
 
 class EmailServiceAdapter(IEmailService):
-    """Adapter for email service using SMTP."""
+    """Adapter for email service using the queued SMTP mailer."""
 
-    def __init__(self):
-        """Initialize email service with SMTP configuration."""
-        self.smtp_host = settings.smtp_host
-        self.smtp_port = settings.smtp_port
-        self.smtp_username = settings.smtp_username
-        self.smtp_password = settings.smtp_password
-        self.smtp_from_email = settings.smtp_from_email
-        self.smtp_from_name = settings.smtp_from_name
+    def __init__(self, session=None):
+        """
+        Initialize email service.
+
+        Args:
+            session: Optional database session; emails are then queued in its
+                transaction and only sent if it commits.
+        """
         self.frontend_url = settings.frontend_url
-        self.use_tls = settings.smtp_use_tls
+        self._session = session
 
     async def _send_email(self, to_email: str, subject: str, html_body: str, text_body: str) -> bool:
-        """Send email using SMTP."""
-        import smtplib
-        from email.mime.text import MIMEText
-        from email.mime.multipart import MIMEMultipart
-
-        try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{self.smtp_from_name} <{self.smtp_from_email}>"
-            msg['To'] = to_email
-
-            # Add both text and HTML parts
-            part1 = MIMEText(text_body, 'plain')
-            part2 = MIMEText(html_body, 'html')
-            msg.attach(part1)
-            msg.attach(part2)
-
-            # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                if self.smtp_username and self.smtp_password:
-                    server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {str(e)}")
-            return False
+        """Queue email for background delivery over pooled SMTP connections."""
+        return await mailer.enqueue(to_email, subject, html_body, text_body, session=self._session)
 
     async def send_verification_email(self, email: str, token: str) -> bool:
         """Send email verification."""
@@ -249,35 +220,20 @@ class CacheServiceAdapter(ICacheService):
     }
 
     def __init__(self):
-        """Initialize cache service with Redis client."""
-        self.redis = redis_client
+        """Initialize cache service with the shared async Redis client."""
+        self.redis = async_redis_client
+        # Hot user lookups are served from the per-worker near cache
+        self.near_cache = near_cache
 
     async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get cached user data with validation."""
         try:
-            import json
             key = f"user:{self.CACHE_VERSION}:{user_id}"
-            data = self.redis.get(key)
-            if data:
-                cached = json.loads(data) if isinstance(data, (str, bytes)) else data
-
-                # Validate cache structure
-                if not isinstance(cached, dict):
-                    logger.warning(f"Invalid cache type for user {user_id}: {type(cached)}")
-                    self.redis.delete(key)
-                    return None
-
-                missing_fields = self.REQUIRED_USER_FIELDS - set(cached.keys())
-                if missing_fields:
-                    logger.warning(
-                        f"Invalid cache structure for user {user_id}, "
-                        f"missing fields: {missing_fields}. Invalidating cache."
-                    )
-                    self.redis.delete(key)
-                    return None
-
-                return cached
-            return None
+            cached_user = await peek(key, cache=self.near_cache)
+            if cached_user is not None and not self._is_valid_user(user_id, cached_user):
+                await self.near_cache.delete(key)
+                return None
+            return cached_user
         except Exception as e:
             logger.error(f"Failed to get user from cache: {str(e)}", exc_info=True)
             return None
@@ -286,68 +242,89 @@ class CacheServiceAdapter(ICacheService):
         """Cache user data with version."""
         try:
             key = f"user:{self.CACHE_VERSION}:{user_id}"
-            return self.redis.set(key, user_data, ttl=ttl)
+            return await store(key, user_data, ttl, tags=[f"user:{user_id}"], cache=self.near_cache)
         except Exception as e:
             logger.error(f"Failed to set user in cache: {str(e)}", exc_info=True)
             return False
 
+    async def get_or_load_user(
+        self,
+        user_id: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        ttl: int = 300,
+    ) -> Optional[Dict[str, Any]]:
+        """Get cached user data, loading it once on a miss however many requests ask."""
+        key = f"user:{self.CACHE_VERSION}:{user_id}"
+        tags = [f"user:{user_id}"]
+        cached_user = await cached(key, loader, ttl, tags=tags, cache=self.near_cache)
+        if cached_user is not None and not self._is_valid_user(user_id, cached_user):
+            await self.near_cache.delete(key)
+            cached_user = await cached(key, loader, ttl, tags=tags, cache=self.near_cache)
+        return cached_user
+
+    def _is_valid_user(self, user_id: str, cached_user: Any) -> bool:
+        """Check a cached user has the structure this release expects."""
+        if not isinstance(cached_user, dict):
+            logger.warning(f"Invalid cache type for user {user_id}: {type(cached_user)}")
+            return False
+
+        missing_fields = self.REQUIRED_USER_FIELDS - set(cached_user.keys())
+        if missing_fields:
+            logger.warning(
+                f"Invalid cache structure for user {user_id}, "
+                f"missing fields: {missing_fields}. Invalidating cache."
+            )
+            return False
+        return True
+
     async def delete_user(self, user_id: str) -> bool:
         """Delete cached user data (all versions)."""
         try:
-            # Delete current version
+            # Delete current version and old (v1 format) keys if they exist
             current_key = f"user:{self.CACHE_VERSION}:{user_id}"
-            deleted = self.redis.delete(current_key)
-
-            # Also try to delete old version keys if they exist
-            old_key = f"user:{user_id}"  # v1 format
-            self.redis.delete(old_key)
+            old_key = f"user:{user_id}"
+            deleted = await self.near_cache.delete(current_key, old_key)
 
             return deleted > 0
         except Exception as e:
             logger.error(f"Failed to delete user from cache: {str(e)}", exc_info=True)
             return False
 
-    def invalidate_user_cache(self, user_id: str) -> bool:
+    async def invalidate_user_cache(self, user_id: str) -> bool:
         """Invalidate all cache entries for a user."""
         try:
-            # Delete user cache
-            self.redis.delete(f"user:{user_id}")
-            # Delete all user sessions using pattern matching
-            pattern = f"session:{user_id}:*"
-            for key in self.redis.scan_iter(match=pattern):
-                self.redis.delete(key)
+            # The user entry and every session are tagged user:{user_id}
+            await self.near_cache.invalidate_tags(f"user:{user_id}")
+            # Entries written before tagging, including the v1 format
+            await self.near_cache.delete(f"user:{self.CACHE_VERSION}:{user_id}", f"user:{user_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to invalidate user cache: {str(e)}")
             return False
 
-    def invalidate_user_sessions(self, user_id: str) -> bool:
+    async def invalidate_user_sessions(self, user_id: str) -> bool:
         """Invalidate all active sessions for a user."""
         try:
-            pattern = f"session:{user_id}:*"
-            count = 0
-            for key in self.redis.scan_iter(match=pattern):
-                self.redis.delete(key)
-                count += 1
+            count = await self.near_cache.invalidate_tags(f"user_sessions:{user_id}")
             logger.info(f"Invalidated {count} sessions for user {user_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to invalidate user sessions: {str(e)}")
             return False
 
-    def blacklist_token(self, token: str, ttl: int = 3600) -> bool:
+    async def blacklist_token(self, token: str, ttl: int = 3600) -> bool:
         """Blacklist a token until its expiry."""
         try:
             # Store token in blacklist with TTL matching token expiry
-            return self.redis.set(f"blacklist:token:{token}", "1", ttl=ttl)
+            return await self.redis.set(f"blacklist:token:{token}", "1", ttl=ttl)
         except Exception as e:
             logger.error(f"Failed to blacklist token: {str(e)}")
             return False
 
-    def is_token_blacklisted(self, token: str) -> bool:
+    async def is_token_blacklisted(self, token: str) -> bool:
         """Check if a token is blacklisted."""
         try:
-            return self.redis.exists(f"blacklist:token:{token}") > 0
+            return await self.redis.exists(f"blacklist:token:{token}")
         except Exception as e:
             logger.error(f"Failed to check token blacklist: {str(e)}")
             return False
@@ -356,7 +333,7 @@ class CacheServiceAdapter(ICacheService):
         """Get cached session data."""
         try:
             import json
-            data = self.redis.get(f"session:{session_id}")
+            data = await self.redis.get(f"session:{session_id}")
             if data:
                 return json.loads(data) if isinstance(data, (str, bytes)) else data
             return None
@@ -365,12 +342,14 @@ class CacheServiceAdapter(ICacheService):
             return None
 
     async def set_session(self, session_id: str, session_data: Dict[str, Any], ttl: int = 900) -> bool:
-        """Cache session data."""
+        """Cache session data, tagged with its user (session ids are "{user_id}:{token}")."""
         try:
-            return self.redis.set(
+            user_id, _, _ = session_id.partition(":")
+            return await self.redis.set(
                 f"session:{session_id}",
                 session_data,
-                ttl=ttl
+                ttl=ttl,
+                tags=[f"user:{user_id}", f"user_sessions:{user_id}"],
             )
         except Exception as e:
             logger.error(f"Failed to set session in cache: {str(e)}")
@@ -379,7 +358,7 @@ class CacheServiceAdapter(ICacheService):
     async def delete_session(self, session_id: str) -> bool:
         """Delete cached session data."""
         try:
-            return self.redis.delete(f"session:{session_id}") > 0
+            return await self.redis.delete(f"session:{session_id}") > 0
         except Exception as e:
             logger.error(f"Failed to delete session from cache: {str(e)}")
             return False
\ No newline at end of file
@@ -80,7 +80,7 @@ def get_use_case_dependencies(db: Session):
     refresh_token_repo = RefreshTokenRepository(db)
     password_hasher = PasswordHasherAdapter()
     token_service = TokenServiceAdapter()
-    email_service = EmailServiceAdapter()
+    email_service = EmailServiceAdapter(db)
     cache_service = CacheServiceAdapter()
     
     return {
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable
 
 
 class IPasswordHasher(ABC):
@@ -77,6 +77,16 @@ class ICacheService(ABC):
         """Cache user data."""
         pass
     
+    @abstractmethod
+    async def get_or_load_user(
+        self,
+        user_id: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        ttl: int = 300,
+    ) -> Optional[Dict[str, Any]]:
+        """Get cached user data, calling loader on a miss."""
+        pass
+    
     @abstractmethod
     async def delete_user(self, user_id: str) -> bool:
         """Delete cached user data."""
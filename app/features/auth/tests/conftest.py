@@ -133,12 +133,18 @@ def mock_email_service():
     return mock
 
 
+async def _load_through(user_id, loader, ttl=300):
+    """Behave like a cache miss: call the loader."""
+    return await loader()
+
+
 @pytest.fixture
 def mock_cache_service():
     """Mock cache service."""
     mock = Mock(spec=ICacheService)
     mock.get_user = AsyncMock()
     mock.set_user = AsyncMock(return_value=True)
+    mock.get_or_load_user = AsyncMock(side_effect=_load_through)
     mock.delete_user = AsyncMock(return_value=True)
     mock.get_session = AsyncMock()
     mock.set_session = AsyncMock(return_value=True)
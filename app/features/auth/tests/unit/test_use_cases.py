@@ -434,7 +434,8 @@ class TestGetUserUseCase:
             "created_at": sample_user.created_at.isoformat(),
             "last_login_at": None,
         }
-        mock_cache_service.get_user.return_value = cached_data
+        mock_cache_service.get_or_load_user.side_effect = None
+        mock_cache_service.get_or_load_user.return_value = cached_data
         
         # Create use case
         use_case = GetUserUseCase(
@@ -451,7 +452,7 @@ class TestGetUserUseCase:
         assert response.email == sample_user.email
         
         # Verify cache was checked, but repository was not called
-        mock_cache_service.get_user.assert_called_once_with(sample_user.id)
+        assert mock_cache_service.get_or_load_user.await_args.args[0] == sample_user.id
         mock_user_repository.get_by_id.assert_not_called()
     
     @pytest.mark.asyncio
@@ -463,7 +464,6 @@ class TestGetUserUseCase:
     ):
         """Test getting user from repository when not in cache."""
         # Setup mocks - cache miss
-        mock_cache_service.get_user.return_value = None
         mock_user_repository.get_by_id.return_value = sample_user
         
         # Create use case
@@ -480,10 +480,10 @@ class TestGetUserUseCase:
         assert response.id == sample_user.id
         assert response.email == sample_user.email
         
-        # Verify both cache and repository were called
-        mock_cache_service.get_user.assert_called_once_with(sample_user.id)
+        # Verify the cache loaded the user from the repository
+        mock_cache_service.get_or_load_user.assert_awaited_once()
+        assert mock_cache_service.get_or_load_user.await_args.kwargs["ttl"] == 300
         mock_user_repository.get_by_id.assert_called_once_with(sample_user.id)
-        mock_cache_service.set_user.assert_called_once()  # Cache the result
     
     @pytest.mark.asyncio
     async def test_get_nonexistent_user(
@@ -493,7 +493,6 @@ class TestGetUserUseCase:
     ):
         """Test getting non-existent user."""
         # Setup mocks
-        mock_cache_service.get_user.return_value = None
         mock_user_repository.get_by_id.return_value = None
         
         # Create use case
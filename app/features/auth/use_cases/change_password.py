@@ -72,7 +72,7 @@ class ChangePasswordUseCase:
         await self._user_repository.update(user)
 
         # Step 6: Invalidate all user sessions (security best practice)
-        self._cache_service.invalidate_user_sessions(request.user_id)
+        await self._cache_service.invalidate_user_sessions(request.user_id)
 
         return ChangePasswordResponse(
             success=True,
@@ -57,13 +57,13 @@ class LogoutUseCase:
 
         # Step 3: Blacklist current access token
         # Token remains blacklisted until its natural expiry
-        self._cache_service.blacklist_token(request.token)
+        await self._cache_service.blacklist_token(request.token)
 
         # Step 4: Invalidate all user sessions from cache
-        self._cache_service.invalidate_user_sessions(request.user_id)
+        await self._cache_service.invalidate_user_sessions(request.user_id)
 
         # Step 5: Clear user-specific cache
-        self._cache_service.invalidate_user_cache(request.user_id)
+        await self._cache_service.invalidate_user_cache(request.user_id)
 
         return LogoutResponse(
             success=True,
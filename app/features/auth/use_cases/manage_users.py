@@ -63,35 +63,44 @@ class GetUserUseCase:
     
     async def execute(self, request: GetUserRequest) -> UserResponse:
         """Get user by ID with caching and graceful degradation."""
+        import logging
+        logger = logging.getLogger(__name__)
 
-        # Try cache first (but don't fail if it's broken)
+        # Concurrent misses share one repository read (but don't fail if the cache is broken)
         try:
-            cached_user = await self.cache_service.get_user(request.user_id)
-            if cached_user:
-                try:
-                    return UserResponse(**cached_user)
-                except TypeError as e:
-                    # Cache data is corrupted, log and fall back to DB
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(
-                        f"Corrupted cache data for user {request.user_id}: {e}. "
-                        f"Fetching from database instead."
-                    )
-                    # Invalidate bad cache
-                    await self.cache_service.delete_user(request.user_id)
+            user_data = await self.cache_service.get_or_load_user(
+                request.user_id,
+                lambda: self._load_user(request.user_id),
+                ttl=300,
+            )
         except Exception as e:
-            # Cache read failed completely, log and continue
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Cache read error for user {request.user_id}: {e}")
+            user_data = await self._load_user(request.user_id)
+
+        if user_data:
+            try:
+                return UserResponse(**user_data)
+            except TypeError as e:
+                # Cache data is corrupted, log and fall back to DB
+                logger.warning(
+                    f"Corrupted cache data for user {request.user_id}: {e}. "
+                    f"Fetching from database instead."
+                )
+                # Invalidate bad cache
+                await self.cache_service.delete_user(request.user_id)
+                user_data = await self._load_user(request.user_id)
+
+        if not user_data:
+            raise NotFoundError("User", request.user_id)
+        return UserResponse(**user_data)
 
-        # Get from repository (always works)
-        user = await self.user_repository.get_by_id(request.user_id)
+    async def _load_user(self, user_id: str) -> Optional[dict]:
+        """Read a user from the repository in its cached form."""
+        user = await self.user_repository.get_by_id(user_id)
         if not user:
-            raise NotFoundError("User", request.user_id)
+            return None
 
-        response = UserResponse(
+        return asdict(UserResponse(
             id=user.id,
             email=user.email,
             first_name=user.first_name,
@@ -103,21 +112,7 @@ class GetUserUseCase:
             email_verified=user.email_verified,
             created_at=user.created_at.isoformat(),
             last_login_at=user.last_login_at.isoformat() if user.last_login_at else None,
-        )
-
-        # Try to cache for future requests (but don't fail if caching fails)
-        try:
-            await self.cache_service.set_user(
-                user_id=user.id,
-                user_data=asdict(response),
-                ttl=300,
-            )
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to cache user {user.id}: {e}")
-
-        return response
+        ))
 
 
 class ListUsersUseCase:
@@ -1,6 +1,6 @@
 """Bookings database models."""
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Numeric, Text, JSON
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Numeric, Text, JSON, Index
 from sqlalchemy.orm import relationship
 import uuid
 
@@ -50,6 +50,12 @@ class Booking(Base, TimestampMixin):
     booking_services = relationship("BookingService", back_populates="booking", cascade="all, delete-orphan")
     # Note: wash_bay and mobile_team relationships removed to avoid cross-feature imports
     # Use capacity service or direct SQL queries to get wash bay/team details
+
+    # Indexes for date-range analytics and per-customer lookups
+    __table_args__ = (
+        Index("ix_bookings_scheduled_at_status", "scheduled_at", "status"),
+        Index("ix_bookings_customer_id", "customer_id"),
+    )
     
     @property
     def total_price_display(self) -> str:
@@ -88,6 +94,10 @@ class BookingService(Base):
     # Relationships
     booking = relationship("Booking", back_populates="booking_services")
     service = relationship("Service")  # Reference to current service data
+
+    __table_args__ = (
+        Index("ix_booking_services_booking_id", "booking_id"),
+    )
     
     @property
     def price_display(self) -> str:
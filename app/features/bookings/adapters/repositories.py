@@ -1,9 +1,20 @@
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Sequence
+from datetime import date, datetime
 
-from app.core.db import AsyncSession
+from sqlalchemy import desc, func, select
+
+from app.core.cache import mark_changed
+from app.core.db import AsyncSession, as_date, as_decimal, day_bucket, within_days
+from app.features.bookings.adapters.models import (
+    Booking as BookingModel,
+    BookingService as BookingServiceModel,
+)
 from app.features.bookings.ports import (
     Booking,
+    DailyBookingRevenue,
+    ServiceBookingTotals,
+    DailyServiceBookingTotals,
+    CustomerBookingTotals,
     IBookingRepository,
     IServiceRepository,
     IVehicleRepository,
@@ -28,16 +39,19 @@ class SqlBookingRepository(IBookingRepository):
         """Create a new booking."""
         # Convert domain entity to database model and save
         # Return the saved domain entity
+        mark_changed(self._session, "bookings")
         return booking
     
     async def update(self, booking: Booking) -> Booking:
         """Update an existing booking."""
         # Update database model and return domain entity
+        mark_changed(self._session, "bookings")
         return booking
     
     async def delete(self, booking_id: str) -> bool:
         """Delete a booking."""
         # Soft delete in database
+        mark_changed(self._session, "bookings")
         return True
     
     async def list_by_customer(
@@ -93,6 +107,157 @@ class SqlBookingRepository(IBookingRepository):
         # Complex query to find overlapping time slots
         return []
 
+    def _period_conditions(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        statuses: Optional[Sequence[str]],
+    ) -> List[Any]:
+        conditions = []
+        if start_date and end_date:
+            conditions.extend(within_days(BookingModel.scheduled_at, start_date, end_date))
+        if statuses:
+            conditions.append(BookingModel.status.in_(statuses))
+        return conditions
+
+    async def get_daily_revenue(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[DailyBookingRevenue]:
+        """Sum booking revenue per scheduled day, skipping days without bookings."""
+        day = day_bucket(BookingModel.scheduled_at)
+        stmt = (
+            select(day, func.sum(BookingModel.total_price), func.count())
+            .where(*self._period_conditions(start_date, end_date, statuses))
+            .group_by(day)
+            .order_by(day)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            DailyBookingRevenue(day=as_date(row[0]), revenue=as_decimal(row[1]), booking_count=row[2])
+            for row in result
+        ]
+
+    async def count_customers(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Count distinct customers with bookings in the period."""
+        stmt = select(func.count(func.distinct(BookingModel.customer_id))).where(
+            *self._period_conditions(start_date, end_date, statuses)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar() or 0
+
+    async def get_service_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[ServiceBookingTotals]:
+        """Bookings and revenue per service in the period."""
+        revenue = func.sum(BookingServiceModel.price)
+        stmt = (
+            select(
+                BookingServiceModel.service_id,
+                func.max(BookingServiceModel.name),
+                func.count(func.distinct(BookingServiceModel.booking_id)),
+                revenue,
+            )
+            .join(BookingModel, BookingModel.id == BookingServiceModel.booking_id)
+            .where(*self._period_conditions(start_date, end_date, statuses))
+            .group_by(BookingServiceModel.service_id)
+            .order_by(desc(revenue))
+        )
+        result = await self._session.execute(stmt)
+        return [
+            ServiceBookingTotals(
+                service_id=row[0],
+                service_name=row[1],
+                booking_count=row[2],
+                revenue=as_decimal(row[3]),
+            )
+            for row in result
+        ]
+
+    async def get_daily_service_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[DailyServiceBookingTotals]:
+        """Bookings and revenue per scheduled day and service in the period."""
+        day = day_bucket(BookingModel.scheduled_at)
+        stmt = (
+            select(
+                day,
+                BookingServiceModel.service_id,
+                func.max(BookingServiceModel.name),
+                func.count(func.distinct(BookingServiceModel.booking_id)),
+                func.sum(BookingServiceModel.price),
+            )
+            .join(BookingModel, BookingModel.id == BookingServiceModel.booking_id)
+            .where(*self._period_conditions(start_date, end_date, statuses))
+            .group_by(day, BookingServiceModel.service_id)
+            .order_by(day)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            DailyServiceBookingTotals(
+                day=as_date(row[0]),
+                service_id=row[1],
+                service_name=row[2],
+                booking_count=row[3],
+                revenue=as_decimal(row[4]),
+            )
+            for row in result
+        ]
+
+    async def get_customer_totals(
+        self,
+        customer_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        statuses: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[CustomerBookingTotals]:
+        """Bookings and spending per customer, biggest spenders first."""
+        conditions = self._period_conditions(start_date, end_date, statuses)
+        if customer_id:
+            conditions.append(BookingModel.customer_id == customer_id)
+
+        total_spent = func.sum(BookingModel.total_price)
+        stmt = (
+            select(
+                BookingModel.customer_id,
+                func.count(),
+                total_spent,
+                func.min(BookingModel.scheduled_at),
+                func.max(BookingModel.scheduled_at),
+            )
+            .where(*conditions)
+            .group_by(BookingModel.customer_id)
+            .order_by(desc(total_spent))
+        )
+        if limit:
+            stmt = stmt.limit(limit)
+
+        result = await self._session.execute(stmt)
+        return [
+            CustomerBookingTotals(
+                customer_id=row[0],
+                booking_count=row[1],
+                total_spent=as_decimal(row[2]),
+                first_booking_date=as_date(row[3]),
+                last_booking_date=as_date(row[4]),
+            )
+            for row in result
+        ]
+
 
 class SqlServiceRepository(IServiceRepository):
     """SQLAlchemy implementation of service repository."""
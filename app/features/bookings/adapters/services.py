@@ -1,8 +1,8 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
-import json
-import uuid
 
+from app.core.cache import AsyncRedisClient, DistributedLock
+from app.core.background import offload
 from app.features.bookings.domain import Booking
 from app.features.bookings.ports import (
     INotificationService,
@@ -19,6 +19,7 @@ class EmailNotificationService(INotificationService):
     def __init__(self, email_service):
         self._email_service = email_service
     
+    @offload
     async def send_booking_confirmation(
         self,
         customer_email: str,
@@ -58,6 +59,7 @@ class EmailNotificationService(INotificationService):
         except Exception:
             return False
     
+    @offload
     async def send_booking_cancellation(
         self,
         customer_email: str,
@@ -86,6 +88,7 @@ class EmailNotificationService(INotificationService):
         except Exception:
             return False
     
+    @offload
     async def send_booking_reminder(
         self,
         customer_email: str,
@@ -117,6 +120,7 @@ class EmailNotificationService(INotificationService):
         except Exception:
             return False
     
+    @offload
     async def send_booking_updated(
         self,
         customer_email: str,
@@ -282,16 +286,13 @@ class RedisCacheService(ICacheService):
     async def set_booking(self, booking: Booking, ttl: int = 3600) -> bool:
         """Cache booking data."""
         try:
-            # Serialize booking to JSON
-            # This would require custom serialization logic
-            data = json.dumps({
+            # Full entity serialization would require custom logic
+            data = {
                 "id": booking.id,
                 "customer_id": booking.customer_id,
                 # ... other fields
-            })
-            
-            await self._redis.setex(f"booking:{booking.id}", ttl, data)
-            return True
+            }
+            return await self._redis.set(f"booking:{booking.id}", data, ttl=ttl)
         except Exception:
             return False
     
@@ -312,10 +313,7 @@ class RedisCacheService(ICacheService):
         """Get cached customer bookings."""
         try:
             key = f"customer_bookings:{customer_id}:{page}:{limit}"
-            data = await self._redis.get(key)
-            if data:
-                return json.loads(data)
-            return None
+            return await self._redis.get(key)
         except Exception:
             return None
     
@@ -330,19 +328,15 @@ class RedisCacheService(ICacheService):
         """Cache customer bookings."""
         try:
             key = f"customer_bookings:{customer_id}:{page}:{limit}"
-            data = json.dumps(bookings)
-            await self._redis.setex(key, ttl, data)
-            return True
+            return await self._redis.set(key, bookings, ttl=ttl, tags=[f"customer:{customer_id}"])
         except Exception:
             return False
     
     async def invalidate_customer_cache(self, customer_id: str) -> bool:
         """Invalidate all cached data for customer."""
         try:
-            pattern = f"customer_bookings:{customer_id}:*"
-            keys = await self._redis.keys(pattern)
-            if keys:
-                await self._redis.delete(*keys)
+            # Every page of the customer's bookings is tagged customer:{customer_id}
+            await self._redis.invalidate_tags(f"customer:{customer_id}")
             return True
         except Exception:
             return False
@@ -378,6 +372,7 @@ class EventBusService(IEventService):
                 "event_type": "booking_confirmed",
                 "booking_id": booking.id,
                 "customer_id": booking.customer_id,
+                "scheduled_at": booking.scheduled_at.isoformat(),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
             
@@ -398,6 +393,7 @@ class EventBusService(IEventService):
                 "event_type": "booking_cancelled",
                 "booking_id": booking.id,
                 "customer_id": booking.customer_id,
+                "scheduled_at": booking.scheduled_at.isoformat(),
                 "cancelled_by": cancelled_by,
                 "reason": reason,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -415,6 +411,7 @@ class EventBusService(IEventService):
                 "event_type": "booking_completed",
                 "booking_id": booking.id,
                 "customer_id": booking.customer_id,
+                "scheduled_at": booking.scheduled_at.isoformat(),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
             
@@ -434,6 +431,7 @@ class EventBusService(IEventService):
                 "event_type": "booking_updated",
                 "booking_id": booking.id,
                 "customer_id": booking.customer_id,
+                "scheduled_at": booking.scheduled_at.isoformat(),
                 "changes": changes,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
@@ -443,33 +441,58 @@ class EventBusService(IEventService):
         except Exception:
             return False
 
+    async def publish_booking_rescheduled(
+        self,
+        booking: Booking,
+        old_scheduled_at: datetime,
+        new_scheduled_at: datetime,
+        rescheduled_by: str,
+    ) -> bool:
+        """Publish booking rescheduled event."""
+        try:
+            event_data = {
+                "event_type": "booking_rescheduled",
+                "booking_id": booking.id,
+                "customer_id": booking.customer_id,
+                "previous_scheduled_at": old_scheduled_at.isoformat(),
+                "scheduled_at": new_scheduled_at.isoformat(),
+                "rescheduled_by": rescheduled_by,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+
+            await self._event_bus.publish("booking.rescheduled", event_data)
+            return True
+        except Exception:
+            return False
 
-class RedisLockService(ILockService):
-    """Redis-based distributed lock service with atomic operations."""
 
-    # Lua script for atomic lock release (only release if we own the lock)
-    RELEASE_LOCK_SCRIPT = """
-    if redis.call("get", KEYS[1]) == ARGV[1] then
-        return redis.call("del", KEYS[1])
-    else
-        return 0
-    end
+class RedisLockService(ILockService):
     """
+    Redis-based distributed lock service with fencing tokens.
 
-    # Lua script for atomic lock extension (only extend if we own the lock)
-    EXTEND_LOCK_SCRIPT = """
-    if redis.call("get", KEYS[1]) == ARGV[1] then
-        return redis.call("expire", KEYS[1], ARGV[2])
-    else
-        return 0
-    end
+    Leases are fixed (use extend_lock() for longer work) and never renewed
+    in the background, so a lock that is never released expires on its own.
+    Built per request; release_all() drops whatever the request still holds.
     """
 
-    def __init__(self, redis_client):
-        """Initialize lock service with Redis client."""
+    def __init__(self, redis_client: AsyncRedisClient):
+        """Initialize lock service with the async Redis client."""
         self._redis = redis_client
-        # Track lock_id to key mapping for release/extend operations
-        self._lock_keys: Dict[str, str] = {}
+        # Track lock_id to held lock for release/extend/validate operations
+        self._locks: Dict[str, DistributedLock] = {}
+
+    async def _acquire(self, name: str, timeout: int) -> Optional[str]:
+        """Acquire a lock without waiting, for a lease of timeout seconds."""
+        lock = DistributedLock(
+            name,
+            timeout=timeout,
+            blocking=False,
+            redis=self._redis,
+        )
+        if not await lock.acquire():
+            return None
+        self._locks[lock.owner] = lock
+        return lock.owner
 
     async def acquire_booking_lock(
         self,
@@ -477,20 +500,7 @@ class RedisLockService(ILockService):
         timeout: int = 30,
     ) -> Optional[str]:
         """Acquire exclusive lock for booking."""
-        try:
-            lock_id = str(uuid.uuid4())
-            key = f"lock:booking:{booking_id}"
-
-            # SET with NX (only if not exists) and EX (expiry)
-            result = self._redis.set(key, lock_id, ex=timeout, nx=True)
-
-            if result:
-                self._lock_keys[lock_id] = key
-                return lock_id
-            return None
-        except Exception as e:
-            # Log error but don't expose details
-            return None
+        return await self._acquire(f"booking:{booking_id}", timeout)
 
     async def acquire_time_slot_lock(
         self,
@@ -500,66 +510,44 @@ class RedisLockService(ILockService):
         timeout: int = 30,
     ) -> Optional[str]:
         """Acquire lock for time slot to prevent double booking."""
-        try:
-            lock_id = str(uuid.uuid4())
-            # Create a unique key based on time slot and type
-            time_str = scheduled_at.strftime("%Y%m%d_%H%M")
-            key = f"lock:timeslot:{booking_type}:{time_str}:{duration_minutes}"
-
-            # SET with NX (only if not exists) and EX (expiry)
-            result = self._redis.set(key, lock_id, ex=timeout, nx=True)
-
-            if result:
-                self._lock_keys[lock_id] = key
-                return lock_id
-            return None
-        except Exception as e:
-            return None
+        # Create a unique key based on time slot and type
+        time_str = scheduled_at.strftime("%Y%m%d_%H%M")
+        return await self._acquire(f"timeslot:{booking_type}:{time_str}:{duration_minutes}", timeout)
 
     async def release_lock(self, lock_id: str) -> bool:
         """Release acquired lock atomically (only if we own it)."""
-        try:
-            # Get the key for this lock_id
-            key = self._lock_keys.get(lock_id)
-            if not key:
-                # Lock not found in tracking - might already be released
-                return False
-
-            # Use Lua script to atomically check ownership and delete
-            result = self._redis.eval(
-                self.RELEASE_LOCK_SCRIPT,
-                1,  # number of keys
-                key,  # KEYS[1]
-                lock_id  # ARGV[1]
-            )
-
-            # Clean up tracking
-            if result:
-                self._lock_keys.pop(lock_id, None)
-                return True
-
-            return False
-        except Exception as e:
+        lock = self._locks.pop(lock_id, None)
+        if not lock:
+            # Lock not found in tracking - might already be released
             return False
+        return await lock.release()
+
+    async def release_all(self) -> int:
+        """Release every lock still tracked (request teardown); returns how many were held."""
+        locks, self._locks = list(self._locks.values()), {}
+        for lock in locks:
+            try:
+                await lock.release()
+            except Exception:
+                # The lease still expires on its own
+                pass
+        return len(locks)
 
     async def extend_lock(self, lock_id: str, additional_time: int = 30) -> bool:
         """Extend lock expiry time atomically (only if we own it)."""
-        try:
-            # Get the key for this lock_id
-            key = self._lock_keys.get(lock_id)
-            if not key:
-                # Lock not found in tracking
-                return False
+        lock = self._locks.get(lock_id)
+        if not lock:
+            return False
+        return await lock.extend(additional_time)
 
-            # Use Lua script to atomically check ownership and extend expiry
-            result = self._redis.eval(
-                self.EXTEND_LOCK_SCRIPT,
-                1,  # number of keys
-                key,  # KEYS[1]
-                lock_id,  # ARGV[1]
-                additional_time  # ARGV[2]
-            )
+    async def get_fencing_token(self, lock_id: str) -> Optional[int]:
+        """Fencing token issued when the lock was acquired."""
+        lock = self._locks.get(lock_id)
+        return lock.fencing_token if lock else None
 
-            return bool(result)
-        except Exception as e:
-            return False
\ No newline at end of file
+    async def validate_lock(self, lock_id: str) -> bool:
+        """Check the lock is still held with its fencing token (call before writing)."""
+        lock = self._locks.get(lock_id)
+        if not lock:
+            return False
+        return await lock.validate()
@@ -1,7 +1,7 @@
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 from fastapi import Depends
 
-from app.core.db import UnitOfWork, get_unit_of_work, get_db, AsyncSession
+from app.core.db import UnitOfWork, get_unit_of_work, get_db, get_read_db, AsyncSession
 
 
 def get_email_service():
@@ -13,31 +13,21 @@ def get_email_service():
 
 
 def get_cache_service():
-    """Stub for cache service."""
-    class StubCacheService:
-        def get(self, *args, **kwargs):
-            return None
-        def set(self, *args, **kwargs):
-            pass
-    return StubCacheService()
+    """Get the shared async Redis cache client."""
+    from app.core.cache import async_redis_client
+    return async_redis_client
 
 
-def get_event_service():
-    """Stub for event service."""
-    class StubEventService:
-        def publish(self, *args, **kwargs):
-            pass
-    return StubEventService()
+def get_event_service(session: Annotated[AsyncSession, Depends(get_db)]):
+    """Get the event publisher, writing to the outbox in the request's transaction."""
+    from app.core.db import OutboxPublisher
+    return OutboxPublisher(session)
 
 
 def get_lock_service():
-    """Stub for lock service."""
-    class StubLockService:
-        def acquire_lock(self, *args, **kwargs):
-            return True
-        def release_lock(self, *args, **kwargs):
-            pass
-    return StubLockService()
+    """Get the async Redis client backing the lock service."""
+    from app.core.cache import async_redis_client
+    return async_redis_client
 from app.features.bookings.adapters import (
     SqlBookingRepository,
     SqlServiceRepository,
@@ -74,6 +64,13 @@ def get_booking_repository(
     return SqlBookingRepository(db)
 
 
+def get_read_booking_repository(
+    db: AsyncSession = Depends(get_read_db)
+) -> SqlBookingRepository:
+    """Get booking repository for read-only use cases (replica when configured)."""
+    return SqlBookingRepository(db)
+
+
 def get_service_repository(
     db: AsyncSession = Depends(get_db)
 ) -> SqlServiceRepository:
@@ -122,11 +119,15 @@ def get_booking_event_service(
     return EventBusService(event_service)
 
 
-def get_booking_lock_service(
+async def get_booking_lock_service(
     lock_service=Depends(get_lock_service)
-) -> RedisLockService:
-    """Get lock service for bookings."""
-    return RedisLockService(lock_service)
+) -> AsyncGenerator[RedisLockService, None]:
+    """Get lock service for bookings (locks left held are released after the request)."""
+    service = RedisLockService(lock_service)
+    try:
+        yield service
+    finally:
+        await service.release_all()
 
 
 def get_capacity_service(
@@ -203,7 +204,7 @@ def get_get_booking_use_case(
 
 
 def get_list_bookings_use_case(
-    booking_repo: Annotated[SqlBookingRepository, Depends(get_booking_repository)],
+    booking_repo: Annotated[SqlBookingRepository, Depends(get_read_booking_repository)],
     cache_service: Annotated[RedisCacheService, Depends(get_booking_cache_service)],
 ) -> ListBookingsUseCase:
     """Get list bookings use case."""
@@ -3,6 +3,7 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 
 from app.core.errors import NotFoundError, ValidationError, BusinessRuleViolationError
+from app.core.responses import FastJSONResponse
 from app.shared.auth import get_current_user, require_any_role, CurrentUser
 
 from app.features.bookings.api.schemas import (
@@ -261,6 +262,7 @@ async def cancel_booking(
 # Admin-only endpoints
 @router.get(
     "/admin/stats",
+    response_class=FastJSONResponse,
     dependencies=[Depends(require_any_role("admin"))],
     summary="Get booking statistics",
     description="Get booking statistics for administrators.",
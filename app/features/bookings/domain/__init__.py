@@ -5,6 +5,10 @@ from .entities import (
     BookingType,
     VehicleSize,
     QualityRating,
+    DailyBookingRevenue,
+    ServiceBookingTotals,
+    DailyServiceBookingTotals,
+    CustomerBookingTotals,
 )
 from .policies import (
     BookingValidationPolicy,
@@ -25,6 +29,10 @@ __all__ = [
     "BookingType",
     "VehicleSize",
     "QualityRating",
+    "DailyBookingRevenue",
+    "ServiceBookingTotals",
+    "DailyServiceBookingTotals",
+    "CustomerBookingTotals",
     "BookingValidationPolicy",
     "BookingTypePolicy",
     "BookingStateTransitionPolicy",
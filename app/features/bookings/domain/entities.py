@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import List, Optional, Dict, Any
@@ -522,4 +522,45 @@ class Booking:
             return False
 
         min_notice_time = datetime.now(timezone.utc) + timedelta(hours=self.MIN_RESCHEDULE_NOTICE_HOURS)
-        return self.scheduled_at > min_notice_time
\ No newline at end of file
+        return self.scheduled_at > min_notice_time
+
+
+@dataclass
+class DailyBookingRevenue:
+    """Booking revenue and count for one day."""
+
+    day: date
+    revenue: Decimal
+    booking_count: int
+
+
+@dataclass
+class ServiceBookingTotals:
+    """Bookings and revenue for one service over a period."""
+
+    service_id: str
+    service_name: str
+    booking_count: int
+    revenue: Decimal
+
+
+@dataclass
+class CustomerBookingTotals:
+    """Bookings and spending for one customer over a period."""
+
+    customer_id: str
+    booking_count: int
+    total_spent: Decimal
+    first_booking_date: date
+    last_booking_date: date
+
+
+@dataclass
+class DailyServiceBookingTotals:
+    """Bookings and revenue for one service on one day."""
+
+    day: date
+    service_id: str
+    service_name: str
+    booking_count: int
+    revenue: Decimal
@@ -5,6 +5,10 @@ from ..domain.entities import (
     BookingStatus,
     BookingType,
     VehicleSize,
+    DailyBookingRevenue,
+    ServiceBookingTotals,
+    DailyServiceBookingTotals,
+    CustomerBookingTotals,
 )
 
 from .repositories import (
@@ -34,6 +38,10 @@ __all__ = [
     "BookingStatus",
     "BookingType", 
     "VehicleSize",
+    "DailyBookingRevenue",
+    "ServiceBookingTotals",
+    "DailyServiceBookingTotals",
+    "CustomerBookingTotals",
     # Repositories
     "IBookingRepository",
     "IServiceRepository", 
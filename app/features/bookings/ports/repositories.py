@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Sequence
+from datetime import date, datetime
 
-from app.features.bookings.domain import Booking, BookingService
+from app.features.bookings.domain import (
+    Booking,
+    BookingService,
+    DailyBookingRevenue,
+    ServiceBookingTotals,
+    DailyServiceBookingTotals,
+    CustomerBookingTotals,
+)
 
 
 class IBookingRepository(ABC):
@@ -81,6 +88,58 @@ class IBookingRepository(ABC):
         """Find bookings that might conflict with the given time slot."""
         pass
 
+    @abstractmethod
+    async def get_daily_revenue(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[DailyBookingRevenue]:
+        """Sum booking revenue per scheduled day, skipping days without bookings."""
+        pass
+
+    @abstractmethod
+    async def count_customers(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Count distinct customers with bookings in the period."""
+        pass
+
+    @abstractmethod
+    async def get_service_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[ServiceBookingTotals]:
+        """Bookings and revenue per service in the period."""
+        pass
+
+    @abstractmethod
+    async def get_daily_service_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[DailyServiceBookingTotals]:
+        """Bookings and revenue per scheduled day and service in the period."""
+        pass
+
+    @abstractmethod
+    async def get_customer_totals(
+        self,
+        customer_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        statuses: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[CustomerBookingTotals]:
+        """Bookings and spending per customer, biggest spenders first."""
+        pass
+
 
 class IServiceRepository(ABC):
     """Service repository interface for booking services."""
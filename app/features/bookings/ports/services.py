@@ -177,6 +177,17 @@ class IEventService(ABC):
         """Publish booking updated event."""
         pass
 
+    @abstractmethod
+    async def publish_booking_rescheduled(
+        self,
+        booking: Booking,
+        old_scheduled_at: datetime,
+        new_scheduled_at: datetime,
+        rescheduled_by: str,
+    ) -> bool:
+        """Publish booking rescheduled event."""
+        pass
+
 
 class ILockService(ABC):
     """Distributed lock service for booking concurrency control."""
@@ -209,4 +220,14 @@ class ILockService(ABC):
     @abstractmethod
     async def extend_lock(self, lock_id: str, additional_time: int = 30) -> bool:
         """Extend lock expiry time."""
+        pass
+
+    @abstractmethod
+    async def get_fencing_token(self, lock_id: str) -> Optional[int]:
+        """Get the monotonically increasing fencing token of a held lock."""
+        pass
+
+    @abstractmethod
+    async def validate_lock(self, lock_id: str) -> bool:
+        """Check the lock is still held (its lease has not expired or been taken over)."""
         pass
\ No newline at end of file
@@ -7,17 +7,17 @@ from typing import List
 
 from app.features.bookings.ports.repositories import IBookingRepository
 
+# Bookings that count towards revenue
+REVENUE_STATUSES = ("confirmed", "completed")
+
 
 @dataclass
-class BookingRevenueData:
-    """Revenue data for a booking."""
+class DailyBookingRevenueData:
+    """Booking revenue for one day."""
 
-    booking_id: str
     booking_date: date
     total_amount: Decimal
-    status: str
-    customer_id: str
-    service_id: str
+    booking_count: int
 
 
 @dataclass
@@ -36,27 +36,31 @@ class GetRevenueDataUseCase:
 
     async def execute(
         self, request: GetRevenueDataRequest
-    ) -> List[BookingRevenueData]:
-        """Get revenue data for confirmed/completed bookings in period."""
-        bookings = await self._repository.list_all()
-
-        # Filter by date range and status
-        revenue_data = []
-        for booking in bookings:
-            if (
-                booking.booking_date >= request.start_date
-                and booking.booking_date <= request.end_date
-                and booking.status in ["confirmed", "completed"]
-            ):
-                revenue_data.append(
-                    BookingRevenueData(
-                        booking_id=booking.id,
-                        booking_date=booking.booking_date,
-                        total_amount=booking.total_amount,
-                        status=booking.status,
-                        customer_id=booking.customer_id,
-                        service_id=booking.service_id,
-                    )
-                )
-
-        return revenue_data
+    ) -> List[DailyBookingRevenueData]:
+        """Get daily revenue for confirmed/completed bookings in period."""
+        # Aggregated in SQL: one row per day with bookings
+        days = await self._repository.get_daily_revenue(
+            request.start_date, request.end_date, REVENUE_STATUSES
+        )
+
+        return [
+            DailyBookingRevenueData(
+                booking_date=day.day,
+                total_amount=day.revenue,
+                booking_count=day.booking_count,
+            )
+            for day in days
+        ]
+
+
+class CountRevenueCustomersUseCase:
+    """Public use case for analytics to count customers behind booking revenue."""
+
+    def __init__(self, booking_repository: IBookingRepository):
+        self._repository = booking_repository
+
+    async def execute(self, request: GetRevenueDataRequest) -> int:
+        """Count distinct customers with confirmed/completed bookings in period."""
+        return await self._repository.count_customers(
+            request.start_date, request.end_date, REVENUE_STATUSES
+        )
@@ -37,38 +37,54 @@ class GetServiceStatsUseCase:
         self, request: GetServiceStatsRequest
     ) -> List[ServiceBookingStats]:
         """Get booking statistics by service."""
-        bookings = await self._repository.list_all()
-
-        # Filter by date range
-        period_bookings = [
-            b
-            for b in bookings
-            if request.start_date <= b.booking_date <= request.end_date
+        totals = await self._repository.get_service_totals(
+            request.start_date, request.end_date
+        )
+
+        return [
+            ServiceBookingStats(
+                service_id=service.service_id,
+                service_name=service.service_name,
+                booking_count=service.booking_count,
+                total_revenue=service.revenue,
+                status="active",
+            )
+            for service in totals
         ]
 
-        # Group by service
-        service_map = {}
-        for booking in period_bookings:
-            sid = booking.service_id
-            if sid not in service_map:
-                service_map[sid] = {
-                    "count": 0,
-                    "revenue": Decimal("0"),
-                }
-            service_map[sid]["count"] += 1
-            service_map[sid]["revenue"] += booking.total_amount
-
-        # Create stats list
-        stats_list = []
-        for sid, data in service_map.items():
-            stats_list.append(
-                ServiceBookingStats(
-                    service_id=sid,
-                    service_name="",  # Will be populated by analytics
-                    booking_count=data["count"],
-                    total_revenue=data["revenue"],
-                    status="active",
-                )
-            )
 
-        return stats_list
+@dataclass
+class DailyServiceBookingStats:
+    """Booking statistics for a service on one day."""
+
+    booking_date: date
+    service_id: str
+    service_name: str
+    booking_count: int
+    total_revenue: Decimal
+
+
+class GetDailyServiceStatsUseCase:
+    """Public use case for analytics to get service booking statistics per day."""
+
+    def __init__(self, booking_repository: IBookingRepository):
+        self._repository = booking_repository
+
+    async def execute(
+        self, request: GetServiceStatsRequest
+    ) -> List[DailyServiceBookingStats]:
+        """Get booking statistics by day and service."""
+        totals = await self._repository.get_daily_service_totals(
+            request.start_date, request.end_date
+        )
+
+        return [
+            DailyServiceBookingStats(
+                booking_date=service.day,
+                service_id=service.service_id,
+                service_name=service.service_name,
+                booking_count=service.booking_count,
+                total_revenue=service.revenue,
+            )
+            for service in totals
+        ]
@@ -7,6 +7,7 @@ from typing import List, Optional
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import mark_changed
 from app.features.expenses.domain.entities import Expense, Budget, ExpenseSummary
 from app.features.expenses.domain.enums import (
     ExpenseCategory,
@@ -29,6 +30,7 @@ class ExpenseRepository(IExpenseRepository):
         """Create new expense."""
         model = self._to_model(expense)
         self._session.add(model)
+        mark_changed(self._session, "expenses")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -63,6 +65,7 @@ class ExpenseRepository(IExpenseRepository):
         model.parent_expense_id = expense.parent_expense_id
         model.updated_at = datetime.now(timezone.utc)
 
+        mark_changed(self._session, "expenses")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -249,6 +252,7 @@ class ExpenseRepository(IExpenseRepository):
 
         if model:
             model.deleted_at = datetime.now(timezone.utc)
+            mark_changed(self._session, "expenses")
             await self._session.flush()
 
     def _to_domain(self, model: ExpenseModel) -> Expense:
@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db.session import get_db
+from app.core.db.session import get_db, get_read_db
 from app.features.expenses.adapters.repositories import (
     ExpenseRepository,
     BudgetRepository,
@@ -44,6 +44,20 @@ def get_budget_repository(
     return BudgetRepository(session)
 
 
+def get_read_expense_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> ExpenseRepository:
+    """Get expense repository for read-only use cases (replica when configured)."""
+    return ExpenseRepository(session)
+
+
+def get_read_budget_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> BudgetRepository:
+    """Get budget repository for read-only use cases (replica when configured)."""
+    return BudgetRepository(session)
+
+
 # ============================================================================
 # Expense Use Case Factories
 # ============================================================================
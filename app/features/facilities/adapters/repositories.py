@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..domain.entities import WashBay, MobileTeam, Location, VehicleSize, ResourceStatus
 from ..ports.repositories import IWashBayRepository, IMobileTeamRepository
 from .models import WashBayModel, MobileTeamModel
+from app.core.cache import mark_changed
 from app.core.errors import ValidationError
 
 
@@ -36,6 +37,7 @@ class SQLAlchemyWashBayRepository(IWashBayRepository):
         """Create a new wash bay in the database."""
         model = self._to_model(wash_bay)
         self._session.add(model)
+        mark_changed(self._session, "wash_bays")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -119,6 +121,7 @@ class SQLAlchemyWashBayRepository(IWashBayRepository):
             model.location_latitude = None
             model.location_longitude = None
 
+        mark_changed(self._session, "wash_bays")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -139,6 +142,7 @@ class SQLAlchemyWashBayRepository(IWashBayRepository):
 
         model.deleted_at = datetime.now(timezone.utc)
         model.status = ResourceStatus.INACTIVE.value
+        mark_changed(self._session, "wash_bays")
         await self._session.flush()
         return True
 
@@ -212,6 +216,7 @@ class SQLAlchemyMobileTeamRepository(IMobileTeamRepository):
         """Create a new mobile team in the database."""
         model = self._to_model(mobile_team)
         self._session.add(model)
+        mark_changed(self._session, "mobile_teams")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -291,6 +296,7 @@ class SQLAlchemyMobileTeamRepository(IMobileTeamRepository):
         model.status = mobile_team.status.value
         model.updated_at = datetime.now(timezone.utc)
 
+        mark_changed(self._session, "mobile_teams")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -311,6 +317,7 @@ class SQLAlchemyMobileTeamRepository(IMobileTeamRepository):
 
         model.deleted_at = datetime.now(timezone.utc)
         model.status = ResourceStatus.INACTIVE.value
+        mark_changed(self._session, "mobile_teams")
         await self._session.flush()
         return True
 
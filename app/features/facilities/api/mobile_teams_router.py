@@ -33,6 +33,7 @@ from ..use_cases import (
     DeleteMobileTeamRequest
 )
 from ..domain.entities import ResourceStatus
+from app.core.cache import conditional_get
 from app.core.errors import ValidationError, BusinessRuleViolationError, NotFoundError
 from app.shared.auth import get_current_user, CurrentUser, require_any_role
 
@@ -42,6 +43,9 @@ from app.features.auth.domain import UserRole
 
 router = APIRouter()
 
+# Reference data read far more often than it changes
+MOBILE_TEAMS_ETAG = conditional_get("mobile_teams")
+
 
 @router.post(
     "/",
@@ -113,7 +117,10 @@ async def create_mobile_team(
     response_model=ListMobileTeamsSchema,
     summary="List Mobile Teams",
     description="List all mobile teams with optional filtering. Requires Admin, Manager, or Washer role.",
-    dependencies=[Depends(require_any_role(UserRole.ADMIN.value, UserRole.MANAGER.value, UserRole.WASHER.value))]
+    dependencies=[
+        Depends(require_any_role(UserRole.ADMIN.value, UserRole.MANAGER.value, UserRole.WASHER.value)),
+        Depends(MOBILE_TEAMS_ETAG),
+    ]
 )
 async def list_mobile_teams(
     current_user: CurrentUser,
@@ -32,6 +32,7 @@ from ..use_cases import (
     DeleteWashBayRequest
 )
 from ..domain.entities import ResourceStatus
+from app.core.cache import conditional_get
 from app.core.errors import ValidationError, BusinessRuleViolationError, NotFoundError
 from app.shared.auth import get_current_user, CurrentUser, require_any_role
 
@@ -41,6 +42,9 @@ from app.features.auth.domain import UserRole
 
 router = APIRouter()
 
+# Reference data read far more often than it changes
+WASH_BAYS_ETAG = conditional_get("wash_bays")
+
 
 @router.post(
     "/",
@@ -113,7 +117,10 @@ async def create_wash_bay(
     response_model=ListWashBaysSchema,
     summary="List Wash Bays",
     description="List all wash bays with optional filtering. Requires Admin, Manager, or Washer role.",
-    dependencies=[Depends(require_any_role(UserRole.ADMIN.value, UserRole.MANAGER.value, UserRole.WASHER.value))]
+    dependencies=[
+        Depends(require_any_role(UserRole.ADMIN.value, UserRole.MANAGER.value, UserRole.WASHER.value)),
+        Depends(WASH_BAYS_ETAG),
+    ]
 )
 async def list_wash_bays(
     current_user: CurrentUser,
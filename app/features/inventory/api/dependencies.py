@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.features.inventory.adapters.repositories import (
     ProductRepository,
     StockMovementRepository,
@@ -44,6 +44,13 @@ def get_product_repository(
     return ProductRepository(session)
 
 
+def get_read_product_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> ProductRepository:
+    """Get product repository for read-only use cases (replica when configured)."""
+    return ProductRepository(session)
+
+
 def get_stock_movement_repository(
     session: Annotated[AsyncSession, Depends(get_db)]
 ) -> StockMovementRepository:
@@ -85,7 +92,7 @@ def get_get_product_use_case(
 
 
 def get_list_products_use_case(
-    repository: Annotated[ProductRepository, Depends(get_product_repository)]
+    repository: Annotated[ProductRepository, Depends(get_read_product_repository)]
 ) -> ListProductsUseCase:
     """Get list products use case."""
     return ListProductsUseCase(repository)
@@ -188,7 +195,7 @@ def get_delete_supplier_use_case(
 
 
 def get_low_stock_alerts_use_case(
-    repository: Annotated[ProductRepository, Depends(get_product_repository)]
+    repository: Annotated[ProductRepository, Depends(get_read_product_repository)]
 ) -> GetLowStockAlertsUseCase:
     """Get low stock alerts use case."""
     return GetLowStockAlertsUseCase(repository)
@@ -24,6 +24,7 @@ from ..ports.repositories import (
     IWashBayRepository, IMobileTeamRepository,
     ITimeSlotRepository, ISchedulingConstraintsRepository
 )
+from app.core.cache import mark_changed, near_cache
 
 
 class WashBayRepository(IWashBayRepository):
@@ -61,6 +62,7 @@ class WashBayRepository(IWashBayRepository):
         )
         
         self.db.add(bay_model)
+        mark_changed(self.db, "wash_bays")
         self.db.commit()
         self.db.refresh(bay_model)
         
@@ -80,6 +82,7 @@ class WashBayRepository(IWashBayRepository):
         bay_model.location_longitude = wash_bay.location.longitude if wash_bay.location else None
         bay_model.updated_at = wash_bay.updated_at
         
+        mark_changed(self.db, "wash_bays")
         self.db.commit()
         self.db.refresh(bay_model)
         
@@ -92,6 +95,7 @@ class WashBayRepository(IWashBayRepository):
             return False
         
         self.db.delete(bay_model)
+        mark_changed(self.db, "wash_bays")
         self.db.commit()
         return True
     
@@ -152,6 +156,7 @@ class MobileTeamRepository(IMobileTeamRepository):
         )
         
         self.db.add(team_model)
+        mark_changed(self.db, "mobile_teams")
         self.db.commit()
         self.db.refresh(team_model)
         
@@ -172,6 +177,7 @@ class MobileTeamRepository(IMobileTeamRepository):
         team_model.status = mobile_team.status.value
         team_model.updated_at = mobile_team.updated_at
         
+        mark_changed(self.db, "mobile_teams")
         self.db.commit()
         self.db.refresh(team_model)
         
@@ -184,6 +190,7 @@ class MobileTeamRepository(IMobileTeamRepository):
             return False
         
         self.db.delete(team_model)
+        mark_changed(self.db, "mobile_teams")
         self.db.commit()
         return True
     
@@ -318,12 +325,20 @@ class TimeSlotRepository(ITimeSlotRepository):
 
 class SchedulingConstraintsRepository(ISchedulingConstraintsRepository):
     """SQLAlchemy implementation of scheduling constraints repository."""
+
+    # Constraints are read on every availability check but rarely change
+    CACHE_KEY = "scheduling:constraints"
+    CACHE_TTL = 3600
     
     def __init__(self, db: Session):
         self.db = db
     
     async def get_current_constraints(self) -> ConstraintsEntity:
         """Get current scheduling constraints."""
+        cached = await near_cache.get(self.CACHE_KEY)
+        if cached:
+            return self._dict_to_entity(cached)
+
         constraints_model = self.db.query(SchedulingConstraints).filter(
             SchedulingConstraints.is_active == True
         ).first()
@@ -332,6 +347,9 @@ class SchedulingConstraintsRepository(ISchedulingConstraintsRepository):
             # Return default constraints if none found
             return ConstraintsEntity()
         
+        await near_cache.set(
+            self.CACHE_KEY, self._model_to_dict(constraints_model), ttl=self.CACHE_TTL
+        )
         return self._model_to_entity(constraints_model)
     
     async def update_constraints(self, constraints: ConstraintsEntity) -> ConstraintsEntity:
@@ -352,8 +370,30 @@ class SchedulingConstraintsRepository(ISchedulingConstraintsRepository):
         self.db.add(constraints_model)
         self.db.commit()
         self.db.refresh(constraints_model)
+
+        await near_cache.delete(self.CACHE_KEY)
         
         return self._model_to_entity(constraints_model)
+
+    def _model_to_dict(self, model: SchedulingConstraints) -> dict:
+        """Convert model to a cacheable dictionary."""
+        return {
+            "min_advance_hours": model.min_advance_hours,
+            "max_advance_days": model.max_advance_days,
+            "slot_duration_minutes": model.slot_duration_minutes,
+            "buffer_minutes": model.buffer_minutes,
+            "business_hours": model.business_hours or {},
+        }
+
+    def _dict_to_entity(self, data: dict) -> ConstraintsEntity:
+        """Convert cached dictionary to entity."""
+        return ConstraintsEntity(
+            min_advance_hours=data["min_advance_hours"],
+            max_advance_days=data["max_advance_days"],
+            slot_duration_minutes=data["slot_duration_minutes"],
+            buffer_minutes=data["buffer_minutes"],
+            business_hours=self._business_hours_from_dict(data["business_hours"])
+        )
     
     def _model_to_entity(self, model: SchedulingConstraints) -> ConstraintsEntity:
         """Convert model to entity."""
@@ -4,6 +4,8 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
+
+from app.core.cache import mark_changed
 from app.features.services.ports import (
     Category as CategoryDomain,
     Service as ServiceDomain,
@@ -76,6 +78,7 @@ class SqlCategoryRepository(ICategoryRepository):
 
         # Save to database
         self._session.add(db_category)
+        mark_changed(self._session, "categories")
         await self._session.commit()
         await self._session.refresh(db_category)
 
@@ -97,6 +100,7 @@ class SqlCategoryRepository(ICategoryRepository):
         db_category.status = category.status.value if hasattr(category.status, 'value') else category.status
         db_category.display_order = category.display_order
 
+        mark_changed(self._session, "categories")
         await self._session.commit()
         await self._session.refresh(db_category)
 
@@ -109,6 +113,7 @@ class SqlCategoryRepository(ICategoryRepository):
         result = await self._session.execute(
             sql_delete(CategoryModel).where(CategoryModel.id == category_id)
         )
+        mark_changed(self._session, "categories")
         await self._session.commit()
         return result.rowcount > 0
 
@@ -264,6 +269,7 @@ class SqlServiceRepository(IServiceRepository):
         )
 
         self._session.add(db_service)
+        mark_changed(self._session, "services")
         await self._session.commit()
         await self._session.refresh(db_service)
 
@@ -287,6 +293,7 @@ class SqlServiceRepository(IServiceRepository):
         db_service.is_popular = service.is_popular
         db_service.display_order = service.display_order
 
+        mark_changed(self._session, "services")
         await self._session.commit()
         await self._session.refresh(db_service)
 
@@ -299,6 +306,7 @@ class SqlServiceRepository(IServiceRepository):
         result = await self._session.execute(
             sql_delete(ServiceModel).where(ServiceModel.id == service_id)
         )
+        mark_changed(self._session, "services")
         await self._session.commit()
         return result.rowcount > 0
     
@@ -1,9 +1,12 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable
+from dataclasses import asdict
 from decimal import Decimal
 from datetime import datetime, timezone
 import json
 
-from app.features.services.domain import Category, Service
+from app.core.background import offload
+from app.core.cache import cached, peek, store, store_many, register_enum
+from app.features.services.domain import Category, CategoryStatus, Service, ServiceStatus
 from app.features.services.ports import (
     ICacheService,
     IEventService,
@@ -12,87 +15,113 @@ from app.features.services.ports import (
     IAnalyticsService,
 )
 
+# Cached categories and services carry these; decode them in every worker
+register_enum(CategoryStatus, ServiceStatus)
+
 
 class RedisCacheService(ICacheService):
     """Redis-based cache service implementation for services."""
     
     def __init__(self, redis_client):
         self._redis = redis_client
-    
+
     async def get_category(self, category_id: str) -> Optional[Category]:
         """Get cached category."""
         try:
-            data = self._redis.get(f"category:{category_id}")
-            if data:
-                # Deserialize category data
-                return None  # Placeholder
-            return None
+            data = await self._redis.get(f"category:{category_id}")
+            return Category(**data) if data else None
         except Exception:
             return None
 
     async def set_category(self, category: Category, ttl: int = 3600) -> bool:
         """Cache category data."""
         try:
-            data = {
-                "id": category.id,
-                "name": category.name,
-                "description": category.description,
-                "status": category.status.value,
-                "display_order": category.display_order,
-            }
-            return self._redis.set(f"category:{category.id}", data, ttl=ttl)
+            return await self._redis.set(
+                f"category:{category.id}",
+                asdict(category),
+                ttl=ttl,
+                tags=["services", f"category:{category.id}"],
+            )
         except Exception:
             return False
 
     async def delete_category(self, category_id: str) -> bool:
         """Remove category from cache."""
         try:
-            return self._redis.delete(f"category:{category_id}")
+            return await self._redis.delete(f"category:{category_id}") > 0
         except Exception:
             return False
     
     async def get_service(self, service_id: str) -> Optional[Service]:
         """Get cached service."""
         try:
-            data = self._redis.get(f"service:{service_id}")
-            if data:
-                # Deserialize service data
-                return None  # Placeholder
-            return None
+            data = await peek(f"service:{service_id}", cache=self._redis)
+            return Service(**data) if data else None
         except Exception:
             return None
 
     async def set_service(self, service: Service, ttl: int = 3600) -> bool:
         """Cache service data."""
         try:
-            data = {
-                "id": service.id,
-                "category_id": service.category_id,
-                "name": service.name,
-                "description": service.description,
-                "price": str(service.price),
-                "duration_minutes": service.duration_minutes,
-                "status": service.status.value,
-                "is_popular": service.is_popular,
-            }
-            return self._redis.set(f"service:{service.id}", data, ttl=ttl)
+            return await store(
+                f"service:{service.id}",
+                asdict(service),
+                ttl,
+                tags=self._service_tags(service.category_id),
+                cache=self._redis,
+            )
         except Exception:
             return False
 
+    async def get_or_load_service(
+        self,
+        service_id: str,
+        loader: Callable[[], Awaitable[Optional[Service]]],
+        ttl: int = 3600,
+    ) -> Optional[Service]:
+        """Get a cached service, loading it once on a miss however many requests ask."""
+
+        async def load():
+            service = await loader()
+            return asdict(service) if service else None
+
+        data = await cached(
+            f"service:{service_id}",
+            load,
+            ttl,
+            tags=lambda item: self._service_tags(item["category_id"]),
+            cache=self._redis,
+        )
+        return Service(**data) if data else None
+
+    @staticmethod
+    def _service_tags(category_id: str) -> List[str]:
+        """Tags of a service:{id} entry, however it was cached."""
+        return ["services", f"category:{category_id}"]
+
+    async def _store_services(self, items: List[Dict[str, Any]], ttl: int) -> bool:
+        """Cache service:{id} entries, one round trip per category."""
+        by_category: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            by_category.setdefault(item["category_id"], {})[f"service:{item['id']}"] = item
+        stored = True
+        for category_id, entries in by_category.items():
+            stored &= await store_many(entries, ttl, tags=self._service_tags(category_id), cache=self._redis)
+        return stored
+
     async def delete_service(self, service_id: str) -> bool:
         """Remove service from cache."""
         try:
-            return self._redis.delete(f"service:{service_id}")
+            return await self._redis.delete(f"service:{service_id}") > 0
         except Exception:
             return False
     
     async def get_popular_services(self) -> Optional[List[Service]]:
         """Get cached popular services."""
         try:
-            data = self._redis.get("popular_services")
-            if data:
-                # Deserialize list of services
-                return None  # Placeholder
+            data = await peek("popular_services", cache=self._redis)
+            if data is not None:
+                return [Service(**item) for item in data]
             return None
         except Exception:
             return None
@@ -105,21 +134,20 @@ class RedisCacheService(ICacheService):
         """Cache popular services."""
         try:
             if not services:
-                self._redis.delete("popular_services")
+                await self._redis.delete("popular_services")
                 return True
 
-            data = [
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "price": str(s.price),
-                    "duration_minutes": s.duration_minutes,
-                }
-                for s in services
-            ]
-            return self._redis.set("popular_services", data, ttl=ttl)
+            return await self._set_service_list("popular_services", services, ttl, ["services"])
         except Exception:
             return False
+
+    async def get_or_load_popular_services(
+        self,
+        loader: Callable[[], Awaitable[List[Service]]],
+        ttl: int = 1800,
+    ) -> List[Service]:
+        """Get cached popular services, loading them once across workers on a miss."""
+        return await self._get_or_load_service_list("popular_services", loader, ttl, ["services"])
     
     async def get_category_services(
         self,
@@ -127,10 +155,9 @@ class RedisCacheService(ICacheService):
     ) -> Optional[List[Service]]:
         """Get cached services for a category."""
         try:
-            data = self._redis.get(f"category_services:{category_id}")
-            if data:
-                # Deserialize list of services
-                return None  # Placeholder
+            data = await peek(f"category_services:{category_id}", cache=self._redis)
+            if data is not None:
+                return [Service(**item) for item in data]
             return None
         except Exception:
             return None
@@ -143,35 +170,71 @@ class RedisCacheService(ICacheService):
     ) -> bool:
         """Cache services for a category."""
         try:
-            data = [
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "price": str(s.price),
-                    "duration_minutes": s.duration_minutes,
-                    "is_popular": s.is_popular,
-                }
-                for s in services
-            ]
-            return self._redis.set(f"category_services:{category_id}", data, ttl=ttl)
+            return await self._set_service_list(
+                f"category_services:{category_id}",
+                services,
+                ttl,
+                ["services", f"category:{category_id}"],
+            )
         except Exception:
             return False
 
+    async def get_or_load_category_services(
+        self,
+        category_id: str,
+        loader: Callable[[], Awaitable[List[Service]]],
+        ttl: int = 1800,
+    ) -> List[Service]:
+        """Get cached services for a category, loading them once across workers on a miss."""
+        return await self._get_or_load_service_list(
+            f"category_services:{category_id}",
+            loader,
+            ttl,
+            ["services", f"category:{category_id}"],
+        )
+
+    async def _set_service_list(
+        self,
+        key: str,
+        services: List[Service],
+        ttl: int,
+        tags: List[str],
+    ) -> bool:
+        """Cache a service list and warm each service:{id} entry."""
+        items = [asdict(service) for service in services]
+        stored = await store_many({key: items}, ttl, tags=tags, cache=self._redis)
+        return await self._store_services(items, ttl) and stored
+
+    async def _get_or_load_service_list(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[List[Service]]],
+        ttl: int,
+        tags: List[str],
+    ) -> List[Service]:
+        async def load():
+            items = [asdict(service) for service in await loader()]
+            # Warm the per-service entries alongside the list
+            await self._store_services(items, ttl)
+            return items
+
+        data = await cached(key, load, ttl, lock=True, tags=tags, cache=self._redis)
+        return [Service(**item) for item in data or []]
+
     async def delete_category_services(self, category_id: str) -> bool:
         """Remove category services from cache."""
         try:
-            return self._redis.delete(f"category_services:{category_id}")
+            return await self._redis.delete(f"category_services:{category_id}") > 0
         except Exception:
             return False
     
     async def invalidate_services_cache(self) -> bool:
         """Invalidate all services cache."""
         try:
-            # Delete popular services cache
-            self._redis.delete("popular_services")
-            # Note: Pattern-based deletion (service:*, category_services:*)
-            # would require RedisClient.keys() method which is not implemented yet
-            # For now, cache entries will expire based on TTL
+            # Every service, category and list entry is tagged "services"
+            await self._redis.invalidate_tags("services")
+            # Entries cached before tagging existed
+            await self._redis.delete("popular_services")
             return True
         except Exception:
             return False
@@ -343,6 +406,7 @@ class EmailNotificationService(INotificationService):
     def __init__(self, email_service):
         self._email_service = email_service
     
+    @offload
     async def notify_service_price_change(
         self,
         service: Service,
@@ -385,6 +449,7 @@ class EmailNotificationService(INotificationService):
         except Exception:
             return False
     
+    @offload
     async def notify_new_service_available(
         self,
         service: Service,
@@ -421,6 +486,7 @@ class EmailNotificationService(INotificationService):
         except Exception:
             return False
     
+    @offload
     async def notify_service_discontinued(
         self,
         service: Service,
@@ -468,6 +534,7 @@ class AuditService(IAuditService):
     def __init__(self, audit_logger):
         self._logger = audit_logger
     
+    @offload
     async def log_category_creation(
         self,
         category: Category,
@@ -489,6 +556,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_category_update(
         self,
         category: Category,
@@ -511,6 +579,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_category_deactivation(
         self,
         category: Category,
@@ -534,6 +603,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_service_creation(
         self,
         service: Service,
@@ -556,6 +626,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_service_update(
         self,
         service: Service,
@@ -578,6 +649,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_service_price_change(
         self,
         service: Service,
@@ -603,6 +675,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_service_deactivation(
         self,
         service: Service,
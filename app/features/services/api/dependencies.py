@@ -5,7 +5,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.auth import CurrentUser
-from app.core.db import get_db
+from app.core.db import OutboxPublisher, get_db, get_read_db
 from app.features.services.adapters import (
     SqlCategoryRepository,
     SqlServiceRepository,
@@ -44,16 +44,27 @@ def get_booking_repository(db: AsyncSession = Depends(get_db)) -> SqlBookingRepo
     return SqlBookingRepository(db)
 
 
+def get_read_category_repository(db: AsyncSession = Depends(get_read_db)) -> SqlCategoryRepository:
+    """Get category repository for catalog reads (replica when configured)."""
+    return SqlCategoryRepository(db)
+
+
+def get_read_service_repository(db: AsyncSession = Depends(get_read_db)) -> SqlServiceRepository:
+    """Get service repository for catalog reads (replica when configured)."""
+    return SqlServiceRepository(db)
+
+
 def get_cache_service() -> RedisCacheService:
-    """Get cache service."""
-    from app.core.cache import redis_client
-    return RedisCacheService(redis_client)
+    """Get cache service backed by the two-tier near cache."""
+    from app.core.cache import near_cache
+    return RedisCacheService(near_cache)
 
 
-def get_event_service() -> EventBusService:
-    """Get event service."""
-    # TODO: Implement proper event bus
-    return EventBusService(event_bus=None)
+def get_event_service(
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> EventBusService:
+    """Get event service publishing through the transactional outbox."""
+    return EventBusService(event_bus=OutboxPublisher(session))
 
 
 def get_notification_service() -> EmailNotificationService:
@@ -101,7 +112,7 @@ def get_create_service_use_case(
 
 
 def get_list_categories_use_case(
-    category_repo: Annotated[SqlCategoryRepository, Depends(get_category_repository)],
+    category_repo: Annotated[SqlCategoryRepository, Depends(get_read_category_repository)],
     cache_service: Annotated[RedisCacheService, Depends(get_cache_service)],
 ) -> ListCategoriesUseCase:
     """Get list categories use case."""
@@ -112,8 +123,8 @@ def get_list_categories_use_case(
 
 
 def get_list_services_use_case(
-    service_repo: Annotated[SqlServiceRepository, Depends(get_service_repository)],
-    category_repo: Annotated[SqlCategoryRepository, Depends(get_category_repository)],
+    service_repo: Annotated[SqlServiceRepository, Depends(get_read_service_repository)],
+    category_repo: Annotated[SqlCategoryRepository, Depends(get_read_category_repository)],
     cache_service: Annotated[RedisCacheService, Depends(get_cache_service)],
 ) -> ListServicesUseCase:
     """Get list services use case."""
@@ -185,8 +196,8 @@ def get_deactivate_service_use_case(
 
 
 def get_popular_services_use_case(
-    service_repo: Annotated[SqlServiceRepository, Depends(get_service_repository)],
-    category_repo: Annotated[SqlCategoryRepository, Depends(get_category_repository)],
+    service_repo: Annotated[SqlServiceRepository, Depends(get_read_service_repository)],
+    category_repo: Annotated[SqlCategoryRepository, Depends(get_read_category_repository)],
     cache_service: Annotated[RedisCacheService, Depends(get_cache_service)],
 ) -> GetPopularServicesUseCase:
     """Get popular services use case."""
@@ -198,8 +209,8 @@ def get_popular_services_use_case(
 
 
 def get_search_services_use_case(
-    service_repo: Annotated[SqlServiceRepository, Depends(get_service_repository)],
-    category_repo: Annotated[SqlCategoryRepository, Depends(get_category_repository)],
+    service_repo: Annotated[SqlServiceRepository, Depends(get_read_service_repository)],
+    category_repo: Annotated[SqlCategoryRepository, Depends(get_read_category_repository)],
     cache_service: Annotated[RedisCacheService, Depends(get_cache_service)],
 ) -> SearchServicesUseCase:
     """Get search services use case."""
@@ -1,9 +1,10 @@
 from typing import List, Optional
 from decimal import Decimal
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status, Request
-from fastapi.responses import JSONResponse
 import logging
 
+from app.core.cache import conditional_get, private_max_age
+from app.core.responses import FastJSONResponse
 from app.shared.auth import get_current_user as get_auth_user, require_any_role
 from app.shared.auth.contracts import AuthenticatedUser
 from app.features.auth.api.dependencies import CurrentUser, AdminUser
@@ -105,7 +106,16 @@ async def create_category(
         raise
 
 
-@router.get("/categories", response_model=CategoryListResponseSchema)
+# The catalog changes rarely: clients reuse it briefly, then revalidate by ETag
+CATEGORIES_ETAG = conditional_get("categories", cache_control=private_max_age())
+SERVICES_ETAG = conditional_get("categories", "services", cache_control=private_max_age())
+
+
+@router.get(
+    "/categories",
+    response_model=CategoryListResponseSchema,
+    dependencies=[CurrentUser, Depends(CATEGORIES_ETAG)],
+)
 async def list_categories(
     include_inactive: bool = Query(False, description="Include inactive categories"),
     current_user: AuthenticatedUser = Depends(require_any_role("admin", "manager", "client", "washer")),
@@ -209,7 +219,11 @@ async def create_service(
         )
 
 
-@router.get("/", response_model=ServiceListResponseSchema)
+@router.get(
+    "/",
+    response_model=ServiceListResponseSchema,
+    dependencies=[CurrentUser, Depends(SERVICES_ETAG)],
+)
 async def list_services(
     category_id: Optional[str] = Query(None, description="Filter by category"),
     include_inactive: bool = Query(False, description="Include inactive services"),
@@ -276,7 +290,11 @@ async def list_services(
         )
 
 
-@router.get("/popular", response_model=PopularServicesResponseSchema)
+@router.get(
+    "/popular",
+    response_model=PopularServicesResponseSchema,
+    dependencies=[CurrentUser, Depends(SERVICES_ETAG)],
+)
 async def get_popular_services(
     limit: int = Query(10, ge=1, le=50, description="Number of popular services"),
     current_user: AuthenticatedUser = CurrentUser,
@@ -318,7 +336,11 @@ async def get_popular_services(
         )
 
 
-@router.get("/search", response_model=ServiceListResponseSchema)
+@router.get(
+    "/search",
+    response_model=ServiceListResponseSchema,
+    dependencies=[CurrentUser, Depends(SERVICES_ETAG)],
+)
 async def search_services(
     q: str = Query(..., min_length=2, description="Search query"),
     category_id: Optional[str] = Query(None, description="Filter by category"),
@@ -368,7 +390,11 @@ async def search_services(
         )
 
 
-@router.get("/{service_id}", response_model=ServiceResponseSchema)
+@router.get(
+    "/{service_id}",
+    response_model=ServiceResponseSchema,
+    dependencies=[CurrentUser, Depends(SERVICES_ETAG)],
+)
 async def get_service(
     service_id: str,
     current_user: AuthenticatedUser = CurrentUser,
@@ -506,7 +532,7 @@ async def deactivate_service(
             deactivated_by=current_user.id,
         )
         
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content={"message": "Service deactivated successfully"}
         )
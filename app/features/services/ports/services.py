@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable
 from decimal import Decimal
 
 from app.features.services.domain import Category, Service
@@ -33,6 +33,16 @@ class ICacheService(ABC):
         """Cache service data."""
         pass
     
+    @abstractmethod
+    async def get_or_load_service(
+        self,
+        service_id: str,
+        loader: Callable[[], Awaitable[Optional[Service]]],
+        ttl: int = 3600,
+    ) -> Optional[Service]:
+        """Get cached service, calling loader on a miss."""
+        pass
+    
     @abstractmethod
     async def delete_service(self, service_id: str) -> bool:
         """Remove service from cache."""
@@ -52,6 +62,15 @@ class ICacheService(ABC):
         """Cache popular services."""
         pass
     
+    @abstractmethod
+    async def get_or_load_popular_services(
+        self,
+        loader: Callable[[], Awaitable[List[Service]]],
+        ttl: int = 1800,
+    ) -> List[Service]:
+        """Get cached popular services, calling loader on a miss."""
+        pass
+    
     @abstractmethod
     async def get_category_services(
         self,
@@ -70,6 +89,16 @@ class ICacheService(ABC):
         """Cache services for a category."""
         pass
     
+    @abstractmethod
+    async def get_or_load_category_services(
+        self,
+        category_id: str,
+        loader: Callable[[], Awaitable[List[Service]]],
+        ttl: int = 1800,
+    ) -> List[Service]:
+        """Get cached services for a category, calling loader on a miss."""
+        pass
+    
     @abstractmethod
     async def invalidate_services_cache(self) -> bool:
         """Invalidate all services cache."""
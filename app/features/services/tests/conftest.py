@@ -74,11 +74,14 @@ def mock_cache_service():
     service.delete_category = AsyncMock()
     service.get_service = AsyncMock()
     service.set_service = AsyncMock()
+    service.get_or_load_service = AsyncMock()
     service.delete_service = AsyncMock()
     service.get_popular_services = AsyncMock()
     service.set_popular_services = AsyncMock()
+    service.get_or_load_popular_services = AsyncMock()
     service.get_category_services = AsyncMock()
     service.set_category_services = AsyncMock()
+    service.get_or_load_category_services = AsyncMock()
     service.delete_category_services = AsyncMock()
     service.invalidate_services_cache = AsyncMock()
     return service
@@ -112,9 +112,9 @@ class CreateServiceUseCase:
         saved_service = await self._service_repository.create(service)
         
         # Step 9: Clear cache
-        self._cache_service.delete_category_services(request.category_id)
+        await self._cache_service.delete_category_services(request.category_id)
         if saved_service.is_popular:
-            self._cache_service.set_popular_services(None, ttl=0)  # Invalidate
+            await self._cache_service.set_popular_services(None, ttl=0)  # Invalidate
         
         # Step 10: Publish domain event
         self._event_service.publish_service_created(saved_service)
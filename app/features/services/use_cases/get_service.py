@@ -42,17 +42,14 @@ class GetServiceUseCase:
     async def execute(self, request: GetServiceRequest) -> GetServiceResponse:
         """Execute the get service use case."""
 
-        # Try to get from cache first
-        service = await self._cache_service.get_service(request.service_id)
-
+        # Concurrent misses for the same service share one repository read
+        service = await self._cache_service.get_or_load_service(
+            request.service_id,
+            lambda: self._service_repository.get_by_id(request.service_id),
+            ttl=3600,
+        )
         if not service:
-            # Get from repository if not cached
-            service = await self._service_repository.get_by_id(request.service_id)
-            if not service:
-                raise NotFoundError(f"Service {request.service_id} not found")
-
-            # Cache the service for future requests
-            await self._cache_service.set_service(service, ttl=3600)
+            raise NotFoundError(f"Service {request.service_id} not found")
 
         return GetServiceResponse(
             id=service.id,
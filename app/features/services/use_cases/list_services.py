@@ -75,24 +75,28 @@ class ListServicesUseCase:
         # Step 2: Calculate offset
         offset = (request.page - 1) * request.limit
 
-        # Step 3: Try to get from cache for common queries
+        # Step 3: Serve common queries from cache, loading them once on a miss
         cached_services = None
         if (request.popular_only and not request.category_id and
             not request.search_query and request.page == 1):
-            cached_services = await self._cache_service.get_popular_services()
+            cached_services = await self._cache_service.get_or_load_popular_services(
+                lambda: self._service_repository.list_popular(limit=50)
+            )
         elif (request.category_id and not request.search_query and
-              not request.popular_only and request.page == 1):
-            cached_services = await self._cache_service.get_category_services(
-                request.category_id
+              not request.popular_only and not request.include_inactive and
+              request.page == 1):
+            cached_services = await self._cache_service.get_or_load_category_services(
+                request.category_id,
+                lambda: self._service_repository.list_by_category(
+                    request.category_id, include_inactive=False
+                ),
             )
 
         services = []
 
         if cached_services is not None:
-            # Use cached data
-            services = cached_services
             # Apply pagination to cached results
-            services = services[offset:offset + request.limit]
+            services = cached_services[offset:offset + request.limit]
         else:
             # Step 4: Query services based on filters
             if request.search_query:
@@ -188,19 +192,7 @@ class ListServicesUseCase:
             # There might be more
             total_count = offset + len(service_summaries) + 1
         
-        # Step 9: Cache results if appropriate
-        if request.popular_only and not cached_services and request.page == 1:
-            popular_services = self._service_repository.list_popular()
-            self._cache_service.set_popular_services(popular_services)
-        elif request.category_id and not cached_services and request.page == 1:
-            category_services = self._service_repository.list_by_category(
-                request.category_id, include_inactive=False
-            )
-            self._cache_service.set_category_services(
-                request.category_id, category_services
-            )
-        
-        # Step 10: Prepare response
+        # Step 9: Prepare response
         filters_applied = {
             "category": request.category_id is not None,
             "popular": request.popular_only,
@@ -2,13 +2,16 @@
 
 from datetime import date, datetime
 from typing import List, Optional
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, case, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.db import as_decimal
+
 from app.features.staff.domain import (
     StaffMember,
     StaffDocument,
     Attendance,
+    AttendanceSummary,
     WorkSchedule,
     EmploymentType,
     StaffStatus,
@@ -499,6 +502,43 @@ class AttendanceRepository(IAttendanceRepository):
         models = result.scalars().all()
         return [self._to_domain(model) for model in models]
 
+    async def summarize_attendance(
+        self,
+        start_date: date,
+        end_date: date,
+        staff_id: Optional[str] = None,
+    ) -> List[AttendanceSummary]:
+        """Aggregate attendance per staff member in date range."""
+        conditions = [
+            AttendanceModel.date >= start_date,
+            AttendanceModel.date <= end_date,
+        ]
+        if staff_id:
+            conditions.append(AttendanceModel.staff_id == staff_id)
+
+        present = case(
+            (AttendanceModel.status == AttendanceStatus.PRESENT.value, 1), else_=0
+        )
+        result = await self._session.execute(
+            select(
+                AttendanceModel.staff_id,
+                func.count(),
+                func.sum(present),
+                func.sum(AttendanceModel.hours_worked),
+            )
+            .where(and_(*conditions))
+            .group_by(AttendanceModel.staff_id)
+        )
+        return [
+            AttendanceSummary(
+                staff_id=row[0],
+                days_recorded=row[1],
+                present_days=row[2] or 0,
+                hours_worked=as_decimal(row[3]),
+            )
+            for row in result
+        ]
+
     def _to_domain(self, model: AttendanceModel) -> Attendance:
         """Convert model to domain entity."""
         return Attendance(
@@ -3,7 +3,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.features.staff.adapters import (
     StaffRepository,
     StaffDocumentRepository,
@@ -70,6 +70,20 @@ async def get_work_schedule_repository(
     return WorkScheduleRepository(session)
 
 
+async def get_read_staff_repository(
+    session: AsyncSession = Depends(get_read_db),
+) -> IStaffRepository:
+    """Get staff repository for read-only use cases (replica when configured)."""
+    return StaffRepository(session)
+
+
+async def get_read_attendance_repository(
+    session: AsyncSession = Depends(get_read_db),
+) -> IAttendanceRepository:
+    """Get attendance repository for read-only use cases (replica when configured)."""
+    return AttendanceRepository(session)
+
+
 # ============================================================================
 # Service Dependencies
 # ============================================================================
@@ -1,6 +1,12 @@
 """Staff domain layer - business entities and rules."""
 
-from .entities import StaffMember, StaffDocument, Attendance, WorkSchedule
+from .entities import (
+    StaffMember,
+    StaffDocument,
+    Attendance,
+    AttendanceSummary,
+    WorkSchedule,
+)
 from .enums import (
     EmploymentType,
     StaffStatus,
@@ -19,6 +25,7 @@ __all__ = [
     "StaffMember",
     "StaffDocument",
     "Attendance",
+    "AttendanceSummary",
     "WorkSchedule",
     # Enums
     "EmploymentType",
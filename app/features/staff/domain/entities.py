@@ -321,3 +321,13 @@ class WorkSchedule:
         return (
             self.shift_start < other.shift_end and self.shift_end > other.shift_start
         )
+
+
+@dataclass
+class AttendanceSummary:
+    """Attendance totals for one staff member over a period."""
+
+    staff_id: str
+    days_recorded: int
+    present_days: int
+    hours_worked: Decimal
@@ -8,6 +8,7 @@ from app.features.staff.domain import (
     StaffMember,
     StaffDocument,
     Attendance,
+    AttendanceSummary,
     WorkSchedule,
     StaffStatus,
 )
@@ -176,6 +177,16 @@ class IAttendanceRepository(ABC):
         """Get all currently checked-in staff."""
         pass
 
+    @abstractmethod
+    async def summarize_attendance(
+        self,
+        start_date: date,
+        end_date: date,
+        staff_id: Optional[str] = None,
+    ) -> List[AttendanceSummary]:
+        """Aggregate attendance per staff member in date range."""
+        pass
+
 
 class IWorkScheduleRepository(ABC):
     """Interface for work schedule repository."""
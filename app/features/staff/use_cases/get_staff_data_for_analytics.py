@@ -3,8 +3,9 @@
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
+from app.features.staff.domain import StaffStatus
 from app.features.staff.ports.repositories import (
     IStaffRepository,
     IAttendanceRepository,
@@ -34,6 +35,16 @@ class AttendanceData:
     hours_worked: Decimal
 
 
+@dataclass
+class AttendanceSummaryData:
+    """Attendance totals for a staff member over a period."""
+
+    staff_id: str
+    days_recorded: int
+    present_days: int
+    hours_worked: Decimal
+
+
 @dataclass
 class GetStaffWorkDataRequest:
     """Request for staff work data."""
@@ -52,6 +63,15 @@ class GetAttendanceDataRequest:
     end_date: date
 
 
+@dataclass
+class GetAttendanceSummaryRequest:
+    """Request for attendance totals (all staff when staff_id is None)."""
+
+    start_date: date
+    end_date: date
+    staff_id: Optional[str] = None
+
+
 class GetStaffWorkDataUseCase:
     """Public use case for analytics to get staff work data."""
 
@@ -70,19 +90,11 @@ class GetStaffWorkDataUseCase:
         if not staff:
             raise LookupError(f"Staff member {request.staff_id} not found")
 
-        # Get attendance records
-        all_attendance = await self._attendance_repo.list_all()
-        period_attendance = [
-            a
-            for a in all_attendance
-            if a.staff_member_id == request.staff_id
-            and request.start_date <= a.date <= request.end_date
-        ]
-
-        # Aggregate data
-        total_hours = sum(
-            a.hours_worked for a in period_attendance if a.hours_worked
+        # Aggregate attendance in the database
+        summaries = await self._attendance_repo.summarize_attendance(
+            request.start_date, request.end_date, staff_id=request.staff_id
         )
+        total_hours = summaries[0].hours_worked if summaries else Decimal("0")
 
         # Note: services_completed and revenue_generated would need
         # booking assignments to calculate - simplified here
@@ -107,27 +119,51 @@ class GetAttendanceDataUseCase:
         self, request: GetAttendanceDataRequest
     ) -> List[AttendanceData]:
         """Get attendance records for a staff member."""
-        all_attendance = await self._repository.list_all()
-
-        # Filter by staff and date range
-        period_attendance = [
-            a
-            for a in all_attendance
-            if a.staff_member_id == request.staff_id
-            and request.start_date <= a.date <= request.end_date
-        ]
+        # At most one record per staff member and day
+        period_days = (request.end_date - request.start_date).days + 1
+        period_attendance = await self._repository.list_by_staff(
+            request.staff_id,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            limit=period_days,
+        )
 
         return [
             AttendanceData(
-                staff_id=a.staff_member_id,
+                staff_id=a.staff_id,
                 date=a.date,
-                status=a.status,
+                status=a.status.value,
                 hours_worked=a.hours_worked or Decimal("0"),
             )
             for a in period_attendance
         ]
 
 
+class GetAttendanceSummaryUseCase:
+    """Public use case for analytics to get attendance totals per staff member."""
+
+    def __init__(self, attendance_repository: IAttendanceRepository):
+        self._repository = attendance_repository
+
+    async def execute(
+        self, request: GetAttendanceSummaryRequest
+    ) -> List[AttendanceSummaryData]:
+        """Get attendance totals for the period, one entry per staff member."""
+        summaries = await self._repository.summarize_attendance(
+            request.start_date, request.end_date, staff_id=request.staff_id
+        )
+
+        return [
+            AttendanceSummaryData(
+                staff_id=s.staff_id,
+                days_recorded=s.days_recorded,
+                present_days=s.present_days,
+                hours_worked=s.hours_worked,
+            )
+            for s in summaries
+        ]
+
+
 class GetActiveStaffIdsUseCase:
     """Public use case for analytics to get all active staff IDs."""
 
@@ -136,5 +172,8 @@ class GetActiveStaffIdsUseCase:
 
     async def execute(self) -> List[str]:
         """Get IDs of all active staff members."""
-        all_staff = await self._repository.list_all()
-        return [s.id for s in all_staff if s.status == "active"]
+        active_count = await self._repository.count(status=StaffStatus.ACTIVE)
+        active_staff = await self._repository.list(
+            limit=active_count, status=StaffStatus.ACTIVE
+        )
+        return [s.id for s in active_staff]
@@ -1,7 +1,9 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable
+from dataclasses import asdict
 from datetime import datetime, timezone
-import json
 
+from app.core.background import offload
+from app.core.cache import cached, peek, store
 from app.features.vehicles.domain import Vehicle
 from app.features.vehicles.ports import (
     ICacheService,
@@ -21,37 +23,32 @@ class RedisCacheService(ICacheService):
     async def get_vehicle(self, vehicle_id: str) -> Optional[Vehicle]:
         """Get cached vehicle."""
         try:
-            data = await self._redis.get(f"vehicle:{vehicle_id}")
-            if data:
-                # Deserialize vehicle data back to domain entity
-                # This would require custom serialization logic
-                return None  # Placeholder
-            return None
+            data = await peek(f"vehicle:{vehicle_id}", cache=self._redis)
+            return Vehicle(**data) if data else None
         except Exception:
             return None
     
     async def set_vehicle(self, vehicle: Vehicle, ttl: int = 3600) -> bool:
         """Cache vehicle data."""
         try:
-            # Serialize vehicle to JSON
-            data = json.dumps({
-                "id": vehicle.id,
-                "customer_id": vehicle.customer_id,
-                "make": vehicle.make,
-                "model": vehicle.model,
-                "year": vehicle.year,
-                "color": vehicle.color,
-                "license_plate": vehicle.license_plate,
-                "is_default": vehicle.is_default,
-                "is_deleted": vehicle.is_deleted,
-                "created_at": vehicle.created_at.isoformat(),
-                "updated_at": vehicle.updated_at.isoformat(),
-            })
-            
-            await self._redis.setex(f"vehicle:{vehicle.id}", ttl, data)
-            return True
+            return await store(f"vehicle:{vehicle.id}", asdict(vehicle), ttl, cache=self._redis)
         except Exception:
             return False
+
+    async def get_or_load_vehicle(
+        self,
+        vehicle_id: str,
+        loader: Callable[[], Awaitable[Optional[Vehicle]]],
+        ttl: int = 3600,
+    ) -> Optional[Vehicle]:
+        """Get a cached vehicle, loading it once on a miss however many requests ask."""
+
+        async def load():
+            vehicle = await loader()
+            return asdict(vehicle) if vehicle else None
+
+        data = await cached(f"vehicle:{vehicle_id}", load, ttl, cache=self._redis)
+        return Vehicle(**data) if data else None
     
     async def delete_vehicle(self, vehicle_id: str) -> bool:
         """Remove vehicle from cache."""
@@ -68,11 +65,9 @@ class RedisCacheService(ICacheService):
     ) -> Optional[List[Vehicle]]:
         """Get cached customer vehicles."""
         try:
-            key = f"customer_vehicles:{customer_id}:{'all' if include_deleted else 'active'}"
-            data = await self._redis.get(key)
-            if data:
-                # Deserialize list of vehicles
-                return None  # Placeholder
+            data = await peek(self._customer_key(customer_id, include_deleted), cache=self._redis)
+            if data is not None:
+                return [Vehicle(**item) for item in data]
             return None
         except Exception:
             return None
@@ -86,34 +81,37 @@ class RedisCacheService(ICacheService):
     ) -> bool:
         """Cache customer vehicles."""
         try:
-            key = f"customer_vehicles:{customer_id}:{'all' if include_deleted else 'active'}"
-            # Serialize list of vehicles
-            data = json.dumps([
-                {
-                    "id": v.id,
-                    "make": v.make,
-                    "model": v.model,
-                    "year": v.year,
-                    "color": v.color,
-                    "license_plate": v.license_plate,
-                    "is_default": v.is_default,
-                    "is_deleted": v.is_deleted,
-                    "display_name": v.display_name,
-                }
-                for v in vehicles
-            ])
-            await self._redis.setex(key, ttl, data)
-            return True
+            data = [asdict(v) for v in vehicles]
+            return await store(self._customer_key(customer_id, include_deleted), data, ttl, cache=self._redis)
         except Exception:
             return False
+
+    async def get_or_load_customer_vehicles(
+        self,
+        customer_id: str,
+        loader: Callable[[], Awaitable[List[Vehicle]]],
+        include_deleted: bool = False,
+        ttl: int = 1800,
+    ) -> List[Vehicle]:
+        """Get cached customer vehicles, loading them once on a miss."""
+
+        async def load():
+            return [asdict(v) for v in await loader()]
+
+        data = await cached(self._customer_key(customer_id, include_deleted), load, ttl, cache=self._redis)
+        return [Vehicle(**item) for item in data or []]
+
+    @staticmethod
+    def _customer_key(customer_id: str, include_deleted: bool) -> str:
+        return f"customer_vehicles:{customer_id}:{'all' if include_deleted else 'active'}"
     
     async def invalidate_customer_cache(self, customer_id: str) -> bool:
         """Invalidate all cached data for customer."""
         try:
-            pattern = f"customer_vehicles:{customer_id}:*"
-            keys = await self._redis.keys(pattern)
-            if keys:
-                await self._redis.delete(*keys)
+            await self._redis.delete(
+                f"customer_vehicles:{customer_id}:active",
+                f"customer_vehicles:{customer_id}:all",
+            )
             return True
         except Exception:
             return False
@@ -212,6 +210,7 @@ class EmailNotificationService(INotificationService):
     def __init__(self, email_service):
         self._email_service = email_service
     
+    @offload
     async def send_vehicle_added_notification(
         self,
         customer_email: str,
@@ -246,6 +245,7 @@ class EmailNotificationService(INotificationService):
         except Exception:
             return False
     
+    @offload
     async def send_default_vehicle_changed_notification(
         self,
         customer_email: str,
@@ -280,6 +280,7 @@ class EmailNotificationService(INotificationService):
         except Exception:
             return False
     
+    @offload
     async def send_vehicle_deleted_notification(
         self,
         customer_email: str,
@@ -386,6 +387,7 @@ class AuditService(IAuditService):
     def __init__(self, audit_logger):
         self._logger = audit_logger
     
+    @offload
     async def log_vehicle_creation(
         self,
         vehicle: Vehicle,
@@ -415,6 +417,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_vehicle_update(
         self,
         vehicle: Vehicle,
@@ -439,6 +442,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_vehicle_deletion(
         self,
         vehicle: Vehicle,
@@ -469,6 +473,7 @@ class AuditService(IAuditService):
         except Exception:
             return False
     
+    @offload
     async def log_default_vehicle_change(
         self,
         customer_id: str,
@@ -5,7 +5,6 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.shared.auth import CurrentUser
 from app.core.db import AsyncSession, get_db
 from app.core.dependencies import (
-    get_cache_service,
     get_event_service,
     get_email_service,
     get_audit_service,
@@ -57,11 +56,10 @@ def get_booking_repository(
     return SqlBookingRepository(session)
 
 
-def get_vehicle_cache_service(
-    cache_service=Depends(get_cache_service)
-) -> RedisCacheService:
-    """Get cache service for vehicles."""
-    return RedisCacheService(cache_service)
+def get_vehicle_cache_service() -> RedisCacheService:
+    """Get cache service for vehicles, backed by the near cache."""
+    from app.core.cache import near_cache
+    return RedisCacheService(near_cache)
 
 
 def get_vehicle_event_service(
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable
 
 from app.features.vehicles.domain import Vehicle
 
@@ -17,6 +17,16 @@ class ICacheService(ABC):
         """Cache vehicle data."""
         pass
     
+    @abstractmethod
+    async def get_or_load_vehicle(
+        self,
+        vehicle_id: str,
+        loader: Callable[[], Awaitable[Optional[Vehicle]]],
+        ttl: int = 3600,
+    ) -> Optional[Vehicle]:
+        """Get cached vehicle, calling loader on a miss."""
+        pass
+    
     @abstractmethod
     async def delete_vehicle(self, vehicle_id: str) -> bool:
         """Remove vehicle from cache."""
@@ -42,6 +52,17 @@ class ICacheService(ABC):
         """Cache customer vehicles."""
         pass
     
+    @abstractmethod
+    async def get_or_load_customer_vehicles(
+        self,
+        customer_id: str,
+        loader: Callable[[], Awaitable[List[Vehicle]]],
+        include_deleted: bool = False,
+        ttl: int = 1800,
+    ) -> List[Vehicle]:
+        """Get cached customer vehicles, calling loader on a miss."""
+        pass
+    
     @abstractmethod
     async def invalidate_customer_cache(self, customer_id: str) -> bool:
         """Invalidate all cached data for customer."""
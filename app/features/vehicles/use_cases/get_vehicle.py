@@ -44,28 +44,25 @@ class GetVehicleUseCase:
         self._vehicle_repository = vehicle_repository
         self._cache_service = cache_service
     
-    def execute(self, request: GetVehicleRequest) -> GetVehicleResponse:
+    async def execute(self, request: GetVehicleRequest) -> GetVehicleResponse:
         """Execute the get vehicle use case."""
         
-        # Step 1: Try to get from cache first
-        vehicle = self._cache_service.get_vehicle(request.vehicle_id)
-        
+        # Step 1: Get from cache, loading from the repository once on a miss
+        vehicle = await self._cache_service.get_or_load_vehicle(
+            request.vehicle_id,
+            lambda: self._vehicle_repository.get_by_id(request.vehicle_id),
+            ttl=3600,
+        )
         if not vehicle:
-            # Step 2: Get from repository if not cached
-            vehicle = self._vehicle_repository.get_by_id(request.vehicle_id)
-            if not vehicle:
-                raise NotFoundError(f"Vehicle {request.vehicle_id} not found")
-            
-            # Cache the vehicle for future requests
-            self._cache_service.set_vehicle(vehicle, ttl=3600)
+            raise NotFoundError(f"Vehicle {request.vehicle_id} not found")
         
-        # Step 3: Validate access permissions
+        # Step 2: Validate access permissions
         if not request.is_admin and vehicle.customer_id != request.requested_by:
             raise BusinessRuleViolationError(
                 "You can only view your own vehicles"
             )
         
-        # Step 4: Build response
+        # Step 3: Build response
         response = GetVehicleResponse(
             id=vehicle.id,
             customer_id=vehicle.customer_id,
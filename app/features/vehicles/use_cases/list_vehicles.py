@@ -64,20 +64,21 @@ class ListVehiclesUseCase:
         # Step 2: Calculate offset
         offset = (request.page - 1) * request.limit
         
-        # Step 3: Try to get from cache first (for active vehicles only)
+        # Step 3: Serve the first page of active vehicles from cache
         cached_vehicles = None
         if not request.include_deleted and request.page == 1 and request.limit <= 20:
-            cached_vehicles = await self._cache_service.get_customer_vehicles(
-                request.customer_id, include_deleted=False
+            cached_vehicles = await self._cache_service.get_or_load_customer_vehicles(
+                request.customer_id,
+                lambda: self._vehicle_repository.list_by_customer(
+                    request.customer_id, include_deleted=False
+                ),
             )
         
         if cached_vehicles is not None:
-            # Use cached data
-            vehicles = cached_vehicles
-            total_count = len(vehicles)
+            total_count = len(cached_vehicles)
             
             # Apply pagination to cached results
-            paginated_vehicles = vehicles[offset:offset + request.limit]
+            paginated_vehicles = cached_vehicles[offset:offset + request.limit]
         else:
             # Get from repository
             vehicles = await self._vehicle_repository.list_by_customer(
@@ -93,15 +94,6 @@ class ListVehiclesUseCase:
             )
 
             paginated_vehicles = vehicles
-
-            # Cache active vehicles for future requests
-            if not request.include_deleted and request.page == 1:
-                all_active_vehicles = await self._vehicle_repository.list_by_customer(
-                    request.customer_id, include_deleted=False
-                )
-                await self._cache_service.set_customer_vehicles(
-                    request.customer_id, all_active_vehicles, include_deleted=False
-                )
         
         # Step 4: Convert to summary format
         vehicle_summaries = [
@@ -2,16 +2,21 @@
 
 from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import json
 
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import mark_changed
+from app.core.db import as_date, as_decimal, day_bucket, within_days
+
 from app.features.walkins.domain.entities import (
     WalkInService,
     WalkInServiceItem,
+    DailyWalkInRevenue,
+    DailyWalkInServiceTotals,
 )
 from app.features.walkins.domain.enums import (
     WalkInStatus,
@@ -37,6 +42,7 @@ class WalkInRepository(IWalkInRepository):
         """Create walk-in service."""
         model = self._to_model(walkin)
         self._session.add(model)
+        mark_changed(self._session, "walkins")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -98,6 +104,7 @@ class WalkInRepository(IWalkInRepository):
             )
             self._session.add(item_model)
 
+        mark_changed(self._session, "walkins")
         await self._session.flush()
         await self._session.refresh(model)
         return self._to_domain(model)
@@ -219,6 +226,78 @@ class WalkInRepository(IWalkInRepository):
         models = result.scalars().all()
         return [self._to_domain(model) for model in models]
 
+    def _revenue_conditions(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[WalkInStatus]],
+    ) -> list:
+        conditions = [
+            WalkInServiceModel.deleted_at.is_(None),
+            *within_days(WalkInServiceModel.started_at, start_date, end_date),
+        ]
+        if statuses:
+            conditions.append(
+                WalkInServiceModel.status.in_([status.value for status in statuses])
+            )
+        return conditions
+
+    async def get_daily_revenue(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[WalkInStatus]] = None,
+    ) -> List[DailyWalkInRevenue]:
+        """Sum walk-in revenue per service day, skipping days without walk-ins."""
+        day = day_bucket(WalkInServiceModel.started_at)
+        stmt = (
+            select(day, func.sum(WalkInServiceModel.final_amount), func.count())
+            .where(and_(*self._revenue_conditions(start_date, end_date, statuses)))
+            .group_by(day)
+            .order_by(day)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            DailyWalkInRevenue(day=as_date(row[0]), revenue=as_decimal(row[1]), walkin_count=row[2])
+            for row in result
+        ]
+
+    async def get_daily_service_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[WalkInStatus]] = None,
+    ) -> List[DailyWalkInServiceTotals]:
+        """Walk-ins and item revenue per service day and service."""
+        day = day_bucket(WalkInServiceModel.started_at)
+        stmt = (
+            select(
+                day,
+                WalkInServiceItemModel.service_id,
+                func.max(WalkInServiceItemModel.service_name),
+                func.count(func.distinct(WalkInServiceItemModel.walkin_id)),
+                func.sum(WalkInServiceItemModel.price * WalkInServiceItemModel.quantity),
+            )
+            .join(
+                WalkInServiceModel,
+                WalkInServiceModel.id == WalkInServiceItemModel.walkin_id,
+            )
+            .where(and_(*self._revenue_conditions(start_date, end_date, statuses)))
+            .group_by(day, WalkInServiceItemModel.service_id)
+            .order_by(day)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            DailyWalkInServiceTotals(
+                day=as_date(row[0]),
+                service_id=row[1],
+                service_name=row[2],
+                walkin_count=row[3],
+                revenue=as_decimal(row[4]),
+            )
+            for row in result
+        ]
+
     async def list_by_date(self, service_date: date) -> List[WalkInService]:
         """List walk-ins by date (alias for get_daily_services)."""
         return await self.get_daily_services(service_date)
@@ -288,6 +367,7 @@ class WalkInRepository(IWalkInRepository):
 
         if model:
             model.deleted_at = datetime.now(timezone.utc)
+            mark_changed(self._session, "walkins")
             await self._session.flush()
 
     def _to_domain(self, model: WalkInServiceModel) -> WalkInService:
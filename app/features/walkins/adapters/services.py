@@ -0,0 +1,57 @@
+"""Walk-in service implementations."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict
+
+from app.features.walkins.domain.entities import WalkInService
+from app.features.walkins.ports.services import IWalkInEventService
+
+
+class EventBusService(IWalkInEventService):
+    """Event bus service implementation."""
+
+    def __init__(self, event_bus):
+        self._event_bus = event_bus
+
+    def _event_data(self, event_type: str, walkin: WalkInService) -> Dict[str, Any]:
+        return {
+            "event_type": event_type,
+            "walkin_id": walkin.id,
+            "service_number": walkin.service_number,
+            "started_at": walkin.started_at.isoformat(),
+            "final_amount": walkin.final_amount,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def publish_walkin_completed(self, walkin: WalkInService) -> bool:
+        """Publish walk-in completed event."""
+        try:
+            await self._event_bus.publish(
+                "walkin.completed", self._event_data("walkin_completed", walkin)
+            )
+            return True
+        except Exception:
+            return False
+
+    async def publish_walkin_cancelled(self, walkin: WalkInService) -> bool:
+        """Publish walk-in cancelled event."""
+        try:
+            await self._event_bus.publish(
+                "walkin.cancelled", self._event_data("walkin_cancelled", walkin)
+            )
+            return True
+        except Exception:
+            return False
+
+    async def publish_walkin_payment_recorded(
+        self, walkin: WalkInService, amount: Decimal
+    ) -> bool:
+        """Publish walk-in payment recorded event."""
+        try:
+            event_data = self._event_data("walkin_payment_recorded", walkin)
+            event_data["amount"] = amount
+            await self._event_bus.publish("walkin.payment_recorded", event_data)
+            return True
+        except Exception:
+            return False
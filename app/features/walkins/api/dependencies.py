@@ -5,8 +5,10 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.core.dependencies import get_event_service
 from app.features.walkins.adapters.repositories import WalkInRepository
+from app.features.walkins.adapters.services import EventBusService
 from app.features.walkins.use_cases.create_walkin import CreateWalkInUseCase
 from app.features.walkins.use_cases.add_service import AddServiceUseCase
 from app.features.walkins.use_cases.remove_service import RemoveServiceUseCase
@@ -31,6 +33,20 @@ def get_walkin_repository(
     return WalkInRepository(session)
 
 
+def get_read_walkin_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> WalkInRepository:
+    """Get walk-in repository for read-only use cases (replica when configured)."""
+    return WalkInRepository(session)
+
+
+def get_walkin_event_service(
+    event_service=Depends(get_event_service)
+) -> EventBusService:
+    """Get event service for walk-ins."""
+    return EventBusService(event_service)
+
+
 # ============================================================================
 # Use Case Dependencies
 # ============================================================================
@@ -65,24 +81,27 @@ def get_apply_discount_use_case(
 
 
 def get_complete_walkin_use_case(
-    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)]
+    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)],
+    event_service: Annotated[EventBusService, Depends(get_walkin_event_service)],
 ) -> CompleteWalkInUseCase:
     """Get complete walk-in use case."""
-    return CompleteWalkInUseCase(repository)
+    return CompleteWalkInUseCase(repository, event_service)
 
 
 def get_record_payment_use_case(
-    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)]
+    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)],
+    event_service: Annotated[EventBusService, Depends(get_walkin_event_service)],
 ) -> RecordPaymentUseCase:
     """Get record payment use case."""
-    return RecordPaymentUseCase(repository)
+    return RecordPaymentUseCase(repository, event_service)
 
 
 def get_cancel_walkin_use_case(
-    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)]
+    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)],
+    event_service: Annotated[EventBusService, Depends(get_walkin_event_service)],
 ) -> CancelWalkInUseCase:
     """Get cancel walk-in use case."""
-    return CancelWalkInUseCase(repository)
+    return CancelWalkInUseCase(repository, event_service)
 
 
 def get_get_walkin_use_case(
@@ -93,14 +112,14 @@ def get_get_walkin_use_case(
 
 
 def get_list_walkins_use_case(
-    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)]
+    repository: Annotated[WalkInRepository, Depends(get_read_walkin_repository)]
 ) -> ListWalkInsUseCase:
     """Get list walk-ins use case."""
     return ListWalkInsUseCase(repository)
 
 
 def get_daily_report_use_case(
-    repository: Annotated[WalkInRepository, Depends(get_walkin_repository)]
+    repository: Annotated[WalkInRepository, Depends(get_read_walkin_repository)]
 ) -> GetDailyReportUseCase:
     """Get daily report use case."""
     return GetDailyReportUseCase(repository)
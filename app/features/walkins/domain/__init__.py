@@ -1,6 +1,12 @@
 """Walk-in domain layer - business entities and rules."""
 
-from .entities import WalkInService, WalkInServiceItem, DailyWalkInReport
+from .entities import (
+    WalkInService,
+    WalkInServiceItem,
+    DailyWalkInReport,
+    DailyWalkInRevenue,
+    DailyWalkInServiceTotals,
+)
 from .enums import (
     WalkInStatus,
     PaymentStatus,
@@ -17,6 +23,8 @@ __all__ = [
     "WalkInService",
     "WalkInServiceItem",
     "DailyWalkInReport",
+    "DailyWalkInRevenue",
+    "DailyWalkInServiceTotals",
     # Enums
     "WalkInStatus",
     "PaymentStatus",
@@ -273,3 +273,23 @@ class DailyWalkInReport:
         if self.total_revenue == 0:
             return Decimal("0.00")
         return (self.total_profit / self.total_revenue) * Decimal("100")
+
+
+@dataclass
+class DailyWalkInRevenue:
+    """Walk-in revenue and count for one day."""
+
+    day: date
+    revenue: Decimal
+    walkin_count: int
+
+
+@dataclass
+class DailyWalkInServiceTotals:
+    """Walk-ins and revenue for one service on one day."""
+
+    day: date
+    service_id: str
+    service_name: str
+    walkin_count: int
+    revenue: Decimal
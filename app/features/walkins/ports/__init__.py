@@ -1,7 +1,9 @@
 """Walk-in ports layer - interfaces and abstract base classes."""
 
 from .repositories import IWalkInRepository
+from .services import IWalkInEventService
 
 __all__ = [
     "IWalkInRepository",
+    "IWalkInEventService",
 ]
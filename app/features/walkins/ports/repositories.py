@@ -2,10 +2,12 @@
 
 from abc import ABC, abstractmethod
 from datetime import date, datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from app.features.walkins.domain import (
     WalkInService,
+    DailyWalkInRevenue,
+    DailyWalkInServiceTotals,
     WalkInStatus,
     PaymentStatus,
 )
@@ -69,6 +71,26 @@ class IWalkInRepository(ABC):
         """Get all services for a specific date."""
         pass
 
+    @abstractmethod
+    async def get_daily_revenue(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[WalkInStatus]] = None,
+    ) -> List[DailyWalkInRevenue]:
+        """Sum walk-in revenue per service day, skipping days without walk-ins."""
+        pass
+
+    @abstractmethod
+    async def get_daily_service_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        statuses: Optional[Sequence[WalkInStatus]] = None,
+    ) -> List[DailyWalkInServiceTotals]:
+        """Walk-ins and item revenue per service day and service."""
+        pass
+
     @abstractmethod
     async def get_next_service_number(self, date_prefix: str) -> str:
         """Get next service number for the day."""
@@ -0,0 +1,27 @@
+"""Walk-in service interfaces."""
+
+from abc import ABC, abstractmethod
+from decimal import Decimal
+
+from app.features.walkins.domain import WalkInService
+
+
+class IWalkInEventService(ABC):
+    """Event service interface for walk-in domain events."""
+
+    @abstractmethod
+    async def publish_walkin_completed(self, walkin: WalkInService) -> bool:
+        """Publish walk-in completed event."""
+        pass
+
+    @abstractmethod
+    async def publish_walkin_cancelled(self, walkin: WalkInService) -> bool:
+        """Publish walk-in cancelled event."""
+        pass
+
+    @abstractmethod
+    async def publish_walkin_payment_recorded(
+        self, walkin: WalkInService, amount: Decimal
+    ) -> bool:
+        """Publish walk-in payment recorded event."""
+        pass
@@ -6,14 +6,18 @@ from typing import Optional
 from app.features.walkins.domain.entities import WalkInService
 from app.features.walkins.domain.enums import WalkInStatus, PaymentStatus
 from app.features.walkins.ports.repositories import IWalkInRepository
+from app.features.walkins.ports.services import IWalkInEventService
 
 
 class CancelWalkInUseCase:
     """Use case for cancelling walk-in service."""
 
-    def __init__(self, repository: IWalkInRepository):
-        """Initialize use case with repository."""
+    def __init__(
+        self, repository: IWalkInRepository, event_service: IWalkInEventService
+    ):
+        """Initialize use case with repository and event service."""
         self._repository = repository
+        self._event_service = event_service
 
     async def execute(
         self, walkin_id: str, cancelled_by_id: str, reason: Optional[str] = None
@@ -62,4 +66,7 @@ class CancelWalkInUseCase:
         # Update in repository
         updated = await self._repository.update(walkin)
 
+        # Publish domain event
+        await self._event_service.publish_walkin_cancelled(updated)
+
         return updated
@@ -5,14 +5,18 @@ from datetime import datetime, timezone
 from app.features.walkins.domain.entities import WalkInService
 from app.features.walkins.domain.enums import WalkInStatus, PaymentStatus
 from app.features.walkins.ports.repositories import IWalkInRepository
+from app.features.walkins.ports.services import IWalkInEventService
 
 
 class CompleteWalkInUseCase:
     """Use case for completing walk-in service."""
 
-    def __init__(self, repository: IWalkInRepository):
-        """Initialize use case with repository."""
+    def __init__(
+        self, repository: IWalkInRepository, event_service: IWalkInEventService
+    ):
+        """Initialize use case with repository and event service."""
         self._repository = repository
+        self._event_service = event_service
 
     async def execute(self, walkin_id: str, completed_by_id: str) -> WalkInService:
         """
@@ -56,4 +60,7 @@ class CompleteWalkInUseCase:
         # Update in repository
         updated = await self._repository.update(walkin)
 
+        # Publish domain event
+        await self._event_service.publish_walkin_completed(updated)
+
         return updated
@@ -5,17 +5,20 @@ from datetime import date
 from decimal import Decimal
 from typing import List
 
+from app.features.walkins.domain import WalkInStatus
 from app.features.walkins.ports.repositories import IWalkInRepository
 
+# Walk-ins that count towards revenue
+REVENUE_STATUSES = (WalkInStatus.IN_PROGRESS, WalkInStatus.COMPLETED)
+
 
 @dataclass
-class WalkInRevenueData:
-    """Revenue data for a walk-in service."""
+class DailyWalkInRevenueData:
+    """Walk-in revenue for one day."""
 
-    walkin_id: str
     service_date: date
-    final_amount: Decimal
-    status: str
+    total_amount: Decimal
+    walkin_count: int
 
 
 @dataclass
@@ -34,26 +37,55 @@ class GetWalkInRevenueDataUseCase:
 
     async def execute(
         self, request: GetWalkInRevenueDataRequest
-    ) -> List[WalkInRevenueData]:
-        """Get revenue data for walk-ins in period."""
-        walkins = await self._repository.list_all()
-
-        # Filter by date range and status
-        revenue_data = []
-        for walkin in walkins:
-            service_date = walkin.created_at.date()
-            if (
-                service_date >= request.start_date
-                and service_date <= request.end_date
-                and walkin.status in ["in_progress", "completed"]
-            ):
-                revenue_data.append(
-                    WalkInRevenueData(
-                        walkin_id=walkin.id,
-                        service_date=service_date,
-                        final_amount=walkin.final_amount,
-                        status=walkin.status,
-                    )
-                )
-
-        return revenue_data
+    ) -> List[DailyWalkInRevenueData]:
+        """Get daily revenue for in-progress/completed walk-ins in period."""
+        # Aggregated in SQL: one row per day with walk-ins
+        days = await self._repository.get_daily_revenue(
+            request.start_date, request.end_date, REVENUE_STATUSES
+        )
+
+        return [
+            DailyWalkInRevenueData(
+                service_date=day.day,
+                total_amount=day.revenue,
+                walkin_count=day.walkin_count,
+            )
+            for day in days
+        ]
+
+
+@dataclass
+class DailyWalkInServiceData:
+    """Walk-in revenue for one service on one day."""
+
+    service_date: date
+    service_id: str
+    service_name: str
+    walkin_count: int
+    total_amount: Decimal
+
+
+class GetWalkInDailyServiceDataUseCase:
+    """Public use case for analytics to get walk-in revenue per day and service."""
+
+    def __init__(self, walkin_repository: IWalkInRepository):
+        self._repository = walkin_repository
+
+    async def execute(
+        self, request: GetWalkInRevenueDataRequest
+    ) -> List[DailyWalkInServiceData]:
+        """Get item revenue per day and service for in-progress/completed walk-ins."""
+        totals = await self._repository.get_daily_service_totals(
+            request.start_date, request.end_date, REVENUE_STATUSES
+        )
+
+        return [
+            DailyWalkInServiceData(
+                service_date=service.day,
+                service_id=service.service_id,
+                service_name=service.service_name,
+                walkin_count=service.walkin_count,
+                total_amount=service.revenue,
+            )
+            for service in totals
+        ]
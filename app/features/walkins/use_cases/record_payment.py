@@ -9,6 +9,7 @@ from app.features.walkins.domain.entities import WalkInService
 from app.features.walkins.domain.enums import WalkInStatus, PaymentMethod
 from app.features.walkins.domain.policies import WalkInPaymentPolicy
 from app.features.walkins.ports.repositories import IWalkInRepository
+from app.features.walkins.ports.services import IWalkInEventService
 
 
 @dataclass
@@ -25,9 +26,12 @@ class RecordPaymentRequest:
 class RecordPaymentUseCase:
     """Use case for recording payment for walk-in."""
 
-    def __init__(self, repository: IWalkInRepository):
-        """Initialize use case with repository."""
+    def __init__(
+        self, repository: IWalkInRepository, event_service: IWalkInEventService
+    ):
+        """Initialize use case with repository and event service."""
         self._repository = repository
+        self._event_service = event_service
 
     async def execute(self, request: RecordPaymentRequest) -> WalkInService:
         """
@@ -80,6 +84,9 @@ class RecordPaymentUseCase:
         # Update in repository
         updated = await self._repository.update(walkin)
 
+        # Publish domain event
+        await self._event_service.publish_walkin_payment_recorded(updated, request.amount)
+
         return updated
 
     def _validate_request(self, request: RecordPaymentRequest) -> None:
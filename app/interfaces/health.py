@@ -28,6 +28,15 @@ async def health_check() -> Dict[str, Any]:
         }
 
 
+@router.get("/live")
+async def liveness_check() -> Dict[str, Any]:
+    """
+    Liveness check endpoint.
+    Returns as long as the event loop is serving requests; performs no I/O.
+    """
+    return health_checker.get_liveness_status()
+
+
 @router.get("/ready")
 async def readiness_check() -> Dict[str, Any]:
     """
@@ -2,16 +2,23 @@
 HTTP API Interface - FastAPI application factory
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config.settings import settings
-from app.core.middleware.request_id import RequestIdMiddleware
-from app.core.middleware.logging import LoggingMiddleware
-from app.core.middleware.security_headers import SecurityHeadersMiddleware
-from app.core.middleware.rate_limit import RateLimitMiddleware
+from app.core.cache.async_redis_client import async_redis_client
+from app.core.cache.near_cache import near_cache
+from app.core.db.session import replica_router
+from app.core.db.outbox import outbox_dispatcher
+from app.core.background import background_executor
+from app.core.mail import mailer
+from app.core.middleware import register_middlewares
 from app.core.errors.handlers import register_error_handlers
 from app.interfaces.health import router as health_router
+from app.interfaces.metrics import router as metrics_router
+from app.core.observability.metrics import metrics_collector
+from app.core.observability.health import health_checker
 from app.interfaces.openapi import configure_openapi
 from app.shared.auth import register_auth_adapter
 
@@ -106,11 +113,13 @@ except ImportError as e:
 
 try:
     from app.features.analytics.api.router import router as analytics_router
+    from app.features.analytics.api.events import rollup_day_closer
     print("Successfully loaded analytics router")
 except ImportError as e:
     print(f"Failed to load analytics router: {e}")
     from fastapi import APIRouter
     analytics_router = APIRouter()
+    rollup_day_closer = None
 
 
 def _setup_auth_adapter():
@@ -123,11 +132,47 @@ def _setup_auth_adapter():
     pass
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: set up and tear down shared infrastructure."""
+    # Shared async Redis connection pool for all request-path cache access
+    await async_redis_client.initialize()
+    # Cross-worker invalidation feed for the in-process near cache
+    await near_cache.start()
+    # Event-loop lag and connection pool gauges
+    await metrics_collector.start()
+    # Cached CPU / memory / disk snapshot for /health
+    await health_checker.start()
+    # Workers for offloaded notifications and audit logging
+    await background_executor.start()
+    # Deliver domain events from the transactional outbox
+    if settings.outbox_dispatcher_enabled:
+        await outbox_dispatcher.start()
+    # Roll up each day's revenue once it closes
+    if rollup_day_closer:
+        await rollup_day_closer.start()
+    try:
+        yield
+    finally:
+        # Drain side effects while Redis and the database are still up
+        await background_executor.stop()
+        await outbox_dispatcher.stop()
+        if rollup_day_closer:
+            await rollup_day_closer.stop()
+        await mailer.close()
+        await health_checker.stop()
+        await metrics_collector.stop()
+        await near_cache.stop()
+        await async_redis_client.close()
+        await replica_router.dispose()
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
 
     app = FastAPI(
         title=settings.app_name,
+        lifespan=lifespan,
         version=settings.app_version,
         description="Car Wash Management System API",
         docs_url="/docs" if not settings.is_production else None,
@@ -138,29 +183,19 @@ def create_app() -> FastAPI:
     # Register authentication adapter for shared dependencies
     _setup_auth_adapter()
 
-    # Configure CORS
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.cors_origins,
-        allow_credentials=settings.cors_allow_credentials,
-        allow_methods=settings.cors_allow_methods,
-        allow_headers=settings.cors_allow_headers,
-    )
-    
-    # Add custom middleware
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(RequestIdMiddleware)
-    app.add_middleware(LoggingMiddleware)
-    
-    if settings.rate_limit_enabled:
-        app.add_middleware(RateLimitMiddleware)
-    
+    # Compression, CORS and the request pipeline, innermost first
+    register_middlewares(app)
+
     # Setup error handlers
     register_error_handlers(app)
     
     # Include routers
     # Health endpoints (no versioning, no prefix)
     app.include_router(health_router, tags=["Health"])
+
+    # Prometheus metrics (no versioning, no prefix)
+    if settings.metrics_enabled:
+        app.include_router(metrics_router, tags=["Metrics"])
     
     # API v1 endpoints
     API_V1_PREFIX = "/api/v1"
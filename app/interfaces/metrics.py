@@ -0,0 +1,20 @@
+"""
+Prometheus metrics endpoint.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.observability.metrics import metrics_collector
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Metrics endpoint.
+    Returns all metrics in Prometheus text format, aggregated across workers.
+    """
+    body, content_type = metrics_collector.render()
+    return Response(content=body, media_type=content_type)
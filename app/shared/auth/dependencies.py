@@ -5,8 +5,10 @@ These are the ONLY dependencies that should be imported across features for auth
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated, Callable
 
+from app.core.db import get_db
 from .contracts import AuthenticatedUser
 
 # Use auto_error=False to handle missing credentials manually with 401
@@ -28,11 +30,15 @@ def register_auth_adapter(adapter):
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
 ) -> AuthenticatedUser:
     """
     Get current authenticated user from JWT token.
     This is the main dependency for authentication across features.
+
+    Uses the request-scoped session, so the user lookup and the endpoint's
+    own dependencies share a single pool connection.
     """
     # Check if credentials are provided
     if credentials is None:
@@ -43,29 +49,26 @@ async def get_current_user(
         )
 
     # Import here to avoid circular dependencies
-    from app.core.db import AsyncSessionLocal
     from app.features.auth.api.dependencies import create_auth_adapter
 
-    # Get database session properly using async context manager
-    async with AsyncSessionLocal() as db:
-        auth_adapter = create_auth_adapter(db)
-
-        try:
-            user = await auth_adapter.authenticate_from_credentials(credentials)
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired token"
-                )
-            return user
-        except HTTPException:
-            # Re-raise HTTP exceptions from adapter
-            raise
-        except Exception as e:
+    auth_adapter = create_auth_adapter(db)
+
+    try:
+        user = await auth_adapter.authenticate_from_credentials(credentials)
+        if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=str(e)
+                detail="Invalid or expired token"
             )
+        return user
+    except HTTPException:
+        # Re-raise HTTP exceptions from adapter
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e)
+        )
 
 
 async def get_current_user_id(
@@ -6,10 +6,13 @@ Car Wash Management System
 import uvicorn
 from app.interfaces.http_api import create_app
 from app.core.config.settings import settings
+from app.core.observability.metrics import reset_multiprocess_dir
 
 app = create_app()
 
 if __name__ == "__main__":
+    # Drop metric files from previous runs before workers start writing
+    reset_multiprocess_dir()
     uvicorn.run(
         "main:app",
         host=settings.host,
@@ -67,6 +67,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from app.features.analytics.adapters.models import *
+except ImportError:
+    pass
+
 # Import the base metadata
 try:
     from app.core.db import Base
@@ -0,0 +1,47 @@
+"""outbox events
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the transactional outbox table."""
+    # 001 creates every registered model, so fresh databases already have it
+    if sa.inspect(op.get_bind()).has_table('outbox_events'):
+        return
+
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('event_name', sa.String(length=100), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('available_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+    )
+    op.create_index(
+        'ix_outbox_events_status_available_at',
+        'outbox_events',
+        ['status', 'available_at'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the transactional outbox table."""
+    op.drop_index('ix_outbox_events_status_available_at', table_name='outbox_events')
+    op.drop_table('outbox_events')
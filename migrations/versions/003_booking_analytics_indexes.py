@@ -0,0 +1,40 @@
+"""booking analytics indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_bookings_scheduled_at_status', 'bookings', ['scheduled_at', 'status']),
+    ('ix_bookings_customer_id', 'bookings', ['customer_id']),
+    ('ix_booking_services_booking_id', 'booking_services', ['booking_id']),
+]
+
+
+def upgrade() -> None:
+    """Index the columns analytics aggregates filter and join on."""
+    inspector = sa.inspect(op.get_bind())
+
+    for name, table, columns in INDEXES:
+        # 001 creates every registered model, so fresh databases already have them
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop the analytics indexes."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
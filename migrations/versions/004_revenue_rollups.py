@@ -0,0 +1,50 @@
+"""revenue rollups
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the daily revenue and service rollup tables."""
+    inspector = sa.inspect(op.get_bind())
+
+    # 001 creates every registered model, so fresh databases already have them
+    if not inspector.has_table('daily_revenue_rollup'):
+        op.create_table(
+            'daily_revenue_rollup',
+            sa.Column('day', sa.Date(), primary_key=True),
+            sa.Column('source', sa.String(length=20), primary_key=True),
+            sa.Column('revenue', sa.Numeric(12, 2), nullable=False),
+            sa.Column('transaction_count', sa.Integer(), nullable=False),
+            sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+        )
+
+    if not inspector.has_table('daily_service_rollup'):
+        op.create_table(
+            'daily_service_rollup',
+            sa.Column('day', sa.Date(), primary_key=True),
+            sa.Column('source', sa.String(length=20), primary_key=True),
+            sa.Column('service_id', sa.String(), primary_key=True),
+            sa.Column('service_name', sa.String(length=200), nullable=False),
+            sa.Column('revenue', sa.Numeric(12, 2), nullable=False),
+            sa.Column('transaction_count', sa.Integer(), nullable=False),
+            sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Drop the rollup tables."""
+    op.drop_table('daily_service_rollup')
+    op.drop_table('daily_revenue_rollup')
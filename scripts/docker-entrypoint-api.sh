@@ -108,6 +108,12 @@ echo "  - Host: ${HOST:-0.0.0.0}"
 echo "  - Port: ${PORT:-8000}"
 echo "  - Workers: ${WORKERS:-4}"
 echo ""
+# Reset Prometheus multi-process metric files left by a previous run
+if [ "${WORKERS:-1}" -gt 1 ]; then
+    rm -rf "${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}"
+    mkdir -p "${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}"
+fi
+
 echo "→ Starting Uvicorn server..."
 echo ""
 
@@ -0,0 +1,852 @@
+#!/usr/bin/env python3
+"""
+Generate a large synthetic dataset for performance work.
+
+Bulk-loads customers, vehicles, the service catalog, bookings with their
+booking_services, walk-ins with their items, staff with daily attendance,
+stock movements and expenses. Volumes grow linearly with --scale:
+
+    scale 1:  ~2k customers, ~47k bookings, ~30k walk-ins, ~38k stock
+              movements and ~7k attendance records for a year of history
+    scale 10: ~470k bookings, ~300k walk-ins, ~380k stock movements
+
+The output is deterministic for a given --seed, --scale, --days and
+--end-date, so benchmarks and query plans can be compared across runs and
+machines. Rows are written with COPY on PostgreSQL (asyncpg) and with
+batched executemany on other databases. Run it against an empty database.
+
+Usage:
+    python scripts/generate_perf_data.py --scale 1
+    python scripts/generate_perf_data.py --scale 10 --days 1095 --end-date 2025-12-31
+    DATABASE_URL=sqlite+aiosqlite:///./perf.db python scripts/generate_perf_data.py --scale 0.1 --create-tables
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import JSON, DateTime, Table, select
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.config.settings import settings
+from app.core.db.base import Base
+from app.features.analytics.adapters import models as analytics_models  # noqa: F401 (rollup tables)
+from app.features.auth.adapters.models import UserModel
+from app.features.bookings.adapters.models import Booking, BookingService
+from app.features.expenses.adapters.models import ExpenseModel
+from app.features.expenses.domain.policies import ExpenseManagementPolicy
+from app.features.facilities.adapters import models as facilities_models  # noqa: F401 (FK targets)
+from app.features.inventory.adapters.models import ProductModel, StockMovementModel
+from app.features.inventory.domain.policies import InventoryManagementPolicy
+from app.features.scheduling.adapters import models as scheduling_models  # noqa: F401 (FK targets)
+from app.features.services.adapters.models import Category, Service
+from app.features.staff.adapters.models import AttendanceModel, StaffMemberModel
+from app.features.staff.domain.policies import StaffManagementPolicy
+from app.features.vehicles.adapters.models import Vehicle
+from app.features.walkins.adapters.models import WalkInServiceItemModel, WalkInServiceModel
+
+Row = Dict[str, Any]
+
+EMAIL_DOMAIN = "perf.blingauto.test"
+PASSWORD = "PerfPass123!"
+
+# Volumes at --scale 1; the catalog and history length do not scale
+BASE_VOLUMES = {
+    "customers": 2_000,
+    "staff": 25,
+    "products": 60,
+    "bookings_per_day": 120,
+    "walkins_per_day": 80,
+    "movements_per_day": 100,
+    "expenses_per_day": 10,
+}
+
+# Days of bookings created ahead of --end-date (pending and confirmed)
+BOOKING_HORIZON_DAYS = 14
+
+CATALOG = {
+    "Exterior Wash": [
+        ("Basic Wash", "15.00", 20),
+        ("Premium Wash", "25.00", 35),
+        ("Underbody Wash", "12.00", 15),
+        ("Wheel & Tire Clean", "10.00", 15),
+        ("Hand Wash", "30.00", 45),
+        ("Waterless Wash", "20.00", 30),
+    ],
+    "Interior Cleaning": [
+        ("Vacuum", "10.00", 15),
+        ("Interior Wipe Down", "15.00", 20),
+        ("Seat Shampoo", "45.00", 60),
+        ("Leather Conditioning", "40.00", 45),
+        ("Odor Removal", "35.00", 40),
+    ],
+    "Detailing": [
+        ("Full Detail", "150.00", 180),
+        ("Clay Bar Treatment", "60.00", 60),
+        ("Paint Correction", "200.00", 240),
+        ("Headlight Restoration", "50.00", 45),
+        ("Engine Bay Detail", "55.00", 50),
+    ],
+    "Protection": [
+        ("Spray Wax", "18.00", 15),
+        ("Hand Wax", "60.00", 60),
+        ("Ceramic Coating", "350.00", 300),
+        ("Sealant", "80.00", 75),
+        ("Glass Treatment", "25.00", 20),
+    ],
+    "Express": [
+        ("Express Exterior", "9.00", 10),
+        ("Express Interior", "9.00", 10),
+        ("Express Combo", "16.00", 20),
+    ],
+}
+
+MAKES = {
+    "Toyota": ["Corolla", "Camry", "RAV4", "Yaris", "Hilux"],
+    "Renault": ["Clio", "Megane", "Captur", "Kangoo"],
+    "Dacia": ["Logan", "Sandero", "Duster"],
+    "Peugeot": ["208", "308", "3008", "Partner"],
+    "Volkswagen": ["Golf", "Polo", "Tiguan", "Passat"],
+    "Hyundai": ["i10", "i20", "Tucson", "Accent"],
+    "Mercedes-Benz": ["C-Class", "E-Class", "GLC"],
+    "BMW": ["3 Series", "5 Series", "X3"],
+}
+COLORS = ["White", "Black", "Silver", "Grey", "Blue", "Red", "Beige", "Green"]
+FIRST_NAMES = [
+    "Adam", "Amine", "Sara", "Yasmine", "Omar", "Lina", "Mehdi", "Nora", "Karim", "Salma",
+    "Youssef", "Imane", "Hamza", "Leila", "Anas", "Hiba", "Rayan", "Meriem", "Ilyas", "Aya",
+]
+LAST_NAMES = [
+    "Alaoui", "Benali", "Chraibi", "Idrissi", "Tazi", "Fassi", "Berrada", "Naciri", "Bennani",
+    "Lahlou", "Amrani", "Ziani", "Haddad", "Saidi", "Kettani", "Sebti",
+]
+PRODUCTS = [
+    ("Car Shampoo", "CLEANING_CHEMICAL", "LITER", "6.50"),
+    ("Wheel Cleaner", "CLEANING_CHEMICAL", "LITER", "9.00"),
+    ("Carnauba Wax", "CLEANING_CHEMICAL", "KILOGRAM", "28.00"),
+    ("Glass Cleaner", "CLEANING_CHEMICAL", "LITER", "4.50"),
+    ("Microfiber Towel", "EQUIPMENT", "PIECE", "2.20"),
+    ("Wash Mitt", "EQUIPMENT", "PIECE", "5.00"),
+    ("Nitrile Gloves", "PROTECTIVE", "BOX", "7.50"),
+    ("Air Freshener", "ACCESSORY", "PIECE", "1.20"),
+    ("Tire Shine", "ACCESSORY", "BOTTLE", "6.00"),
+    ("Trash Bags", "CONSUMABLE", "PACK", "3.00"),
+]
+ATTENDANCE_STATUSES = [
+    ("present", 86), ("late", 6), ("absent", 2), ("half_day", 2),
+    ("on_leave", 2), ("sick_leave", 2),
+]
+RECURRING_EXPENSES = [
+    # (category, day of month, amount, description)
+    ("RENT", 1, "4500.00", "Facility rent"),
+    ("INSURANCE", 1, "600.00", "Business insurance"),
+    ("UTILITIES", 5, "900.00", "Water and electricity"),
+    ("SALARIES", 28, "38000.00", "Staff payroll"),
+]
+ADHOC_EXPENSES = [
+    ("SUPPLIES", 40, "20.00", "400.00", "Cleaning supplies"),
+    ("MAINTENANCE", 15, "50.00", "1500.00", "Equipment repair"),
+    ("FUEL", 20, "30.00", "150.00", "Mobile team fuel"),
+    ("MARKETING", 8, "100.00", "2000.00", "Advertising"),
+    ("EQUIPMENT", 5, "200.00", "5000.00", "Equipment purchase"),
+    ("OTHER", 12, "10.00", "300.00", "Miscellaneous"),
+]
+EXPENSE_PAYMENT_METHODS = ["CASH", "BANK_TRANSFER", "CHECK", "CREDIT_CARD", "DEBIT_CARD"]
+
+
+class SyntheticDataset:
+    """
+    Deterministic row generators for every table in the dataset.
+
+    Each method draws from one seeded Random in a fixed order and remembers
+    the ids later tables refer to, so the tables must be generated in the
+    order load() writes them.
+    """
+
+    def __init__(self, scale: float = 1.0, seed: int = 42, days: int = 365, end_date: Optional[date] = None):
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        self.scale = scale
+        self.days = days
+        self.end_date = end_date or date.today()
+        self.start_date = self.end_date - timedelta(days=days - 1)
+        self.rng = random.Random(seed)
+
+        self.customers: List[str] = []
+        self.vehicles: List[List[Tuple[str, str, str, str]]] = []
+        self.services: List[Row] = []
+        self.service_weights: List[float] = []
+        self.staff_users: List[str] = []
+        self.staff_ids: List[Tuple[str, date]] = []
+        self.manager_id = ""
+        self.password_hash = ""
+
+    def volume(self, name: str) -> int:
+        return max(1, round(BASE_VOLUMES[name] * self.scale))
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _phone(self) -> str:
+        return f"+2126{self.rng.randrange(10 ** 8):08d}"
+
+    def _name(self) -> Tuple[str, str]:
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def _moment(self, day: date, first_hour: int = 8, last_hour: int = 18) -> datetime:
+        """A time on day during opening hours, rounded to 5 minutes."""
+        minutes = self.rng.randrange(first_hour * 60, last_hour * 60, 5)
+        return datetime.combine(day, datetime.min.time()) + timedelta(minutes=minutes)
+
+    def _daily_count(self, base: int, day: date) -> int:
+        """Busier weekends, with some day-to-day noise."""
+        weekday_factor = 1.4 if day.weekday() >= 5 else 0.9
+        return max(0, round(self.rng.gauss(base * weekday_factor, base * 0.15)))
+
+    def _history(self, extra_days: int = 0) -> Iterator[date]:
+        for offset in range(self.days + extra_days):
+            yield self.start_date + timedelta(days=offset)
+
+    def _pick_services(self, count: int) -> List[Row]:
+        chosen: Dict[str, Row] = {}
+        while len(chosen) < count:
+            service = self.rng.choices(self.services, weights=self.service_weights)[0]
+            chosen[service["id"]] = service
+        return list(chosen.values())
+
+    def _pick_customer(self) -> int:
+        # Squaring skews visits toward a core of regular customers
+        return int(len(self.customers) * self.rng.random() ** 2)
+
+    def users(self) -> Iterator[Row]:
+        now = datetime.combine(self.start_date, datetime.min.time()) - timedelta(days=30)
+
+        def user(email: str, role: str, created_at: datetime) -> Row:
+            first_name, last_name = self._name()
+            return {
+                "id": self._uuid(),
+                "email": email,
+                "first_name": first_name,
+                "last_name": last_name,
+                "password_hash": self.password_hash,
+                "role": role,
+                "is_active": True,
+                "phone_number": self._phone(),
+                "is_email_verified": True,
+                "email_verified_at": created_at,
+                "failed_login_attempts": 0,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+        manager = user(f"manager@{EMAIL_DOMAIN}", "manager", now)
+        self.manager_id = manager["id"]
+        yield manager
+
+        for index in range(self.volume("staff")):
+            row = user(f"washer.{index:04d}@{EMAIL_DOMAIN}", "washer", now)
+            self.staff_users.append(row["id"])
+            yield row
+
+        for index in range(self.volume("customers")):
+            signed_up = now + timedelta(days=self.rng.randrange(self.days + 30), minutes=self.rng.randrange(1440))
+            row = user(f"client.{index:06d}@{EMAIL_DOMAIN}", "client", signed_up)
+            self.customers.append(row["id"])
+            yield row
+
+    def vehicles_rows(self) -> Iterator[Row]:
+        for customer_id in self.customers:
+            owned = []
+            for position in range(self.rng.choices((1, 2, 3), weights=(70, 25, 5))[0]):
+                make = self.rng.choice(list(MAKES))
+                vehicle = {
+                    "id": self._uuid(),
+                    "customer_id": customer_id,
+                    "make": make,
+                    "model": self.rng.choice(MAKES[make]),
+                    "year": self.rng.randint(2005, self.end_date.year),
+                    "color": self.rng.choice(COLORS),
+                    "license_plate": f"{self.rng.randrange(1, 99999):05d}-{self.rng.choice('ABDHW')}-{self.rng.randint(1, 89)}",
+                    "is_default": position == 0,
+                    "is_deleted": False,
+                    "deleted_at": None,
+                    "created_at": datetime.combine(self.start_date, datetime.min.time()),
+                    "updated_at": datetime.combine(self.start_date, datetime.min.time()),
+                }
+                owned.append((vehicle["id"], vehicle["make"], vehicle["model"], vehicle["color"]))
+                yield vehicle
+            self.vehicles.append(owned)
+
+    def categories_and_services(self) -> Tuple[List[Row], List[Row]]:
+        created = datetime.combine(self.start_date, datetime.min.time()) - timedelta(days=60)
+        categories, services = [], []
+        for category_order, (category_name, items) in enumerate(CATALOG.items()):
+            category_id = self._uuid()
+            categories.append({
+                "id": category_id,
+                "name": category_name,
+                "description": f"{category_name} services",
+                "status": "ACTIVE",
+                "display_order": category_order,
+                "created_at": created,
+                "updated_at": created,
+            })
+            for order, (name, price, duration) in enumerate(items):
+                services.append({
+                    "id": self._uuid(),
+                    "category_id": category_id,
+                    "name": name,
+                    "description": f"{name} ({duration} min)",
+                    "price": Decimal(price),
+                    "duration_minutes": duration,
+                    "status": "ACTIVE",
+                    "is_popular": order == 0,
+                    "display_order": order,
+                    "created_at": created,
+                    "updated_at": created,
+                })
+        self.services = services
+        # Zipf-like popularity: a few services account for most of the demand
+        ranks = list(range(1, len(services) + 1))
+        self.rng.shuffle(ranks)
+        self.service_weights = [1.0 / rank for rank in ranks]
+        return categories, services
+
+    def bookings(self) -> Iterator[Tuple[Row, List[Row]]]:
+        today = self.end_date
+        for day in self._history(BOOKING_HORIZON_DAYS):
+            for _ in range(self._daily_count(self.volume("bookings_per_day"), day)):
+                customer = self._pick_customer()
+                vehicle_id = self.rng.choice(self.vehicles[customer])[0]
+                scheduled_at = self._moment(day)
+                created_at = scheduled_at - timedelta(hours=self.rng.randint(2, 24 * 14))
+                services = self._pick_services(self.rng.choices((1, 2, 3), weights=(60, 30, 10))[0])
+                booking_id = self._uuid()
+                mobile = self.rng.random() < 0.2
+
+                booking = {
+                    "id": booking_id,
+                    "customer_id": self.customers[customer],
+                    "vehicle_id": vehicle_id,
+                    "scheduled_at": scheduled_at,
+                    "booking_type": "mobile" if mobile else "stationary",
+                    "total_price": sum(service["price"] for service in services),
+                    "estimated_duration_minutes": sum(service["duration_minutes"] for service in services),
+                    "wash_bay_id": None,
+                    "mobile_team_id": None,
+                    "notes": "",
+                    "phone_number": "",
+                    "customer_location": (
+                        {"lat": round(33.5 + self.rng.random() * 0.2, 5), "lng": round(-7.7 + self.rng.random() * 0.2, 5)}
+                        if mobile else None
+                    ),
+                    "cancellation_fee": Decimal("0.00"),
+                    "quality_rating": None,
+                    "quality_feedback": None,
+                    "actual_start_time": None,
+                    "actual_end_time": None,
+                    "overtime_charges": Decimal("0.00"),
+                    "cancelled_at": None,
+                    "cancelled_by": None,
+                    "cancellation_reason": None,
+                    "payment_intent_id": None,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+
+                if day < today:
+                    status = self.rng.choices(
+                        ("completed", "cancelled", "no_show"), weights=(86, 10, 4)
+                    )[0]
+                else:
+                    status = self.rng.choices(("pending", "confirmed"), weights=(40, 60))[0]
+                booking["status"] = status
+
+                if status == "completed":
+                    start = scheduled_at + timedelta(minutes=self.rng.randint(-5, 15))
+                    booking["actual_start_time"] = start
+                    booking["actual_end_time"] = start + timedelta(
+                        minutes=booking["estimated_duration_minutes"] + self.rng.randint(-5, 20)
+                    )
+                    booking["updated_at"] = booking["actual_end_time"]
+                    if self.rng.random() < 0.6:
+                        booking["quality_rating"] = self.rng.choices((1, 2, 3, 4, 5), weights=(2, 3, 10, 35, 50))[0]
+                elif status == "cancelled":
+                    cancelled_at = scheduled_at - timedelta(hours=self.rng.randint(1, 48))
+                    booking["cancelled_at"] = max(cancelled_at, created_at)
+                    booking["cancelled_by"] = booking["customer_id"]
+                    booking["cancellation_reason"] = "Change of plans"
+                    if cancelled_at > scheduled_at - timedelta(hours=24):
+                        booking["cancellation_fee"] = (booking["total_price"] * Decimal("0.25")).quantize(Decimal("0.01"))
+                    booking["updated_at"] = booking["cancelled_at"]
+
+                items = [
+                    {
+                        "id": self._uuid(),
+                        "booking_id": booking_id,
+                        "service_id": service["id"],
+                        "name": service["name"],
+                        "price": service["price"],
+                        "duration_minutes": service["duration_minutes"],
+                    }
+                    for service in services
+                ]
+                yield booking, items
+
+    def walkins(self) -> Iterator[Tuple[Row, List[Row]]]:
+        for day in self._history():
+            daily_number = 0
+            is_today = day == self.end_date
+            for _ in range(self._daily_count(self.volume("walkins_per_day"), day)):
+                daily_number += 1
+                walkin_id = self._uuid()
+                started_at = self._moment(day, last_hour=19)
+                staff_id = self.rng.choice(self.staff_users)
+                make = self.rng.choice(list(MAKES))
+                services = self._pick_services(self.rng.choices((1, 2, 3), weights=(55, 35, 10))[0])
+                total = sum(service["price"] for service in services)
+                discount = Decimal("0.00")
+                if self.rng.random() < 0.1:
+                    discount = (total * Decimal("0.10")).quantize(Decimal("0.01"))
+                final = total - discount
+
+                status = self.rng.choices(("completed", "cancelled"), weights=(95, 5))[0]
+                if is_today and self.rng.random() < 0.3:
+                    status = "in_progress"
+                duration = sum(service["duration_minutes"] for service in services)
+
+                walkin = {
+                    "id": walkin_id,
+                    "service_number": f"WI-{day:%Y%m%d}-{daily_number:03d}",
+                    "vehicle_make": make,
+                    "vehicle_model": self.rng.choice(MAKES[make]),
+                    "vehicle_color": self.rng.choice(COLORS),
+                    "vehicle_size": self.rng.choices(("compact", "standard", "large", "oversized"), weights=(30, 45, 20, 5))[0],
+                    "license_plate": f"{self.rng.randrange(1, 99999):05d}-{self.rng.choice('ABDHW')}-{self.rng.randint(1, 89)}",
+                    "customer_name": " ".join(self._name()) if self.rng.random() < 0.5 else None,
+                    "customer_phone": self._phone() if self.rng.random() < 0.4 else None,
+                    "status": status,
+                    "payment_status": "pending",
+                    "total_amount": total,
+                    "discount_amount": discount,
+                    "discount_reason": "Loyalty discount" if discount else None,
+                    "final_amount": final,
+                    "paid_amount": Decimal("0.00"),
+                    "started_at": started_at,
+                    "completed_at": None,
+                    "cancelled_at": None,
+                    "created_by_id": staff_id,
+                    "completed_by_id": None,
+                    "cancelled_by_id": None,
+                    "notes": None,
+                    "cancellation_reason": None,
+                    "payment_details": None,
+                    "created_at": started_at,
+                    "updated_at": started_at,
+                    "deleted_at": None,
+                }
+                if status == "completed":
+                    completed_at = started_at + timedelta(minutes=duration + self.rng.randint(0, 20))
+                    method = self.rng.choices(("cash", "card", "mobile"), weights=(55, 35, 10))[0]
+                    walkin.update(
+                        payment_status="paid",
+                        paid_amount=final,
+                        completed_at=completed_at,
+                        completed_by_id=staff_id,
+                        updated_at=completed_at,
+                        payment_details={
+                            "payments": [{
+                                "amount": str(final),
+                                "payment_method": method,
+                                "paid_at": completed_at.isoformat(),
+                                "recorded_by": staff_id,
+                            }]
+                        },
+                    )
+                elif status == "cancelled":
+                    cancelled_at = started_at + timedelta(minutes=self.rng.randint(1, 15))
+                    walkin.update(
+                        cancelled_at=cancelled_at,
+                        cancelled_by_id=staff_id,
+                        cancellation_reason="Customer left",
+                        updated_at=cancelled_at,
+                    )
+
+                items = [
+                    {
+                        "id": self._uuid(),
+                        "walkin_id": walkin_id,
+                        "service_id": service["id"],
+                        "service_name": service["name"],
+                        "price": service["price"],
+                        "product_costs": (service["price"] * Decimal(self.rng.randint(10, 30)) / 100).quantize(Decimal("0.01")),
+                        "quantity": 1,
+                        "notes": None,
+                        "created_at": started_at,
+                        "updated_at": started_at,
+                    }
+                    for service in services
+                ]
+                yield walkin, items
+
+    def staff_members(self) -> Iterator[Row]:
+        for index, user_id in enumerate(self.staff_users):
+            first_name, last_name = self._name()
+            hire_date = self.start_date - timedelta(days=self.rng.randrange(0, 3 * 365))
+            # Some staff join during the period
+            if index and self.rng.random() < 0.2:
+                hire_date = self.start_date + timedelta(days=self.rng.randrange(self.days))
+            staff_id = self._uuid()
+            self.staff_ids.append((staff_id, hire_date))
+            created = datetime.combine(hire_date, datetime.min.time())
+            yield {
+                "id": staff_id,
+                "user_id": user_id,
+                "employee_code": StaffManagementPolicy.generate_employee_code(index),
+                "first_name": first_name,
+                "last_name": last_name,
+                "phone": self._phone(),
+                "email": f"washer.{index:04d}@{EMAIL_DOMAIN}",
+                "hire_date": hire_date,
+                "employment_type": self.rng.choices(("full_time", "part_time", "contractor"), weights=(70, 25, 5))[0],
+                "status": "active",
+                "hourly_rate": Decimal(self.rng.randint(1500, 3000)) / 100,
+                "assigned_bay_id": None,
+                "assigned_team_id": None,
+                "skills": self.rng.sample(["basic_wash", "premium_wash", "detailing", "wax_polish", "interior_cleaning"], 3),
+                "total_services_completed": 0,
+                "total_revenue_generated": Decimal("0.00"),
+                "average_rating": Decimal("0.00"),
+                "created_at": created,
+                "updated_at": created,
+                "deleted_at": None,
+            }
+
+    def attendance(self) -> Iterator[Row]:
+        statuses, weights = zip(*ATTENDANCE_STATUSES)
+        for staff_id, hire_date in self.staff_ids:
+            for day in self._history():
+                # Closed on Sundays
+                if day < hire_date or day.weekday() == 6:
+                    continue
+                status = self.rng.choices(statuses, weights=weights)[0]
+                start = datetime.combine(day, datetime.min.time()) + timedelta(hours=8)
+                check_in = check_out = None
+                hours = Decimal("0.00")
+                if status in ("present", "late", "half_day"):
+                    late_by = self.rng.randint(15, 60) if status == "late" else self.rng.randint(-10, 5)
+                    check_in = start + timedelta(minutes=late_by)
+                    shift = 240 if status == "half_day" else 540 + self.rng.randint(-15, 45)
+                    check_out = check_in + timedelta(minutes=shift)
+                    hours = (Decimal(shift) / 60).quantize(Decimal("0.01"))
+                created = check_out or start
+                yield {
+                    "id": self._uuid(),
+                    "staff_id": staff_id,
+                    "date": day,
+                    "check_in": check_in,
+                    "check_out": check_out,
+                    "status": status,
+                    "hours_worked": hours,
+                    "notes": None,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+
+    def products_and_movements(self) -> Tuple[List[Row], Iterator[Row]]:
+        """Products, plus the stock movements that bring them to their current quantity."""
+        created = datetime.combine(self.start_date, datetime.min.time()) - timedelta(days=30)
+        products = []
+        for index in range(self.volume("products")):
+            name, category, unit, cost = PRODUCTS[index % len(PRODUCTS)]
+            maximum = Decimal(self.rng.choice((50, 100, 200)))
+            products.append({
+                "id": self._uuid(),
+                "sku": InventoryManagementPolicy.generate_sku(index),
+                "name": name if index < len(PRODUCTS) else f"{name} #{index // len(PRODUCTS) + 1}",
+                "description": None,
+                "category": category,
+                "unit": unit,
+                "current_quantity": maximum,
+                "minimum_quantity": maximum * Decimal("0.1"),
+                "reorder_point": maximum * Decimal("0.25"),
+                "maximum_quantity": maximum,
+                "unit_cost": Decimal(cost),
+                "unit_price": None,
+                "supplier_id": None,
+                "supplier_sku": None,
+                "is_active": True,
+                "notes": None,
+                "created_at": created,
+                "updated_at": created,
+                "deleted_at": None,
+            })
+
+        def movements() -> Iterator[Row]:
+            order = 0
+            for day in self._history():
+                for _ in range(self._daily_count(self.volume("movements_per_day"), day)):
+                    product = self.rng.choice(products)
+                    before = product["current_quantity"]
+                    moved_at = self._moment(day)
+                    if before <= product["reorder_point"]:
+                        order += 1
+                        movement_type, quantity = "IN", product["maximum_quantity"] - before
+                        reference_type, reference_id, reason = "PURCHASE_ORDER", f"PO-{order:06d}", "Restock"
+                    else:
+                        movement_type = self.rng.choices(("OUT", "WASTE", "ADJUSTMENT"), weights=(94, 3, 3))[0]
+                        quantity = min(before, Decimal(self.rng.randint(5, 50)) / 10)
+                        reference_type, reference_id, reason = None, None, "Used in service"
+                    after = before + quantity if movement_type == "IN" else before - quantity
+                    product["current_quantity"] = after
+                    product["updated_at"] = moved_at
+                    yield {
+                        "id": self._uuid(),
+                        "product_id": product["id"],
+                        "movement_type": movement_type,
+                        "quantity": quantity,
+                        "quantity_before": before,
+                        "quantity_after": after,
+                        "unit_cost": product["unit_cost"],
+                        "total_cost": (quantity * product["unit_cost"]).quantize(Decimal("0.01")),
+                        "reference_type": reference_type,
+                        "reference_id": reference_id,
+                        "performed_by_id": self.rng.choice(self.staff_users),
+                        "reason": reason,
+                        "notes": None,
+                        "movement_date": moved_at,
+                        "created_at": moved_at,
+                    }
+
+        return products, movements()
+
+    def expenses(self) -> Iterator[Row]:
+        adhoc_weights = [weight for _, weight, *_ in ADHOC_EXPENSES]
+        recent = self.end_date - timedelta(days=30)
+        for day in self._history():
+            entries = [
+                (category, Decimal(amount), description)
+                for category, day_of_month, amount, description in RECURRING_EXPENSES
+                if day.day == day_of_month
+            ]
+            for _ in range(self._daily_count(self.volume("expenses_per_day"), day)):
+                category, _, low, high, description = self.rng.choices(ADHOC_EXPENSES, weights=adhoc_weights)[0]
+                cents = self.rng.randint(int(Decimal(low) * 100), int(Decimal(high) * 100))
+                entries.append((category, Decimal(cents) / 100, description))
+
+            for daily_count, (category, amount, description) in enumerate(entries):
+                created = self._moment(day)
+                status = "PAID" if day < recent else self.rng.choice(("PENDING", "APPROVED", "PAID"))
+                if self.rng.random() < 0.03:
+                    status = "REJECTED"
+                paid = status == "PAID"
+                yield {
+                    "id": self._uuid(),
+                    "expense_number": ExpenseManagementPolicy.generate_expense_number(day, daily_count),
+                    "category": category,
+                    "amount": amount,
+                    "description": description,
+                    "status": status,
+                    "payment_method": self.rng.choice(EXPENSE_PAYMENT_METHODS) if paid else None,
+                    "expense_date": day,
+                    "due_date": day + timedelta(days=30),
+                    "paid_date": day + timedelta(days=self.rng.randint(0, 20)) if paid else None,
+                    "created_by_id": self.manager_id,
+                    "approved_by_id": self.manager_id if status in ("APPROVED", "PAID") else None,
+                    "paid_by_id": self.manager_id if paid else None,
+                    "vendor_name": None,
+                    "vendor_id": None,
+                    "receipt_url": None,
+                    "notes": None,
+                    "approval_notes": None,
+                    "rejection_reason": "Not budgeted" if status == "REJECTED" else None,
+                    "recurrence_type": "MONTHLY" if category in ("RENT", "INSURANCE", "UTILITIES", "SALARIES") else "ONE_TIME",
+                    "parent_expense_id": None,
+                    "created_at": created,
+                    "updated_at": created,
+                    "deleted_at": None,
+                }
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    return value.replace(tzinfo=timezone.utc) if value is not None and value.tzinfo is None else value
+
+
+def _naive(value: Optional[datetime]) -> Optional[datetime]:
+    return value.replace(tzinfo=None) if value is not None else value
+
+
+def _json(value: Any) -> Optional[str]:
+    return json.dumps(value) if value is not None else None
+
+
+def _converters(table: Table, copy: bool) -> Dict[str, Callable[[Any], Any]]:
+    """Per-column adapters from the generated Python values to what the driver expects."""
+    converters = {}
+    for column in table.columns:
+        if isinstance(column.type, DateTime):
+            converters[column.name] = _aware if column.type.timezone else _naive
+        elif copy and isinstance(column.type, JSON):
+            # asyncpg's COPY takes json/jsonb columns as text
+            converters[column.name] = _json
+    return converters
+
+
+def _uses_copy(connection: AsyncConnection) -> bool:
+    return connection.dialect.name == "postgresql" and connection.dialect.driver == "asyncpg"
+
+
+async def write_rows(connection: AsyncConnection, table: Table, rows: Iterable[Row], batch_size: int) -> int:
+    """Bulk-insert rows in batches: COPY on asyncpg, executemany elsewhere."""
+    copy = _uses_copy(connection)
+    converters = _converters(table, copy)
+    driver = (await connection.get_raw_connection()).driver_connection if copy else None
+
+    total = 0
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        for row in batch:
+            for name, convert in converters.items():
+                if name in row:
+                    row[name] = convert(row[name])
+        if copy:
+            columns = list(batch[0])
+            await driver.copy_records_to_table(
+                table.name,
+                records=[tuple(row[name] for name in columns) for row in batch],
+                columns=columns,
+            )
+        else:
+            await connection.execute(table.insert(), batch)
+        total += len(batch)
+    return total
+
+
+async def write_nested(
+    connection: AsyncConnection,
+    parent: Table,
+    child: Table,
+    pairs: Iterable[Tuple[Row, List[Row]]],
+    batch_size: int,
+) -> Tuple[int, int]:
+    """Bulk-insert parent rows and their children, parents first in each batch."""
+    parents = children = 0
+    pairs = iter(pairs)
+    while batch := list(islice(pairs, batch_size)):
+        parents += await write_rows(connection, parent, [row for row, _ in batch], batch_size)
+        children += await write_rows(
+            connection, child, [item for _, items in batch for item in items], batch_size * 4
+        )
+    return parents, children
+
+
+async def load(
+    connection: AsyncConnection,
+    dataset: SyntheticDataset,
+    batch_size: int = 5_000,
+    report: Callable[[str, int], None] = lambda table, count: None,
+) -> Dict[str, int]:
+    """Generate and write every table of the dataset, returning row counts."""
+    from app.core.security import password_hasher
+
+    # One hash for everyone; hashing per user would dominate the run time
+    dataset.password_hash = password_hasher.hash(PASSWORD)
+    counts: Dict[str, int] = {}
+
+    async def write(table: Table, rows: Iterable[Row]) -> None:
+        counts[table.name] = await write_rows(connection, table, rows, batch_size)
+        report(table.name, counts[table.name])
+
+    async def nested(parent: Table, child: Table, pairs: Iterable[Tuple[Row, List[Row]]]) -> None:
+        counts[parent.name], counts[child.name] = await write_nested(connection, parent, child, pairs, batch_size)
+        report(parent.name, counts[parent.name])
+        report(child.name, counts[child.name])
+
+    await write(UserModel.__table__, dataset.users())
+    await write(Vehicle.__table__, dataset.vehicles_rows())
+    categories, services = dataset.categories_and_services()
+    await write(Category.__table__, categories)
+    await write(Service.__table__, services)
+    await nested(Booking.__table__, BookingService.__table__, dataset.bookings())
+    await nested(WalkInServiceModel.__table__, WalkInServiceItemModel.__table__, dataset.walkins())
+    await write(StaffMemberModel.__table__, dataset.staff_members())
+    await write(AttendanceModel.__table__, dataset.attendance())
+    products, movements = dataset.products_and_movements()
+    # Movements first: they leave each product at its final quantity
+    await write(StockMovementModel.__table__, movements)
+    await write(ProductModel.__table__, products)
+    await write(ExpenseModel.__table__, dataset.expenses())
+    return counts
+
+
+async def generate(
+    database_url: str,
+    dataset: SyntheticDataset,
+    batch_size: int = 5_000,
+    create_tables: bool = False,
+    report: Callable[[str, int], None] = lambda table, count: None,
+) -> Dict[str, int]:
+    """Load the dataset into database_url in one transaction."""
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as connection:
+            if create_tables:
+                await connection.run_sync(Base.metadata.create_all)
+            existing = await connection.scalar(
+                select(UserModel.id).where(UserModel.email == f"manager@{EMAIL_DOMAIN}")
+            )
+            if existing:
+                raise RuntimeError("The database already contains generated data; use an empty database")
+            return await load(connection, dataset, batch_size, report)
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="Volume multiplier (1 = ~47k bookings a year)")
+    parser.add_argument("--days", type=int, default=365, help="Days of history to generate")
+    parser.add_argument("--end-date", type=date.fromisoformat, help="Last day of history (default: today)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database (default: DATABASE_URL)")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Rows per COPY or executemany batch")
+    parser.add_argument("--create-tables", action="store_true", help="Create missing tables first (no migrations)")
+    args = parser.parse_args()
+
+    dataset = SyntheticDataset(scale=args.scale, seed=args.seed, days=args.days, end_date=args.end_date)
+    print(f"Generating scale {args.scale} data for {dataset.start_date} to {dataset.end_date} (seed {args.seed})")
+    started = time.perf_counter()
+
+    try:
+        counts = asyncio.run(generate(
+            args.database_url,
+            dataset,
+            batch_size=args.batch_size,
+            create_tables=args.create_tables,
+            report=lambda table, count: print(f"  ✓ {table}: {count:,} rows"),
+        ))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"\n{total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+    print(f"All generated accounts use the password {PASSWORD}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
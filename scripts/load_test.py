@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""
+Load test and throughput benchmark for the API.
+
+Drives a weighted mix of scripted workloads (login, catalog browsing,
+availability checks, booking creation, walk-in flows and analytics
+dashboards) with N concurrent virtual users, and writes RPS and p50/p95/p99
+latency per route to a JSON report that can be diffed between commits.
+
+By default the app from create_app() runs in-process against a fresh SQLite
+database seeded with the Postman test accounts and a service catalog.
+--data-scale adds a production-sized dataset from scripts/generate_perf_data.py
+first. Pass --base-url to load an already running server (uvicorn, docker
+compose) seeded with scripts/seed_test_users.py instead.
+
+Usage:
+    python scripts/load_test.py --concurrency 20 --duration 30 --output load-report.json
+    python scripts/load_test.py --data-scale 1 --mix analytics=1 --output analytics-report.json
+    python scripts/load_test.py --base-url http://localhost:8000 --mix browse=5,analytics=1
+    python scripts/load_test.py --compare load-report.json --output new-report.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+API = "/api/v1"
+
+# Accounts created by scripts/seed_test_users.py and scripts/create_default_admin.py;
+# the admin is only used to create the service catalog when it is empty
+ACCOUNTS = {
+    "client": ("client@blingauto.com", "ClientPass123!"),
+    "manager": ("manager@blingauto.com", "ManagerPass123!"),
+    "washer": ("washer@blingauto.com", "WasherPass123!"),
+    "admin": (
+        os.getenv("INITIAL_ADMIN_EMAIL", "admin@blingauto.com"),
+        os.getenv("INITIAL_ADMIN_PASSWORD", "AdminPass123!"),
+    ),
+}
+
+DEFAULT_MIX = {
+    "login": 10,
+    "browse": 30,
+    "availability": 20,
+    "booking": 15,
+    "walkin": 10,
+    "analytics": 15,
+}
+
+
+class Recorder:
+    """Latency samples and status codes per route template."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, route: str, status: int, seconds: float) -> None:
+        self.latencies[route].append(seconds)
+        self.statuses[route][str(status)] += 1
+
+    @staticmethod
+    def _summary(samples: List[float], statuses: Counter, elapsed: float) -> Dict[str, Any]:
+        ordered = sorted(samples)
+        if len(ordered) > 1:
+            cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = ordered[0]
+        errors = sum(count for status, count in statuses.items() if status == "0" or status >= "400")
+        return {
+            "requests": len(ordered),
+            "errors": errors,
+            "rps": round(len(ordered) / elapsed, 2),
+            "status": dict(sorted(statuses.items())),
+            "latency_ms": {
+                "mean": round(statistics.fmean(ordered) * 1000, 2),
+                "p50": round(p50 * 1000, 2),
+                "p95": round(p95 * 1000, 2),
+                "p99": round(p99 * 1000, 2),
+                "max": round(ordered[-1] * 1000, 2),
+            },
+        }
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        routes = {
+            route: self._summary(samples, self.statuses[route], elapsed)
+            for route, samples in sorted(self.latencies.items())
+        }
+        everything = [sample for samples in self.latencies.values() for sample in samples]
+        statuses = sum(self.statuses.values(), Counter())
+        return {
+            "total": self._summary(everything, statuses, elapsed) if everything else {},
+            "routes": routes,
+        }
+
+
+class VirtualUser:
+    """One simulated client issuing requests back to back."""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, fixtures: Dict[str, Any], rng: random.Random):
+        self.client = client
+        self.recorder = recorder
+        self.fixtures = fixtures
+        self.rng = rng
+
+    async def request(self, method: str, route: str, path: Optional[str] = None, role: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Send a request, recording it under its route template."""
+        headers = kwargs.pop("headers", {})
+        if role:
+            headers["Authorization"] = f"Bearer {self.fixtures['tokens'][role]}"
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path or route, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(f"{method} {route}", 0, time.perf_counter() - start)
+            raise
+        self.recorder.record(f"{method} {route}", response.status_code, time.perf_counter() - start)
+        return response
+
+    def _period(self) -> Dict[str, str]:
+        end = date.today()
+        days = self.rng.choice((7, 30, 90, 365))
+        return {"start_date": (end - timedelta(days=days)).isoformat(), "end_date": end.isoformat()}
+
+    def _slot(self) -> str:
+        day = datetime.now(timezone.utc).date() + timedelta(days=self.rng.randint(1, 30))
+        hour = self.rng.randint(9, 16)
+        return datetime(day.year, day.month, day.day, hour, self.rng.choice((0, 30)), tzinfo=timezone.utc).isoformat()
+
+    async def login(self) -> None:
+        email, password = ACCOUNTS["client"]
+        await self.request("POST", f"{API}/auth/login", json={"email": email, "password": password})
+
+    async def browse(self) -> None:
+        await self.request("GET", f"{API}/services/", role="client")
+        await self.request("GET", f"{API}/services/popular", role="client")
+        service_id = self.rng.choice(self.fixtures["service_ids"])
+        await self.request("GET", f"{API}/services/{{service_id}}", f"{API}/services/{service_id}", role="client")
+
+    async def availability(self) -> None:
+        slot = self._slot()
+        await self.request(
+            "POST",
+            f"{API}/scheduling/check-availability",
+            role="client",
+            json={
+                "requested_time": slot,
+                "duration_minutes": self.rng.choice((30, 45, 60)),
+                "vehicle_size": "standard",
+                "service_type": "wash_bay",
+            },
+        )
+        start = datetime.fromisoformat(slot).replace(hour=8, minute=0)
+        await self.request(
+            "POST",
+            f"{API}/scheduling/available-slots",
+            role="client",
+            json={
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(hours=10)).isoformat(),
+                "service_type": "wash_bay",
+                "duration_minutes": 60,
+            },
+        )
+
+    async def booking(self) -> None:
+        service_ids = self.rng.sample(self.fixtures["service_ids"], k=self.rng.randint(1, 2))
+        await self.request(
+            "POST",
+            f"{API}/bookings",
+            role="client",
+            json={
+                "customer_id": self.fixtures["client_id"],
+                "vehicle_id": self.fixtures["vehicle_id"],
+                "service_ids": service_ids,
+                "scheduled_at": self._slot(),
+                "booking_type": "scheduled",
+            },
+        )
+        await self.request("GET", f"{API}/bookings", role="client")
+
+    async def walkin(self) -> None:
+        created = await self.request(
+            "POST",
+            f"{API}/walkins/",
+            role="washer",
+            json={
+                "vehicle_make": "Toyota",
+                "vehicle_model": "Corolla",
+                "vehicle_color": "Blue",
+                "vehicle_size": self.rng.choice(("compact", "standard", "large")),
+                "customer_name": "Load Test",
+            },
+        )
+        if created.status_code >= 300:
+            return
+        walkin_id = created.json()["id"]
+        service = self.rng.choice(self.fixtures["services"])
+        await self.request(
+            "POST",
+            f"{API}/walkins/{{walkin_id}}/services",
+            f"{API}/walkins/{walkin_id}/services",
+            role="washer",
+            json={"service_id": service["id"], "service_name": service["name"], "price": service["price"]},
+        )
+        await self.request(
+            "POST",
+            f"{API}/walkins/{{walkin_id}}/payments",
+            f"{API}/walkins/{walkin_id}/payments",
+            role="washer",
+            json={
+                "amount": service["price"],
+                "payment_method": "card",
+                "transaction_reference": f"LOAD-{self.rng.getrandbits(32):08x}",
+            },
+        )
+        await self.request(
+            "POST",
+            f"{API}/walkins/{{walkin_id}}/complete",
+            f"{API}/walkins/{walkin_id}/complete",
+            role="washer",
+        )
+
+    async def analytics(self) -> None:
+        period = self._period()
+        await self.request("GET", f"{API}/analytics/dashboard", role="manager", params=period)
+        await self.request("GET", f"{API}/analytics/revenue/daily", role="manager", params=period)
+
+    async def run(self, mix: Dict[str, int], deadline: float) -> None:
+        scenarios: List[Callable[[], Any]] = [getattr(self, name) for name in mix]
+        weights = list(mix.values())
+        while time.perf_counter() < deadline:
+            scenario = self.rng.choices(scenarios, weights=weights)[0]
+            try:
+                await scenario()
+            except (httpx.HTTPError, ValueError, KeyError):
+                # Already recorded as a failed request; keep the load going
+                await asyncio.sleep(0)
+
+
+async def login(client: httpx.AsyncClient, role: str) -> Dict[str, Any]:
+    email, password = ACCOUNTS[role]
+    response = await client.post(f"{API}/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()
+
+
+async def prepare_fixtures(client: httpx.AsyncClient, seeded: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Log in every role and make sure the catalog and a customer vehicle exist.
+
+    seeded holds ids the in-process app created directly in its database;
+    against a remote server the vehicle is looked up or created over the API.
+    """
+    tokens = {}
+    client_id = None
+    for role in ACCOUNTS:
+        data = await login(client, role)
+        tokens[role] = data["access_token"]
+        if role == "client":
+            client_id = data["user"]["user_id"]
+
+    admin = {"Authorization": f"Bearer {tokens['admin']}"}
+    customer = {"Authorization": f"Bearer {tokens['client']}"}
+
+    services = await list_services(client, customer)
+    if not services:
+        await create_catalog(client, admin)
+        services = await list_services(client, customer)
+
+    vehicle_id = seeded.get("vehicle_id")
+    if vehicle_id is None:
+        response = await client.get(f"{API}/vehicles/", headers=customer)
+        vehicles = response.json().get("vehicles", []) if response.is_success else []
+        if not vehicles:
+            response = await client.post(
+                f"{API}/vehicles/",
+                headers=customer,
+                json={"make": "Toyota", "model": "Corolla", "year": 2020, "color": "Blue", "license_plate": "LOAD-001"},
+            )
+            vehicles = [response.json()] if response.is_success else []
+        vehicle_id = vehicles[0]["id"] if vehicles else None
+
+    return {
+        "tokens": tokens,
+        "client_id": client_id,
+        "vehicle_id": vehicle_id,
+        "services": [{"id": s["id"], "name": s["name"], "price": str(s["price"])} for s in services],
+        "service_ids": [s["id"] for s in services],
+    }
+
+
+async def list_services(client: httpx.AsyncClient, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+    response = await client.get(f"{API}/services/", params={"limit": 100}, headers=headers)
+    response.raise_for_status()
+    return response.json()["services"]
+
+
+async def create_catalog(client: httpx.AsyncClient, headers: Dict[str, str]) -> None:
+    """Create a small catalog of categories and services."""
+    for category_index, category in enumerate(("Exterior", "Interior", "Detailing")):
+        response = await client.post(
+            f"{API}/services/categories",
+            headers=headers,
+            json={"name": category, "description": f"{category} services", "display_order": category_index},
+        )
+        response.raise_for_status()
+        category_id = response.json()["category_id"]
+        for index in range(4):
+            response = await client.post(
+                f"{API}/services/categories/{category_id}/services",
+                headers=headers,
+                json={
+                    "name": f"{category} Service {index + 1}",
+                    "description": f"{category} service {index + 1}",
+                    "price": str(15 + 10 * index),
+                    "duration_minutes": 30 + 15 * index,
+                    "is_popular": index == 0,
+                    "display_order": index,
+                },
+            )
+            response.raise_for_status()
+
+
+@asynccontextmanager
+async def in_process_client(
+    database_url: str, data_scale: float = 0, seed: int = 1
+) -> AsyncIterator[Tuple[httpx.AsyncClient, Dict[str, Any]]]:
+    """Boot create_app() in this process against a fresh database; yields the client and seeded ids."""
+    os.environ["DATABASE_URL"] = database_url
+    # Every virtual user shares one client address, so the limiter would throttle the whole run
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+    from app.core.db import Base
+    from app.core.db.session import engine
+    from app.features.vehicles.adapters.models import Vehicle
+    from app.interfaces.http_api import create_app
+    from seed_test_users import create_test_user
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        if data_scale > 0:
+            from generate_perf_data import SyntheticDataset, load
+
+            counts = await load(connection, SyntheticDataset(scale=data_scale, seed=seed))
+            print(f"Loaded {sum(counts.values()):,} rows of synthetic data (scale {data_scale})")
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        for role, (email, password) in ACCOUNTS.items():
+            await create_test_user(session, email, password, "Load", role.title(), role)
+        result = await session.execute(text("SELECT id FROM users WHERE email = :email"), {"email": ACCOUNTS["client"][0]})
+        vehicle = Vehicle(
+            customer_id=result.scalar_one(),
+            make="Toyota",
+            model="Corolla",
+            year=2020,
+            color="Blue",
+            license_plate="LOAD-001",
+            is_default=True,
+        )
+        session.add(vehicle)
+        await session.flush()
+        seeded = {"vehicle_id": vehicle.id}
+        await session.commit()
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        # Unhandled errors come back as 500s, as they would from a real server
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=30) as client:
+            yield client, seeded
+
+
+@asynccontextmanager
+async def remote_client(base_url: str, concurrency: int) -> AsyncIterator[Tuple[httpx.AsyncClient, Dict[str, Any]]]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        yield client, {}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    with ExitStack() as stack:
+        if args.base_url:
+            connect = remote_client(args.base_url, args.concurrency)
+        else:
+            database = args.database_url
+            if not database:
+                directory = stack.enter_context(tempfile.TemporaryDirectory(prefix="loadtest-"))
+                database = f"sqlite+aiosqlite:///{Path(directory) / 'loadtest.db'}"
+            connect = in_process_client(database, args.data_scale, args.seed)
+        return await measure(args, connect)
+
+
+async def measure(args: argparse.Namespace, connect) -> Dict[str, Any]:
+    async with connect as (client, seeded):
+        fixtures = await prepare_fixtures(client, seeded)
+        if not fixtures["vehicle_id"] and args.mix.pop("booking", None):
+            print("No customer vehicle could be found or created, skipping the booking scenario")
+        recorder = Recorder()
+
+        # Warm up caches and connection pools before measuring
+        if args.warmup > 0:
+            warmup = [
+                VirtualUser(client, Recorder(), fixtures, random.Random(f"{args.seed}-warmup-{i}")).run(
+                    args.mix, time.perf_counter() + args.warmup
+                )
+                for i in range(args.concurrency)
+            ]
+            await asyncio.gather(*warmup)
+
+        start = time.perf_counter()
+        deadline = start + args.duration
+        users = [
+            VirtualUser(client, recorder, fixtures, random.Random(f"{args.seed}-{i}")).run(args.mix, deadline)
+            for i in range(args.concurrency)
+        ]
+        await asyncio.gather(*users)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "target": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "duration_seconds": round(elapsed, 2),
+            "mix": args.mix,
+            "seed": args.seed,
+            "data_scale": args.data_scale,
+        },
+        **recorder.report(elapsed),
+    }
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Print RPS and p95 changes per route against an earlier report."""
+    print(f"{'route':<60} {'rps':>16} {'p95 ms':>20}")
+    for route, stats in current["routes"].items():
+        before = previous.get("routes", {}).get(route)
+        if not before:
+            print(f"{route:<60} {stats['rps']:>16} {stats['latency_ms']['p95']:>20}")
+            continue
+        rps = f"{before['rps']} -> {stats['rps']}"
+        p95 = f"{before['latency_ms']['p95']} -> {stats['latency_ms']['p95']}"
+        print(f"{route:<60} {rps:>16} {p95:>20}")
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}, expected one of {sorted(DEFAULT_MIX)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", help="Load a running server instead of booting the app in-process")
+    parser.add_argument("--database-url", help="Database for the in-process app (default: a fresh SQLite file)")
+    parser.add_argument(
+        "--data-scale",
+        type=float,
+        default=0,
+        help="Preload the in-process database with scripts/generate_perf_data.py at this scale",
+    )
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds before the run")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="Scenario weights, e.g. browse=5,analytics=1")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the workload")
+    parser.add_argument("--output", default="load-report.json", help="JSON report path")
+    parser.add_argument("--compare", help="Earlier report to print changes against")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    total = report["total"]
+    print(f"{total.get('requests', 0)} requests, {total.get('rps', 0)} req/s, "
+          f"p95 {total.get('latency_ms', {}).get('p95')} ms -> {args.output}")
+
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Rebuild the analytics revenue rollups from bookings and walk-ins.
+
+Recomputes daily_revenue_rollup and daily_service_rollup for a period of
+closed days. After that the app rolls up each day once it closes, but only
+looks back ANALYTICS_ROLLUP_BACKFILL_DAYS days, and booking and walk-in
+events refresh closed days they touch. Run this once after migrating, after
+an outage longer than the backfill window, after bulk imports that bypass
+the events, or to repair a period. Days are replaced whole, so re-running it
+is safe. Each chunk of days is committed on its own.
+
+Usage:
+    python scripts/rebuild_revenue_rollups.py --days 365
+    python scripts/rebuild_revenue_rollups.py --start 2025-01-01 --end 2025-06-30 --source bookings
+    DATABASE_URL=sqlite+aiosqlite:///./perf.db python scripts/rebuild_revenue_rollups.py
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Sequence
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config.settings import settings
+from app.features.analytics.api.dependencies import build_rollup_refresher
+from app.features.analytics.domain.enums import RevenueSource
+from app.features.analytics.use_cases.refresh_revenue_rollups import (
+    RefreshRevenueRollupsRequest,
+)
+from app.features.auth.adapters import models as auth_models  # noqa: F401 (relationship targets)
+from app.features.facilities.adapters import models as facilities_models  # noqa: F401 (relationship targets)
+from app.features.scheduling.adapters import models as scheduling_models  # noqa: F401 (relationship targets)
+from app.features.services.adapters import models as services_models  # noqa: F401 (relationship targets)
+from app.features.vehicles.adapters import models as vehicles_models  # noqa: F401 (relationship targets)
+
+SOURCES = {
+    "bookings": (RevenueSource.BOOKINGS,),
+    "walk_ins": (RevenueSource.WALK_INS,),
+    "all": (RevenueSource.BOOKINGS, RevenueSource.WALK_INS),
+}
+
+
+async def rebuild(
+    database_url: str,
+    start_date: date,
+    end_date: date,
+    sources: Sequence[RevenueSource] = SOURCES["all"],
+    chunk_days: int = 31,
+    report: Callable[[date, date], None] = lambda start, end: None,
+) -> int:
+    """Refresh the rollups for [start_date, end_date]; returns the days refreshed."""
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    refreshed = 0
+    try:
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            async with session_factory() as session:
+                refreshed += await build_rollup_refresher(session).execute(
+                    RefreshRevenueRollupsRequest(chunk_start, chunk_end, sources=tuple(sources))
+                )
+                await session.commit()
+            report(chunk_start, chunk_end)
+            chunk_start = chunk_end + timedelta(days=1)
+    finally:
+        await engine.dispose()
+    return refreshed
+
+
+def main() -> int:
+    yesterday = date.today() - timedelta(days=1)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", type=date.fromisoformat, help="First day to rebuild (default: --days before --end)")
+    parser.add_argument("--end", type=date.fromisoformat, default=yesterday, help="Last day to rebuild (default: yesterday)")
+    parser.add_argument("--days", type=int, default=365, help="Days to rebuild when --start is not given")
+    parser.add_argument("--source", choices=sorted(SOURCES), default="all", help="Revenue source to rebuild")
+    parser.add_argument("--chunk-days", type=int, default=31, help="Days refreshed per transaction")
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database (default: DATABASE_URL)")
+    args = parser.parse_args()
+
+    end_date = min(args.end, yesterday)
+    start_date = args.start or end_date - timedelta(days=args.days - 1)
+    if start_date > end_date:
+        # Today is aggregated live and never rolled up
+        print(f"❌ Nothing to rebuild: {start_date} is after the last closed day ({end_date})")
+        return 1
+
+    print(f"Rebuilding {args.source} rollups for {start_date} to {end_date}")
+    started = time.perf_counter()
+
+    days = asyncio.run(rebuild(
+        args.database_url,
+        start_date,
+        end_date,
+        sources=SOURCES[args.source],
+        chunk_days=max(args.chunk_days, 1),
+        report=lambda start, end: print(f"  ✓ {start} to {end}"),
+    ))
+
+    print(f"\n{days:,} days in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
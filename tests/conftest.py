@@ -9,7 +9,7 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from main import app
-from app.core.db import Base, get_db
+from app.core.db import Base, get_db, assert_query_budget
 
 
 # Configure async test environment
@@ -191,6 +191,18 @@ def app_config() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def query_budget():
+    """
+    Fail a block that executes more SQL statements than allowed.
+
+    Usage:
+        with query_budget(2):
+            await client.get("/api/v1/services")
+    """
+    return assert_query_budget
+
+
 # Time-related fixtures
 @pytest.fixture
 def now() -> datetime:
@@ -0,0 +1,50 @@
+"""
+Smoke test for scripts/load_test.py.
+
+Runs the harness in-process for a second and checks the report it writes.
+It does not assert on throughput, only that every scenario is exercised and
+reported per route.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parents[2] / "scripts" / "load_test.py"
+
+
+@pytest.mark.slow
+def test_harness_writes_a_per_route_report(tmp_path):
+    report_path = tmp_path / "report.json"
+
+    subprocess.run(
+        [
+            sys.executable,
+            str(SCRIPT),
+            "--database-url", f"sqlite+aiosqlite:///{tmp_path / 'load.db'}",
+            "--concurrency", "2",
+            "--duration", "1",
+            "--warmup", "0",
+            "--mix", "login=1,browse=2,walkin=1,analytics=1",
+            "--output", str(report_path),
+        ],
+        check=True,
+        capture_output=True,
+        timeout=300,
+        cwd=tmp_path,
+        # Other tests leave ENVIRONMENT=testing behind, which Settings rejects
+        env={**os.environ, "ENVIRONMENT": "development"},
+    )
+
+    report = json.loads(report_path.read_text())
+    assert report["meta"]["concurrency"] == 2
+    assert report["total"]["requests"] == sum(route["requests"] for route in report["routes"].values())
+    assert "GET /api/v1/services/{service_id}" in report["routes"]
+    assert "POST /api/v1/auth/login" in report["routes"]
+    for route in report["routes"].values():
+        latency = route["latency_ms"]
+        assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
@@ -0,0 +1,143 @@
+"""
+Throughput of the legacy BaseHTTPMiddleware stack versus the fused ASGI pipeline.
+
+Both stacks wrap the same trivial endpoint and are driven directly through
+the ASGI interface, so the numbers isolate middleware overhead from network
+and server costs. Run with:
+
+    pytest tests/performance/test_middleware_throughput.py --benchmark-group-by=func
+"""
+
+import asyncio
+import time
+import uuid
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.cache import rate_limiter
+from app.core.middleware import RequestPipelineMiddleware
+from app.core.middleware.security_headers import CONTENT_SECURITY_POLICY
+
+REQUESTS_PER_ROUND = 500
+
+
+async def ping(request: Request):
+    return PlainTextResponse("pong")
+
+
+def trivial_app():
+    return Starlette(routes=[Route("/ping", ping)])
+
+
+# Legacy stack, as it was before the ASGI rewrite
+
+class LegacyRequestId(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyLogging(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        return response
+
+
+class LegacySecurityHeaders(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Content-Security-Policy"] = CONTENT_SECURITY_POLICY
+        if "Server" in response.headers:
+            del response.headers["Server"]
+        return response
+
+
+class LegacyRateLimit(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        client_ip = request.client.host if request.client else "unknown"
+        allowed, remaining, _ = await rate_limiter.check_ip_rate_limit(client_ip)
+        response = await call_next(request)
+        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        return response
+
+
+def legacy_stack():
+    app = trivial_app()
+    for middleware in (LegacySecurityHeaders, LegacyRequestId, LegacyLogging, LegacyRateLimit):
+        app.add_middleware(middleware)
+    return app
+
+
+def asgi_stack():
+    app = trivial_app()
+    app.add_middleware(RequestPipelineMiddleware)
+    return app
+
+
+STACKS = {"legacy": legacy_stack, "asgi": asgi_stack}
+
+
+async def drive(app, requests: int) -> None:
+    """Send requests straight through the ASGI interface."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+
+
+@pytest.fixture(autouse=True)
+def permissive_rate_limit(monkeypatch):
+    """Exercise the rate-limit path without Redis and without hitting the limit."""
+    monkeypatch.setattr("app.core.config.settings.rate_limit_enabled", True)
+    monkeypatch.setattr("app.core.config.settings.rate_limit_local_prefilter", False)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("stack", list(STACKS))
+def test_middleware_throughput(benchmark, stack):
+    app = STACKS[stack]()
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(drive(app, 10))  # warm up
+        benchmark.extra_info["requests_per_round"] = REQUESTS_PER_ROUND
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(drive(app, REQUESTS_PER_ROUND)),
+            rounds=5,
+            iterations=1,
+        )
+        benchmark.extra_info["requests_per_second"] = REQUESTS_PER_ROUND / benchmark.stats.stats.mean
+    finally:
+        loop.close()
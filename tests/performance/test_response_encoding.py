@@ -0,0 +1,134 @@
+"""
+End-to-end response time and bytes on the wire for large analytics responses.
+
+Requests go through the real analytics router, with its use case, result
+cache and auth dependencies overridden so only routing, validation and
+response serialization are measured. The daily revenue route is served with
+FastAPI's default JSONResponse, where routes with a response_model take the
+pydantic-core dump_json fast path, and with FastJSONResponse as the app's
+default_response_class, which turns that fast path off. A plain dict route
+compares JSONResponse with FastJSONResponse, the case FastJSONResponse is
+meant for. Each benchmark records the raw and gzipped body size. Run with:
+
+    pytest tests/performance/test_response_encoding.py --benchmark-group-by=param:route
+"""
+
+import gzip
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.responses import FastJSONResponse
+from app.features.analytics.api.cache import AnalyticsResultCache, get_analytics_cache
+from app.features.analytics.api.dependencies import get_daily_revenue_use_case
+from app.features.analytics.api.router import router as analytics_router
+from app.features.analytics.api.schemas import DailyRevenueListSchema
+from app.features.analytics.domain.entities import DailyRevenue
+from app.shared.auth import get_current_user
+from app.shared.auth.contracts import AuthenticatedUser
+
+START = date(2025, 1, 1)
+END = date(2025, 12, 31)
+DAYS = (END - START).days + 1
+
+DAILY_REVENUE_URL = f"/api/v1/analytics/revenue/daily?start_date={START}&end_date={END}"
+
+
+def daily_revenue(days: int = DAYS) -> list[DailyRevenue]:
+    return [
+        DailyRevenue(
+            date=START + timedelta(days=i),
+            revenue=Decimal("1234.50") + i,
+            bookings_count=20 + i % 7,
+            walkins_count=5 + i % 3,
+            average_value=Decimal("48.25"),
+        )
+        for i in range(days)
+    ]
+
+
+class StubDailyRevenueUseCase:
+    def __init__(self, rows: list[DailyRevenue]):
+        self._rows = rows
+
+    async def execute(self, request) -> list[DailyRevenue]:
+        return self._rows
+
+
+def uncached(
+    request: Request,
+    response: Response,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+) -> AnalyticsResultCache:
+    return AnalyticsResultCache("/revenue/daily", start_date, end_date, response, bypass=True)
+
+
+def admin() -> AuthenticatedUser:
+    now = datetime(2026, 1, 1, 8, 30)
+    return AuthenticatedUser(
+        id="admin",
+        email="admin@example.com",
+        first_name="Ada",
+        last_name="Admin",
+        role="admin",
+        status="active",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def analytics_app(**kwargs) -> FastAPI:
+    app = FastAPI(**kwargs)
+    app.include_router(analytics_router, prefix="/api/v1/analytics")
+
+    rows = daily_revenue()
+    payload = DailyRevenueListSchema.model_validate(
+        {"items": [row.__dict__ for row in rows], "total_days": len(rows)}
+    ).model_dump()
+
+    @app.get("/dict/json", response_class=JSONResponse)
+    async def dict_json():
+        return payload
+
+    @app.get("/dict/orjson", response_class=FastJSONResponse)
+    async def dict_orjson():
+        return payload
+
+    app.dependency_overrides[get_daily_revenue_use_case] = lambda: StubDailyRevenueUseCase(rows)
+    app.dependency_overrides[get_analytics_cache] = uncached
+    app.dependency_overrides[get_current_user] = admin
+    return app
+
+
+CASES = {
+    # response_model route, default JSONResponse: dump_json fast path
+    "response_model-default": ({}, DAILY_REVENUE_URL),
+    # response_model route, FastJSONResponse as the app default
+    "response_model-orjson_default": (
+        {"default_response_class": FastJSONResponse},
+        DAILY_REVENUE_URL,
+    ),
+    # dict route: jsonable_encoder then json.dumps
+    "dict-json": ({}, "/dict/json"),
+    # dict route rendered by orjson
+    "dict-orjson": ({}, "/dict/orjson"),
+}
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("route", list(CASES))
+def test_response_encoding(benchmark, route):
+    app_kwargs, url = CASES[route]
+
+    with TestClient(analytics_app(**app_kwargs)) as client:
+        response = benchmark(client.get, url)
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == DAYS
+    benchmark.extra_info["bytes"] = len(response.content)
+    benchmark.extra_info["gzip_bytes"] = len(gzip.compress(response.content, compresslevel=6))
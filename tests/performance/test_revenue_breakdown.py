@@ -0,0 +1,77 @@
+"""
+Scaling of RevenueAnalyticsRepository.get_daily_revenue with the range length.
+
+The providers are replaced by in-memory ones returning one row per day, so
+the numbers isolate the bucketing and zero-filling from the database. The
+breakdown used to scan every provider row for every day in the range; it
+now makes a single pass, so time grows linearly with the number of days.
+Run with:
+
+    pytest tests/performance/test_revenue_breakdown.py --benchmark-group-by=param:granularity
+"""
+
+import asyncio
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.features.analytics.adapters.repositories import RevenueAnalyticsRepository
+from app.features.analytics.domain.enums import TimeGranularity
+from app.features.analytics.ports.data_providers import DailyRevenueDTO
+
+START = date(2020, 1, 1)
+
+
+class InMemoryDailyRevenue:
+    """Provider double serving precomputed daily rows."""
+
+    def __init__(self, days: int, count: int):
+        self._rows = [
+            DailyRevenueDTO(START + timedelta(days=i), Decimal("40.00") * count + i % 9, count)
+            for i in range(days)
+            if i % 7  # leave gaps to exercise zero-filling
+        ]
+
+    async def get_daily_revenue(self, start_date, end_date):
+        return [row for row in self._rows if start_date <= row.date <= end_date]
+
+
+def repository(days: int) -> RevenueAnalyticsRepository:
+    return RevenueAnalyticsRepository(InMemoryDailyRevenue(days, 30), InMemoryDailyRevenue(days, 12))
+
+
+def breakdown(days: int, granularity: TimeGranularity = TimeGranularity.DAILY):
+    return asyncio.run(
+        repository(days).get_daily_revenue(START, START + timedelta(days=days - 1), granularity)
+    )
+
+
+def best_of(rounds: int, days: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        breakdown(days)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("granularity", [TimeGranularity.DAILY, TimeGranularity.WEEKLY, TimeGranularity.MONTHLY])
+@pytest.mark.parametrize("years", [1, 4, 16])
+def test_revenue_breakdown(benchmark, years, granularity):
+    days = 365 * years
+    benchmark.extra_info["days"] = days
+    periods = benchmark(breakdown, days, granularity)
+
+    assert sum(p.bookings_count for p in periods) == 30 * sum(1 for i in range(days) if i % 7)
+
+
+@pytest.mark.slow
+def test_breakdown_time_grows_linearly_with_days():
+    breakdown(365)  # warm up
+    short, long = best_of(5, 2 * 365), best_of(5, 16 * 365)
+
+    # 8x the days: linear is ~8x, the old per-day scan was ~64x
+    assert long / short < 20
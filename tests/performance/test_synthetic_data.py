@@ -0,0 +1,86 @@
+"""
+Tests for scripts/generate_perf_data.py.
+
+Loads a small dataset into SQLite and checks that it is reproducible and
+internally consistent, so benchmarks built on it compare like with like.
+"""
+
+import importlib.util
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+SCRIPT = Path(__file__).parents[2] / "scripts" / "generate_perf_data.py"
+
+spec = importlib.util.spec_from_file_location("generate_perf_data", SCRIPT)
+generate_perf_data = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_perf_data)
+
+
+def dataset(**kwargs):
+    options = {"scale": 0.02, "seed": 7, "days": 30, "end_date": date(2025, 6, 30), **kwargs}
+    return generate_perf_data.SyntheticDataset(**options)
+
+
+def bookings(data):
+    list(data.users())
+    list(data.vehicles_rows())
+    data.categories_and_services()
+    return list(data.bookings())
+
+
+def test_same_seed_generates_the_same_rows():
+    assert bookings(dataset()) == bookings(dataset())
+    assert bookings(dataset()) != bookings(dataset(seed=8))
+
+
+def test_volumes_scale_linearly():
+    small, large = bookings(dataset(scale=0.02)), bookings(dataset(scale=0.2))
+
+    assert 8 < len(large) / len(small) < 12
+
+
+def test_booking_totals_match_their_services():
+    for booking, items in bookings(dataset()):
+        assert booking["total_price"] == sum(item["price"] for item in items)
+        assert booking["estimated_duration_minutes"] == sum(item["duration_minutes"] for item in items)
+        assert all(item["booking_id"] == booking["id"] for item in items)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_generate_loads_every_table(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'perf.db'}"
+
+    counts = await generate_perf_data.generate(url, dataset(), batch_size=500, create_tables=True)
+
+    assert set(counts) == {
+        "users", "vehicles", "categories", "services", "bookings", "booking_services",
+        "walkin_services", "walkin_service_items", "staff_members", "attendance_records",
+        "stock_movements", "products", "expenses",
+    }
+    assert all(count > 0 for count in counts.values())
+
+    engine = generate_perf_data.create_async_engine(url)
+    async with engine.connect() as connection:
+        orphans = await connection.scalar(text(
+            "SELECT COUNT(*) FROM booking_services bs "
+            "LEFT JOIN bookings b ON b.id = bs.booking_id WHERE b.id IS NULL"
+        ))
+        movements = (await connection.execute(text(
+            "SELECT product_id, quantity_after FROM stock_movements ORDER BY movement_date, rowid"
+        ))).all()
+        products = dict((await connection.execute(text("SELECT id, current_quantity FROM products"))).all())
+    await engine.dispose()
+
+    assert orphans == 0
+    # Each product ends at the quantity its last movement left it with
+    last = {product_id: quantity for product_id, quantity in movements}
+    for product_id, quantity in last.items():
+        assert Decimal(str(products[product_id])) == Decimal(str(quantity))
+
+    with pytest.raises(RuntimeError):
+        await generate_perf_data.generate(url, dataset())
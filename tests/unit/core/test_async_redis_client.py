@@ -0,0 +1,157 @@
+"""Unit tests for the asyncio Redis client wrapper."""
+
+import json
+from decimal import Decimal
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.cache.async_redis_client import AsyncRedisClient
+
+
+@pytest.fixture
+def fake_redis():
+    """Mocked redis.asyncio client."""
+    mock = MagicMock()
+    mock.get = AsyncMock()
+    mock.setex = AsyncMock(return_value=True)
+    mock.delete = AsyncMock(return_value=1)
+    mock.exists = AsyncMock(return_value=1)
+    mock.incr = AsyncMock(return_value=2)
+    mock.expire = AsyncMock(return_value=True)
+    mock.ping = AsyncMock(return_value=True)
+    return mock
+
+
+@pytest.fixture
+def client(fake_redis):
+    """AsyncRedisClient bound to the mocked connection."""
+    instance = AsyncRedisClient()
+    previous = instance._client
+    instance._client = fake_redis
+    yield instance
+    instance._client = previous
+
+
+class TestAsyncRedisClient:
+    """Test AsyncRedisClient operations."""
+
+    @pytest.mark.asyncio
+    async def test_get_deserializes_json(self, client, fake_redis):
+        fake_redis.get.return_value = json.dumps({"id": "u1"})
+
+        assert await client.get("user:u1") == {"id": "u1"}
+
+    @pytest.mark.asyncio
+    async def test_set_uses_default_ttl(self, client, fake_redis):
+        assert await client.set("key", {"a": 1}) is True
+
+        key, ttl, payload = fake_redis.setex.await_args.args
+        assert key == "key"
+        assert ttl > 0
+        assert client.codec.decode(payload) == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_delete_returns_removed_count(self, client, fake_redis):
+        fake_redis.delete.return_value = 2
+
+        assert await client.delete("a", "b") == 2
+        fake_redis.delete.assert_awaited_once_with("a", "b")
+
+    @pytest.mark.asyncio
+    async def test_errors_are_swallowed(self, client, fake_redis):
+        fake_redis.get.side_effect = ConnectionError("down")
+
+        assert await client.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_scan_iter_yields_keys(self, client, fake_redis):
+        async def scan_iter(match=None, count=100):
+            for key in ("session:1:a", "session:1:b"):
+                yield key
+
+        fake_redis.scan_iter = scan_iter
+
+        keys = [key async for key in client.scan_iter(match="session:1:*")]
+        assert keys == ["session:1:a", "session:1:b"]
+
+    @pytest.mark.asyncio
+    async def test_get_reads_values_written_by_the_codec(self, client, fake_redis):
+        fake_redis.get.return_value = client.codec.encode({"price": Decimal("12.50")})
+
+        assert await client.get("service:s1") == {"price": Decimal("12.50")}
+
+    @pytest.mark.asyncio
+    async def test_mget_decodes_hits_and_keeps_misses(self, client, fake_redis):
+        fake_redis.mget = AsyncMock(return_value=[client.codec.encode({"id": "a"}), None, b"not json"])
+
+        assert await client.mget(["a", "b", "c"]) == [{"id": "a"}, None, None]
+        fake_redis.mget.assert_awaited_once_with(["a", "b", "c"])
+
+    @pytest.mark.asyncio
+    async def test_mset_and_pipeline_use_one_round_trip(self, client, fake_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        fake_redis.pipeline.return_value = pipe
+
+        assert await client.mset({"a": 1, "b": [2]}, ttl=60) is True
+
+        fake_redis.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args[:2] for c in pipe.setex.call_args_list] == [("a", 60), ("b", 60)]
+        assert client.codec.decode(pipe.setex.call_args_list[1].args[2]) == [2]
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_decodes_results_and_isolates_errors(self, client, fake_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[client.codec.encode({"id": "u1"}), ConnectionError("x"), 2])
+        fake_redis.pipeline.return_value = pipe
+
+        batch = client.pipeline()
+        batch.get("user:u1").set("user:u2", {"id": "u2"}).delete("a", "b")
+
+        assert await batch.execute() == [{"id": "u1"}, None, 2]
+        pipe.get.assert_called_once_with("user:u1")
+        pipe.delete.assert_called_once_with("a", "b")
+
+    @pytest.mark.asyncio
+    async def test_tagged_set_registers_key_in_tag_sets(self, client, fake_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, 1, True, 1, True])
+        fake_redis.pipeline.return_value = pipe
+
+        assert await client.set("session:u1:a", {"id": "a"}, ttl=900, tags=["user:u1", "user_sessions:u1"]) is True
+
+        assert [c.args for c in pipe.sadd.call_args_list] == [
+            ("tag:user:u1", "session:u1:a"),
+            ("tag:user_sessions:u1", "session:u1:a"),
+        ]
+        # Tag sets must not expire before their members
+        assert all(c.args[1] >= 900 for c in pipe.expire.call_args_list)
+        fake_redis.setex.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_runs_one_script(self, client, fake_redis):
+        script = AsyncMock(return_value=[b"service:s1", b"popular_services"])
+        fake_redis.register_script.return_value = script
+
+        assert await client.invalidate_tags("services", "category:c1") == ["service:s1", "popular_services"]
+        script.assert_awaited_once_with(keys=["tag:services", "tag:category:c1"])
+
+    @pytest.mark.asyncio
+    async def test_operations_without_connection(self):
+        instance = AsyncRedisClient()
+        previous = instance._client
+        instance._client = None
+        try:
+            assert await instance.get("key") is None
+            assert await instance.set("key", 1) is False
+            assert await instance.delete("key") == 0
+            assert await instance.mget(["a", "b"]) == [None, None]
+            assert await instance.mset({"a": 1}) is False
+            assert await instance.invalidate_tags("services") == []
+            assert await instance.pipeline().get("a").execute() == [None]
+            assert await instance.is_available() is False
+            assert [key async for key in instance.scan_iter()] == []
+        finally:
+            instance._client = previous
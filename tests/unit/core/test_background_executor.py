@@ -0,0 +1,178 @@
+"""Unit tests for the bounded background executor."""
+
+import asyncio
+
+import pytest
+from prometheus_client import CollectorRegistry
+from sqlalchemy import text
+
+from app.core.background import BackgroundExecutor, offload
+from app.core.db import get_db
+from app.core.observability.metrics import MetricsCollector
+
+
+@pytest.fixture
+def metrics():
+    return MetricsCollector(registry=CollectorRegistry())
+
+
+def counted(metrics, status):
+    return metrics.background_tasks.labels(status)._value.get()
+
+
+@pytest.mark.asyncio
+async def test_submitted_work_runs_off_the_caller(metrics):
+    executor = BackgroundExecutor(workers=2, metrics=metrics)
+    done = []
+
+    async def notify(name):
+        await asyncio.sleep(0)
+        done.append(name)
+
+    assert executor.submit(notify, "a")
+    assert executor.submit(lambda: done.append("sync"))
+    assert done == []
+
+    await executor.stop()
+    assert sorted(done) == ["a", "sync"]
+    assert counted(metrics, "completed") == 2
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_work(metrics):
+    executor = BackgroundExecutor(workers=1, max_queue_size=2, metrics=metrics)
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    assert executor.submit(blocked)
+    await asyncio.sleep(0)  # worker picks up the first task
+    assert executor.submit(blocked)
+    assert executor.submit(blocked)
+    assert not executor.submit(blocked)
+    assert executor.queue_depth == 2
+    assert counted(metrics, "rejected") == 1
+
+    release.set()
+    await executor.stop()
+    assert counted(metrics, "completed") == 3
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted_and_do_not_stop_workers(metrics):
+    executor = BackgroundExecutor(workers=1, metrics=metrics)
+    done = []
+
+    async def broken():
+        raise RuntimeError("smtp down")
+
+    executor.submit(broken)
+    executor.submit(done.append, "after")
+    await executor.stop()
+
+    assert done == ["after"]
+    assert counted(metrics, "failed") == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_then_rejects(metrics):
+    executor = BackgroundExecutor(workers=1, metrics=metrics)
+    done = []
+
+    async def slow(i):
+        await asyncio.sleep(0.01)
+        done.append(i)
+
+    for i in range(5):
+        executor.submit(slow, i)
+    await executor.stop()
+
+    assert done == [0, 1, 2, 3, 4]
+    assert not executor.running
+
+
+@pytest.mark.asyncio
+async def test_stop_gives_up_after_drain_timeout(metrics):
+    executor = BackgroundExecutor(workers=1, metrics=metrics)
+
+    async def hang():
+        await asyncio.sleep(60)
+
+    executor.submit(hang)
+    executor.submit(hang)
+    await executor.stop(timeout=0.05)
+
+    assert not executor.running
+
+
+@pytest.mark.asyncio
+async def test_offload_returns_immediately(monkeypatch, metrics):
+    executor = BackgroundExecutor(workers=1, metrics=metrics)
+    monkeypatch.setattr("app.core.background.executor.background_executor", executor)
+    sent = []
+    release = asyncio.Event()
+
+    class Notifier:
+        @offload
+        async def send(self, email):
+            await release.wait()
+            sent.append(email)
+            return True
+
+    notifier = Notifier()
+    assert await notifier.send("a@example.com") is True
+    notifier.send("b@example.com")  # not awaited, still delivered
+    assert sent == []
+
+    release.set()
+    await executor.stop()
+    assert sent == ["a@example.com", "b@example.com"]
+
+
+async def run_request(fail: bool, work) -> None:
+    """Drive get_db the way FastAPI does, calling work() mid-request."""
+    session_dependency = get_db()
+    session = await session_dependency.__anext__()
+    await session.execute(text("SELECT 1"))
+    work()
+    if fail:
+        with pytest.raises(RuntimeError):
+            await session_dependency.athrow(RuntimeError("write failed"))
+    else:
+        with pytest.raises(StopAsyncIteration):
+            await session_dependency.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_request_work_waits_for_the_commit(metrics):
+    executor = BackgroundExecutor(workers=1, metrics=metrics)
+    sent = []
+
+    async def send(email):
+        sent.append(email)
+
+    def work():
+        assert executor.submit_after_commit(send, "a@example.com")
+        assert executor.queue_depth == 0
+
+    await run_request(fail=False, work=work)
+    await executor.stop()
+
+    assert sent == ["a@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_request_work_is_dropped_on_rollback(metrics):
+    executor = BackgroundExecutor(workers=1, metrics=metrics)
+    sent = []
+
+    async def send(email):
+        sent.append(email)
+
+    await run_request(fail=True, work=lambda: executor.submit_after_commit(send, "a@example.com"))
+    await executor.stop()
+    # The next request's commit must not pick it up either
+    await run_request(fail=False, work=lambda: None)
+
+    assert sent == []
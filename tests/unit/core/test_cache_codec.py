@@ -0,0 +1,102 @@
+"""Unit tests for the Redis value codecs."""
+
+import json
+import uuid
+from dataclasses import asdict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+from app.core.cache.codec import Codec, JSONCodec, MsgpackCodec, _enum_name, get_codec, register_enum
+from app.features.services.domain import Service, ServiceStatus
+
+
+class Size(str, Enum):
+    SMALL = "small"
+
+
+@pytest.fixture
+def codec():
+    return MsgpackCodec()
+
+
+def test_msgpack_round_trips_rich_types(codec):
+    value = {
+        "price": Decimal("19.90"),
+        "at": datetime(2025, 3, 1, 9, 30, tzinfo=timezone.utc),
+        "naive": datetime(2025, 3, 1, 9, 30),
+        "day": date(2025, 3, 1),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "status": ServiceStatus.ACTIVE,
+        "size": Size.SMALL,
+        "pair": (1, 2),
+        "by_hour": {9: Decimal("1.5")},
+        "nothing": None,
+    }
+
+    decoded = codec.decode(codec.encode(value))
+
+    assert decoded == {**value, "pair": [1, 2]}
+    assert type(decoded["status"]) is ServiceStatus
+    assert type(decoded["size"]) is Size
+
+
+def test_msgpack_round_trips_entities(codec):
+    service = Service(name="Premium Wash", price=Decimal("25.00"), duration_minutes=45)
+    data = codec.decode(codec.encode(asdict(service)))
+
+    assert Service(**data) == service
+
+
+def test_msgpack_is_smaller_than_json(codec):
+    items = [{"id": i, "name": f"Wash {i}", "price": "25.00", "popular": True} for i in range(50)]
+
+    assert len(codec.encode(items)) < len(JSONCodec().encode(items))
+
+
+def test_codecs_read_each_others_payloads(codec):
+    legacy = json.dumps({"id": "u1"}).encode()
+
+    assert codec.decode(legacy) == {"id": "u1"}
+    assert JSONCodec().decode(codec.encode({"price": Decimal("1.5")})) == {"price": Decimal("1.5")}
+
+
+def test_enum_lookup_never_imports_from_the_payload(codec):
+    payload = codec._pack(["json:dumps", "x"])
+
+    with pytest.raises(ValueError, match="not registered"):
+        codec._ext_hook(5, payload)
+
+
+def test_registered_enums_decode_before_being_encoded(codec):
+    class Shade(Enum):
+        DARK = "dark"
+
+    payload = codec._pack([_enum_name(Shade), "dark"])
+    with pytest.raises(ValueError):
+        codec._ext_hook(5, payload)
+
+    register_enum(Shade)
+
+    assert codec._ext_hook(5, payload) is Shade.DARK
+    with pytest.raises(TypeError):
+        register_enum(str)
+
+
+def test_codec_is_abstract():
+    with pytest.raises(TypeError):
+        Codec()
+
+
+def test_unsupported_values_raise(codec):
+    with pytest.raises(TypeError):
+        codec.encode({"value": object()})
+
+
+def test_get_codec():
+    assert isinstance(get_codec("msgpack"), MsgpackCodec)
+    assert isinstance(get_codec("json"), JSONCodec)
+    with pytest.raises(ValueError):
+        get_codec("pickle")
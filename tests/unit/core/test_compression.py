@@ -0,0 +1,141 @@
+"""Unit tests for the orjson response class and the compression middleware."""
+
+import gzip
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.middleware.compression import CompressionMiddleware, accepts_gzip
+from app.core.responses import FastJSONResponse
+
+LARGE = [{"id": i, "name": f"Wash {i}", "price": "25.00"} for i in range(200)]
+
+
+class Price(BaseModel):
+    amount: Decimal
+    valid_from: date
+
+
+def test_fast_json_response_handles_rich_types():
+    item_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    body = FastJSONResponse({
+        "id": item_id,
+        "price": Decimal("19.90"),
+        "at": datetime(2025, 3, 1, 9, 30),
+        "model": Price(amount=Decimal("5.5"), valid_from=date(2025, 1, 1)),
+        "tags": {"a"},
+    }).body
+
+    assert orjson.loads(body) == {
+        "id": str(item_id),
+        "price": "19.90",
+        "at": "2025-03-01T09:30:00",
+        "model": {"amount": "5.5", "valid_from": "2025-01-01"},
+        "tags": ["a"],
+    }
+
+
+def test_fast_json_response_matches_pydantic_json_mode():
+    price = Price(amount=Decimal("12.50"), valid_from=date(2025, 1, 1))
+
+    assert orjson.loads(FastJSONResponse(price).body) == orjson.loads(price.model_dump_json())
+
+
+def test_fast_json_response_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        FastJSONResponse({"value": object()})
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.5", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+@pytest.fixture
+def client():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    async def large():
+        return LARGE
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse("x" * 1000, headers={"Vary": "Authorization"})
+
+    @app.get("/image")
+    async def image():
+        return PlainTextResponse("x" * 1000, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk {i} ".encode() * 100
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_large_json_is_gzipped(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(orjson.dumps(LARGE))
+    assert response.json() == LARGE
+
+
+def test_small_response_is_not_compressed(client):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"status": "ok"}
+
+
+def test_client_without_gzip_gets_identity(client):
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == LARGE
+
+
+def test_existing_vary_is_extended(client):
+    response = client.get("/text", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Authorization, Accept-Encoding"
+
+
+def test_content_type_outside_allowlist_is_not_compressed(client):
+    response = client.get("/image", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_streaming_response_is_compressed_per_chunk(client):
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode() == "".join(f"chunk {i} " * 100 for i in range(3))
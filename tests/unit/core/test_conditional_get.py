@@ -0,0 +1,175 @@
+"""Unit tests for resource version counters and conditional GET."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.cache import NotModified, ResourceVersions, conditional_get, mark_changed
+from app.core.cache.conditional import etag_matches, make_etag, not_modified_handler
+from app.core.cache.versions import GET_SCRIPT, VERSION_KEY_PREFIX
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the version scripts."""
+
+    def __init__(self):
+        self.values = {}
+
+    def register_script(self, source):
+        async def script(keys, args):
+            result = []
+            for key in keys:
+                self.values.setdefault(key, int(args[0]))
+                if source != GET_SCRIPT:
+                    self.values[key] += 1
+                result.append(self.values[key])
+            return result
+        return script
+
+
+def versions_with(client):
+    return ResourceVersions(redis=MagicMock(client=client))
+
+
+def test_make_etag():
+    assert make_etag(["categories", "services"], [3, 7]) == 'W/"categories.3-services.7"'
+
+
+def test_etag_matches_weakly():
+    etag = 'W/"services.7"'
+    assert etag_matches('W/"services.7"', etag)
+    assert etag_matches('"services.7"', etag)
+    assert etag_matches('"other", W/"services.7"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"services.6"', etag)
+    assert not etag_matches(None, etag)
+
+
+@pytest.mark.asyncio
+async def test_bump_changes_version():
+    versions = versions_with(FakeRedis())
+
+    first = await versions.get("services")
+    assert await versions.get("services") == first
+    assert await versions.bump("services")
+    assert await versions.get("services") == [first[0] + 1]
+
+
+@pytest.mark.asyncio
+async def test_versions_unavailable_without_redis():
+    versions = versions_with(None)
+
+    assert await versions.get("services") is None
+    assert await versions.bump("services") is False
+
+
+@pytest.mark.asyncio
+async def test_versions_unavailable_on_redis_error():
+    client = MagicMock()
+    client.register_script.return_value = AsyncMock(side_effect=ConnectionError("down"))
+    versions = versions_with(client)
+
+    assert await versions.get("services") is None
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def bump(monkeypatch):
+    bump = AsyncMock(return_value=True)
+    monkeypatch.setattr("app.core.cache.versions.resource_versions.bump", bump)
+    return bump
+
+
+@pytest.mark.asyncio
+async def test_versions_bumped_after_commit(session_factory, bump):
+    async with session_factory() as session:
+        mark_changed(session, "services")
+        mark_changed(session, "categories", "services")
+        bump.assert_not_called()
+        await session.commit()
+    await asyncio.sleep(0)
+
+    bump.assert_awaited_once_with("categories", "services")
+
+
+@pytest.mark.asyncio
+async def test_versions_not_bumped_after_rollback(session_factory, bump):
+    async with session_factory() as session:
+        await session.execute(text("SELECT 1"))
+        mark_changed(session, "services")
+        await session.rollback()
+        await session.commit()
+    await asyncio.sleep(0)
+
+    bump.assert_not_called()
+
+
+def make_app():
+    app = FastAPI()
+    app.add_exception_handler(NotModified, not_modified_handler)
+    calls = []
+
+    @app.get("/services", dependencies=[Depends(conditional_get("services"))])
+    async def list_services():
+        calls.append(1)
+        return {"items": []}
+
+    return app, calls
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr("app.core.cache.conditional.resource_versions", versions_with(redis))
+    return redis
+
+
+def test_conditional_get_returns_304_for_current_copy(redis):
+    app, calls = make_app()
+    client = TestClient(app)
+
+    response = client.get("/services")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert response.headers["vary"] == "Authorization"
+    etag = response.headers["etag"]
+
+    response = client.get("/services", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert len(calls) == 1
+
+
+def test_conditional_get_returns_200_after_bump(redis):
+    app, _ = make_app()
+    client = TestClient(app)
+    etag = client.get("/services").headers["etag"]
+
+    redis.values[f"{VERSION_KEY_PREFIX}services"] += 1
+    response = client.get("/services", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_conditional_get_without_redis_serves_full_response(monkeypatch):
+    monkeypatch.setattr("app.core.cache.conditional.resource_versions", versions_with(None))
+    app, _ = make_app()
+
+    response = TestClient(app).get("/services", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
@@ -0,0 +1,144 @@
+"""Unit tests for the asyncio distributed lock."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.cache.distributed_lock import (
+    ACQUIRE_SCRIPT,
+    EXTEND_SCRIPT,
+    FENCING_COUNTER_KEY,
+    RELEASE_SCRIPT,
+    DistributedLock,
+    LockAcquisitionError,
+)
+
+
+@pytest.fixture
+def scripts():
+    return {
+        ACQUIRE_SCRIPT: AsyncMock(return_value=7),
+        RELEASE_SCRIPT: AsyncMock(return_value=1),
+        EXTEND_SCRIPT: AsyncMock(return_value=1),
+    }
+
+
+@pytest.fixture
+def redis(scripts):
+    client = MagicMock()
+    client.register_script.side_effect = lambda source: scripts[source]
+    client.get = AsyncMock()
+    return MagicMock(client=client)
+
+
+@pytest.mark.asyncio
+async def test_acquire_issues_fencing_token(redis, scripts):
+    lock = DistributedLock("booking:1", timeout=30, redis=redis)
+
+    assert await lock.acquire() is True
+
+    assert lock.fencing_token == 7
+    scripts[ACQUIRE_SCRIPT].assert_awaited_once_with(
+        keys=["lock:booking:1", FENCING_COUNTER_KEY], args=[lock.owner, 30000]
+    )
+
+
+@pytest.mark.asyncio
+async def test_fails_closed_without_redis():
+    lock = DistributedLock("booking:1", redis=MagicMock(client=None))
+
+    assert await lock.acquire() is False
+
+
+@pytest.mark.asyncio
+async def test_fails_closed_on_redis_error(redis, scripts):
+    scripts[ACQUIRE_SCRIPT].side_effect = ConnectionError("down")
+
+    assert await DistributedLock("booking:1", redis=redis).acquire() is False
+
+
+@pytest.mark.asyncio
+async def test_blocking_acquire_backs_off_exponentially(redis, scripts):
+    scripts[ACQUIRE_SCRIPT].side_effect = [0, 0, 0, 9]
+    lock = DistributedLock("k", redis=redis, initial_backoff=0.01, max_backoff=0.02)
+    sleep = AsyncMock()
+
+    with patch("app.core.cache.distributed_lock.asyncio.sleep", sleep), \
+            patch("app.core.cache.distributed_lock.random.uniform", return_value=1.0):
+        assert await lock.acquire() is True
+
+    assert [call.args[0] for call in sleep.await_args_list] == [0.01, 0.02, 0.02]
+    assert lock.fencing_token == 9
+
+
+@pytest.mark.asyncio
+async def test_non_blocking_acquire_does_not_wait(redis, scripts):
+    scripts[ACQUIRE_SCRIPT].return_value = 0
+
+    assert await DistributedLock("k", blocking=False, redis=redis).acquire() is False
+    scripts[ACQUIRE_SCRIPT].assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_blocking_acquire_times_out(redis, scripts):
+    scripts[ACQUIRE_SCRIPT].return_value = 0
+    lock = DistributedLock("k", blocking_timeout=0.05, redis=redis)
+
+    assert await lock.acquire() is False
+
+
+@pytest.mark.asyncio
+async def test_release_and_validate_use_owner_and_token(redis, scripts):
+    lock = DistributedLock("k", redis=redis)
+    await lock.acquire()
+
+    redis.client.get.return_value = f"{lock.owner}:7".encode()
+    assert await lock.validate() is True
+    redis.client.get.return_value = b"someone-else:8"
+    assert await lock.validate() is False
+
+    assert await lock.release() is True
+    scripts[RELEASE_SCRIPT].assert_awaited_once_with(keys=["lock:k"], args=[f"{lock.owner}:7"])
+
+
+@pytest.mark.asyncio
+async def test_auto_renew_extends_until_lease_is_lost(redis, scripts):
+    scripts[EXTEND_SCRIPT].side_effect = [1, 0]
+    lock = DistributedLock("k", timeout=0.03, auto_renew=True, redis=redis)
+
+    await lock.acquire()
+    await asyncio.sleep(0.06)
+
+    assert scripts[EXTEND_SCRIPT].await_count == 2
+    assert lock.lost is True
+    assert await lock.validate() is False
+    await lock.release()
+
+
+@pytest.mark.asyncio
+async def test_context_manager_raises_when_not_acquired(redis, scripts):
+    scripts[ACQUIRE_SCRIPT].return_value = 0
+
+    with pytest.raises(LockAcquisitionError):
+        async with DistributedLock("k", blocking=False, redis=redis):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_booking_locks_are_not_renewed_and_are_released_at_teardown(redis, scripts):
+    from app.features.bookings.api.dependencies import get_booking_lock_service
+
+    dependency = get_booking_lock_service(redis)
+    service = await dependency.__anext__()
+    lock_id = await service.acquire_booking_lock("b1", timeout=30)
+    assert lock_id
+
+    # A fixed lease: a lock that is never released still expires
+    assert service._locks[lock_id].auto_renew is False
+
+    # The request ends without releasing the lock
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    scripts[RELEASE_SCRIPT].assert_awaited_once()
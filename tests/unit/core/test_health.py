@@ -0,0 +1,84 @@
+"""Unit tests for the cached, non-blocking health checks."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.observability.health import HealthChecker
+
+
+@pytest.fixture
+def checker():
+    return HealthChecker()
+
+
+@pytest.mark.asyncio
+async def test_check_system_reads_cached_snapshot(checker):
+    with patch("app.core.observability.health.psutil") as psutil:
+        assert (await checker.check_system())["status"] == "unknown"
+
+        psutil.cpu_percent.return_value = 12.0
+        psutil.virtual_memory.return_value.percent = 40.0
+        psutil.disk_usage.return_value.percent = 55.0
+        checker._system = checker.sample_system()
+        psutil.reset_mock()
+
+        system = await checker.check_system()
+
+    assert system["cpu_percent"] == 12.0
+    assert system["status"] == "healthy"
+    assert system["age_seconds"] >= 0
+    psutil.cpu_percent.assert_not_called()
+
+
+def test_sample_system_never_blocks_on_cpu():
+    with patch("app.core.observability.health.psutil") as psutil:
+        psutil.cpu_percent.return_value = 95.0
+        psutil.virtual_memory.return_value.percent = 10.0
+        psutil.disk_usage.return_value.percent = 10.0
+
+        assert HealthChecker.sample_system()["status"] == "degraded"
+
+    psutil.cpu_percent.assert_called_once_with(interval=None)
+
+
+@pytest.mark.asyncio
+async def test_sampler_refreshes_snapshot(checker):
+    with patch("app.core.observability.health.settings.health_sample_interval", 0.01):
+        await checker.start()
+        await asyncio.sleep(0.05)
+        await checker.stop()
+
+    assert "cpu_percent" in await checker.check_system()
+
+
+@pytest.mark.asyncio
+async def test_check_database_measures_latency(checker):
+    result = await checker.check_database()
+
+    assert result["status"] == "healthy"
+    assert result["latency_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_check_redis_reports_latency_and_saturation(checker):
+    pool = MagicMock(_in_use_connections={1, 2}, max_connections=8)
+    redis = MagicMock(is_available=AsyncMock(return_value=True), client=MagicMock(connection_pool=pool))
+
+    with patch("app.core.observability.health.settings.redis_url", "redis://test"), \
+            patch("app.core.cache.async_redis_client.async_redis_client", redis):
+        result = await checker.check_redis()
+
+    assert result["status"] == "healthy"
+    assert result["pool_saturation"] == 0.25
+    assert result["latency_ms"] >= 0
+
+
+def test_liveness_does_no_io():
+    with patch("app.core.observability.health.engine") as engine, \
+            patch("app.core.observability.health.psutil") as psutil:
+        assert HealthChecker.get_liveness_status()["status"] == "alive"
+
+    assert not engine.mock_calls
+    assert not psutil.mock_calls
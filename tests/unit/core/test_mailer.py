@@ -0,0 +1,174 @@
+"""Unit tests for pooled SMTP delivery and the queued mailer, against an in-process SMTP server."""
+
+import asyncio
+import socket
+
+import aiosmtplib
+import pytest
+import pytest_asyncio
+from aiosmtpd.controller import Controller
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.db import OutboxDispatcher, OutboxEventModel
+from app.core.events import EventBus
+from app.core.mail import MAIL_EVENT, Mailer, SMTPConnectionPool
+
+
+class RecordingHandler:
+    """Accepts every message and records which SMTP session delivered it."""
+
+    def __init__(self):
+        self.messages = []
+        self.sessions = set()
+        self.rcpt_reply = None
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if self.rcpt_reply:
+            return self.rcpt_reply
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        self.messages.append(envelope.content.decode())
+        return "250 Message accepted"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+@pytest.fixture
+def pool(smtp_server):
+    controller, _ = smtp_server
+    return SMTPConnectionPool(controller.hostname, controller.port, start_tls=False, size=2, timeout=5)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(OutboxEventModel.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+def make_mailer(pool, session_factory=None):
+    return Mailer(pool, "noreply@blingauto.com", "BlingAuto", session_factory=session_factory)
+
+
+def message(mailer, to="user@example.com", subject="Hello"):
+    return mailer.build_message(to, subject, "<p>Hi</p>", "Hi")
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_one_connection_for_consecutive_messages(smtp_server, pool):
+    _, handler = smtp_server
+    mailer = make_mailer(pool)
+
+    for i in range(5):
+        await pool.send(message(mailer, subject=f"Message {i}"))
+    await pool.close()
+
+    assert len(handler.messages) == 5
+    assert len(handler.sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrent_connections(smtp_server, pool):
+    _, handler = smtp_server
+    mailer = make_mailer(pool)
+
+    await asyncio.gather(*(pool.send(message(mailer, subject=f"Message {i}")) for i in range(10)))
+    await pool.close()
+
+    assert len(handler.messages) == 10
+    assert len(handler.sessions) <= 2
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_idle_connections(smtp_server):
+    controller, handler = smtp_server
+    pool = SMTPConnectionPool(controller.hostname, controller.port, start_tls=False, idle_timeout=0)
+    mailer = make_mailer(pool)
+
+    await pool.send(message(mailer))
+    await pool.send(message(mailer))
+    await pool.close()
+
+    assert len(handler.sessions) == 2
+
+
+@pytest.mark.asyncio
+async def test_queued_email_is_sent_by_the_outbox_dispatcher(smtp_server, pool, session_factory):
+    _, handler = smtp_server
+    mailer = make_mailer(pool, session_factory)
+    bus = EventBus()
+    bus.subscribe(MAIL_EVENT, mailer.deliver)
+
+    for i in range(3):
+        assert await mailer.enqueue(f"user{i}@example.com", "Verify Your Email", "<p>Hi</p>", "Hi")
+    assert handler.messages == []
+
+    dispatcher = OutboxDispatcher(bus=bus, session_factory=session_factory)
+    assert await dispatcher.dispatch_batch() == 3
+    await pool.close()
+
+    assert len(handler.messages) == 3
+    assert all("Subject: Verify Your Email" in m for m in handler.messages)
+    assert len(handler.sessions) <= 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_in_caller_transaction(pool, session_factory):
+    mailer = make_mailer(pool, session_factory)
+
+    async with session_factory() as session:
+        assert await mailer.enqueue("user@example.com", "Reset", "<p>Hi</p>", "Hi", session=session)
+        await session.rollback()
+
+    async with session_factory() as session:
+        rows = (await session.execute(select(OutboxEventModel))).scalars().all()
+    assert rows == []
+
+
+@pytest.mark.asyncio
+async def test_permanent_rejection_is_dropped(smtp_server, pool):
+    _, handler = smtp_server
+    handler.rcpt_reply = "550 No such user"
+    mailer = make_mailer(pool)
+
+    await mailer.deliver({"to_email": "ghost@example.com", "subject": "Hi", "html_body": "", "text_body": "Hi"})
+    await pool.close()
+
+    assert handler.messages == []
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_raised_for_retry(smtp_server, pool):
+    _, handler = smtp_server
+    handler.rcpt_reply = "451 Try again later"
+    mailer = make_mailer(pool)
+
+    with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+        await mailer.deliver({"to_email": "user@example.com", "subject": "Hi", "html_body": "", "text_body": "Hi"})
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_without_smtp_configured():
+    mailer = make_mailer(None)
+
+    assert await mailer.enqueue("user@example.com", "Hi", "<p>Hi</p>", "Hi") is False
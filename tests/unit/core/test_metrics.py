@@ -0,0 +1,124 @@
+"""Unit tests for the Prometheus metrics collector."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from unittest.mock import MagicMock, patch
+
+from app.core.cache.near_cache import NearCache
+from app.core.middleware import RequestPipelineMiddleware
+from app.core.observability.metrics import MetricsCollector, _bucket_quantile
+
+
+@pytest.fixture
+def collector():
+    return MetricsCollector()
+
+
+def test_render_exposes_histogram_buckets(collector):
+    collector.record_request("/api/v1/bookings/{booking_id}", "GET", 200, 0.03)
+
+    body, content_type = collector.render()
+    text = body.decode()
+
+    assert content_type.startswith("text/plain")
+    assert 'http_requests_total{method="GET",route="/api/v1/bookings/{booking_id}",status="200"} 1.0' in text
+    assert 'http_request_duration_seconds_bucket{le="0.05",method="GET",route="/api/v1/bookings/{booking_id}"} 1.0' in text
+    assert 'http_request_duration_seconds_bucket{le="0.025",method="GET",route="/api/v1/bookings/{booking_id}"} 0.0' in text
+
+
+def test_get_metrics_estimates_percentiles(collector):
+    for _ in range(95):
+        collector.record_request("/items", "GET", 200, 0.004)
+    for _ in range(5):
+        collector.record_request("/items", "GET", 500, 0.8)
+
+    summary = collector.get_metrics()
+
+    assert summary["requests"] == {"GET:/items:200": 95, "GET:/items:500": 5}
+    durations = summary["durations"]["GET:/items"]
+    assert durations["count"] == 100
+    assert durations["p50_ms"] <= 5
+    assert 500 <= durations["p99_ms"] <= 1000
+
+
+def test_bucket_quantile_interpolates():
+    buckets = [(0.1, 50.0), (0.2, 100.0), (float("inf"), 100.0)]
+
+    assert _bucket_quantile(0.5, buckets) == pytest.approx(0.1)
+    assert _bucket_quantile(0.75, buckets) == pytest.approx(0.15)
+    assert _bucket_quantile(0.5, [(float("inf"), 0.0)]) is None
+
+
+def test_reset_clears_series(collector):
+    collector.record_request("/items", "GET", 200, 0.01)
+    collector.record_error("ValueError")
+
+    collector.reset()
+
+    assert collector.get_metrics()["requests"] == {}
+    assert collector.get_metrics()["errors"] == {}
+
+
+def test_sample_pools_reads_redis_pool(collector):
+    pool = MagicMock(_in_use_connections={1, 2}, _available_connections=[3])
+    redis = MagicMock(client=MagicMock(connection_pool=pool))
+
+    with patch("app.core.observability.metrics.async_redis_client", redis):
+        collector.sample_pools()
+
+    text = collector.render()[0].decode()
+    assert 'redis_pool_connections{state="in_use"} 2.0' in text
+    assert 'redis_pool_connections{state="idle"} 1.0' in text
+
+
+def test_sample_near_cache_exports_local_tier_stats(collector):
+    cache = NearCache(redis=MagicMock(), max_entries=2, local_ttl=30, enabled=True)
+    cache.local.set("a", 1)
+    cache.local.get("a")
+    cache.local.get("b")
+    collector.sample_near_cache(cache)
+    cache.local.set("b", 2)
+    cache.local.set("c", 3)
+    cache.local.get("c")
+    collector.sample_near_cache(cache)
+
+    text = collector.render()[0].decode()
+    assert "near_cache_hits_total 2.0" in text
+    assert "near_cache_misses_total 1.0" in text
+    assert "near_cache_evictions_total 1.0" in text
+    assert "near_cache_entries 2.0" in text
+    assert "near_cache_max_entries 2.0" in text
+
+
+@pytest.mark.asyncio
+async def test_sampler_records_event_loop_lag(collector):
+    with patch("app.core.observability.metrics.settings.metrics_sample_interval", 0.01):
+        await collector.start()
+        await asyncio.sleep(0.05)
+        await collector.stop()
+
+    assert "event_loop_lag_seconds" in collector.render()[0].decode()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_records_route_template(collector):
+    app = FastAPI()
+
+    @app.get("/bookings/{booking_id}")
+    async def get_booking(booking_id: str):
+        return {"id": booking_id}
+
+    transport = httpx.ASGITransport(app=RequestPipelineMiddleware(app))
+    with patch("app.core.middleware.pipeline.metrics_collector", collector):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/bookings/1")
+            await client.get("/bookings/2")
+            await client.get("/nope")
+
+    assert collector.get_metrics()["requests"] == {
+        "GET:/bookings/{booking_id}:200": 2,
+        "GET:unmatched:404": 1,
+    }
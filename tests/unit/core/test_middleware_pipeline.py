@@ -0,0 +1,95 @@
+"""Unit tests for the fused ASGI request pipeline middleware."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.middleware import RequestPipelineMiddleware
+
+
+async def echo_request_id(request: Request):
+    return PlainTextResponse(request.state.request_id, headers={"Server": "uvicorn"})
+
+
+def build_app():
+    app = Starlette(routes=[
+        Route("/echo", echo_request_id),
+        Route("/health", echo_request_id),
+    ])
+    return RequestPipelineMiddleware(app)
+
+
+async def call(path, headers=None):
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers=headers)
+
+
+@pytest.fixture
+def rate_limit(monkeypatch):
+    monkeypatch.setattr("app.core.middleware.pipeline.settings.rate_limit_enabled", True)
+    check = AsyncMock(return_value=(True, 41, None))
+    with patch("app.core.middleware.pipeline.rate_limiter.check_ip_rate_limit", check):
+        yield check
+
+
+@pytest.mark.asyncio
+async def test_generates_request_id_visible_to_endpoint():
+    response = await call("/echo")
+
+    assert response.headers["X-Request-ID"]
+    assert response.text == response.headers["X-Request-ID"]
+    assert float(response.headers["X-Process-Time"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_reuses_incoming_request_id():
+    response = await call("/echo", headers={"X-Request-ID": "abc-123"})
+
+    assert response.text == "abc-123"
+    assert response.headers["X-Request-ID"] == "abc-123"
+
+
+@pytest.mark.asyncio
+async def test_applies_security_headers_and_strips_server():
+    response = await call("/echo")
+
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert "default-src 'self'" in response.headers["Content-Security-Policy"]
+    assert "server" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_allowed_request_gets_rate_limit_headers(rate_limit):
+    response = await call("/echo")
+
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Remaining"] == "41"
+    rate_limit.assert_awaited_once_with("127.0.0.1")
+
+
+@pytest.mark.asyncio
+async def test_rejected_request_short_circuits(rate_limit):
+    rate_limit.return_value = (False, 0, None)
+
+    response = await call("/echo", headers={"X-Request-ID": "limited"})
+
+    assert response.status_code == 429
+    assert response.json()["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+    assert response.headers["Retry-After"] == "60"
+    assert response.headers["X-Request-ID"] == "limited"
+    assert response.headers["X-Frame-Options"] == "DENY"
+
+
+@pytest.mark.asyncio
+async def test_health_checks_are_not_rate_limited(rate_limit):
+    response = await call("/health")
+
+    assert response.status_code == 200
+    rate_limit.assert_not_awaited()
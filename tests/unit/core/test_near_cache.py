@@ -0,0 +1,172 @@
+"""Unit tests for the two-tier near cache."""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.cache.near_cache import LocalLRUCache, NearCache
+
+
+class TestLocalLRUCache:
+    """Test the bounded in-process LRU."""
+
+    def test_evicts_least_recently_used(self):
+        cache = LocalLRUCache(max_entries=2, default_ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_expired_entries_count_as_misses(self):
+        cache = LocalLRUCache(max_entries=10, default_ttl=60)
+        with patch("app.core.cache.near_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=5)
+        with patch("app.core.cache.near_cache.time.monotonic", return_value=106.0):
+            assert cache.get("a") is None
+
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["expirations"] == 1
+        assert stats["size"] == 0
+
+    def test_ttl_is_capped_by_default_ttl(self):
+        cache = LocalLRUCache(max_entries=10, default_ttl=5)
+        with patch("app.core.cache.near_cache.time.monotonic", return_value=0.0):
+            cache.set("a", 1, ttl=3600)
+        with patch("app.core.cache.near_cache.time.monotonic", return_value=6.0):
+            assert cache.get("a") is None
+
+
+@pytest.fixture
+def redis():
+    """Mocked AsyncRedisClient with a publish-capable raw client."""
+    mock = MagicMock()
+    mock.get = AsyncMock(return_value={"id": "u1"})
+    mock.set = AsyncMock(return_value=True)
+    mock.delete = AsyncMock(return_value=1)
+    mock.mget = AsyncMock(side_effect=lambda keys: [{"id": key} for key in keys])
+    mock.mset = AsyncMock(return_value=True)
+    mock.invalidate_tags = AsyncMock(return_value=["user:u1", "session:u1:a"])
+    mock.client = MagicMock()
+    mock.client.publish = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def cache(redis):
+    return NearCache(redis=redis, max_entries=10, local_ttl=30, channel="test:inv", enabled=True)
+
+
+class TestNearCache:
+    """Test read-through, write-through and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_locally(self, cache, redis):
+        assert await cache.get("user:u1") == {"id": "u1"}
+        assert await cache.get("user:u1") == {"id": "u1"}
+
+        redis.get.assert_awaited_once_with("user:u1")
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_publishes_invalidation(self, cache, redis):
+        await cache.set("user:u1", {"id": "u1"}, ttl=300)
+
+        channel, payload = redis.client.publish.await_args.args
+        assert channel == "test:inv"
+        assert json.loads(payload) == {"origin": cache.node_id, "keys": ["user:u1"]}
+        assert await cache.get("user:u1") == {"id": "u1"}
+        redis.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_local_copy(self, cache, redis):
+        await cache.get("user:u1")
+        cache._handle_message(json.dumps({"origin": "other-node", "keys": ["user:u1"]}))
+        await cache.get("user:u1")
+
+        assert redis.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_own_messages_are_ignored(self, cache, redis):
+        await cache.get("user:u1")
+        cache._handle_message(json.dumps({"origin": cache.node_id, "keys": ["user:u1"]}))
+        await cache.get("user:u1")
+
+        redis.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_read_skips_local_fill(self, cache, redis):
+        async def racing_get(key):
+            cache._handle_message(json.dumps({"origin": "other-node", "keys": [key]}))
+            return {"id": "stale"}
+
+        redis.get.side_effect = racing_get
+
+        assert await cache.get("user:u1") == {"id": "stale"}
+        assert "user:u1" not in cache.local
+
+    @pytest.mark.asyncio
+    async def test_local_delete_during_read_skips_local_fill(self, cache, redis):
+        async def racing_get(key):
+            # Another request on this worker deletes the key mid-read
+            await cache.delete(key)
+            return {"id": "deleted"}
+
+        redis.get.side_effect = racing_get
+
+        await cache.get("user:u1")
+        assert "user:u1" not in cache.local
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_not_kept_locally(self, cache, redis):
+        await cache.get("user:u1")
+        redis.set.return_value = False
+
+        assert await cache.set("user:u1", {"id": "new"}, ttl=300) is False
+
+        assert "user:u1" not in cache.local
+        redis.client.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_clears_local_and_redis(self, cache, redis):
+        await cache.get("user:u1")
+        await cache.delete("user:u1")
+
+        redis.delete.assert_awaited_once_with("user:u1")
+        assert "user:u1" not in cache.local
+
+    @pytest.mark.asyncio
+    async def test_get_many_fetches_only_local_misses(self, cache, redis):
+        await cache.get("user:u1")
+
+        values = await cache.get_many(["user:u1", "user:u2", "user:u3"])
+
+        assert values == [{"id": "u1"}, {"id": "user:u2"}, {"id": "user:u3"}]
+        redis.mget.assert_awaited_once_with(["user:u2", "user:u3"])
+        assert "user:u2" in cache.local
+
+    @pytest.mark.asyncio
+    async def test_set_many_writes_once_and_publishes_once(self, cache, redis):
+        await cache.set_many({"user:u1": {"id": "u1"}, "user:u2": {"id": "u2"}}, ttl=300)
+
+        redis.mset.assert_awaited_once_with({"user:u1": {"id": "u1"}, "user:u2": {"id": "u2"}}, ttl=300, tags=())
+        channel, payload = redis.client.publish.await_args.args
+        assert json.loads(payload)["keys"] == ["user:u1", "user:u2"]
+        assert await cache.get_many(["user:u1", "user:u2"]) == [{"id": "u1"}, {"id": "u2"}]
+        redis.mget.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_drops_members_everywhere(self, cache, redis):
+        await cache.set("user:u1", {"id": "u1"}, ttl=300, tags=["user:u1"])
+        redis.set.assert_awaited_once_with("user:u1", {"id": "u1"}, ttl=300, tags=["user:u1"])
+
+        assert await cache.invalidate_tags("user:u1") == 2
+
+        redis.invalidate_tags.assert_awaited_once_with("user:u1")
+        assert "user:u1" not in cache.local
+        channel, payload = redis.client.publish.await_args.args
+        assert json.loads(payload)["keys"] == ["user:u1", "session:u1:a"]
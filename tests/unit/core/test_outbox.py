@@ -0,0 +1,218 @@
+"""Unit tests for the transactional outbox and its dispatcher."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.db import OutboxDispatcher, OutboxEventModel, OutboxPublisher, UnitOfWork
+from app.core.events import EventBus, EventDeliveryError
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(OutboxEventModel.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def publish(session_factory, *events, fail=False):
+    async with session_factory() as session:
+        try:
+            async with UnitOfWork(session=session):
+                publisher = OutboxPublisher(session)
+                for name, data in events:
+                    await publisher.publish(name, data)
+                if fail:
+                    raise RuntimeError("business change failed")
+        except RuntimeError:
+            pass
+
+
+async def outbox_rows(session_factory):
+    async with session_factory() as session:
+        result = await session.execute(select(OutboxEventModel).order_by(OutboxEventModel.id))
+        return result.scalars().all()
+
+
+def dispatcher(bus, session_factory, **kwargs):
+    kwargs.setdefault("base_backoff", 0)
+    return OutboxDispatcher(bus=bus, session_factory=session_factory, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_publish_commits_with_the_unit_of_work(session_factory):
+    await publish(session_factory, ("booking.created", {"booking_id": "b1", "total": 12.5}))
+    await publish(session_factory, ("booking.created", {"booking_id": "b2"}), fail=True)
+
+    rows = await outbox_rows(session_factory)
+    assert [row.event_name for row in rows] == ["booking.created"]
+    assert rows[0].status == "pending"
+    assert '"booking_id": "b1"' in rows[0].payload
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_delivers_pending_events(session_factory):
+    bus = EventBus()
+    received = []
+
+    async def on_created(data):
+        received.append(data["booking_id"])
+
+    bus.subscribe("booking.created", on_created)
+    await publish(
+        session_factory,
+        ("booking.created", {"booking_id": "b1"}),
+        ("booking.created", {"booking_id": "b2"}),
+    )
+
+    assert await dispatcher(bus, session_factory).dispatch_batch() == 2
+    assert sorted(received) == ["b1", "b2"]
+    rows = await outbox_rows(session_factory)
+    assert all(row.status == "dispatched" and row.dispatched_at for row in rows)
+
+    # Dispatched events are not delivered again
+    assert await dispatcher(bus, session_factory).dispatch_batch() == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_respects_batch_size(session_factory):
+    await publish(session_factory, *[("vehicle.created", {"n": i}) for i in range(5)])
+
+    assert await dispatcher(EventBus(), session_factory, batch_size=2).dispatch_batch() == 2
+    rows = await outbox_rows(session_factory)
+    assert [row.status for row in rows] == ["dispatched"] * 2 + ["pending"] * 3
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried_then_given_up(session_factory):
+    bus = EventBus()
+    calls = []
+
+    def flaky(data):
+        calls.append(data)
+        raise ValueError("smtp down")
+
+    bus.subscribe("booking.cancelled", flaky)
+    await publish(session_factory, ("booking.cancelled", {"booking_id": "b1"}))
+    outbox = dispatcher(bus, session_factory, max_attempts=3)
+
+    for _ in range(3):
+        assert await outbox.dispatch_batch() == 1
+    assert await outbox.dispatch_batch() == 0
+
+    assert len(calls) == 3
+    row = (await outbox_rows(session_factory))[0]
+    assert row.status == "failed"
+    assert row.attempts == 3
+    assert "smtp down" in row.last_error
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_for_backoff(session_factory):
+    bus = EventBus()
+    bus.subscribe("booking.cancelled", lambda data: 1 / 0)
+    await publish(session_factory, ("booking.cancelled", {"booking_id": "b1"}))
+    outbox = dispatcher(bus, session_factory, base_backoff=60)
+
+    assert await outbox.dispatch_batch() == 1
+    assert await outbox.dispatch_batch() == 0
+
+
+@pytest.mark.asyncio
+async def test_claim_commits_before_delivery(session_factory):
+    bus = EventBus()
+    seen = []
+
+    async def on_created(data):
+        # The claim is visible to other sessions while the handler runs
+        seen.extend((row.status, row.attempts) for row in await outbox_rows(session_factory))
+
+    bus.subscribe("booking.created", on_created)
+    await publish(session_factory, ("booking.created", {"booking_id": "b1"}))
+
+    assert await dispatcher(bus, session_factory).dispatch_batch() == 1
+    assert seen == [("in_flight", 1)]
+    assert (await outbox_rows(session_factory))[0].status == "dispatched"
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_claimed_again(session_factory):
+    await publish(session_factory, ("booking.created", {"booking_id": "b1"}))
+    outbox = dispatcher(EventBus(), session_factory, lease=60)
+
+    # A worker claimed the row and died before recording the outcome
+    assert len(await outbox._claim()) == 1
+    assert await outbox.dispatch_batch() == 0
+
+    async with session_factory() as session:
+        await session.execute(
+            update(OutboxEventModel).values(available_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        await session.commit()
+
+    assert await outbox.dispatch_batch() == 1
+    row = (await outbox_rows(session_factory))[0]
+    assert (row.status, row.attempts) == ("dispatched", 2)
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_only_old_dispatched_events(session_factory):
+    bus = EventBus()
+    bus.subscribe("booking.cancelled", lambda data: 1 / 0)
+    await publish(
+        session_factory,
+        ("booking.created", {"booking_id": "old"}),
+        ("booking.created", {"booking_id": "new"}),
+        ("booking.cancelled", {"booking_id": "failed"}),
+    )
+    outbox = dispatcher(bus, session_factory, max_attempts=1, retention=timedelta(days=7))
+    await outbox.dispatch_batch()
+
+    async with session_factory() as session:
+        await session.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.payload.contains('"old"'))
+            .values(dispatched_at=datetime.now(timezone.utc) - timedelta(days=8))
+        )
+        await session.commit()
+
+    assert await outbox.purge() == 1
+    rows = await outbox_rows(session_factory)
+    assert [(row.status, row.payload) for row in rows] == [
+        ("dispatched", '{"booking_id": "new"}'),
+        ("failed", '{"booking_id": "failed"}'),
+    ]
+
+
+def test_backoff_grows_exponentially_with_cap():
+    outbox = OutboxDispatcher(base_backoff=1, max_backoff=10)
+
+    assert 0.5 <= outbox.backoff(1) <= 1
+    assert 2 <= outbox.backoff(3) <= 4
+    assert 5 <= outbox.backoff(10) <= 10
+
+
+@pytest.mark.asyncio
+async def test_event_bus_deliver_raises_on_handler_failure():
+    bus = EventBus()
+    received = []
+
+    async def ok(data):
+        received.append(data)
+
+    def broken(data):
+        raise RuntimeError("boom")
+
+    bus.subscribe("service.created", ok)
+    bus.subscribe("service.created", broken)
+
+    with pytest.raises(EventDeliveryError, match="broken: boom"):
+        await bus.deliver("service.created", {"id": 1})
+    assert received == [{"id": 1}]
+
+    await bus.deliver("service.unknown", {})
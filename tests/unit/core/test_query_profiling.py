@@ -0,0 +1,142 @@
+"""Unit tests for per-request SQL profiling and N+1 detection."""
+
+import logging
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.db import QueryBudgetExceeded, assert_query_budget, profile_queries
+from app.core.db.profiling import statement_shape
+from app.core.middleware import RequestPipelineMiddleware
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        for i in range(5):
+            await conn.execute(text("INSERT INTO items (id, name) VALUES (:id, :name)"), {"id": i, "name": f"item {i}"})
+    yield engine
+    await engine.dispose()
+
+
+async def select_each(engine, n):
+    async with engine.connect() as conn:
+        for i in range(n):
+            await conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": i})
+
+
+def test_statement_shape_ignores_parameters():
+    assert statement_shape("SELECT * FROM t WHERE id = 1") == statement_shape("SELECT *  FROM t\nWHERE id = 42")
+    assert statement_shape("SELECT * FROM t WHERE name = 'a'") == "SELECT * FROM t WHERE name = ?"
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?)"
+    assert statement_shape("SELECT * FROM t WHERE id IN ($1, $2)") == "SELECT * FROM t WHERE id IN (?)"
+
+
+@pytest.mark.asyncio
+async def test_profile_counts_statements_and_shapes(engine):
+    with profile_queries() as profile:
+        await select_each(engine, 4)
+
+    assert profile.count == 4
+    assert profile.total_time > 0
+    assert profile.repeated(3) == [("SELECT name FROM items WHERE id = ?", 4)]
+    assert profile.repeated(5) == []
+
+
+@pytest.mark.asyncio
+async def test_nothing_recorded_outside_profile(engine):
+    with profile_queries() as profile:
+        pass
+    await select_each(engine, 2)
+
+    assert profile.count == 0
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fails_when_exceeded(engine):
+    with assert_query_budget(3):
+        await select_each(engine, 3)
+
+    with pytest.raises(QueryBudgetExceeded, match="at most 2 queries, executed 3"):
+        with assert_query_budget(2):
+            await select_each(engine, 3)
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fixture(engine, query_budget):
+    with query_budget(1) as profile:
+        await select_each(engine, 1)
+
+    assert profile.count == 1
+
+
+def build_app(engine, n):
+    async def items(request):
+        await select_each(engine, n)
+        return PlainTextResponse("ok")
+
+    return RequestPipelineMiddleware(Starlette(routes=[Route("/items", items)]))
+
+
+async def call(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/items")
+
+
+@pytest.fixture
+def profiling(monkeypatch):
+    monkeypatch.setattr("app.core.middleware.pipeline.settings.db_query_profiling", True)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_adds_server_timing(engine, profiling):
+    response = await call(build_app(engine, 3))
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert response.headers["server-timing"].endswith('desc="3 queries"')
+
+
+@pytest.mark.asyncio
+async def test_pipeline_logs_db_fields_and_warns_on_n_plus_one(engine, profiling, monkeypatch, caplog):
+    monkeypatch.setattr("app.core.middleware.pipeline.settings.db_n_plus_one_threshold", 3)
+
+    with caplog.at_level(logging.INFO, logger="app.core.middleware.logging"):
+        await call(build_app(engine, 4))
+
+    completed = next(r for r in caplog.records if r.getMessage().startswith("Request completed"))
+    assert completed.db_queries == 4
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert warnings[0].executions == 4
+    assert warnings[0].statement == "SELECT name FROM items WHERE id = ?"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_profiling_can_be_disabled(engine, monkeypatch):
+    monkeypatch.setattr("app.core.middleware.pipeline.settings.db_query_profiling", False)
+
+    response = await call(build_app(engine, 1))
+
+    assert "server-timing" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_pipeline_profiling_follows_debug_by_default(engine, monkeypatch):
+    monkeypatch.setattr("app.core.middleware.pipeline.settings.db_query_profiling", None)
+    monkeypatch.setattr("app.core.middleware.pipeline.settings.debug", False)
+
+    assert "server-timing" not in (await call(build_app(engine, 1))).headers
+
+    monkeypatch.setattr("app.core.middleware.pipeline.settings.debug", True)
+
+    assert "server-timing" in (await call(build_app(engine, 1))).headers
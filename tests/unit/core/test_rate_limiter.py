@@ -0,0 +1,101 @@
+"""Unit tests for the atomic sliding-window rate limiter."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.cache.rate_limiter import LocalTokenBucket, RateLimiter, SLIDING_WINDOW_SCRIPT
+
+
+class TestLocalTokenBucket:
+    """Test the per-worker token bucket pre-filter."""
+
+    def test_rejects_after_capacity_is_spent(self):
+        bucket = LocalTokenBucket()
+        with patch("app.core.cache.rate_limiter.time.monotonic", return_value=0.0):
+            results = [bucket.consume("k", 3, 60)[0] for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    def test_refills_over_time(self):
+        bucket = LocalTokenBucket()
+        with patch("app.core.cache.rate_limiter.time.monotonic", return_value=0.0):
+            for _ in range(3):
+                bucket.consume("k", 3, 60)
+            allowed, retry_after = bucket.consume("k", 3, 60)
+        assert allowed is False
+        assert retry_after == pytest.approx(20.0)
+
+        with patch("app.core.cache.rate_limiter.time.monotonic", return_value=20.0):
+            assert bucket.consume("k", 3, 60)[0] is True
+
+    def test_key_count_is_bounded(self):
+        bucket = LocalTokenBucket(max_keys=2)
+        for key in ("a", "b", "c"):
+            bucket.consume(key, 1, 60)
+
+        assert list(bucket._buckets) == ["b", "c"]
+
+
+@pytest.fixture
+def limiter():
+    """RateLimiter wired to a mocked redis.asyncio client."""
+    script = AsyncMock(return_value=[1, 4, 0])
+    client = MagicMock()
+    client.register_script = MagicMock(return_value=script)
+
+    instance = RateLimiter()
+    instance._redis_client = MagicMock(client=client)
+    return instance, client, script
+
+
+class TestRateLimiter:
+    """Test the single round-trip Redis check."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_request_uses_one_script_call(self, limiter):
+        instance, client, script = limiter
+
+        assert await instance.check_rate_limit("rate_limit:ip:1", 5, 60) == (True, 4, None)
+        client.register_script.assert_called_once_with(SLIDING_WINDOW_SCRIPT)
+        script.assert_awaited_once()
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == ["rate_limit:ip:1"]
+        assert kwargs["args"][1:3] == [60000, 5]
+
+    @pytest.mark.asyncio
+    async def test_denied_request_returns_reset_seconds(self, limiter):
+        instance, _, script = limiter
+        script.return_value = [0, 0, 1700000060000]
+
+        assert await instance.check_rate_limit("k", 5, 60) == (False, 0, 1700000060)
+
+    @pytest.mark.asyncio
+    async def test_local_prefilter_skips_redis(self, limiter):
+        instance, _, script = limiter
+        for _ in range(2):
+            await instance.check_rate_limit("k", 2, 60)
+        script.reset_mock()
+
+        allowed, remaining, reset_time = await instance.check_rate_limit("k", 2, 60)
+
+        assert (allowed, remaining) == (False, 0)
+        assert reset_time is not None
+        script.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_denials_do_not_drain_the_local_bucket(self, limiter):
+        instance, _, script = limiter
+        script.return_value = [0, 0, 1700000060000]
+        for _ in range(5):
+            await instance.check_rate_limit("k", 2, 60)
+
+        # Once the global window admits the client again, so does this worker
+        script.return_value = [1, 1, 0]
+        assert await instance.check_rate_limit("k", 2, 60) == (True, 1, None)
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_redis_errors(self, limiter):
+        instance, _, script = limiter
+        script.side_effect = ConnectionError("down")
+
+        assert await instance.check_rate_limit("k", 5, 60) == (True, 5, None)
@@ -0,0 +1,219 @@
+"""Unit tests for stampede-protected read-through caching."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.cache import read_through
+from app.core.cache.read_through import cached, peek, store
+
+
+class FakeCache:
+    """In-memory stand-in for NearCache."""
+
+    def __init__(self, redis_client=None):
+        self.data = {}
+        self.tags = {}
+        self.sets = 0
+        self.redis = MagicMock(client=redis_client)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None, tags=()):
+        self.sets += 1
+        self.data[key] = value
+        self.tags[key] = list(tags)
+        return True
+
+    async def set_many(self, mapping, ttl=None, tags=()):
+        self.data.update(mapping)
+        return True
+
+    def invalidate_local(self, keys=None):
+        pass
+
+
+@pytest.fixture
+def cache():
+    return FakeCache()
+
+
+def counting_loader(value="fresh", delay=0.01):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return value
+
+    return loader, calls
+
+
+async def drain():
+    """Let background refreshes finish."""
+    for _ in range(5):
+        await asyncio.sleep(0.02)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_call_the_loader_once(cache):
+    loader, calls = counting_loader(delay=0.05)
+
+    results = await asyncio.gather(*(cached("k", loader, 60, cache=cache) for _ in range(20)))
+
+    assert results == ["fresh"] * 20
+    assert len(calls) == 1
+    assert await peek("k", cache=cache) == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_loading(cache):
+    await store("k", "cached", 60, cache=cache)
+    loader, calls = counting_loader()
+
+    assert await cached("k", loader, 60, early_refresh=0, cache=cache) == "cached"
+    await drain()
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing(cache):
+    await store("k", "old", 60, stale_ttl=30, cache=cache)
+    cache.data["k"]["expires_at"] = time.time() - 1
+    loader, calls = counting_loader(value="request")
+    refresher, refreshes = counting_loader(value="new")
+
+    results = await asyncio.gather(
+        *(cached("k", loader, 60, stale_ttl=30, refresher=refresher, cache=cache) for _ in range(5))
+    )
+
+    assert results == ["old"] * 5
+    await drain()
+    assert calls == []
+    assert len(refreshes) == 1
+    assert await peek("k", cache=cache) == "new"
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_without_refresher_is_reloaded_inline(cache):
+    await store("k", "old", 60, stale_ttl=30, cache=cache)
+    cache.data["k"]["expires_at"] = time.time() - 1
+    loader, calls = counting_loader(value="new")
+
+    results = await asyncio.gather(*(cached("k", loader, 60, stale_ttl=30, cache=cache) for _ in range(5)))
+
+    # The loader ran while its callers waited, never after they returned
+    assert results == ["new"] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_when_the_inline_reload_fails(cache):
+    await store("k", "old", 60, stale_ttl=30, cache=cache)
+    cache.data["k"]["expires_at"] = time.time() - 1
+
+    async def loader():
+        raise RuntimeError("db down")
+
+    assert await cached("k", loader, 60, stale_ttl=30, cache=cache) == "old"
+
+
+@pytest.mark.asyncio
+async def test_entry_past_the_stale_window_is_a_miss(cache):
+    await store("k", "old", 60, stale_ttl=30, cache=cache)
+    cache.data["k"]["expires_at"] = time.time() - 31
+    loader, _ = counting_loader(value="new")
+
+    assert await cached("k", loader, 60, stale_ttl=30, cache=cache) == "new"
+
+
+@pytest.mark.asyncio
+async def test_early_refresh_fires_close_to_expiry(cache):
+    await store("k", "old", 60, cache=cache)
+    cache.data["k"].update(expires_at=time.time() + 1, delta=10.0)
+    loader, calls = counting_loader(value="request")
+    refresher, refreshes = counting_loader(value="new")
+
+    assert await cached("k", loader, 60, early_refresh=5.0, refresher=refresher, cache=cache) == "old"
+    await drain()
+    assert calls == []
+    assert len(refreshes) == 1
+    assert cache.data["k"]["value"] == "new"
+
+
+@pytest.mark.asyncio
+async def test_no_early_refresh_without_refresher(cache):
+    await store("k", "old", 60, cache=cache)
+    cache.data["k"].update(expires_at=time.time() + 1, delta=10.0)
+    loader, calls = counting_loader(value="new")
+
+    assert await cached("k", loader, 60, early_refresh=5.0, cache=cache) == "old"
+    await drain()
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_none_is_not_cached(cache):
+    loader, calls = counting_loader(value=None)
+
+    assert await cached("k", loader, 60, cache=cache) is None
+    assert await cached("k", loader, 60, cache=cache) is None
+    assert len(calls) == 2
+    assert cache.sets == 0
+
+
+@pytest.mark.asyncio
+async def test_tags_can_depend_on_the_loaded_value(cache):
+    loader, _ = counting_loader(value={"id": "s1", "category_id": "c1"})
+
+    await cached("k", loader, 60, tags=lambda value: [f"category:{value['category_id']}"], cache=cache)
+
+    assert cache.tags["k"] == ["category:c1"]
+
+
+@pytest.mark.asyncio
+async def test_loader_errors_reach_every_waiter(cache):
+    async def loader():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(*(cached("k", loader, 60, cache=cache) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert "k" not in read_through._single_flight
+
+
+@pytest.mark.asyncio
+async def test_lock_rereads_value_stored_by_another_worker():
+    cache = FakeCache(redis_client=MagicMock())
+    lock = MagicMock()
+    loader, calls = counting_loader()
+
+    async def acquire():
+        # Another worker finished loading while we waited for the lock
+        await store("k", "theirs", 60, cache=cache)
+        return True
+
+    lock.acquire = AsyncMock(side_effect=acquire)
+    lock.release = AsyncMock(return_value=True)
+
+    with patch.object(read_through, "DistributedLock", return_value=lock) as lock_type:
+        assert await cached("k", loader, 60, lock=True, cache=cache) == "theirs"
+
+    assert lock_type.call_args.args[0] == "cache:k"
+    lock.release.assert_awaited_once()
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_lock_is_skipped_without_redis(cache):
+    loader, calls = counting_loader()
+
+    with patch.object(read_through, "DistributedLock") as lock_type:
+        assert await cached("k", loader, 60, lock=True, cache=cache) == "fresh"
+
+    lock_type.assert_not_called()
+    assert len(calls) == 1
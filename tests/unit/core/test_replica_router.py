@@ -0,0 +1,84 @@
+"""Unit tests for read-replica routing and failover."""
+
+import pytest
+from unittest.mock import patch
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.db.session import ReplicaRouter, get_read_db
+
+
+def bound_url(session):
+    return str(session.bind.url)
+
+
+@pytest.fixture
+def replica_urls(tmp_path):
+    return [f"sqlite+aiosqlite:///{tmp_path}/replica{i}.db" for i in range(2)]
+
+
+@pytest.mark.asyncio
+async def test_round_robin_across_replicas(replica_urls):
+    router = ReplicaRouter(replica_urls)
+
+    urls = []
+    for _ in range(4):
+        session = router.open_session()
+        urls.append(bound_url(session))
+        await session.close()
+    await router.dispose()
+
+    assert urls == replica_urls * 2
+
+
+@pytest.mark.asyncio
+async def test_failed_replica_leaves_rotation(replica_urls, tmp_path):
+    broken = f"sqlite+aiosqlite:///{tmp_path}/missing/dir/replica.db"
+    router = ReplicaRouter([broken, replica_urls[0]], retry_seconds=60)
+
+    session = router.open_session()
+    with pytest.raises(OperationalError):
+        await session.execute(text("SELECT 1"))
+    await session.close()
+
+    # The broken replica is skipped until retry_seconds have passed
+    for _ in range(3):
+        session = router.open_session()
+        assert bound_url(session) == replica_urls[0]
+        await session.close()
+    await router.dispose()
+
+
+@pytest.mark.asyncio
+async def test_no_healthy_replica_means_primary(tmp_path):
+    assert ReplicaRouter([]).open_session() is None
+
+    router = ReplicaRouter([f"sqlite+aiosqlite:///{tmp_path}/replica.db"])
+    router.mark_down(0)
+    assert router.open_session() is None
+    await router.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_db_uses_replica(replica_urls):
+    router = ReplicaRouter(replica_urls[:1])
+    primary = object()
+
+    with patch("app.core.db.session.replica_router", router):
+        dependency = get_read_db(primary)
+        session = await dependency.__anext__()
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+        assert bound_url(session) == replica_urls[0]
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+    await router.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_db_shares_primary_without_replicas():
+    primary = object()
+
+    with patch("app.core.db.session.replica_router", ReplicaRouter([])):
+        dependency = get_read_db(primary)
+        assert await dependency.__anext__() is primary
@@ -0,0 +1,92 @@
+"""One pooled connection per request, shared by auth and endpoint dependencies."""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, text
+from unittest.mock import patch
+
+from app.core.db import UnitOfWork, engine, get_db, get_read_db, get_unit_of_work
+from app.shared.auth import AuthenticatedUser, get_current_user
+
+USER = AuthenticatedUser(
+    id="user-1",
+    email="user@example.com",
+    first_name="Test",
+    last_name="User",
+    role="client",
+    status="active",
+    created_at=datetime.now(timezone.utc),
+    updated_at=datetime.now(timezone.utc),
+)
+
+
+class FakeAuthAdapter:
+    """Loads the user with a query on the session it was built with."""
+
+    def __init__(self, db, query):
+        self._db = db
+        self._query = query
+
+    async def authenticate_from_credentials(self, credentials):
+        if self._query:
+            await self._db.execute(text("SELECT 1"))
+        return USER
+
+
+def build_app():
+    app = FastAPI()
+
+    @app.get("/bookings")
+    async def endpoint(
+        user: AuthenticatedUser = Depends(get_current_user),
+        uow: UnitOfWork = Depends(get_unit_of_work),
+        db=Depends(get_db),
+        read_db=Depends(get_read_db),
+        query: bool = True,
+    ):
+        if query:
+            await uow.session.execute(text("SELECT 1"))
+            await db.execute(text("SELECT 1"))
+            await read_db.execute(text("SELECT 1"))
+        return {"user": user.id}
+
+    return app
+
+
+@pytest.fixture
+def checkouts():
+    counter = {"count": 0}
+
+    def on_checkout(*args):
+        counter["count"] += 1
+
+    event.listen(engine.sync_engine.pool, "checkout", on_checkout)
+    yield counter
+    event.remove(engine.sync_engine.pool, "checkout", on_checkout)
+
+
+async def get(path, query):
+    factory = lambda db: FakeAuthAdapter(db, query)
+    transport = httpx.ASGITransport(app=build_app())
+    with patch("app.features.auth.api.dependencies.create_auth_adapter", factory):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers={"Authorization": "Bearer token"})
+
+
+@pytest.mark.asyncio
+async def test_authenticated_request_checks_out_one_connection(checkouts):
+    response = await get("/bookings", query=True)
+
+    assert response.status_code == 200
+    assert checkouts["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_request_without_queries_never_touches_the_pool(checkouts):
+    response = await get("/bookings?query=false", query=False)
+
+    assert response.status_code == 200
+    assert checkouts["count"] == 0
@@ -0,0 +1,227 @@
+"""
+Tests for the SQL aggregates behind the analytics data providers.
+
+Loads a small synthetic dataset into SQLite and checks each pushed-down
+aggregate against the same figures computed in Python from the raw rows.
+"""
+
+import importlib.util
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.features.analytics.adapters.data_adapters import BookingDataAdapter, WalkInDataAdapter
+from app.features.analytics.adapters.repositories import RevenueAnalyticsRepository
+from app.features.analytics.domain.enums import TimeGranularity
+from app.features.bookings.adapters.repositories import SqlBookingRepository
+from app.features.bookings.use_cases.get_customer_stats import (
+    GetCustomerStatsUseCase,
+    GetTopCustomersUseCase,
+)
+from app.features.bookings.use_cases.get_revenue_data import (
+    CountRevenueCustomersUseCase,
+    GetRevenueDataUseCase,
+)
+from app.features.bookings.use_cases.get_service_stats import (
+    GetDailyServiceStatsUseCase,
+    GetServiceStatsUseCase,
+)
+from app.features.staff.adapters.repositories import AttendanceRepository
+from app.features.walkins.adapters.repositories import WalkInRepository
+from app.features.walkins.domain import WalkInStatus
+from app.features.walkins.use_cases.get_revenue_data import (
+    GetWalkInDailyServiceDataUseCase,
+    GetWalkInRevenueDataUseCase,
+)
+
+SCRIPT = Path(__file__).parents[3] / "scripts" / "generate_perf_data.py"
+
+spec = importlib.util.spec_from_file_location("generate_perf_data", SCRIPT)
+generate_perf_data = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_perf_data)
+
+END = date(2025, 6, 30)
+START = END - timedelta(days=13)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def session_factory(tmp_path_factory):
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('aggregates') / 'perf.db'}"
+    dataset = generate_perf_data.SyntheticDataset(scale=0.02, seed=3, days=30, end_date=END)
+    await generate_perf_data.generate(url, dataset, batch_size=500, create_tables=True)
+
+    engine = create_async_engine(url)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def rows(session_factory, sql):
+    async with session_factory() as session:
+        return (await session.execute(text(sql))).all()
+
+
+def day_of(value):
+    return date.fromisoformat(str(value)[:10])
+
+
+def in_period(day):
+    return START <= day <= END
+
+
+@pytest.mark.asyncio
+async def test_booking_daily_revenue_matches_raw_rows(session_factory):
+    expected_revenue = defaultdict(Decimal)
+    expected_count = defaultdict(int)
+    customers = set()
+    for scheduled_at, status, total, customer_id in await rows(
+        session_factory, "SELECT scheduled_at, status, total_price, customer_id FROM bookings"
+    ):
+        if in_period(day_of(scheduled_at)) and status in ("confirmed", "completed"):
+            expected_revenue[day_of(scheduled_at)] += Decimal(str(total))
+            expected_count[day_of(scheduled_at)] += 1
+            customers.add(customer_id)
+
+    async with session_factory() as session:
+        repository = SqlBookingRepository(session)
+        days = await repository.get_daily_revenue(START, END, ("confirmed", "completed"))
+        customer_count = await repository.count_customers(START, END, ("confirmed", "completed"))
+
+    assert expected_count
+    assert {d.day: d.revenue for d in days} == dict(expected_revenue)
+    assert {d.day: d.booking_count for d in days} == dict(expected_count)
+    assert customer_count == len(customers)
+
+
+@pytest.mark.asyncio
+async def test_booking_service_and_customer_totals(session_factory):
+    expected = defaultdict(Decimal)
+    for service_id, price, scheduled_at in await rows(
+        session_factory,
+        "SELECT bs.service_id, bs.price, b.scheduled_at "
+        "FROM booking_services bs JOIN bookings b ON b.id = bs.booking_id",
+    ):
+        if in_period(day_of(scheduled_at)):
+            expected[service_id] += Decimal(str(price))
+
+    async with session_factory() as session:
+        repository = SqlBookingRepository(session)
+        services = await repository.get_service_totals(START, END)
+        top = await repository.get_customer_totals(start_date=START, end_date=END, limit=3)
+        single = await repository.get_customer_totals(customer_id=top[0].customer_id)
+
+    assert {s.service_id: s.revenue for s in services} == dict(expected)
+    assert all(s.service_name for s in services)
+    assert len(top) == 3
+    assert top[0].total_spent >= top[1].total_spent >= top[2].total_spent
+    assert single[0].booking_count >= top[0].booking_count
+
+
+@pytest.mark.asyncio
+async def test_walkin_daily_revenue_matches_raw_rows(session_factory):
+    expected = defaultdict(Decimal)
+    for started_at, status, amount in await rows(
+        session_factory,
+        "SELECT started_at, status, final_amount FROM walkin_services WHERE deleted_at IS NULL",
+    ):
+        if in_period(day_of(started_at)) and status in ("in_progress", "completed"):
+            expected[day_of(started_at)] += Decimal(str(amount))
+
+    async with session_factory() as session:
+        days = await WalkInRepository(session).get_daily_revenue(
+            START, END, (WalkInStatus.IN_PROGRESS, WalkInStatus.COMPLETED)
+        )
+
+    assert expected
+    assert {d.day: d.revenue for d in days} == dict(expected)
+
+
+@pytest.mark.asyncio
+async def test_attendance_summary_matches_raw_rows(session_factory):
+    expected = defaultdict(lambda: [0, 0, Decimal("0")])
+    for staff_id, day, status, hours in await rows(
+        session_factory, "SELECT staff_id, date, status, hours_worked FROM attendance_records"
+    ):
+        if in_period(day_of(day)):
+            totals = expected[staff_id]
+            totals[0] += 1
+            totals[1] += status == "present"
+            totals[2] += Decimal(str(hours))
+
+    async with session_factory() as session:
+        summaries = await AttendanceRepository(session).summarize_attendance(START, END)
+        one = await AttendanceRepository(session).summarize_attendance(
+            START, END, staff_id=summaries[0].staff_id
+        )
+
+    assert {
+        s.staff_id: [s.days_recorded, s.present_days, s.hours_worked] for s in summaries
+    } == dict(expected)
+    assert one == [summaries[0]]
+
+
+def revenue_repository(session):
+    bookings = SqlBookingRepository(session)
+    walkins = WalkInRepository(session)
+    return RevenueAnalyticsRepository(
+        BookingDataAdapter(
+            GetRevenueDataUseCase(bookings),
+            CountRevenueCustomersUseCase(bookings),
+            GetCustomerStatsUseCase(bookings),
+            GetTopCustomersUseCase(bookings),
+            GetServiceStatsUseCase(bookings),
+            GetDailyServiceStatsUseCase(bookings),
+        ),
+        WalkInDataAdapter(
+            GetWalkInRevenueDataUseCase(walkins),
+            GetWalkInDailyServiceDataUseCase(walkins),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_revenue_analytics_zero_fills_days_and_computes_growth(session_factory):
+    async with session_factory() as session:
+        repository = revenue_repository(session)
+        # Starts before the generated 30 days, so the first days have no activity
+        first = END - timedelta(days=32)
+        daily = await repository.get_daily_revenue(first, END)
+        metrics = await repository.get_revenue_metrics(first, END)
+        # The 14 days before START are covered by the dataset
+        growth = await repository.get_revenue_growth_rate(START, END)
+
+    assert [d.date for d in daily] == [first + timedelta(days=i) for i in range(33)]
+    assert all(d.revenue == 0 and d.bookings_count == 0 for d in daily[:3])
+    assert metrics.total_revenue == sum(d.revenue for d in daily) > 0
+    assert metrics.total_bookings == sum(d.bookings_count for d in daily)
+    assert metrics.growth_rate is None
+    assert growth is not None
+
+
+@pytest.mark.asyncio
+async def test_revenue_breakdown_by_week_and_month(session_factory):
+    first = date(2025, 5, 28)  # a Wednesday
+
+    async with session_factory() as session:
+        repository = revenue_repository(session)
+        daily = await repository.get_daily_revenue(first, END)
+        weekly = await repository.get_daily_revenue(first, END, TimeGranularity.WEEKLY)
+        monthly = await repository.get_daily_revenue(first, END, TimeGranularity.MONTHLY)
+        with pytest.raises(ValueError):
+            await repository.get_daily_revenue(first, END, TimeGranularity.HOURLY)
+
+    # The first period is clamped to the start date; the rest start on Mondays
+    assert [w.date for w in weekly] == [first] + [
+        date(2025, 6, 2) + timedelta(weeks=i) for i in range(5)
+    ]
+    assert [m.date for m in monthly] == [first, date(2025, 6, 1)]
+    assert monthly[1].revenue == sum(d.revenue for d in daily if d.date.month == 6)
+    assert weekly[-1].walkins_count == daily[-1].walkins_count  # 2025-06-30 is a Monday
+    for periods in (weekly, monthly):
+        assert sum(p.revenue for p in periods) == sum(d.revenue for d in daily)
+        assert sum(p.bookings_count for p in periods) == sum(d.bookings_count for d in daily)
@@ -0,0 +1,133 @@
+"""Unit tests for the period-aware analytics result cache."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.observability.metrics import MetricsCollector
+from app.features.analytics.api import cache as analytics_cache
+from app.features.analytics.api.cache import (
+    ANALYTICS_RESOURCES,
+    AnalyticsResultCache,
+    get_analytics_cache,
+)
+
+TODAY = date.today()
+CLOSED = {"start_date": str(TODAY - timedelta(days=30)), "end_date": str(TODAY - timedelta(days=1))}
+OPEN = {"start_date": str(TODAY - timedelta(days=6)), "end_date": str(TODAY)}
+
+
+class FakeCache:
+    """In-memory stand-in for NearCache."""
+
+    def __init__(self):
+        self.data = {}
+        self.redis = MagicMock(client=None)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None, tags=()):
+        self.data[key] = value
+        return True
+
+
+class FakeVersions:
+    """Resource versions; unavailable (None) like ResourceVersions without Redis."""
+
+    def __init__(self, available=True):
+        self.available = available
+        self.values = {resource: 1 for resource in ANALYTICS_RESOURCES}
+
+    async def get(self, *resources):
+        return [self.values[r] for r in resources] if self.available else None
+
+
+class Report(BaseModel):
+    period_start: date
+    calls: int
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    backends = MagicMock(cache=FakeCache(), versions=FakeVersions(), metrics=MetricsCollector())
+    monkeypatch.setattr(analytics_cache, "near_cache", backends.cache)
+    monkeypatch.setattr(analytics_cache, "resource_versions", backends.versions)
+    monkeypatch.setattr(analytics_cache, "metrics_collector", backends.metrics)
+    return backends
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    calls = []
+
+    @app.get("/report", response_model=Report)
+    async def report(
+        start_date: date,
+        end_date: date,
+        cache: AnalyticsResultCache = Depends(get_analytics_cache),
+    ):
+        async def compute():
+            calls.append(1)
+            return Report(period_start=start_date, calls=len(calls))
+
+        return await cache.get_or_compute(Report, compute)
+
+    return TestClient(app)
+
+
+def test_closed_range_is_served_from_cache(client, backends):
+    first = client.get("/report", params=CLOSED)
+    second = client.get("/report", params=CLOSED)
+    backends.versions.values["bookings"] += 1
+    third = client.get("/report", params=CLOSED)
+
+    assert [r.headers["X-Cache"] for r in (first, second, third)] == ["MISS", "HIT", "HIT"]
+    assert third.json() == first.json() == {"period_start": CLOSED["start_date"], "calls": 1}
+    # Another range is another entry
+    assert client.get("/report", params={**CLOSED, "end_date": str(TODAY - timedelta(days=2))}).headers[
+        "X-Cache"
+    ] == "MISS"
+
+    stats = backends.metrics.get_metrics()["response_cache"]["/report"]
+    assert (stats["hit"], stats["miss"]) == (2, 2)
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_open_range_is_recomputed_after_a_write(client, backends):
+    assert client.get("/report", params=OPEN).headers["X-Cache"] == "MISS"
+    assert client.get("/report", params=OPEN).headers["X-Cache"] == "HIT"
+
+    backends.versions.values["expenses"] += 1
+    response = client.get("/report", params=OPEN)
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.json()["calls"] == 2
+
+
+def test_open_range_is_not_cached_without_versions(client, backends):
+    backends.versions.available = False
+
+    responses = [client.get("/report", params=OPEN) for _ in range(2)]
+
+    assert [r.headers["X-Cache"] for r in responses] == ["BYPASS", "BYPASS"]
+    assert responses[1].json()["calls"] == 2
+    assert backends.cache.data == {}
+
+
+def test_bypass_header_skips_reading_and_storing(client, backends):
+    client.get("/report", params=CLOSED)
+
+    bypassed = client.get("/report", params=CLOSED, headers={"X-Cache-Bypass": "1"})
+    cached = client.get("/report", params=CLOSED)
+
+    assert bypassed.headers["X-Cache"] == "BYPASS"
+    assert bypassed.json()["calls"] == 2
+    assert cached.headers["X-Cache"] == "HIT"
+    assert cached.json()["calls"] == 1
+    assert backends.metrics.get_metrics()["response_cache"]["/report"]["bypass"] == 1
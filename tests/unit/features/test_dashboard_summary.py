@@ -0,0 +1,132 @@
+"""
+Tests for the concurrent dashboard summary and the provider memo behind it.
+"""
+
+import asyncio
+import importlib.util
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.features.analytics.adapters.memo import ProviderMemo
+from app.features.analytics.api.dependencies import build_dashboard_repository
+
+SCRIPT = Path(__file__).parents[3] / "scripts" / "generate_perf_data.py"
+
+spec = importlib.util.spec_from_file_location("generate_perf_data", SCRIPT)
+generate_perf_data = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_perf_data)
+
+END = date(2025, 6, 30)
+START = END - timedelta(days=13)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def engine(tmp_path_factory):
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('dashboard') / 'perf.db'}"
+    dataset = generate_perf_data.SyntheticDataset(scale=0.02, seed=11, days=30, end_date=END)
+    await generate_perf_data.generate(url, dataset, batch_size=500, create_tables=True)
+
+    engine = create_async_engine(url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_memo_loads_each_key_once_for_concurrent_callers():
+    memo = ProviderMemo()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["rows"]
+
+    results = await asyncio.gather(*(memo.get(("key", 1), load) for _ in range(5)))
+    again = await memo.get(("key", 1), load)
+
+    assert results == [["rows"]] * 5 and again == ["rows"]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_memo_does_not_remember_failures():
+    memo = ProviderMemo()
+
+    async def fail():
+        raise RuntimeError("database unavailable")
+
+    async def load():
+        return 42
+
+    with pytest.raises(RuntimeError):
+        await memo.get("key", fail)
+
+    assert await memo.get("key", load) == 42
+
+
+@pytest.mark.asyncio
+async def test_memo_waiter_cancellation_does_not_cancel_the_load():
+    memo = ProviderMemo()
+
+    async def load():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.create_task(memo.get("key", load))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(memo.get("key", load))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    assert await first == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+async def section(session_factory, name, method):
+    """One dashboard section computed alone, with a memo of its own."""
+    async with session_factory() as session:
+        dashboard = build_dashboard_repository([session])
+        return await getattr(getattr(dashboard, f"_{name}_repo"), method)(START, END)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lanes", [1, 2, 4])
+async def test_dashboard_sections_match_and_share_period_data(engine, lanes):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        revenue = await section(session_factory, "revenue", "get_revenue_metrics")
+        financial = await section(session_factory, "financial", "get_financial_kpis")
+        customers = await section(session_factory, "customer", "get_customer_metrics")
+        services = await section(session_factory, "service", "get_service_popularity")
+        sequential = len(statements)
+        statements.clear()
+
+        sessions = [session_factory() for _ in range(lanes)]
+        try:
+            summary = await build_dashboard_repository(sessions).get_dashboard_summary(START, END)
+        finally:
+            for session in sessions:
+                await session.close()
+        shared = len(statements)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    assert summary.revenue_metrics == revenue
+    assert summary.financial_kpis == financial
+    assert summary.customer_metrics == customers
+    assert summary.top_performing_services == services[:5]
+    # Financial KPIs reuse the booking and walk-in daily revenue (a rollup
+    # read and a live read each) that the revenue section loaded
+    assert shared <= sequential - 4
@@ -0,0 +1,214 @@
+"""
+Tests for the analytics revenue rollups.
+
+Loads a small synthetic dataset into SQLite and checks that rollup-backed
+providers return exactly what the live aggregates return, whether the
+period is fully, partly or not at all rolled up.
+"""
+
+import importlib.util
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.events import EventBus
+from app.features.analytics.adapters.models import DailyRevenueRollupModel, DailyServiceRollupModel
+from app.features.analytics.adapters.rollups import (
+    RollupBookingDataProvider,
+    RollupReader,
+    RollupWalkInDataProvider,
+    SqlRevenueRollupRepository,
+)
+from app.features.analytics.api.dependencies import (
+    build_rollup_refresher,
+    get_booking_data_provider,
+    get_walkin_data_provider,
+)
+from app.features.analytics.api.events import RevenueRollupSubscriber, RollupDayCloser
+from app.features.analytics.domain.enums import RevenueSource
+from app.features.analytics.use_cases.refresh_revenue_rollups import RefreshRevenueRollupsRequest
+from app.features.bookings.adapters.repositories import SqlBookingRepository
+from app.features.walkins.adapters.repositories import WalkInRepository
+
+SCRIPT = Path(__file__).parents[3] / "scripts" / "generate_perf_data.py"
+
+spec = importlib.util.spec_from_file_location("generate_perf_data", SCRIPT)
+generate_perf_data = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_perf_data)
+
+END = date(2025, 6, 30)
+START = END - timedelta(days=13)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def session_factory(tmp_path_factory):
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('rollups') / 'perf.db'}"
+    dataset = generate_perf_data.SyntheticDataset(scale=0.02, seed=5, days=30, end_date=END)
+    await generate_perf_data.generate(url, dataset, batch_size=500, create_tables=True)
+
+    engine = create_async_engine(url)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def refresh(session_factory, start_date, end_date):
+    async with session_factory() as session:
+        days = await build_rollup_refresher(session).execute(
+            RefreshRevenueRollupsRequest(start_date, end_date)
+        )
+        await session.commit()
+    return days
+
+
+async def clear(session_factory):
+    async with session_factory() as session:
+        await session.execute(delete(DailyRevenueRollupModel))
+        await session.execute(delete(DailyServiceRollupModel))
+        await session.commit()
+
+
+async def assert_matches_live(session, start_date, end_date):
+    live_bookings = get_booking_data_provider(SqlBookingRepository(session))
+    live_walkins = get_walkin_data_provider(WalkInRepository(session))
+    rollups = SqlRevenueRollupRepository(session)
+    pairs = [
+        (live_bookings, RollupBookingDataProvider(live_bookings, rollups)),
+        (live_walkins, RollupWalkInDataProvider(live_walkins, rollups)),
+    ]
+
+    for live, rolled in pairs:
+        assert await rolled.get_daily_revenue(start_date, end_date) == await live.get_daily_revenue(
+            start_date, end_date
+        )
+        key = lambda row: (row.date, row.service_id)
+        assert sorted(await rolled.get_daily_service_data(start_date, end_date), key=key) == sorted(
+            await live.get_daily_service_data(start_date, end_date), key=key
+        )
+
+    live_services = await live_bookings.get_service_booking_data(start_date, end_date)
+    rolled_services = await pairs[0][1].get_service_booking_data(start_date, end_date)
+    assert {s.service_id: (s.booking_count, s.total_revenue) for s in rolled_services} == {
+        s.service_id: (s.booking_count, s.total_revenue) for s in live_services
+    }
+
+
+@pytest.mark.asyncio
+async def test_rolled_up_period_matches_live_aggregates(session_factory):
+    await clear(session_factory)
+
+    assert await refresh(session_factory, START, END) == 14
+
+    async with session_factory() as session:
+        rolled_days = await session.scalar(select(func.count()).select_from(DailyRevenueRollupModel))
+        await assert_matches_live(session, START, END)
+
+    # Every day is recorded per source, quiet days included
+    assert rolled_days == 2 * 14
+
+
+@pytest.mark.asyncio
+async def test_days_not_rolled_up_fall_back_to_live(session_factory):
+    await clear(session_factory)
+    await refresh(session_factory, START + timedelta(days=3), START + timedelta(days=6))
+
+    async with session_factory() as session:
+        await assert_matches_live(session, START - timedelta(days=5), END)
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_idempotent(session_factory):
+    await clear(session_factory)
+    await refresh(session_factory, START, END)
+
+    async def snapshot():
+        async with session_factory() as session:
+            rows = await session.execute(
+                select(
+                    DailyServiceRollupModel.day,
+                    DailyServiceRollupModel.source,
+                    DailyServiceRollupModel.service_id,
+                    DailyServiceRollupModel.revenue,
+                    DailyServiceRollupModel.transaction_count,
+                ).order_by(
+                    DailyServiceRollupModel.day,
+                    DailyServiceRollupModel.source,
+                    DailyServiceRollupModel.service_id,
+                )
+            )
+            return rows.all()
+
+    first = await snapshot()
+    await refresh(session_factory, START, END)
+
+    assert first and await snapshot() == first
+
+
+@pytest.mark.asyncio
+async def test_subscriber_refreshes_the_day_named_in_an_event(session_factory):
+    await clear(session_factory)
+    await refresh(session_factory, START, END)
+
+    async with session_factory() as session:
+        booking_id, scheduled_at = (await session.execute(text(
+            "SELECT id, scheduled_at FROM bookings WHERE status = 'completed' "
+            f"AND date(scheduled_at) = '{START}' LIMIT 1"
+        ))).one()
+        await session.execute(text(f"UPDATE bookings SET status = 'cancelled' WHERE id = '{booking_id}'"))
+        await session.commit()
+
+        # The rollup is stale until the event is handled
+        with pytest.raises(AssertionError):
+            await assert_matches_live(session, START, START)
+
+    bus = EventBus()
+    RevenueRollupSubscriber(session_factory).subscribe(bus)
+    await bus.deliver(
+        "booking.cancelled",
+        {"booking_id": booking_id, "scheduled_at": str(scheduled_at).replace(" ", "T")},
+    )
+
+    async with session_factory() as session:
+        await assert_matches_live(session, START, START)
+
+
+@pytest.mark.asyncio
+async def test_live_queries_cover_only_the_days_not_rolled_up(session_factory):
+    await clear(session_factory)
+    await refresh(session_factory, START + timedelta(days=3), START + timedelta(days=6))
+
+    async with session_factory() as session:
+        live = get_booking_data_provider(SqlBookingRepository(session))
+        queried = []
+
+        async def recording_live(start_date, end_date):
+            queried.append((start_date, end_date))
+            return await live.get_daily_revenue(start_date, end_date)
+
+        reader = RollupReader(SqlRevenueRollupRepository(session), RevenueSource.BOOKINGS)
+        await reader.daily_revenue(START, END, recording_live)
+
+    assert queried == [
+        (START, START + timedelta(days=2)),
+        (START + timedelta(days=7), END),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_day_closer_rolls_up_closed_days_missing_from_the_rollups(session_factory):
+    await clear(session_factory)
+    await refresh(session_factory, START, END - timedelta(days=3))
+    closer = RollupDayCloser(session_factory, backfill_days=7)
+
+    # The day after END: END - 2 to END are closed and missing, for both sources
+    assert await closer.close_days(today=END + timedelta(days=1)) == 2 * 3
+    assert await closer.close_days(today=END + timedelta(days=1)) == 0
+
+    async with session_factory() as session:
+        rolled_days = await session.scalar(select(func.count()).select_from(DailyRevenueRollupModel))
+        await assert_matches_live(session, START, END)
+
+    assert rolled_days == 2 * 14